@@ -0,0 +1,117 @@
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from app.scheme import Scheme
+
+class ApplyQueue:
+    """
+    Applies schemes one at a time in a worker thread. A request still waiting
+    when a newer one with the same selection of files and tags arrives is
+    superseded by it, so rapid requests write only the latest scheme.
+    Requests with other selections write other parts of the configuration,
+    so they are kept and applied in order.
+
+    Other tasks writing the configuration, e.g. undoing an apply, run in
+    the same worker, in order with the applies. A task is never superseded
+    and applies queued before it are not superseded by applies queued
+    after it, so it sees exactly the applies requested before it.
+
+    Attributes:
+        condition (threading.Condition): Condition guarding the pending
+                                         requests.
+        pending (list[tuple[Scheme | Callable[[], object], Future]]): The
+            waiting schemes and tasks, oldest first.
+        applied (int): The number of applied requests.
+        superseded (int): The number of superseded requests.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes the ApplyQueue class and starts its worker thread.
+        """
+        self.condition: threading.Condition = threading.Condition()
+        self.pending: list[
+            tuple[Scheme | Callable[[], object], Future]
+        ] = []
+        self.applied: int = 0
+        self.superseded: int = 0
+        threading.Thread(
+            target=self.run, name='scheme-apply', daemon=True
+        ).start()
+
+    def submit(self, scheme: Scheme) -> Future:
+        """
+        Queues the scheme to be applied, superseding the waiting request
+        with the same selection.
+
+        Args:
+            scheme (Scheme): The scheme to apply.
+
+        Returns:
+            Future: Resolves to True once the scheme is applied, or to False
+                    if it was superseded by a newer request.
+        """
+        future: Future = Future()
+
+        with self.condition:
+            # Requests queued before the latest task are kept
+            start: int = max(
+                (
+                    i + 1 for i, (task, _) in enumerate(self.pending)
+                    if callable(task)
+                ), default=0
+            )
+            selection: tuple = scheme.get_selection()
+            for request in [
+                request for request in self.pending[start:]
+                if request[0].get_selection() == selection
+            ]:
+                request[0].discard_materialized()
+                request[1].set_result(False)
+                self.pending.remove(request)
+                self.superseded += 1
+            self.pending.append((scheme, future))
+            self.condition.notify()
+
+        return future
+
+    def submit_task(self, task: Callable[[], object]) -> Future:
+        """
+        Queues a task writing the configuration, run after the waiting
+        requests.
+
+        Args:
+            task (Callable[[], object]): The task.
+
+        Returns:
+            Future: Resolves to the result of the task.
+        """
+        future: Future = Future()
+
+        with self.condition:
+            self.pending.append((task, future))
+            self.condition.notify()
+
+        return future
+
+    def run(self) -> None:
+        """
+        Applies queued schemes and runs queued tasks, runs in the worker
+        thread.
+        """
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                task, future = self.pending.pop(0)
+
+            try:
+                if callable(task):
+                    result: object = task()
+                else:
+                    task.apply_scheme()
+                    self.applied += 1
+                    result = True
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
@@ -0,0 +1,510 @@
+import hashlib
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+import defusedxml.ElementTree as defusedxmlET
+from app.colors import ColorUtils
+from app.config import (
+    CATALOG_RETRY_INTERVAL, CATALOG_TIMEOUT, CATALOG_VERSION, SCHEME_BATCH_SIZE
+)
+from app.duplicates import DuplicateFinder
+from app.store import SchemeStore
+from app.utils import SchemeFileManager
+
+class SchemeCatalog:
+    """
+    A local SQLite catalog of schemes with their metadata.
+
+    The catalog is refreshed incrementally: only scheme files whose
+    fingerprint (modification time and size, or CRC and size for archived
+    files) changed are read again, and only those whose content hash changed
+    are parsed again. The catalog is rebuilt when its layout version
+    changes.
+
+    Several threads refresh the catalog through their own connections. The
+    database is kept in write-ahead log mode, so readers are not blocked by
+    a writer, and files are read and parsed before a transaction begins, so
+    transactions hold the write lock only for their statements.
+
+    Attributes:
+        db_path (str): The path to the SQLite database file.
+        dominant_colors (int): The number of dominant colors to store.
+        connection (sqlite3.Connection): The database connection.
+        fts (bool): Whether the SQLite build supports full-text search.
+    """
+    def __init__(self, db_path: str, dominant_colors: int) -> None:
+        """
+        Opens the catalog database, creating it if it does not exist.
+
+        Args:
+            db_path (str): The path to the SQLite database file.
+            dominant_colors (int): The number of dominant colors to store.
+        """
+        self.db_path: str = db_path
+        self.dominant_colors: int = dominant_colors
+        self.connection: sqlite3.Connection = sqlite3.connect(
+            db_path, timeout=CATALOG_TIMEOUT
+        )
+        self.connection.row_factory = sqlite3.Row
+        self.set_wal_mode()
+        self.fts: bool = True
+        self.create_schema()
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+    def set_wal_mode(self) -> None:
+        """
+        Switches the database to write-ahead log mode. The mode is kept in
+        the database file, but switching needs an exclusive lock and does not
+        wait for other connections, so it is retried until the timeout.
+
+        Raises:
+            sqlite3.OperationalError: If the database stays locked.
+        """
+        deadline: float = time.monotonic() + CATALOG_TIMEOUT
+        while True:
+            try:
+                self.connection.execute('PRAGMA journal_mode=WAL')
+                return
+            except sqlite3.OperationalError:
+                if time.monotonic() >= deadline:
+                    raise
+            time.sleep(CATALOG_RETRY_INTERVAL)
+
+    def create_schema(self) -> None:
+        """
+        Creates the catalog tables if they do not exist, dropping tables of
+        an outdated layout.
+        """
+        with self.connection:
+            version: int = self.connection.execute(
+                'PRAGMA user_version'
+            ).fetchone()[0]
+            if version != CATALOG_VERSION:
+                # Cataloged metadata is rebuilt by the next refresh
+                self.connection.execute('DROP TABLE IF EXISTS schemes')
+                self.connection.execute('DROP TABLE IF EXISTS schemes_fts')
+                self.connection.execute(
+                    f'PRAGMA user_version = {CATALOG_VERSION}'
+                )
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS schemes ('
+                'id INTEGER PRIMARY KEY, '
+                'path TEXT NOT NULL, '
+                'name TEXT NOT NULL, '
+                'missing TEXT NOT NULL, '
+                'fingerprints TEXT NOT NULL, '
+                'hashes TEXT NOT NULL, '
+                'dark_mode TEXT, '
+                'style_names TEXT, '
+                'file_colors_count INTEGER, '
+                'xml_tags TEXT, '
+                'config_version TEXT, '
+                'dominant_colors TEXT, '
+                'canonical_hash TEXT, '
+                'simhash TEXT, '
+                'error TEXT, '
+                'UNIQUE (path, name))'
+            )
+            try:
+                self.connection.execute(
+                    'CREATE VIRTUAL TABLE IF NOT EXISTS schemes_fts '
+                    'USING fts5(name, style_names, xml_tags)'
+                )
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5, fall back to LIKE queries
+                self.fts = False
+
+    def refresh(
+        self, scheme_path: str, scheme_exts: list[str]
+    ) -> Iterator[list[tuple[str, list[str]]]]:
+        """
+        Brings the catalog up to date with the schemes directory or archive,
+        touching only added, changed and removed schemes. Changes are
+        committed and yielded batch by batch, as the schemes are scanned.
+
+        Args:
+            scheme_path (str): The path to the directory or zip archive
+                               containing scheme files.
+            scheme_exts (list[str]): A list of required file extensions for
+                                     each scheme.
+
+        Yields:
+            list[tuple[str, list[str]]]: Added, changed and removed schemes
+                                         paired with their missing files.
+                                         Removed schemes miss all files.
+        """
+        stored: dict[str, sqlite3.Row] = {
+            row['name']: row for row in self.connection.execute(
+                'SELECT * FROM schemes WHERE path = ?', (scheme_path,)
+            )
+        }
+
+        store: SchemeStore = SchemeStore.create(scheme_path)
+        try:
+            for batch in store.scan(scheme_exts, SCHEME_BATCH_SIZE):
+                # Read files before taking the write lock
+                updates: list[tuple[str, list[str], dict]] = []
+                for name, missing in batch:
+                    row: sqlite3.Row | None = stored.pop(name, None)
+                    update: dict | None = self.read_scheme(
+                        store, name, missing, scheme_exts, row
+                    )
+                    if update is not None:
+                        updates.append((name, missing, update))
+
+                changes: list[tuple[str, list[str]]] = []
+                with self.connection:
+                    for name, missing, update in updates:
+                        if self.update_scheme(store, name, missing, update):
+                            changes.append((name, missing))
+                if changes:
+                    yield changes
+        finally:
+            store.close()
+
+        # Schemes that disappeared from the directory
+        if stored:
+            with self.connection:
+                for row in stored.values():
+                    self.delete_scheme(row['id'])
+            yield [
+                (name, [f'{name}.{ext}' for ext in scheme_exts])
+                for name in stored
+            ]
+
+    def read_scheme(
+        self, store: SchemeStore, name: str, missing: list[str],
+        scheme_exts: list[str], row: sqlite3.Row | None
+    ) -> dict | None:
+        """
+        Reads the files of a scheme if they changed since it was cataloged.
+        Nothing is written, so it runs outside of transactions.
+
+        Args:
+            store (SchemeStore): The store containing scheme files.
+            name (str): The name of the scheme.
+            missing (list[str]): Missing files of the scheme.
+            scheme_exts (list[str]): A list of required file extensions.
+            row (sqlite3.Row | None): The stored entry, None for a new scheme.
+
+        Returns:
+            dict | None: The update of the entry, or None if no file
+                         changed. It holds the id of the stored entry ('id',
+                         None for a new scheme), the new 'fingerprints' and
+                         'hashes', and the extracted 'metadata', None if only
+                         the fingerprints changed.
+        """
+        exts: list[str] = [
+            ext for ext in scheme_exts if f'{name}.{ext}' not in missing
+        ]
+        fingerprints: dict[str, list[int] | None] = {}
+        for ext in exts:
+            fingerprint = store.get_fingerprint(name, ext)
+            fingerprints[ext] = list(fingerprint) if fingerprint else None
+        if row is not None and json.loads(row['fingerprints']) == fingerprints:
+            return None
+
+        # Read changed files and hash their content
+        contents: dict[str, bytes] = {
+            ext: store.read(name, ext) for ext in exts
+        }
+        hashes: dict[str, str] = {
+            ext: hashlib.sha256(content).hexdigest()
+            for ext, content in contents.items()
+        }
+
+        # Only touched files keep the metadata valid
+        touched: bool = (
+            row is not None and json.loads(row['hashes']) == hashes
+        )
+
+        return {
+            'id': row['id'] if row is not None else None,
+            'fingerprints': fingerprints,
+            'hashes': hashes,
+            'metadata': None if touched else self.extract_metadata(contents)
+        }
+
+    def update_scheme(
+        self, store: SchemeStore, name: str, missing: list[str],
+        update: dict
+    ) -> bool:
+        """
+        Writes the update of a catalog entry read by read_scheme. Runs
+        within a transaction.
+
+        Args:
+            store (SchemeStore): The store containing scheme files.
+            name (str): The name of the scheme.
+            missing (list[str]): Missing files of the scheme.
+            update (dict): The update of the entry.
+
+        Returns:
+            bool: True if the entry was added or changed.
+        """
+        metadata: dict | None = update['metadata']
+        if metadata is None:
+            self.connection.execute(
+                'UPDATE schemes SET fingerprints = ? WHERE id = ?',
+                (json.dumps(update['fingerprints']), update['id'])
+            )
+            return False
+
+        values: tuple = (
+            store.path, name, json.dumps(missing),
+            json.dumps(update['fingerprints']),
+            json.dumps(update['hashes']), metadata['dark_mode'],
+            json.dumps(metadata['style_names']),
+            metadata['file_colors_count'], json.dumps(metadata['xml_tags']),
+            metadata['config_version'],
+            json.dumps(metadata['dominant_colors']),
+            metadata['canonical_hash'], metadata['simhash'], metadata['error']
+        )
+
+        if update['id'] is not None:
+            self.delete_scheme(update['id'])
+        cursor: sqlite3.Cursor = self.connection.execute(
+            'INSERT INTO schemes (path, name, missing, fingerprints, hashes, '
+            'dark_mode, style_names, file_colors_count, xml_tags, '
+            'config_version, dominant_colors, canonical_hash, simhash, error) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', values
+        )
+        if self.fts:
+            self.connection.execute(
+                'INSERT INTO schemes_fts (rowid, name, style_names, xml_tags) '
+                'VALUES (?, ?, ?, ?)',
+                (
+                    cursor.lastrowid, name,
+                    ' '.join(metadata['style_names']),
+                    ' '.join(metadata['xml_tags'])
+                )
+            )
+
+        return True
+
+    def delete_scheme(self, scheme_id: int) -> None:
+        """
+        Deletes a catalog entry.
+
+        Args:
+            scheme_id (int): The id of the entry.
+        """
+        self.connection.execute(
+            'DELETE FROM schemes WHERE id = ?', (scheme_id,)
+        )
+        if self.fts:
+            self.connection.execute(
+                'DELETE FROM schemes_fts WHERE rowid = ?', (scheme_id,)
+            )
+
+    def extract_metadata(self, contents: dict[str, bytes]) -> dict:
+        """
+        Extracts metadata from the content of scheme files.
+
+        Args:
+            contents (dict[str, bytes]): Content of scheme files, keyed by
+                                         file type.
+
+        Returns:
+            dict: Scheme metadata. Parse errors are stored in 'error' key
+                  rather than raised, so broken schemes are still listed.
+                  Broken schemes have no content fingerprints.
+        """
+        metadata: dict = {
+            'dark_mode': None, 'style_names': [], 'file_colors_count': None,
+            'xml_tags': [], 'config_version': None, 'dominant_colors': [],
+            'canonical_hash': None, 'simhash': None, 'error': None
+        }
+        colors: list[int] = []
+        features: list[str] = []
+
+        try:
+            if 'cfg' in contents:
+                cfg = SchemeFileManager.get_cfg(
+                    contents['cfg'].decode('utf-8').splitlines()
+                )
+                metadata['dark_mode'] = cfg.get('DarkMode')
+                features.extend(DuplicateFinder.get_cfg_features(cfg))
+
+            if 'json' in contents:
+                json_data: dict = SchemeFileManager.parse_json(
+                    contents['json'].decode('utf-8')
+                )
+                metadata['style_names'] = [
+                    style.get('Name') for style in json_data.get('Styles', [])
+                    if isinstance(style, dict)
+                ]
+                metadata['file_colors_count'] = len(
+                    json_data.get('FileColors', [])
+                )
+                colors.extend(ColorUtils.extract_json_colors(json_data))
+                features.extend(DuplicateFinder.get_json_features(json_data))
+
+            if 'xml' in contents:
+                xml_root = defusedxmlET.fromstring(contents['xml'])
+                metadata['xml_tags'] = [child.tag for child in xml_root]
+                metadata['config_version'] = (
+                    xml_root.attrib.get('ConfigVersion')
+                )
+                colors.extend(
+                    ColorUtils.extract_xml_colors(xml_root.find('./Colors'))
+                )
+                features.extend(DuplicateFinder.get_xml_features(xml_root))
+
+            metadata['canonical_hash'] = DuplicateFinder.get_hash(features)
+            metadata['simhash'] = (
+                f'{DuplicateFinder.get_simhash(features):016x}'
+            )
+        except Exception as e:
+            metadata['error'] = str(e)
+
+        metadata['dominant_colors'] = ColorUtils.get_dominant_colors(
+            colors, self.dominant_colors
+        )
+
+        return metadata
+
+    def list_schemes(self, scheme_path: str) -> list[tuple[str, list[str]]]:
+        """
+        Lists cataloged schemes of a directory without touching its files.
+
+        Args:
+            scheme_path (str): The path to the directory or zip archive
+                               containing scheme files.
+
+        Returns:
+            list[tuple[str, list[str]]]: Sorted scheme names paired with their
+                                         missing files.
+        """
+        return [
+            (row['name'], json.loads(row['missing']))
+            for row in self.connection.execute(
+                'SELECT name, missing FROM schemes WHERE path = ? '
+                'ORDER BY name', (scheme_path,)
+            )
+        ]
+
+    def get_scheme(self, scheme_path: str, name: str) -> dict | None:
+        """
+        Gets the catalog entry of a scheme.
+
+        Args:
+            scheme_path (str): The path to the directory or zip archive
+                               containing scheme files.
+            name (str): The name of the scheme.
+
+        Returns:
+            dict | None: Scheme metadata, or None if the scheme is unknown.
+        """
+        row: sqlite3.Row | None = self.connection.execute(
+            'SELECT * FROM schemes WHERE path = ? AND name = ?',
+            (scheme_path, name)
+        ).fetchone()
+
+        return self.row_to_dict(row) if row is not None else None
+
+    def search(
+        self, scheme_path: str, text: str | None = None,
+        dark_mode: str | None = None, config_version: str | None = None,
+        xml_tag: str | None = None, style_name: str | None = None,
+        complete: bool = True
+    ) -> list[dict]:
+        """
+        Searches the catalog with full-text and attribute filters.
+
+        Args:
+            scheme_path (str): The path to the directory or zip archive
+                               containing scheme files.
+            text (str | None): Full-text query over scheme names, style names
+                               and xml tags, words are matched as prefixes.
+            dark_mode (str | None): Required 'DarkMode' value.
+            config_version (str | None): Required xml 'ConfigVersion' value.
+            xml_tag (str | None): Required xml tag.
+            style_name (str | None): Required style name.
+            complete (bool): Whether to return complete schemes only.
+
+        Returns:
+            list[dict]: Metadata of matching schemes, sorted by name.
+        """
+        query: str = 'SELECT * FROM schemes WHERE path = ?'
+        params: list = [scheme_path]
+
+        if text:
+            words: list[str] = text.split()
+            if self.fts:
+                query += (
+                    ' AND id IN (SELECT rowid FROM schemes_fts '
+                    'WHERE schemes_fts MATCH ?)'
+                )
+                params.append(' '.join(
+                    '"{}"*'.format(word.replace('"', '""')) for word in words
+                ))
+            else:
+                for word in words:
+                    query += (
+                        ' AND (name LIKE ? OR style_names LIKE ? '
+                        'OR xml_tags LIKE ?)'
+                    )
+                    params.extend([f'%{word}%'] * 3)
+        if dark_mode is not None:
+            query += ' AND dark_mode = ?'
+            params.append(dark_mode)
+        if config_version is not None:
+            query += ' AND config_version = ?'
+            params.append(config_version)
+        if xml_tag is not None:
+            query += (
+                ' AND EXISTS (SELECT 1 FROM json_each(xml_tags) '
+                'WHERE value = ?)'
+            )
+            params.append(xml_tag)
+        if style_name is not None:
+            query += (
+                ' AND EXISTS (SELECT 1 FROM json_each(style_names) '
+                'WHERE value = ?)'
+            )
+            params.append(style_name)
+        if complete:
+            query += ' AND missing = \'[]\''
+
+        return [
+            self.row_to_dict(row)
+            for row in self.connection.execute(
+                f'{query} ORDER BY name', params
+            )
+        ]
+
+    @staticmethod
+    def row_to_dict(row: sqlite3.Row) -> dict:
+        """
+        Converts a catalog row to a metadata dictionary.
+
+        Args:
+            row (sqlite3.Row): The catalog row.
+
+        Returns:
+            dict: Scheme metadata with json columns decoded.
+        """
+        return {
+            'name': row['name'],
+            'path': row['path'],
+            'missing': json.loads(row['missing']),
+            'darkMode': row['dark_mode'],
+            'styleNames': json.loads(row['style_names']),
+            'fileColorsCount': row['file_colors_count'],
+            'xmlTags': json.loads(row['xml_tags']),
+            'configVersion': row['config_version'],
+            'dominantColors': json.loads(row['dominant_colors']),
+            'canonicalHash': row['canonical_hash'],
+            'simhash': (
+                int(row['simhash'], 16) if row['simhash'] is not None else None
+            ),
+            'hashes': json.loads(row['hashes']),
+            'error': row['error']
+        }
@@ -0,0 +1,303 @@
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import configobj
+import defusedxml.ElementTree as defusedxmlET
+from app.config import (
+    APP_VERSION, CHECK_CHUNK_SIZE, CONTRAST_MIN_RATIO, CONTRAST_PAIRS,
+    SCHEME_BATCH_SIZE, SCHEME_RESOLVE_CACHE_SIZE, SCHEME_SCHEMAS
+)
+from app.contrast import ContrastAuditor
+from app.inherit import SchemeResolver
+from app.store import SchemeStore
+from app.utils import DCFileManager
+from app.validate import SchemeValidator
+
+class SchemeChecker:
+    """
+    Checks every scheme of the scheme roots at once: required files, the
+    structure of each file, required XML tags, 'ConfigVersion'
+    compatibility with the DC configuration and WCAG contrast of paired
+    foreground and background colors.
+
+    Schemes inheriting from base schemes are checked resolved. Schemes are
+    parsed and validated in a process pool. Results are cached by content
+    hash of the scheme files, so a rerun parses only changed schemes. The
+    cache is pruned to the schemes of the last run.
+
+    Attributes:
+        roots (list[str]): The scheme roots.
+        scheme_exts (list[str]): A list of required file extensions for each
+                                 scheme.
+        xml_tags (list[str]): Paths of the XML tags required in xml files.
+        cache_path (str): The path to the cache file.
+        workers (int | None): The number of worker processes, the number of
+                              CPUs if None.
+    """
+    def __init__(
+        self, roots: list[str], scheme_exts: list[str], xml_tags: list[str],
+        cache_path: str, workers: int | None = None
+    ) -> None:
+        """
+        Initializes the SchemeChecker class.
+
+        Args:
+            roots (list[str]): The scheme roots.
+            scheme_exts (list[str]): A list of required file extensions for
+                                     each scheme.
+            xml_tags (list[str]): Paths of the XML tags required in xml
+                                  files.
+            cache_path (str): The path to the cache file.
+            workers (int | None): The number of worker processes, the number
+                                  of CPUs if None.
+        """
+        self.roots: list[str] = roots
+        self.scheme_exts: list[str] = scheme_exts
+        self.xml_tags: list[str] = xml_tags
+        self.cache_path: str = cache_path
+        self.workers: int | None = workers
+
+    @staticmethod
+    def get_target_version(xml_config_path: str) -> str | None:
+        """
+        Gets the 'ConfigVersion' of the DC xml configuration file.
+
+        Args:
+            xml_config_path (str): The path to the xml configuration file,
+                                   may contain environment variables.
+
+        Returns:
+            str | None: The version, or None if the file has none.
+
+        Raises:
+            FileNotFoundError: If the configuration file does not exist.
+        """
+        return defusedxmlET.parse(
+            DCFileManager.get_config(xml_config_path)
+        ).getroot().get('ConfigVersion')
+
+    @staticmethod
+    def check_files(contents: dict[str, bytes], xml_tags: list[str]) -> dict:
+        """
+        Parses and validates the files of a scheme, runs in a worker process.
+
+        Args:
+            contents (dict[str, bytes]): Content of scheme files, keyed by
+                                         file type.
+            xml_tags (list[str]): Paths of the XML tags required in the xml
+                                  file.
+
+        Returns:
+            dict: Errors keyed by file type ('errors'), the 'ConfigVersion'
+                  of the xml file ('configVersion') and the contrast audit
+                  ('contrast'), see ContrastAuditor.audit.
+        """
+        errors: dict[str, list[str]] = {}
+        config_version: str | None = None
+        configs: dict[str, object] = {}
+
+        for file_type, content in contents.items():
+            if file_type not in SCHEME_SCHEMAS:
+                continue
+            try:
+                config = SchemeValidator.parse(file_type, io.BytesIO(content))
+            except ValueError as e:
+                errors[file_type] = [str(e)]
+                continue
+
+            configs[file_type] = config
+            if file_type == 'xml':
+                config_version = config.getroot().get('ConfigVersion')
+            file_errors: list[str] = SchemeValidator.validate(
+                file_type, config, xml_tags
+            )
+            if file_errors:
+                errors[file_type] = file_errors
+
+        contrast: dict = ContrastAuditor.audit(
+            configs.get('json'),
+            configs['xml'].getroot() if 'xml' in configs else None,
+            CONTRAST_PAIRS, CONTRAST_MIN_RATIO
+        )
+
+        return {
+            'errors': errors, 'configVersion': config_version,
+            'contrast': contrast
+        }
+
+    def get_key(self, contents: dict[str, bytes]) -> str:
+        """
+        Gets the cache key of a scheme, covering the content of its files and
+        all options affecting the result.
+
+        Args:
+            contents (dict[str, bytes]): Content of scheme files, keyed by
+                                         file type.
+
+        Returns:
+            str: The cache key.
+        """
+        digest = hashlib.sha256(json.dumps([
+            APP_VERSION, self.xml_tags, CONTRAST_PAIRS, CONTRAST_MIN_RATIO
+        ]).encode('utf-8'))
+        for file_type in sorted(contents):
+            digest.update(f'{file_type}\0'.encode('utf-8'))
+            digest.update(hashlib.sha256(contents[file_type]).digest())
+
+        return digest.hexdigest()
+
+    def load_cache(self) -> dict[str, dict]:
+        """
+        Reads the cached results.
+
+        Returns:
+            dict[str, dict]: Results keyed by cache key.
+        """
+        try:
+            with open(self.cache_path, encoding='utf-8') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def save_cache(self, cache: dict[str, dict]) -> None:
+        """
+        Writes the cached results, replacing the cache file atomically.
+
+        Args:
+            cache (dict[str, dict]): Results keyed by cache key.
+        """
+        temp_path: str = f'{self.cache_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(cache, cache_file, ensure_ascii=False)
+        os.replace(temp_path, self.cache_path)
+
+    def collect(self) -> tuple[list[dict], dict[str, str]]:
+        """
+        Reads schemes of all roots, including copies shadowed by another
+        root. Complete schemes inheriting from base schemes are resolved.
+
+        Returns:
+            tuple[list[dict], dict[str, str]]: Schemes with their root
+                                               ('root'), name ('name'),
+                                               missing files ('missing'),
+                                               file content ('contents')
+                                               and the resolution error
+                                               ('resolveError'), and errors
+                                               keyed by the failed root.
+        """
+        schemes: list[dict] = []
+        errors: dict[str, str] = {}
+        resolver = SchemeResolver(SCHEME_RESOLVE_CACHE_SIZE)
+
+        for root in self.roots:
+            store: SchemeStore = SchemeStore.create(root)
+            root_schemes: list[dict] = []
+            try:
+                for batch in store.scan(self.scheme_exts, SCHEME_BATCH_SIZE):
+                    for name, missing in batch:
+                        root_schemes.append({
+                            'root': root, 'name': name, 'missing': missing,
+                            'contents': {
+                                ext: store.read(name, ext)
+                                for ext in self.scheme_exts
+                                if f'{name}.{ext}' not in missing
+                            }
+                        })
+                for scheme in root_schemes:
+                    scheme['resolveError'] = None
+                    if scheme['missing']:
+                        continue
+                    try:
+                        resolved: dict[str, bytes] | None = (
+                            resolver.resolve(store, scheme['name'])
+                        )
+                    except (
+                        OSError, ValueError, configobj.ConfigObjError
+                    ) as e:
+                        scheme['resolveError'] = str(e)
+                        continue
+                    if resolved is not None:
+                        scheme['contents'].update(resolved)
+            except Exception as e:
+                errors[root] = str(e)
+            finally:
+                store.close()
+            schemes.extend(
+                sorted(root_schemes, key=lambda scheme: scheme['name'])
+            )
+
+        return schemes, errors
+
+    def check(self, target_version: str | None) -> dict:
+        """
+        Checks all schemes and builds the report.
+
+        Args:
+            target_version (str | None): The 'ConfigVersion' of the DC xml
+                                         configuration file, None to skip
+                                         the compatibility check.
+
+        Returns:
+            dict: The report with the target version ('targetConfigVersion'),
+                  counts ('summary'), results of each scheme ('schemes') and
+                  errors keyed by the failed root ('rootErrors').
+        """
+        schemes, root_errors = self.collect()
+        cache: dict[str, dict] = self.load_cache()
+        keys: list[str] = [
+            self.get_key(scheme['contents']) for scheme in schemes
+        ]
+
+        # Identical schemes are checked once
+        pending: dict[str, dict[str, bytes]] = {
+            key: scheme['contents'] for key, scheme in zip(keys, schemes)
+            if key not in cache
+        }
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                cache.update(zip(pending, executor.map(
+                    self.check_files, pending.values(), repeat(self.xml_tags),
+                    chunksize=CHECK_CHUNK_SIZE
+                )))
+        self.save_cache({key: cache[key] for key in keys})
+
+        results: list[dict] = []
+        for key, scheme in zip(keys, schemes):
+            result: dict = cache[key]
+            config_version: str | None = result['configVersion']
+            errors: dict[str, list[str]] = result['errors']
+            if scheme['resolveError'] is not None:
+                # Bases are declared in the cfg file, errors of the partial
+                # files would be misleading
+                errors = {'cfg': [scheme['resolveError']]}
+            results.append({
+                'name': scheme['name'], 'root': scheme['root'],
+                'valid': not scheme['missing'] and not errors,
+                'missing': scheme['missing'], 'errors': errors,
+                'configVersion': config_version,
+                'compatible': None
+                if target_version is None or config_version is None
+                else config_version == target_version,
+                'contrast': result['contrast']
+            })
+
+        return {
+            'targetConfigVersion': target_version,
+            'summary': {
+                'schemes': len(results),
+                'valid': sum(result['valid'] for result in results),
+                'invalid': sum(not result['valid'] for result in results),
+                'incompatible': sum(
+                    result['compatible'] is False for result in results
+                ),
+                'lowContrast': sum(
+                    bool(result['contrast']['failing']) for result in results
+                ),
+                'checked': len(pending)
+            },
+            'schemes': results,
+            'rootErrors': root_errors
+        }
@@ -0,0 +1,914 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from app.catalog import SchemeCatalog
+from app.check import SchemeChecker
+from app.colors import ColorUtils
+from app.config import (
+    APP_NAME, APP_VERSION, CATALOG_PATH, CHECK_CACHE_PATH, DIFF_VALUE_WIDTH,
+    DUPLICATE_MAX_DISTANCE,
+    HISTORY_PATH, HISTORY_SIZE, PALETTE_CELL_SIZE, PALETTE_RESULTS,
+    SCHEDULE_STATE_PATH,
+    SCHEME_DOMINANT_COLORS, SCHEME_MATERIALIZE_CACHE_SIZE,
+    SCHEME_PRELOAD_CACHE_SIZE, TRANSFORM_SUFFIX, WATCH_DEBOUNCE,
+    WATCH_POLL_INTERVAL
+)
+from app.diff import SchemeDiff
+from app.duplicates import DuplicateFinder
+from app.export import SchemeExporter
+from app.history import ApplyHistory
+from app.index import SchemeIndex
+from app.materialize import SchemeMaterializer
+from app.palette import PaletteIndex
+from app.preload import SchemePreloader
+from app.schedule import SchemeScheduler
+from app.scheme import Scheme
+from app.server import SchemeServer, ServerClient
+from app.transform import ColorTransformer
+from app.utils import SchemeFileManager
+from app.watch import SchemeWatcher
+
+class AppCli:
+    """
+    The command line interface, used when the application is started with
+    arguments.
+
+    Attributes:
+        user_config (dict): The configuration dictionary loaded from user
+                            settings.
+        parser (argparse.ArgumentParser): The command line parser.
+        resident (bool): Whether the interface runs in the resident server
+                         and keeps its state warm between commands.
+        index (SchemeIndex | None): The scheme index kept by the resident
+                                    interface.
+        preloader (SchemePreloader | None): The scheme preloader of the
+                                            resident interface.
+
+    Args:
+        user_config (dict): The configuration dictionary loaded from user
+                            settings.
+        resident (bool): Whether the interface runs in the resident server.
+    """
+    def __init__(self, user_config: dict, resident: bool = False) -> None:
+        """
+        Initializes the AppCli class by setting up the command line parser.
+        """
+        self.user_config: dict = user_config
+        self.parser: argparse.ArgumentParser = self.build_parser()
+        self.resident: bool = resident
+        self.index: SchemeIndex | None = None
+        self.preloader: SchemePreloader | None = (
+            SchemePreloader(
+                SCHEME_PRELOAD_CACHE_SIZE,
+                SchemeMaterializer(SCHEME_MATERIALIZE_CACHE_SIZE)
+            ) if resident else None
+        )
+
+    def build_parser(self) -> argparse.ArgumentParser:
+        """
+        Builds the command line parser with all commands.
+
+        Returns:
+            argparse.ArgumentParser: The command line parser.
+        """
+        parser = argparse.ArgumentParser(
+            prog='dc-themer', description=f'{APP_NAME} v{APP_VERSION}'
+        )
+        commands = parser.add_subparsers(dest='command', required=True)
+
+        # List schemes
+        list_parser = commands.add_parser(
+            'list', help='list schemes from the catalog'
+        )
+        list_parser.add_argument(
+            '-s', '--search', help='full-text search in scheme names, style '
+            'names and xml tags'
+        )
+        list_parser.add_argument(
+            '--dark-mode', help='only schemes with this DarkMode value'
+        )
+        list_parser.add_argument(
+            '--config-version', help='only schemes with this xml '
+            'ConfigVersion'
+        )
+        list_parser.add_argument(
+            '--tag', help='only schemes containing this xml tag'
+        )
+        list_parser.add_argument(
+            '--style', help='only schemes containing this style name'
+        )
+        list_parser.add_argument(
+            '--all', action='store_true', help='include incomplete schemes'
+        )
+        similar_group = list_parser.add_mutually_exclusive_group()
+        similar_group.add_argument(
+            '--similar', metavar='SCHEME', help='only schemes with a palette '
+            'similar to this scheme, most similar first'
+        )
+        similar_group.add_argument(
+            '--near', metavar='COLOR', help='only schemes with a color close '
+            'to this color (#RRGGBB, $00BBGGRR or decimal), closest first'
+        )
+        list_parser.add_argument(
+            '--hide-duplicates', action=argparse.BooleanOptionalAction,
+            help='list one scheme of each group of exact duplicates '
+            '(default: hideDuplicates of the configuration)'
+        )
+        list_parser.add_argument(
+            '-n', '--limit', type=int, default=PALETTE_RESULTS,
+            help='maximum number of similar schemes (default: '
+            f'{PALETTE_RESULTS})'
+        )
+        list_parser.add_argument(
+            '--json', action='store_true', help='print scheme metadata as '
+            'json'
+        )
+        list_parser.add_argument(
+            '--refresh', action='store_true', help='refresh the catalog first'
+        )
+        list_parser.set_defaults(handler=self.list_schemes)
+
+        # Refresh catalog
+        refresh_parser = commands.add_parser(
+            'refresh', help='refresh the catalog from the scheme paths'
+        )
+        refresh_parser.set_defaults(handler=self.refresh_catalog)
+
+        # Apply scheme
+        apply_parser = commands.add_parser('apply', help='apply a scheme')
+        apply_parser.add_argument('scheme', help='name of the scheme')
+        apply_parser.add_argument(
+            '--auto-dark-mode', action='store_true',
+            help='force auto Dark mode'
+        )
+        apply_parser.add_argument(
+            '--files', nargs='+', choices=['cfg', 'json', 'xml'],
+            help='apply only these configuration files (default: all)'
+        )
+        apply_parser.add_argument(
+            '--tags', nargs='+', metavar='TAG', help='apply only these XML '
+            'tags (default: xmlTags of the user configuration)'
+        )
+        apply_parser.add_argument(
+            '--dry-run', action='store_true', help='print changes applying '
+            'the scheme would make, without writing anything'
+        )
+        apply_parser.add_argument(
+            '-v', '--verbose', action='store_true', help='print time spent '
+            'waiting for and holding the DC profile lock'
+        )
+        apply_parser.set_defaults(handler=self.apply_scheme)
+
+        # Check schemes
+        check_parser = commands.add_parser(
+            'check', help='validate all schemes and report their '
+            'compatibility with the DC configuration and their contrast'
+        )
+        check_parser.add_argument(
+            '-o', '--output', metavar='FILE', help='write the json report to '
+            'this file (default: standard output)'
+        )
+        check_parser.add_argument(
+            '-j', '--workers', type=int, help='number of worker processes '
+            '(default: number of CPUs)'
+        )
+        check_parser.set_defaults(handler=self.check)
+
+        # Find duplicates
+        duplicates_parser = commands.add_parser(
+            'duplicates', help='report duplicate and near-duplicate schemes'
+        )
+        duplicates_parser.add_argument(
+            '-d', '--max-distance', type=int, default=DUPLICATE_MAX_DISTANCE,
+            help='maximum number of differing fingerprint bits of near '
+            f'duplicates (default: {DUPLICATE_MAX_DISTANCE})'
+        )
+        duplicates_parser.add_argument(
+            '--refresh', action='store_true', help='refresh the catalog first'
+        )
+        duplicates_parser.set_defaults(handler=self.find_duplicates)
+
+        # Export scheme
+        export_parser = commands.add_parser(
+            'export', help='export the current DC configuration as a scheme'
+        )
+        export_parser.add_argument(
+            'scheme', help='name of the scheme, or the name prefix with '
+            '--all-styles'
+        )
+        export_style_group = export_parser.add_mutually_exclusive_group()
+        export_style_group.add_argument(
+            '--style', help='export this style (default: the style matching '
+            'DarkMode)'
+        )
+        export_style_group.add_argument(
+            '--all-styles', action='store_true', help='export every style as '
+            'a separate scheme'
+        )
+        export_parser.add_argument(
+            '--path', help='directory to export to (default: the first scheme '
+            'path)'
+        )
+        export_parser.add_argument(
+            '--force', action='store_true', help='overwrite existing schemes'
+        )
+        export_parser.set_defaults(handler=self.export)
+
+        # Transform colors
+        transform_parser = commands.add_parser(
+            'transform', help='derive new schemes by transforming scheme '
+            'colors'
+        )
+        transform_source_group = (
+            transform_parser.add_mutually_exclusive_group(required=True)
+        )
+        transform_source_group.add_argument(
+            'scheme', nargs='?', help='name of the scheme'
+        )
+        transform_source_group.add_argument(
+            '--all', action='store_true', help='transform every complete '
+            'scheme'
+        )
+        transform_parser.add_argument(
+            '-t', '--transform', action='append', required=True,
+            metavar='SPEC', help='transform to apply, in order: invert, '
+            'hue=DEGREES, saturation=FACTOR, contrast=FACTOR or '
+            'remap=COLOR,COLOR,...'
+        )
+        transform_parser.add_argument(
+            '--name', help='name of the new scheme (default: the scheme name '
+            'and the suffix)'
+        )
+        transform_parser.add_argument(
+            '--suffix', default=TRANSFORM_SUFFIX, help='suffix of the new '
+            f'scheme names (default: {TRANSFORM_SUFFIX})'
+        )
+        transform_parser.add_argument(
+            '--path', help='directory to write to (default: the first scheme '
+            'path)'
+        )
+        transform_parser.add_argument(
+            '--force', action='store_true', help='overwrite existing schemes'
+        )
+        transform_parser.add_argument(
+            '-j', '--workers', type=int, help='number of worker processes '
+            'with --all (default: number of CPUs)'
+        )
+        transform_parser.set_defaults(handler=self.transform)
+
+        # Undo applies
+        undo_parser = commands.add_parser(
+            'undo', help='undo the latest applied schemes'
+        )
+        undo_parser.add_argument(
+            '-n', '--count', type=int, default=1, help='number of applies to '
+            'undo (default: 1)'
+        )
+        undo_parser.set_defaults(handler=self.undo)
+
+        # Watch for changes
+        watch_parser = commands.add_parser(
+            'watch', help='watch scheme paths and DC configuration files for '
+            'changes'
+        )
+        watch_parser.add_argument(
+            '--apply', metavar='SCHEME', help='apply this scheme and re-apply '
+            'it whenever its files or DC configuration files change'
+        )
+        watch_parser.add_argument(
+            '--auto-dark-mode', action='store_true',
+            help='force auto Dark mode'
+        )
+        watch_parser.set_defaults(handler=self.watch)
+
+        # Scheduled switching
+        schedule_parser = commands.add_parser(
+            'schedule', help='switch schemes on the configured schedule'
+        )
+        schedule_parser.add_argument(
+            '--once', action='store_true', help='apply the currently due '
+            'scheme and exit'
+        )
+        schedule_parser.set_defaults(handler=self.schedule)
+
+        # Resident server
+        serve_parser = commands.add_parser(
+            'serve', help='run the resident server answering apply, list and '
+            'refresh commands'
+        )
+        serve_parser.add_argument(
+            '--stop', action='store_true', help='stop the running server'
+        )
+        serve_parser.set_defaults(handler=self.serve)
+
+        return parser
+
+    def run(self, argv: list[str]) -> int:
+        """
+        Parses the arguments and runs the selected command.
+
+        Args:
+            argv (list[str]): The command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        args: argparse.Namespace = self.parser.parse_args(argv)
+
+        try:
+            return args.handler(args)
+        except Exception as e:
+            print(f'Error: {e}', file=sys.stderr)
+            return 1
+
+    def open_catalog(self) -> SchemeCatalog:
+        """
+        Opens the scheme catalog.
+
+        Returns:
+            SchemeCatalog: The scheme catalog.
+        """
+        return SchemeCatalog(CATALOG_PATH, SCHEME_DOMINANT_COLORS)
+
+    def build_index(self, refresh: bool) -> tuple[SchemeIndex, int]:
+        """
+        Builds the merged index of all scheme paths, refreshing their catalog
+        first if requested. Failing scheme paths are reported as warnings.
+        The resident interface reuses its index unless refreshing.
+
+        Args:
+            refresh (bool): Whether to refresh the catalog of each path.
+
+        Returns:
+            tuple[SchemeIndex, int]: The scheme index and the number of
+                                     added, changed and removed schemes.
+
+        Raises:
+            Exception: The error of the first scheme path, if all failed.
+        """
+        if self.index is not None and not refresh:
+            return self.index, 0
+
+        index = SchemeIndex(
+            SchemeIndex.get_roots(self.user_config['schemes']['path']),
+            self.user_config['schemes']['extensions'], CATALOG_PATH,
+            SCHEME_DOMINANT_COLORS
+        )
+        changes: list[int] = []
+
+        def add_batch(kind: str, root: str, batch: list) -> None:
+            index.update(root, batch)
+            if kind == 'changed':
+                changes.append(len(batch))
+
+        errors: dict[str, Exception] = index.build(add_batch, refresh)
+        if len(errors) == len(index.roots):
+            raise errors[index.roots[0]]
+        for root, error in errors.items():
+            print(f'Warning: {root}: {error}', file=sys.stderr)
+        if self.resident:
+            self.index = index
+
+        return index, sum(changes)
+
+    def list_schemes(self, args: argparse.Namespace) -> int:
+        """
+        Lists schemes matching the filters.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        near: int | None = None
+        if args.near is not None:
+            near = ColorUtils.parse_color(args.near)
+            if near is None:
+                print(f'Invalid color: {args.near}', file=sys.stderr)
+                return 1
+
+        index: SchemeIndex = self.build_index(args.refresh)[0]
+        catalog: SchemeCatalog = self.open_catalog()
+        reference: dict | None = None
+
+        try:
+            schemes: list[dict] = self.search_catalog(
+                index, catalog, text=args.search, dark_mode=args.dark_mode,
+                config_version=args.config_version, xml_tag=args.tag,
+                style_name=args.style, complete=not args.all
+            )
+            if args.similar is not None:
+                # The reference scheme may be filtered out itself
+                reference_root: str | None = index.resolve(args.similar)
+                if reference_root is not None:
+                    reference = catalog.get_scheme(
+                        reference_root, args.similar
+                    )
+        finally:
+            catalog.close()
+        schemes.sort(key=lambda entry: entry['name'])
+
+        hide_duplicates: bool = (
+            self.user_config['schemes'].get('hideDuplicates', False)
+            if args.hide_duplicates is None else args.hide_duplicates
+        )
+        if hide_duplicates:
+            hidden: set[str] = DuplicateFinder.get_hidden(schemes)
+            schemes = [
+                entry for entry in schemes if entry['name'] not in hidden
+            ]
+
+        if args.similar is not None or near is not None:
+            if args.similar is not None and reference is None:
+                print(f'Scheme not found: {args.similar}', file=sys.stderr)
+                return 1
+
+            palette_index: PaletteIndex = PaletteIndex(PALETTE_CELL_SIZE)
+            palette_index.add_entries(schemes)
+            try:
+                if near is not None:
+                    ranked: list[tuple[str, float]] = palette_index.near_color(
+                        near, args.limit
+                    )
+                else:
+                    palette_index.add_entries([reference])
+                    ranked = palette_index.similar(args.similar, args.limit)
+            except KeyError as e:
+                print(e.args[0], file=sys.stderr)
+                return 1
+
+            # Order by distance, keeping the catalog metadata
+            entries: dict[str, dict] = {
+                entry['name']: entry for entry in schemes
+            }
+            schemes = [
+                {**entries[name], 'distance': distance}
+                for name, distance in ranked
+            ]
+
+        if args.json:
+            print(json.dumps(schemes, ensure_ascii=False, indent=2))
+        else:
+            for scheme in schemes:
+                print(scheme['name'])
+
+        return 0
+
+    @staticmethod
+    def search_catalog(
+        index: SchemeIndex, catalog: SchemeCatalog, **filters: object
+    ) -> list[dict]:
+        """
+        Searches the catalog of all scheme paths, skipping copies shadowed by
+        a scheme path of higher precedence.
+
+        Args:
+            index (SchemeIndex): The scheme index.
+            catalog (SchemeCatalog): The open catalog.
+            **filters (object): Filters passed to SchemeCatalog.search.
+
+        Returns:
+            list[dict]: Metadata of matching schemes.
+        """
+        return [
+            entry for root in index.roots
+            for entry in catalog.search(root, **filters)
+            if index.resolve(entry['name']) == root
+        ]
+
+    def find_duplicates(self, args: argparse.Namespace) -> int:
+        """
+        Prints the json report of duplicate and near-duplicate schemes.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        index: SchemeIndex = self.build_index(args.refresh)[0]
+        catalog: SchemeCatalog = self.open_catalog()
+        try:
+            schemes: list[dict] = self.search_catalog(index, catalog)
+        finally:
+            catalog.close()
+
+        found: dict = DuplicateFinder.find(schemes, args.max_distance)
+        report: dict = {
+            'summary': {
+                'schemes': len(schemes),
+                'duplicates': sum(
+                    len(group) - 1 for group in found['duplicates']
+                ),
+                'similar': len(found['similar'])
+            },
+            **found
+        }
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+        return 0
+
+    def refresh_catalog(self, args: argparse.Namespace) -> int:
+        """
+        Refreshes the catalog and prints the number of changed schemes.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        changes: int = self.build_index(True)[1]
+
+        print(f'Catalog refreshed, {changes} scheme(s) changed.')
+
+        return 0
+
+    def apply_scheme(self, args: argparse.Namespace) -> int:
+        """
+        Applies the scheme, verifying it against the catalog first.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        scheme: Scheme = self.create_scheme(
+            args.scheme, args.auto_dark_mode, file_types=args.files,
+            xml_tags=args.tags
+        )[1]
+        if self.preloader is not None:
+            self.preloader.prepare(scheme)
+
+        # Report errors of all scheme files before the version check
+        scheme.validate_sources()
+        source_version, target_version = (
+            scheme.get_config_versions() if 'xml' in scheme.file_types
+            else (None, None)
+        )
+        if source_version != target_version:
+            print(
+                'Warning: XML configuration scheme version mismatch '
+                f'(source scheme: {source_version}, target scheme: '
+                f'{target_version}).', file=sys.stderr
+            )
+
+        if args.dry_run:
+            scheme.discard_materialized()
+            print(SchemeDiff.format(scheme.diff_scheme(), DIFF_VALUE_WIDTH))
+            return 0
+
+        scheme.apply_scheme()
+        print(f'Scheme \'{args.scheme}\' applied successfully.')
+        if args.verbose:
+            wait_time, hold_time = scheme.lock_times
+            print(
+                f'Profile lock waited {wait_time * 1000:.1f} ms, held '
+                f'{hold_time * 1000:.1f} ms.'
+            )
+
+        # Parse the files again in the background for the next command
+        if self.preloader is not None:
+            self.preloader.preload(scheme)
+
+        return 0
+
+    def create_scheme(
+        self, name: str, auto_dark_mode: bool,
+        index: SchemeIndex | None = None,
+        file_types: list[str] | None = None,
+        xml_tags: list[str] | None = None
+    ) -> tuple[SchemeIndex, Scheme]:
+        """
+        Finds the scheme in the merged index, refreshing the catalog if the
+        scheme is unknown or incomplete.
+
+        Args:
+            name (str): The name of the scheme.
+            auto_dark_mode (bool): A flag to force auto dark mode if True.
+            index (SchemeIndex | None): The scheme index to search, built if
+                                        not given.
+            file_types (list[str] | None): The configuration file types to
+                                           apply, all if None.
+            xml_tags (list[str] | None): The XML tags to apply, the
+                                         configured ones if None.
+
+        Returns:
+            tuple[SchemeIndex, Scheme]: The scheme index and the scheme.
+
+        Raises:
+            FileNotFoundError: If the scheme does not exist or is incomplete.
+        """
+        if index is None:
+            index = self.build_index(False)[0]
+        if index.get_missing(name):
+            index = self.build_index(True)[0]
+
+        scheme_path: str | None = index.resolve(name)
+        if scheme_path is None:
+            raise FileNotFoundError(f'Scheme \'{name}\' does not exist.')
+        missing: list[str] = index.get_missing(name)
+        if missing:
+            raise FileNotFoundError(
+                f'Missing required scheme files: {missing}'
+            )
+
+        scheme = Scheme(
+            name, scheme_path,
+            self.user_config['doubleCommander']['configPaths'],
+            self.user_config['doubleCommander']['backupConfigs'],
+            auto_dark_mode,
+            self.user_config['schemes']['xmlTags'] if xml_tags is None
+            else SchemeFileManager.select_xml_tags(
+                self.user_config['schemes']['xmlTags'], xml_tags
+            ), file_types
+        )
+
+        return index, scheme
+
+    def check(self, args: argparse.Namespace) -> int:
+        """
+        Validates all schemes of the scheme paths and writes the json report.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code, 1 if any scheme is invalid.
+        """
+        target_version: str | None = None
+        try:
+            target_version = SchemeChecker.get_target_version(
+                self.user_config['doubleCommander']['configPaths']['xml']
+            )
+        except FileNotFoundError as e:
+            print(
+                f'Warning: {e} ConfigVersion is not checked.', file=sys.stderr
+            )
+
+        checker = SchemeChecker(
+            SchemeIndex.get_roots(self.user_config['schemes']['path']),
+            self.user_config['schemes']['extensions'], [
+                SchemeFileManager.get_xml_tag_path(tag)
+                for tag in self.user_config['schemes']['xmlTags']
+            ], CHECK_CACHE_PATH, args.workers
+        )
+        report: dict = checker.check(target_version)
+        for root, error in report['rootErrors'].items():
+            print(f'Warning: {root}: {error}', file=sys.stderr)
+
+        output: str = json.dumps(report, ensure_ascii=False, indent=2)
+        if args.output is None:
+            print(output)
+        else:
+            with open(args.output, 'w', encoding='utf-8') as report_file:
+                report_file.write(f'{output}\n')
+            summary: dict = report['summary']
+            print(
+                f'{summary["schemes"]} scheme(s) checked, '
+                f'{summary["invalid"]} invalid, {summary["incompatible"]} '
+                f'incompatible, {summary["lowContrast"]} with low contrast.'
+            )
+
+        return 1 if report['summary']['invalid'] else 0
+
+    def export(self, args: argparse.Namespace) -> int:
+        """
+        Exports the current DC configuration as one or more schemes.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+
+        Raises:
+            ValueError: If the scheme path is an archive.
+        """
+        scheme_path: str = args.path or SchemeIndex.get_roots(
+            self.user_config['schemes']['path']
+        )[0]
+        if os.path.isfile(scheme_path):
+            raise ValueError(
+                f'Schemes can not be exported to an archive: {scheme_path}'
+            )
+
+        exporter = SchemeExporter(
+            self.user_config['doubleCommander']['configPaths'],
+            self.user_config['schemes']['xmlTags']
+        )
+        if args.all_styles:
+            names: list[str] = exporter.export_styles(
+                args.scheme, scheme_path, args.force
+            )
+        else:
+            exporter.export(args.scheme, scheme_path, args.style, args.force)
+            names = [args.scheme]
+
+        for name in names:
+            print(f'Scheme \'{name}\' exported to {scheme_path}.')
+
+        return 0
+
+    def transform(self, args: argparse.Namespace) -> int:
+        """
+        Derives new schemes by transforming colors of one or all schemes.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code, 1 if any scheme failed.
+
+        Raises:
+            ValueError: If the scheme path is an archive.
+            FileNotFoundError: If the scheme does not exist or is incomplete.
+        """
+        scheme_path: str = args.path or SchemeIndex.get_roots(
+            self.user_config['schemes']['path']
+        )[0]
+        if os.path.isfile(scheme_path):
+            raise ValueError(
+                f'Schemes can not be written to an archive: {scheme_path}'
+            )
+
+        transformer = ColorTransformer(
+            [ColorTransformer.parse_transform(spec)
+             for spec in args.transform], args.workers
+        )
+        index: SchemeIndex = self.build_index(args.all)[0]
+
+        if not args.all:
+            source_path: str = self.create_scheme(
+                args.scheme, False, index
+            )[1].scheme_path
+            name: str = args.name or f'{args.scheme} {args.suffix}'
+            transformer.derive(
+                source_path, args.scheme, name, scheme_path, args.force
+            )
+            print(f'Scheme \'{name}\' written to {scheme_path}.')
+            return 0
+
+        # Derived schemes are not derived again
+        schemes: list[tuple[str, str]] = [
+            (name, index.resolve(name))
+            for name, missing in index.list_schemes()
+            if not missing and not name.endswith(f' {args.suffix}')
+        ]
+        names, errors = transformer.derive_library(
+            schemes, args.suffix, scheme_path, args.force
+        )
+        for name, error in errors.items():
+            print(f'Error: {name}: {error}', file=sys.stderr)
+        print(f'{len(names)} scheme(s) written to {scheme_path}.')
+
+        return 1 if errors else 0
+
+    def undo(self, args: argparse.Namespace) -> int:
+        """
+        Undoes the latest applies, restoring only the sections they replaced.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        names: list[str] = ApplyHistory(HISTORY_PATH, HISTORY_SIZE).undo(
+            self.user_config['doubleCommander']['configPaths'], args.count
+        )
+
+        for name in names:
+            print(f'Scheme \'{name}\' undone.')
+
+        return 0
+
+    def watch(self, args: argparse.Namespace) -> int:
+        """
+        Watches scheme paths and DC configuration files until interrupted,
+        reporting rescanned schemes and re-applying the scheme if requested.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        if args.apply:
+            index, scheme = self.create_scheme(
+                args.apply, args.auto_dark_mode
+            )
+            scheme.apply_scheme()
+            print(f'Scheme \'{args.apply}\' applied successfully.')
+        else:
+            index = self.build_index(False)[0]
+
+        watcher = SchemeWatcher(
+            index, self.user_config['doubleCommander']['configPaths'],
+            WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
+        )
+        if args.apply:
+            watcher.set_scheme(scheme)
+
+        def report_batch(kind: str, root: str, batch: list) -> None:
+            index.update(root, batch)
+            print(f'{root}: {len(batch)} scheme(s) changed.', flush=True)
+
+        def report_event(kind: str, message: str) -> None:
+            if kind in ('error', 'failed'):
+                print(f'Error: {message}', file=sys.stderr, flush=True)
+            else:
+                print(message, flush=True)
+
+        print(
+            f'Watching {len(index.roots)} scheme path(s) and DC '
+            'configuration files, press Ctrl+C to stop.', flush=True
+        )
+        try:
+            watcher.run(report_batch, report_event)
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
+    def schedule(self, args: argparse.Namespace) -> int:
+        """
+        Switches schemes on the schedule configured in 'schedule' key until
+        interrupted. Schemes of all rules are validated first.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+        """
+        scheduler = SchemeScheduler(
+            self.user_config.get('schedule', []), SCHEDULE_STATE_PATH
+        )
+        index: SchemeIndex = self.build_index(False)[0]
+        scheduler.validate(
+            lambda name, auto_dark_mode: self.create_scheme(
+                name, auto_dark_mode, index
+            )[1]
+        )
+
+        if args.once:
+            name: str | None = scheduler.switch(datetime.now())
+            print(
+                f'Scheme \'{name}\' applied.' if name
+                else 'The due scheme has been applied already.'
+            )
+            return 0
+
+        def report_event(kind: str, message: str) -> None:
+            if kind == 'error':
+                print(f'Error: {message}', file=sys.stderr, flush=True)
+            else:
+                print(message, flush=True)
+
+        print(
+            f'Schedule of {len(scheduler.rules)} rule(s) validated, press '
+            'Ctrl+C to stop.', flush=True
+        )
+        try:
+            scheduler.run(report_event)
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
+    def serve(self, args: argparse.Namespace) -> int:
+        """
+        Runs the resident server until interrupted or stopped, or stops the
+        running server.
+
+        Args:
+            args (argparse.Namespace): The parsed command line arguments.
+
+        Returns:
+            int: The exit code.
+
+        Raises:
+            ConnectionError: If the server to stop is not running.
+        """
+        if args.stop:
+            response: dict | None = ServerClient.send({'stop': True})
+            if response is None:
+                raise ConnectionError('The server is not running.')
+            print(response['stdout'], end='')
+            return 0
+
+        server = SchemeServer(
+            self.user_config, lambda user_config: AppCli(user_config, True)
+        )
+        print('Server started, press Ctrl+C to stop.', flush=True)
+        try:
+            server.serve()
+        except KeyboardInterrupt:
+            pass
+
+        return 0
@@ -0,0 +1,258 @@
+import functools
+import re
+from array import array
+from collections import Counter
+from xml.etree.ElementTree import Element
+from app.config import XML_COLOR_TAG_PATTERN
+
+class ColorUtils:
+    """
+    Provides static methods for extracting color values from scheme files.
+
+    DC stores colors as TColor integers (0x00BBGGRR). In json files they are
+    plain integers, in xml files either decimal or Pascal hex ('$00BBGGRR')
+    strings.
+    """
+    @staticmethod
+    def parse_color(value: object) -> int | None:
+        """
+        Parses a single color value.
+
+        Args:
+            value (object): The value read from a json or xml file.
+
+        Returns:
+            int | None: The color as TColor integer, or None if the value is
+                        not a color (e.g. system color name or a flag).
+        """
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value if 0 <= value <= 0xFFFFFF else None
+        if not isinstance(value, str):
+            return None
+
+        value = value.strip()
+        try:
+            if value.startswith('$'):
+                color: int = int(value[1:], 16)
+            elif value.startswith('#'):
+                # HTML notation is RGB, convert it to BGR
+                rgb: int = int(value[1:], 16)
+                color = (
+                    (rgb & 0xFF) << 16 | (rgb & 0xFF00) | (rgb >> 16) & 0xFF
+                )
+            else:
+                color = int(value)
+        except ValueError:
+            return None
+
+        return color if 0 <= color <= 0xFFFFFF else None
+
+    @staticmethod
+    def format_color(color: int, template: str) -> str:
+        """
+        Formats a color in the notation of the value it replaces.
+
+        Args:
+            color (int): The color as TColor integer.
+            template (str): The replaced xml value.
+
+        Returns:
+            str: The color in Pascal hex, HTML or decimal notation.
+        """
+        template = template.strip()
+        if template.startswith('$'):
+            return f'${color:0{max(len(template) - 1, 6)}X}'
+        if template.startswith('#'):
+            red, green, blue = ColorUtils.to_rgb(color)
+            return f'#{red:02X}{green:02X}{blue:02X}'
+
+        return str(color)
+
+    @staticmethod
+    def to_rgb(color: int) -> tuple[int, int, int]:
+        """
+        Splits a TColor integer into its channels.
+
+        Args:
+            color (int): The color as TColor integer.
+
+        Returns:
+            tuple[int, int, int]: The red, green and blue channels.
+        """
+        return color & 0xFF, color >> 8 & 0xFF, color >> 16 & 0xFF
+
+    @staticmethod
+    def from_rgb(red: int, green: int, blue: int) -> int:
+        """
+        Packs channels into a TColor integer.
+
+        Args:
+            red (int): The red channel.
+            green (int): The green channel.
+            blue (int): The blue channel.
+
+        Returns:
+            int: The color as TColor integer.
+        """
+        return blue << 16 | green << 8 | red
+
+    @staticmethod
+    @functools.cache
+    def get_linear_table() -> array:
+        """
+        Gets the linearized value of each 8-bit sRGB channel value.
+
+        Returns:
+            array: 256 linear channel values.
+        """
+        return array('d', (
+            value / 255 / 12.92 if value / 255 <= 0.04045
+            else ((value / 255 + 0.055) / 1.055) ** 2.4
+            for value in range(256)
+        ))
+
+    @staticmethod
+    def to_lab(color: int) -> tuple[float, float, float]:
+        """
+        Converts a color to CIELAB (D65), where euclidean distance
+        approximates the perceived difference.
+
+        Args:
+            color (int): The color as TColor integer.
+
+        Returns:
+            tuple[float, float, float]: The L*, a* and b* components.
+        """
+        table: array = ColorUtils.get_linear_table()
+        red, green, blue = (table[channel] for channel in ColorUtils.to_rgb(
+            color
+        ))
+
+        def scale(value: float) -> float:
+            return (
+                value ** (1 / 3) if value > (6 / 29) ** 3
+                else value / (3 * (6 / 29) ** 2) + 4 / 29
+            )
+
+        x: float = scale(
+            (0.4124 * red + 0.3576 * green + 0.1805 * blue) / 0.95047
+        )
+        y: float = scale(0.2126 * red + 0.7152 * green + 0.0722 * blue)
+        z: float = scale(
+            (0.0193 * red + 0.1192 * green + 0.9505 * blue) / 1.08883
+        )
+
+        return 116 * y - 16, 500 * (x - y), 200 * (y - z)
+
+    @staticmethod
+    def find_json_colors(
+        json_data: dict
+    ) -> list[tuple[dict | list, str | int, int]]:
+        """
+        Finds all color values of a scheme json file.
+
+        Args:
+            json_data (dict): The parsed json data.
+
+        Returns:
+            list[tuple[dict | list, str | int, int]]: The containers of the
+                                                      values, their keys or
+                                                      indexes and the colors,
+                                                      in document order.
+        """
+        found: list[tuple[dict | list, str | int, int]] = []
+
+        def walk(
+            container: dict | list, key: str | int, node: object,
+            is_color: bool
+        ) -> None:
+            if isinstance(node, dict):
+                for child_key, value in node.items():
+                    walk(node, child_key, value, 'Color' in child_key)
+            elif isinstance(node, list):
+                for i, value in enumerate(node):
+                    walk(node, i, value, is_color)
+            elif is_color:
+                color: int | None = ColorUtils.parse_color(node)
+                if color is not None:
+                    found.append((container, key, color))
+
+        for key in ['Styles', 'FileColors']:
+            walk(json_data, key, json_data.get(key, []), False)
+
+        return found
+
+    @staticmethod
+    def extract_json_colors(json_data: dict) -> list[int]:
+        """
+        Extracts all color values from a scheme json file.
+
+        Args:
+            json_data (dict): The parsed json data.
+
+        Returns:
+            list[int]: Color values in document order.
+        """
+        return [
+            color for _, _, color in ColorUtils.find_json_colors(json_data)
+        ]
+
+    @staticmethod
+    def find_xml_colors(
+        element: Element | None
+    ) -> list[tuple[Element, int]]:
+        """
+        Finds all color values of an xml subtree, e.g. 'Colors' tag. Only
+        tags named like colors are read, so numeric settings kept next to
+        them (e.g. 'InactivePanelBrightness') are not taken for colors.
+
+        Args:
+            element (Element | None): The root of the subtree.
+
+        Returns:
+            list[tuple[Element, int]]: The elements holding the values and
+                                       the colors, in document order.
+        """
+        if element is None:
+            return []
+
+        found: list[tuple[Element, int]] = []
+        for child in element.iter():
+            if len(child) or not child.text or not re.search(
+                XML_COLOR_TAG_PATTERN, child.tag
+            ):
+                continue
+            color: int | None = ColorUtils.parse_color(child.text)
+            if color is not None:
+                found.append((child, color))
+
+        return found
+
+    @staticmethod
+    def extract_xml_colors(element: Element | None) -> list[int]:
+        """
+        Extracts all color values from an xml subtree, e.g. 'Colors' tag.
+
+        Args:
+            element (Element | None): The root of the subtree.
+
+        Returns:
+            list[int]: Color values in document order.
+        """
+        return [color for _, color in ColorUtils.find_xml_colors(element)]
+
+    @staticmethod
+    def get_dominant_colors(colors: list[int], count: int) -> list[int]:
+        """
+        Gets the most frequent colors.
+
+        Args:
+            colors (list[int]): Color values.
+            count (int): The maximum number of colors to return.
+
+        Returns:
+            list[int]: The most frequent colors, most frequent first.
+        """
+        return [color for color, _ in Counter(colors).most_common(count)]
@@ -6,15 +6,110 @@ DEV_YEARS = '2024'
 LICENSE_PATH = 'LICENSE'
 REPO_URL = 'https://github.com/t0mmili/dc-themer'
 
+# Apply
+APPLY_LOCK_NAME = '.dc-themer.lock'
+APPLY_LOCK_POLL_INTERVAL = 0.05   # s
+APPLY_LOCK_TIMEOUT = 30   # s
+DIFF_VALUE_WIDTH = 60
+
 # Assets
 DEFAULT_USER_CONFIG = './assets/default-user-config.json'
 ICON_PATH = './assets/dct-icon-v3.ico'
+SCHEME_SCHEMAS = {
+    'cfg': './assets/schemas/scheme-cfg.json',
+    'json': './assets/schemas/scheme-json.json',
+    'xml': './assets/schemas/scheme-xml.json'
+}
 
 # GUI
 ABOUT_TITLE_FONT_SIZE = 12
 ABOUT_TITLE_FONT_WEIGHT = 'bold'
-MAIN_WINDOW_HEIGHT = 140
+COMPONENT_COLUMNS = 3
+MAIN_WINDOW_HEIGHT = 465
 MAIN_WINDOW_WIDTH = 285
+PREVIEW_WINDOW_HEIGHT = 20   # lines
+PREVIEW_WINDOW_WIDTH = 80   # characters
+SCHEME_LOADING_LABEL = 'Loading schemes...'
+SCHEME_NONE_LABEL = 'No schemes found'
+SCHEME_PICKER_BACKGROUND = 'white'
+SCHEME_PICKER_DISABLED_FOREGROUND = 'gray'
+SCHEME_PICKER_FOREGROUND = 'black'
+SCHEME_PICKER_ROW_PADDING = 4
+SCHEME_PICKER_ROWS = 8
+SCHEME_PICKER_SELECT_BACKGROUND = '#0078d7'
+SCHEME_PICKER_SELECT_FOREGROUND = 'white'
+SCHEME_PICKER_TYPEAHEAD_TIMEOUT = 1000   # ms
+SCHEME_PICKER_WIDTH = 225
+SCHEME_POLL_INTERVAL = 50   # ms
+SCHEME_PRELOAD_DELAY = 150   # ms
+SCHEME_WATCH_POLL_INTERVAL = 500   # ms
+
+# Schemes
+CATALOG_PATH = 'dc-themer-catalog.db'
+CATALOG_RETRY_INTERVAL = 0.05   # s
+CATALOG_TIMEOUT = 30   # s, waiting for a writer in another thread
+CATALOG_VERSION = 2   # Bumped when the catalog layout changes
+SCHEME_BASE_KEY = 'Base'
+SCHEME_BATCH_SIZE = 50
+SCHEME_DOMINANT_COLORS = 5
+SCHEME_MATERIALIZE_CACHE_SIZE = 3
+SCHEME_MATERIALIZE_SUFFIX = '.dc-themer'
+XML_MERGE_STRATEGIES = ('replace', 'merge', 'attributes')
+XML_TAG_PATTERN = r'[A-Za-z_][\w.-]*'
+XML_COLOR_TAG_PATTERN = r'Color|Fore|Back|Cursor|Text'   # Tags of colors
+SCHEME_PRELOAD_CACHE_SIZE = 8
+SCHEME_RESOLVE_CACHE_SIZE = 16
+
+# Schedule
+SCHEDULE_STATE_PATH = 'dc-themer-schedule.json'
+
+# History
+HISTORY_PATH = 'dc-themer-history.jsonl'
+HISTORY_SIZE = 20
+
+# Export
+EXPORT_STYLE_DARK_MODES = {'Dark': '2', 'Light': '3'}   # Style: DarkMode
+
+# Check
+CHECK_CACHE_PATH = 'dc-themer-check-cache.json'
+CHECK_CHUNK_SIZE = 16
+
+# Contrast
+CONTRAST_MIN_RATIO = 4.5   # WCAG 2 AA, normal text
+CONTRAST_PAIRS = (   # Foreground, background of the same section
+    ('ForeColor', 'BackColor'),
+    ('ForeColor', 'BackColor2'),
+    ('MarkColor', 'BackColor'),
+    ('MarkColor', 'BackColor2'),
+    ('CursorText', 'CursorColor'),
+    ('PathActiveFore', 'PathActiveBack'),
+    ('PathInactiveFore', 'PathInactiveBack'),
+    ('TextColor', 'BackgroundColor')
+)
+
+# Transform
+COLOR_TRANSFORMS = ('invert', 'hue', 'saturation', 'contrast', 'remap')
+TRANSFORM_CHUNK_SIZE = 16
+TRANSFORM_DARK_MODES = {'2': '3', '3': '2'}   # Inverted DarkMode
+TRANSFORM_SUFFIX = 'Variant'
+
+# Duplicates
+DUPLICATE_MAX_DISTANCE = 3   # Differing simhash bits of near duplicates
+
+# Palette
+PALETTE_CELL_SIZE = 10.0   # CIELAB units
+PALETTE_RESULTS = 10
+
+# Server
+SERVER_FORWARDED_COMMANDS = ('apply', 'list', 'refresh', 'undo')
+SERVER_DIR_NAME = 'dc-themer'   # Private to the user
+SERVER_KEY_NAME = 'server.key'
+SERVER_PIPE_NAME = r'\\.\pipe\dc-themer-{user}-{token}'
+SERVER_SOCKET_NAME = 'server.sock'
+
+# Watch
+WATCH_DEBOUNCE = 0.5   # s
+WATCH_POLL_INTERVAL = 2.0   # s
 
 # User config
 USER_CONFIG_PATH = 'dc-themer.json'
@@ -0,0 +1,166 @@
+from array import array
+from xml.etree.ElementTree import Element
+from app.colors import ColorUtils
+from app.validate import SchemeValidator
+
+class ContrastAuditor:
+    """
+    Provides static methods for auditing the WCAG 2 contrast of foreground
+    and background colors of schemes.
+
+    Colors are paired by key within the same section, e.g. 'ForeColor' and
+    'BackColor' of a json style section or of an element of the xml 'Colors'
+    tag. Relative luminances are computed in one batch over packed arrays,
+    with channels linearized through a lookup table, so auditing a scheme
+    costs a few table lookups per distinct color.
+    """
+    @staticmethod
+    def get_luminances(colors: array) -> array:
+        """
+        Computes relative luminances of packed colors.
+
+        Args:
+            colors (array): TColor integers.
+
+        Returns:
+            array: The relative luminances, in the same order.
+        """
+        table: array = ColorUtils.get_linear_table()
+
+        return array('d', (
+            0.2126 * table[color & 0xFF]
+            + 0.7152 * table[color >> 8 & 0xFF]
+            + 0.0722 * table[color >> 16 & 0xFF]
+            for color in colors
+        ))
+
+    @staticmethod
+    def get_ratios(foregrounds: array, backgrounds: array) -> array:
+        """
+        Computes contrast ratios of packed color pairs.
+
+        Args:
+            foregrounds (array): Foreground TColor integers.
+            backgrounds (array): Background TColor integers, paired by
+                                 index.
+
+        Returns:
+            array: The contrast ratios, from 1 to 21.
+        """
+        # Each distinct color is converted once
+        unique: array = array('L', dict.fromkeys(foregrounds + backgrounds))
+        luminances: dict[int, float] = dict(
+            zip(unique, ContrastAuditor.get_luminances(unique))
+        )
+
+        return array('d', (
+            (max(fore, back) + 0.05) / (min(fore, back) + 0.05)
+            for fore, back in zip(
+                (luminances[color] for color in foregrounds),
+                (luminances[color] for color in backgrounds)
+            )
+        ))
+
+    @staticmethod
+    def find_pairs(
+        json_data: dict | None, xml_root: Element | None,
+        pairs: tuple[tuple[str, str], ...]
+    ) -> list[tuple[str, str, str, int, int]]:
+        """
+        Finds foreground and background color pairs of the json styles and
+        of the xml 'Colors' tag.
+
+        Args:
+            json_data (dict | None): The parsed json file, None to skip it.
+            xml_root (Element | None): The root of the xml file, None to skip
+                                       it.
+            pairs (tuple[tuple[str, str], ...]): Foreground and background
+                                                 keys.
+
+        Returns:
+            list[tuple[str, str, str, int, int]]: Locations of the sections,
+                                                  foreground and background
+                                                  keys and colors.
+        """
+        found: list[tuple[str, str, str, int, int]] = []
+
+        def add_pairs(location: str, section: dict[str, object]) -> None:
+            for fore_key, back_key in pairs:
+                fore: int | None = ColorUtils.parse_color(
+                    section.get(fore_key)
+                )
+                back: int | None = ColorUtils.parse_color(
+                    section.get(back_key)
+                )
+                if fore is not None and back is not None:
+                    found.append((location, fore_key, back_key, fore, back))
+
+        def walk(path: list[str | int], node: object) -> None:
+            if isinstance(node, dict):
+                add_pairs(SchemeValidator.format_location(path), node)
+                for key, value in node.items():
+                    walk(path + [key], value)
+            elif isinstance(node, list):
+                for i, value in enumerate(node):
+                    walk(path + [i], value)
+
+        if json_data is not None:
+            walk(['Styles'], json_data.get('Styles', []))
+
+        colors: Element | None = (
+            None if xml_root is None else xml_root.find('./Colors')
+        )
+        if colors is not None:
+            for element in colors.iter():
+                if len(element):
+                    add_pairs(
+                        element.tag if element is colors
+                        else f'Colors/{element.tag}',
+                        {child.tag: child.text for child in element}
+                    )
+
+        return found
+
+    @staticmethod
+    def audit(
+        json_data: dict | None, xml_root: Element | None,
+        pairs: tuple[tuple[str, str], ...], min_ratio: float
+    ) -> dict:
+        """
+        Audits the contrast of a scheme.
+
+        Args:
+            json_data (dict | None): The parsed json file, None to skip it.
+            xml_root (Element | None): The root of the xml file, None to skip
+                                       it.
+            pairs (tuple[tuple[str, str], ...]): Foreground and background
+                                                 keys.
+            min_ratio (float): The minimum contrast ratio.
+
+        Returns:
+            dict: The number of audited pairs ('pairs'), the lowest ratio
+                  ('minRatio', None without pairs) and the pairs below the
+                  minimum ('failing'), lowest first.
+        """
+        found: list[tuple[str, str, str, int, int]] = (
+            ContrastAuditor.find_pairs(json_data, xml_root, pairs)
+        )
+        ratios: array = ContrastAuditor.get_ratios(
+            array('L', (pair[3] for pair in found)),
+            array('L', (pair[4] for pair in found))
+        )
+
+        failing: list[dict] = [
+            {
+                'location': location, 'foreground': fore_key,
+                'background': back_key, 'ratio': round(ratio, 2)
+            } for (location, fore_key, back_key, _, _), ratio in sorted(
+                zip(found, ratios), key=lambda item: item[1]
+            ) if ratio < min_ratio
+        ]
+
+        return {
+            'pairs': len(found),
+            'minRatio': round(min(ratios), 2) if ratios else None,
+            'failing': failing
+        }
@@ -0,0 +1,323 @@
+import hashlib
+import json
+from xml.etree.ElementTree import Element
+
+class SchemeDiff:
+    """
+    Computes structural differences between DC configuration files and the
+    scheme about to be applied, without writing or prettifying anything.
+
+    Subtrees are compared by their digests, computed once per subtree, so
+    identical subtrees are skipped without walking them and identical list
+    entries or XML elements are matched even if they moved. Remaining
+    entries are paired in order.
+
+    A change is a tuple of its kind ('added', 'removed' or 'changed'), its
+    path, the current value and the value after applying. Values of added or
+    removed containers are None.
+    """
+    @staticmethod
+    def hash_value(value: object, digests: dict[int, bytes]) -> bytes:
+        """
+        Computes the digest of a json value, memoizing digests of all its
+        objects and arrays, so each node is hashed once.
+
+        Args:
+            value (object): The json value.
+            digests (dict[int, bytes]): Digests keyed by node id.
+
+        Returns:
+            bytes: The digest.
+        """
+        if not isinstance(value, (dict, list)):
+            return hashlib.blake2b(
+                json.dumps(value).encode('utf-8'), digest_size=16
+            ).digest()
+
+        digest: bytes | None = digests.get(id(value))
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            if isinstance(value, dict):
+                hasher.update(b'{')
+                for key in sorted(value):
+                    hasher.update(json.dumps(key).encode('utf-8'))
+                    hasher.update(SchemeDiff.hash_value(value[key], digests))
+            else:
+                hasher.update(b'[')
+                for entry in value:
+                    hasher.update(SchemeDiff.hash_value(entry, digests))
+            digest = digests[id(value)] = hasher.digest()
+
+        return digest
+
+    @staticmethod
+    def hash_element(element: Element, digests: dict[int, bytes]) -> bytes:
+        """
+        Computes the digest of an XML subtree, memoizing digests of all its
+        elements, so each element is hashed once.
+
+        Args:
+            element (Element): The root of the subtree.
+            digests (dict[int, bytes]): Digests keyed by element id.
+
+        Returns:
+            bytes: The digest.
+        """
+        digest: bytes | None = digests.get(id(element))
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            hasher.update(element.tag.encode('utf-8'))
+            hasher.update(
+                json.dumps(sorted(element.attrib.items())).encode('utf-8')
+            )
+            hasher.update((element.text or '').strip().encode('utf-8'))
+            for child in element:
+                hasher.update(SchemeDiff.hash_element(child, digests))
+            digest = digests[id(element)] = hasher.digest()
+
+        return digest
+
+    @staticmethod
+    def pair_entries(
+        current: list, applied: list, digests: list[list[bytes]]
+    ) -> tuple[list[tuple[int, int]], list[int], list[int]]:
+        """
+        Pairs list entries, skipping identical ones.
+
+        Args:
+            current (list): Current entries.
+            applied (list): Entries after applying.
+            digests (list[list[bytes]]): Digests of current and applied
+                                         entries.
+
+        Returns:
+            tuple[list[tuple[int, int]], list[int], list[int]]: Indexes of
+                paired differing entries, of removed and of added entries.
+        """
+        unmatched: dict[bytes, list[int]] = {}
+        for i, digest in enumerate(digests[0]):
+            unmatched.setdefault(digest, []).append(i)
+
+        added: list[int] = []
+        for i, digest in enumerate(digests[1]):
+            if unmatched.get(digest):
+                unmatched[digest].pop(0)
+            else:
+                added.append(i)
+        removed: list[int] = sorted(
+            i for indexes in unmatched.values() for i in indexes
+        )
+
+        count: int = min(len(removed), len(added))
+        pairs: list[tuple[int, int]] = list(
+            zip(removed[:count], added[:count])
+        )
+
+        return pairs, removed[count:], added[count:]
+
+    @staticmethod
+    def diff_cfg(
+        current: dict, applied: dict, keys: list[str]
+    ) -> list[tuple[str, str, object, object]]:
+        """
+        Compares cfg keys.
+
+        Args:
+            current (dict): The current cfg configuration.
+            applied (dict): Values of the keys after applying.
+            keys (list[str]): The keys to compare.
+
+        Returns:
+            list[tuple[str, str, object, object]]: The changes.
+        """
+        changes: list[tuple[str, str, object, object]] = []
+
+        for key in keys:
+            if key not in current:
+                changes.append(('added', key, None, applied[key]))
+            elif current[key] != applied[key]:
+                changes.append(('changed', key, current[key], applied[key]))
+
+        return changes
+
+    @staticmethod
+    def diff_json(
+        current: object, applied: object, path: str,
+        changes: list[tuple[str, str, object, object]],
+        digests: dict[int, bytes]
+    ) -> None:
+        """
+        Compares json values recursively, skipping identical subtrees.
+
+        Args:
+            current (object): The current value.
+            applied (object): The value after applying.
+            path (str): The path of the value.
+            changes (list[tuple[str, str, object, object]]): Receives the
+                                                             changes.
+            digests (dict[int, bytes]): Memoized digests keyed by node id.
+        """
+        if isinstance(current, dict) and isinstance(applied, dict):
+            keys: list[str] = list(current) + [
+                key for key in applied if key not in current
+            ]
+            for key in keys:
+                key_path: str = f'{path}.{key}' if path else key
+                if key not in applied:
+                    changes.append(('removed', key_path, current[key], None))
+                elif key not in current:
+                    changes.append(('added', key_path, None, applied[key]))
+                elif SchemeDiff.hash_value(current[key], digests) != (
+                    SchemeDiff.hash_value(applied[key], digests)
+                ):
+                    SchemeDiff.diff_json(
+                        current[key], applied[key], key_path, changes,
+                        digests
+                    )
+        elif isinstance(current, list) and isinstance(applied, list):
+            pairs, removed, added = SchemeDiff.pair_entries(
+                current, applied, [
+                    [
+                        SchemeDiff.hash_value(entry, digests)
+                        for entry in entries
+                    ]
+                    for entries in (current, applied)
+                ]
+            )
+            for i, j in pairs:
+                SchemeDiff.diff_json(
+                    current[i], applied[j], f'{path}[{j}]', changes, digests
+                )
+            for i in removed:
+                changes.append(('removed', f'{path}[{i}]', current[i], None))
+            for j in added:
+                changes.append(('added', f'{path}[{j}]', None, applied[j]))
+        elif current != applied:
+            changes.append(('changed', path, current, applied))
+
+    @staticmethod
+    def diff_xml(
+        current: Element | None, applied: Element, path: str,
+        changes: list[tuple[str, str, object, object]],
+        digests: dict[int, bytes]
+    ) -> None:
+        """
+        Compares XML subtrees recursively, skipping identical subtrees.
+
+        Args:
+            current (Element | None): The current subtree, None if missing.
+            applied (Element): The subtree after applying.
+            path (str): The path of the subtree.
+            changes (list[tuple[str, str, object, object]]): Receives the
+                                                             changes.
+            digests (dict[int, bytes]): Memoized digests keyed by element id.
+        """
+        if current is None:
+            changes.append(('added', path, None, None))
+            return
+        if SchemeDiff.hash_element(current, digests) == (
+            SchemeDiff.hash_element(applied, digests)
+        ):
+            return
+
+        # Text and attributes of the element itself
+        current_text: str = (current.text or '').strip()
+        applied_text: str = (applied.text or '').strip()
+        if current_text != applied_text:
+            changes.append(('changed', path, current_text, applied_text))
+        names: list[str] = list(current.attrib) + [
+            name for name in applied.attrib if name not in current.attrib
+        ]
+        for name in names:
+            attrib_path: str = f'{path}/@{name}'
+            if name not in applied.attrib:
+                changes.append(
+                    ('removed', attrib_path, current.attrib[name], None)
+                )
+            elif name not in current.attrib:
+                changes.append(
+                    ('added', attrib_path, None, applied.attrib[name])
+                )
+            elif current.attrib[name] != applied.attrib[name]:
+                changes.append((
+                    'changed', attrib_path, current.attrib[name],
+                    applied.attrib[name]
+                ))
+
+        # Child elements, paired by tag
+        tags: dict[str, None] = dict.fromkeys(
+            child.tag for element in (current, applied) for child in element
+        )
+        for tag in tags:
+            entries: list[list[Element]] = [
+                element.findall(tag) for element in (current, applied)
+            ]
+            pairs, removed, added = SchemeDiff.pair_entries(
+                entries[0], entries[1], [
+                    [
+                        SchemeDiff.hash_element(child, digests)
+                        for child in children
+                    ] for children in entries
+                ]
+            )
+            many: bool = max(len(entries[0]), len(entries[1])) > 1
+
+            def child_path(i: int) -> str:
+                return f'{path}/{tag}[{i + 1}]' if many else f'{path}/{tag}'
+
+            for i, j in pairs:
+                SchemeDiff.diff_xml(
+                    entries[0][i], entries[1][j], child_path(j), changes,
+                    digests
+                )
+            for i in removed:
+                changes.append(('removed', child_path(i), None, None))
+            for j in added:
+                changes.append(('added', child_path(j), None, None))
+
+    @staticmethod
+    def format(
+        diff: dict[str, list[tuple[str, str, object, object]]],
+        value_width: int
+    ) -> str:
+        """
+        Formats the differences as text.
+
+        Args:
+            diff (dict[str, list[tuple[str, str, object, object]]]): Changes
+                keyed by the configuration file.
+            value_width (int): The maximum width of a printed value.
+
+        Returns:
+            str: One line per change, grouped by configuration file.
+        """
+        def shorten(value: object) -> str:
+            text: str = json.dumps(value, ensure_ascii=False)
+            if len(text) > value_width:
+                text = f'{text[:value_width - 3]}...'
+            return text
+
+        lines: list[str] = []
+        for config_file, changes in diff.items():
+            lines.append(
+                f'{config_file}: {len(changes)} change(s)' if changes
+                else f'{config_file}: no changes'
+            )
+            for kind, path, current, applied in changes:
+                if kind == 'changed':
+                    lines.append(
+                        f'  ~ {path}: {shorten(current)} -> '
+                        f'{shorten(applied)}'
+                    )
+                elif kind == 'added':
+                    lines.append(
+                        f'  + {path}' if applied is None
+                        else f'  + {path}: {shorten(applied)}'
+                    )
+                else:
+                    lines.append(
+                        f'  - {path}' if current is None
+                        else f'  - {path}: {shorten(current)}'
+                    )
+
+        return '\n'.join(lines)
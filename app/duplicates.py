@@ -0,0 +1,239 @@
+import hashlib
+from xml.etree.ElementTree import Element
+import configobj
+from app.colors import ColorUtils
+
+class DuplicateFinder:
+    """
+    Provides static methods for finding duplicate and near-duplicate schemes
+    by content fingerprints.
+
+    A scheme is reduced to canonical features, one per value of its files,
+    e.g. 'cfg:DarkMode=2', 'json:Styles[0].FilePanel.ForeColor=0' or
+    'xml:Colors/Back=16777215'. Key order, attribute order, whitespace and
+    color notation do not change the features, so copies saved by different
+    tools still match. The hash of the sorted features finds exact
+    duplicates, a 64-bit similarity hash (simhash) of the features finds
+    near duplicates: schemes differing in a few values differ in a few bits.
+    Fingerprints are computed once per changed scheme, when the catalog is
+    refreshed, and grouping needs a single pass over the catalog.
+    """
+    @staticmethod
+    def get_cfg_features(cfg_config: configobj.Section) -> list[str]:
+        """
+        Gets canonical features of a cfg file.
+
+        Args:
+            cfg_config (configobj.Section): The parsed cfg file.
+
+        Returns:
+            list[str]: Features of all keys.
+        """
+        features: list[str] = []
+
+        def walk(prefix: str, section: configobj.Section) -> None:
+            for key, value in section.items():
+                if isinstance(value, configobj.Section):
+                    walk(f'{prefix}{key}.', value)
+                else:
+                    text: str = (
+                        ','.join(item.strip() for item in value)
+                        if isinstance(value, list) else value.strip()
+                    )
+                    features.append(f'cfg:{prefix}{key.strip()}={text}')
+
+        walk('', cfg_config)
+
+        return features
+
+    @staticmethod
+    def get_json_features(json_data: dict) -> list[str]:
+        """
+        Gets canonical features of a json file.
+
+        Args:
+            json_data (dict): The parsed json file.
+
+        Returns:
+            list[str]: Features of all values, colors in decimal notation.
+        """
+        features: list[str] = []
+
+        def walk(path: str, node: object) -> None:
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    walk(f'{path}.{key}' if path else key, value)
+            elif isinstance(node, list):
+                for i, value in enumerate(node):
+                    walk(f'{path}[{i}]', value)
+            else:
+                color: int | None = ColorUtils.parse_color(node)
+                features.append(
+                    f'json:{path}={node if color is None else color}'
+                )
+
+        walk('', json_data)
+
+        return features
+
+    @staticmethod
+    def get_xml_features(xml_root: Element) -> list[str]:
+        """
+        Gets canonical features of an xml file. Repeated tags are numbered
+        in document order.
+
+        Args:
+            xml_root (Element): The root of the xml file.
+
+        Returns:
+            list[str]: Features of all attributes and texts, colors in
+                       decimal notation.
+        """
+        features: list[str] = []
+
+        def walk(path: str, element: Element) -> None:
+            for name, value in element.attrib.items():
+                features.append(f'xml:{path}@{name}={value.strip()}')
+            text: str = (element.text or '').strip()
+            if text:
+                color: int | None = ColorUtils.parse_color(text)
+                features.append(
+                    f'xml:{path}={text if color is None else color}'
+                )
+
+            counts: dict[str, int] = {}
+            for child in element:
+                count: int = counts.get(child.tag, 0)
+                counts[child.tag] = count + 1
+                walk(
+                    f'{path}/{child.tag}' + (f'[{count}]' if count else ''),
+                    child
+                )
+
+        walk(xml_root.tag, xml_root)
+
+        return features
+
+    @staticmethod
+    def get_hash(features: list[str]) -> str:
+        """
+        Hashes the canonical form of a scheme, its sorted features.
+
+        Args:
+            features (list[str]): Features of the scheme.
+
+        Returns:
+            str: The hex digest, equal for exact duplicates.
+        """
+        return hashlib.sha256(
+            '\n'.join(sorted(features)).encode('utf-8')
+        ).hexdigest()
+
+    @staticmethod
+    def get_simhash(features: list[str]) -> int:
+        """
+        Computes the 64-bit similarity hash of a scheme. Each bit is set if
+        most features have it set in their own hash.
+
+        Args:
+            features (list[str]): Features of the scheme.
+
+        Returns:
+            int: The similarity hash.
+        """
+        weights: list[int] = [0] * 64
+        for feature in set(features):
+            value: int = int.from_bytes(hashlib.blake2b(
+                feature.encode('utf-8'), digest_size=8
+            ).digest())
+            for bit in range(64):
+                weights[bit] += 1 if value >> bit & 1 else -1
+
+        return sum(
+            1 << bit for bit, weight in enumerate(weights) if weight > 0
+        )
+
+    @staticmethod
+    def find(entries: list[dict], max_distance: int) -> dict:
+        """
+        Groups exact duplicates and pairs near duplicates.
+
+        Near duplicates are searched among one scheme of each exact group.
+        The hash is split into max_distance + 1 bands, and schemes within
+        max_distance bits share at least one band, so only schemes sharing
+        a band bucket are compared.
+
+        Args:
+            entries (list[dict]): Catalog entries with 'name',
+                                  'canonicalHash' and 'simhash', entries
+                                  without fingerprints are skipped.
+            max_distance (int): The maximum number of differing bits of near
+                                duplicates.
+
+        Returns:
+            dict: Exact duplicates ('duplicates'), each a sorted list of
+                  names, and near duplicates ('similar'), pairs of names with
+                  the number of differing bits ('distance'), closest first.
+        """
+        # Exact duplicates share a bucket of the canonical hash
+        groups: dict[str, list[str]] = {}
+        simhashes: dict[str, int] = {}
+        for entry in sorted(entries, key=lambda entry: entry['name']):
+            if entry.get('canonicalHash') is None:
+                continue
+            group: list[str] = groups.setdefault(entry['canonicalHash'], [])
+            if not group:
+                simhashes[entry['name']] = entry['simhash']
+            group.append(entry['name'])
+
+        # Near duplicates share a bucket of at least one band
+        bands: int = max_distance + 1
+        width: int = 64 // bands
+        buckets: dict[tuple[int, int], list[str]] = {}
+        compared: set[tuple[str, str]] = set()
+        pairs: dict[tuple[str, str], int] = {}
+        for name, simhash in simhashes.items():
+            for band in range(bands):
+                # The last band takes the remaining bits
+                bits: int = 64 - width * band if band == bands - 1 else width
+                key: tuple[int, int] = (
+                    band, simhash >> width * band & (1 << bits) - 1
+                )
+                for other in buckets.get(key, []):
+                    if (other, name) in compared:
+                        continue
+                    compared.add((other, name))
+                    distance: int = (simhash ^ simhashes[other]).bit_count()
+                    if distance <= max_distance:
+                        pairs[(other, name)] = distance
+                buckets.setdefault(key, []).append(name)
+
+        return {
+            'duplicates': [
+                group for group in groups.values() if len(group) > 1
+            ],
+            'similar': [
+                {'schemes': list(pair), 'distance': distance}
+                for pair, distance in sorted(
+                    pairs.items(), key=lambda item: (item[1], item[0])
+                )
+            ]
+        }
+
+    @staticmethod
+    def get_hidden(entries: list[dict]) -> set[str]:
+        """
+        Gets names of exact duplicates to hide, keeping the first name of
+        each group.
+
+        Args:
+            entries (list[dict]): Catalog entries with 'name' and
+                                  'canonicalHash'.
+
+        Returns:
+            set[str]: Names of the hidden schemes.
+        """
+        return {
+            name for group in DuplicateFinder.find(entries, 0)['duplicates']
+            for name in group[1:]
+        }
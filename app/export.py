@@ -0,0 +1,316 @@
+import os
+from xml.etree.ElementTree import Element, ElementTree
+import configobj
+import defusedxml.ElementTree as defusedxmlET
+from app.config import EXPORT_STYLE_DARK_MODES
+from app.utils import DCFileManager, SchemeFileManager
+from app.validate import SchemeValidator
+
+class SchemeExporter:
+    """
+    Exports the current DC configuration as a scheme, the inverse of
+    applying a scheme.
+
+    Only the sections a scheme holds are extracted. The cfg file is read
+    line by line up to the 'DarkMode' key. The xml file is parsed
+    incrementally: elements outside the configured tags are dropped as soon
+    as they are parsed, and parsing stops once all tags are found. The json
+    file holds little more than the exported styles and file colors, so it
+    is parsed as a whole.
+
+    Attributes:
+        dc_configs (dict[str, str]): A dictionary containing DC configuration
+                                     file types and their paths.
+        xml_tags (list[str]): Paths of the XML tags to export, tags nested in
+                              another exported tag are exported along with
+                              it.
+    """
+    def __init__(
+        self, dc_configs: dict[str, str], xml_tags: list[str | dict]
+    ) -> None:
+        """
+        Initializes the SchemeExporter class.
+
+        Args:
+            dc_configs (dict[str, str]): A dictionary containing DC
+                                         configuration file types and their
+                                         paths.
+            xml_tags (list[str | dict]): Entries of xmlTags to export.
+        """
+        self.dc_configs: dict[str, str] = dc_configs
+        paths: list[str] = list(dict.fromkeys(
+            SchemeFileManager.get_xml_tag_path(tag) for tag in xml_tags
+        ))
+        self.xml_tags: list[str] = [
+            path for path in paths
+            if not any(path.startswith(f'{other}/') for other in paths)
+        ]
+
+    def read_dark_mode(self) -> str:
+        """
+        Reads the 'DarkMode' value, stopping at its line.
+
+        Returns:
+            str: The 'DarkMode' value.
+
+        Raises:
+            ValueError: If the key does not exist.
+        """
+        target_file: str = DCFileManager.get_config(self.dc_configs['cfg'])
+        with open(target_file, encoding='utf-8-sig') as cfg_file:
+            for line in cfg_file:
+                if line.partition('=')[0].strip() == 'DarkMode':
+                    return SchemeFileManager.get_cfg([line])['DarkMode']
+
+        raise ValueError(
+            f'Key \'DarkMode\' does not exist in {target_file}.'
+        )
+
+    def read_colors(self) -> dict:
+        """
+        Reads styles and file colors.
+
+        Returns:
+            dict: The parsed json configuration.
+
+        Raises:
+            ValueError: If there are no styles.
+        """
+        target_file: str = DCFileManager.get_config(self.dc_configs['json'])
+        config: dict = SchemeFileManager.get_json(target_file)
+        if not config.get('Styles'):
+            raise ValueError(f'There are no styles in {target_file}.')
+
+        return config
+
+    def read_xml(self) -> Element:
+        """
+        Extracts the configured tags into a new tree with the root tag and
+        attributes of the xml configuration file. Like index_xml_paths, the
+        first matching child is taken at each step of a path.
+
+        Returns:
+            Element: The root element of the extracted tree.
+
+        Raises:
+            ValueError: If a tag does not exist.
+        """
+        target_file: str = DCFileManager.get_config(self.dc_configs['xml'])
+        wanted: set[str] = set(self.xml_tags)
+        prefixes: set[str] = set()
+        for path in self.xml_tags:
+            steps: list[str] = SchemeFileManager.split_xml_path(path)
+            prefixes.update(
+                '/'.join(steps[:i]) for i in range(1, len(steps) + 1)
+            )
+
+        root: Element | None = None
+        found: dict[str, Element] = {}
+        seen: set[str] = set()
+        # Path of each open element (None if not on the way to a tag), the
+        # element and whether it lies within a found tag
+        stack: list[tuple[str | None, Element, bool]] = []
+
+        for event, element in defusedxmlET.iterparse(
+            target_file, events=('start', 'end')
+        ):
+            if event == 'start':
+                if root is None:
+                    root = element
+                    stack.append(('', element, False))
+                    continue
+                parent_path, inside = stack[-1][0], stack[-1][2]
+                path: str | None = None
+                if not inside and parent_path is not None:
+                    candidate: str = (
+                        f'{parent_path}/{element.tag}' if parent_path
+                        else element.tag
+                    )
+                    if candidate in prefixes and candidate not in seen:
+                        seen.add(candidate)
+                        path = candidate
+                stack.append((path, element, inside or path in wanted))
+                continue
+
+            path, element, inside = stack.pop()
+            if path in wanted:
+                found[path] = element
+                if len(found) == len(wanted):
+                    break
+            elif path is None and not inside and stack:
+                # Not needed, drop it to keep memory flat
+                stack[-1][1].remove(element)
+
+        missing: list[str] = [
+            path for path in self.xml_tags if path not in found
+        ]
+        if root is None or missing:
+            raise ValueError(
+                f'Tags {missing} do not exist in {target_file}.'
+            )
+
+        extracted = Element(root.tag, dict(root.attrib))
+        index: dict[str, Element] = {'': extracted}
+        for path in self.xml_tags:
+            found[path].tail = None
+            SchemeFileManager.replace_xml_element(index, path, found[path])
+
+        return extracted
+
+    @staticmethod
+    def get_active_style(
+        colors: dict, dark_mode: str, style_name: str | None = None
+    ) -> dict:
+        """
+        Gets the style to export: the named one, the one matching the
+        'DarkMode' value, or the first one.
+
+        Args:
+            colors (dict): The parsed json configuration.
+            dark_mode (str): The 'DarkMode' value.
+            style_name (str | None): The name of the style, None to pick the
+                                     active one.
+
+        Returns:
+            dict: The style.
+
+        Raises:
+            ValueError: If the named style does not exist.
+        """
+        styles: dict[str, dict] = {
+            style.get('Name'): style for style in colors['Styles']
+        }
+        if style_name is not None:
+            if style_name not in styles:
+                raise ValueError(f'Style \'{style_name}\' does not exist.')
+            return styles[style_name]
+
+        for name, mode in EXPORT_STYLE_DARK_MODES.items():
+            if mode == dark_mode and name in styles:
+                return styles[name]
+
+        return colors['Styles'][0]
+
+    @staticmethod
+    def write_scheme(
+        name: str, scheme_path: str, dark_mode: str, style: dict,
+        file_colors: list, xml_root: Element, force: bool
+    ) -> None:
+        """
+        Validates and writes a scheme triplet.
+
+        Args:
+            name (str): The name of the scheme.
+            scheme_path (str): The path to the scheme directory.
+            dark_mode (str): The 'DarkMode' value.
+            style (dict): The style.
+            file_colors (list): The file colors.
+            xml_root (Element): The root element of the extracted tags.
+            force (bool): Whether to overwrite an existing scheme.
+
+        Raises:
+            ValueError: If the name is invalid or the scheme would be
+                        invalid.
+            FileExistsError: If the scheme exists and force is not set.
+        """
+        if not name or os.path.basename(name) != name:
+            raise ValueError(f'Invalid scheme name: \'{name}\'')
+
+        files: dict[str, str] = {
+            file_type: os.path.join(scheme_path, f'{name}.{file_type}')
+            for file_type in ('cfg', 'json', 'xml')
+        }
+        if not force and any(os.path.exists(file) for file in files.values()):
+            raise FileExistsError(f'Scheme \'{name}\' already exists.')
+
+        cfg_config = configobj.ConfigObj()
+        cfg_config['DarkMode'] = dark_mode
+        configs: dict[str, object] = {
+            'cfg': cfg_config,
+            'json': {'Styles': [style], 'FileColors': file_colors},
+            'xml': ElementTree(xml_root)
+        }
+
+        # Never write a scheme that could not be applied
+        errors: list[str] = [
+            f'{name}.{file_type}: {error}'
+            for file_type, config in configs.items()
+            for error in SchemeValidator.validate(file_type, config, [])
+        ]
+        if errors:
+            raise ValueError('\n'.join(errors))
+
+        os.makedirs(scheme_path, exist_ok=True)
+        SchemeFileManager.set_cfg(cfg_config, files['cfg'])
+        SchemeFileManager.set_json(configs['json'], files['json'])
+        SchemeFileManager.set_xml(
+            SchemeFileManager.prettify_xml(xml_root), files['xml']
+        )
+
+    def export(
+        self, name: str, scheme_path: str, style_name: str | None = None,
+        force: bool = False
+    ) -> None:
+        """
+        Exports the current configuration with the active style as a scheme.
+
+        Args:
+            name (str): The name of the scheme.
+            scheme_path (str): The path to the scheme directory.
+            style_name (str | None): The name of the style, None to export
+                                     the active one.
+            force (bool): Whether to overwrite an existing scheme.
+        """
+        dark_mode: str = self.read_dark_mode()
+        colors: dict = self.read_colors()
+
+        self.write_scheme(
+            name, scheme_path, dark_mode,
+            self.get_active_style(colors, dark_mode, style_name),
+            colors.get('FileColors', []), self.read_xml(), force
+        )
+
+    def export_styles(
+        self, prefix: str, scheme_path: str, force: bool = False
+    ) -> list[str]:
+        """
+        Exports every style as a separate scheme named after the prefix and
+        the style. 'DarkMode' of each scheme matches its style, if known.
+
+        Args:
+            prefix (str): The prefix of the scheme names.
+            scheme_path (str): The path to the scheme directory.
+            force (bool): Whether to overwrite existing schemes.
+
+        Returns:
+            list[str]: Names of the exported schemes.
+
+        Raises:
+            FileExistsError: If any of the schemes exists and force is not
+                             set, nothing is written then.
+        """
+        dark_mode: str = self.read_dark_mode()
+        colors: dict = self.read_colors()
+        xml_root: Element = self.read_xml()
+        names: list[str] = [
+            f'{prefix} {style.get("Name")}' for style in colors['Styles']
+        ]
+
+        existing: list[str] = [
+            name for name in names
+            if any(
+                os.path.exists(os.path.join(scheme_path, f'{name}.{ext}'))
+                for ext in ('cfg', 'json', 'xml')
+            )
+        ]
+        if existing and not force:
+            raise FileExistsError(f'Schemes {existing} already exist.')
+
+        for name, style in zip(names, colors['Styles']):
+            self.write_scheme(
+                name, scheme_path,
+                EXPORT_STYLE_DARK_MODES.get(style.get('Name'), dark_mode),
+                style, colors.get('FileColors', []), xml_root, True
+            )
+
+        return names
@@ -1,17 +1,91 @@
 import os
 import platform
+import queue
 import subprocess
+import threading
+from concurrent.futures import Future
 from webbrowser import open
 import tkinter as tk
 from tkinter import ttk
 import tkinter.font as tkFont
+from tkinter.colorchooser import askcolor
 from tkinter.messagebox import showerror, showinfo
 from app.config import (
     ABOUT_TITLE_FONT_SIZE, ABOUT_TITLE_FONT_WEIGHT, APP_AUTHOR, APP_NAME,
-    APP_VERSION, DEV_YEARS, ICON_PATH, LICENSE_PATH, REPO_URL
+    APP_VERSION, CATALOG_PATH, COMPONENT_COLUMNS, DEV_YEARS, DIFF_VALUE_WIDTH,
+    HISTORY_PATH, HISTORY_SIZE, ICON_PATH, LICENSE_PATH, MAIN_WINDOW_HEIGHT,
+    MAIN_WINDOW_WIDTH, PALETTE_CELL_SIZE, PALETTE_RESULTS,
+    PREVIEW_WINDOW_HEIGHT, PREVIEW_WINDOW_WIDTH, REPO_URL,
+    SCHEME_DOMINANT_COLORS,
+    SCHEME_LOADING_LABEL, SCHEME_MATERIALIZE_CACHE_SIZE, SCHEME_NONE_LABEL,
+    SCHEME_PICKER_BACKGROUND, SCHEME_PICKER_DISABLED_FOREGROUND,
+    SCHEME_PICKER_FOREGROUND, SCHEME_PICKER_ROWS, SCHEME_PICKER_ROW_PADDING,
+    SCHEME_PICKER_SELECT_BACKGROUND, SCHEME_PICKER_SELECT_FOREGROUND,
+    SCHEME_PICKER_TYPEAHEAD_TIMEOUT, SCHEME_PICKER_WIDTH, SCHEME_POLL_INTERVAL,
+    SCHEME_PRELOAD_CACHE_SIZE, SCHEME_PRELOAD_DELAY,
+    SCHEME_WATCH_POLL_INTERVAL, WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
 )
+from app.apply import ApplyQueue
+from app.catalog import SchemeCatalog
+from app.colors import ColorUtils
+from app.diff import SchemeDiff
+from app.duplicates import DuplicateFinder
+from app.history import ApplyHistory
+from app.index import SchemeIndex
+from app.materialize import SchemeMaterializer
+from app.palette import PaletteIndex
+from app.preload import SchemePreloader
 from app.scheme import Scheme
+from app.search import SchemeSearchIndex
 from app.utils import AppUtils, SchemeFileManager
+from app.watch import SchemeWatcher
+
+class App(tk.Tk):
+    """
+    The main application class that initializes and runs the tkinter GUI.
+
+    This class inherits from tkinter's Tk class and sets up the application
+    window, including setting the window icon, title, and size, and
+    initializing the menu bar and main application frame.
+
+    Methods:
+        center_window(width, height): Centers the window on the screen with
+                                      the given dimensions.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes the App class by setting up the main application window,
+        its properties, and the components.
+        """
+        super().__init__()
+
+        icon_path: str = AppUtils.get_asset_path(ICON_PATH)
+
+        # Set application window properties
+        self.iconbitmap(icon_path)
+        self.resizable(False, False)
+        self.title(APP_NAME)
+
+        # Create an instance of Menu Bar
+        self.menu = AppMenuBar(self)
+        self.config(menu=self.menu.menu_bar)
+
+        # Center the window on the screen
+        self.center_window(MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT)
+
+    def center_window(self, width: int, height: int) -> None:
+        """
+        Centers the window on the screen using the specified width and height.
+
+        Args:
+            width (int): The width of the window.
+            height (int): The height of the window.
+        """
+        screen_width: int = self.winfo_screenwidth()
+        screen_height: int = self.winfo_screenheight()
+        center_x: int = (screen_width - width) // 2
+        center_y: int = (screen_height - height) // 2
+        self.geometry(f'{width}x{height}+{center_x}+{center_y}')
 
 class AppMenuBar:
     """
@@ -125,19 +199,469 @@ class AppMenuBar:
         about_window.focus_set()
         about_window.wait_window()
 
+class SchemePicker(ttk.Frame):
+    """
+    A virtualized scheme list with an incremental filter box.
+
+    Only the visible rows are drawn on the canvas, so the widget stays
+    responsive regardless of the number of schemes. Filtering and type-ahead
+    are backed by a SchemeSearchIndex. A ranking, e.g. of similar schemes,
+    replaces the whole list until the filter is cleared with Escape. Hidden
+    schemes, e.g. duplicates, are never listed.
+
+    Attributes:
+        variable (tk.StringVar): Variable to hold the selected scheme name.
+        rows (int): The number of visible rows.
+        index (SchemeSearchIndex): Search index over all scheme names.
+        disabled (set[int]): Ids of schemes that can not be selected.
+        hidden (set[int]): Ids of schemes that are not listed.
+        ranking (list[int] | None): Ids of ranked schemes listed instead of
+                                    all schemes, in order, None to list all
+                                    schemes.
+        view (list[int]): Ids of schemes matching the current filter.
+        top (int): Position in view of the first visible row.
+        cursor (int): Position in view of the highlighted row.
+        placeholder (str): Text displayed while the view is empty.
+        typeahead (str): Prefix typed into the list so far.
+        typeahead_job (str | None): Scheduled type-ahead reset.
+        row_height (int): The height of a single row in pixels.
+        filter_var (tk.StringVar): Variable to hold the filter text.
+        filter_entry (ttk.Entry): Entry to type the filter text in.
+        canvas (tk.Canvas): Canvas the visible rows are drawn on.
+        scrollbar (ttk.Scrollbar): Vertical scrollbar of the list.
+        row_backgrounds (list[int]): Canvas items for the row backgrounds.
+        row_labels (list[int]): Canvas items for the row labels.
+
+    Args:
+        parent (tk.Widget): The parent widget.
+        variable (tk.StringVar): Variable to hold the selected scheme name.
+        rows (int): The number of visible rows.
+    """
+    def __init__(
+        self, parent: tk.Widget, variable: tk.StringVar, rows: int
+    ) -> None:
+        """
+        Initializes the SchemePicker class by setting up the widgets.
+        """
+        super().__init__(parent)
+        self.variable: tk.StringVar = variable
+        self.rows: int = rows
+        self.index: SchemeSearchIndex = SchemeSearchIndex()
+        self.disabled: set[int] = set()
+        self.hidden: set[int] = set()
+        self.ranking: list[int] | None = None
+        self.view: list[int] = []
+        self.top: int = 0
+        self.cursor: int = 0
+        self.placeholder: str = SCHEME_LOADING_LABEL
+        self.typeahead: str = ''
+        self.typeahead_job: str | None = None
+
+        font: tkFont.Font = tkFont.nametofont('TkDefaultFont')
+        self.row_height: int = (
+            font.metrics('linespace') + SCHEME_PICKER_ROW_PADDING
+        )
+
+        # Filter box
+        self.filter_var: tk.StringVar = tk.StringVar(self)
+        self.filter_entry: ttk.Entry = ttk.Entry(
+            self, textvariable=self.filter_var
+        )
+        self.filter_entry.grid(
+            column=0, row=0, columnspan=2, sticky=tk.EW, pady=(0, 5)
+        )
+        self.filter_var.trace_add('write', lambda *args: self.apply_filter())
+
+        # Virtualized list
+        self.canvas: tk.Canvas = tk.Canvas(
+            self, width=SCHEME_PICKER_WIDTH, height=rows * self.row_height,
+            background=SCHEME_PICKER_BACKGROUND, highlightthickness=1,
+            takefocus=True
+        )
+        self.canvas.grid(column=0, row=1, sticky=tk.NSEW)
+        self.scrollbar: ttk.Scrollbar = ttk.Scrollbar(
+            self, orient=tk.VERTICAL, command=self.scroll
+        )
+        self.scrollbar.grid(column=1, row=1, sticky=tk.NS)
+
+        # Pool of canvas items reused for the visible rows
+        self.row_backgrounds: list[int] = []
+        self.row_labels: list[int] = []
+        for row in range(rows):
+            y: int = row * self.row_height
+            self.row_backgrounds.append(self.canvas.create_rectangle(
+                0, y, SCHEME_PICKER_WIDTH, y + self.row_height, width=0
+            ))
+            self.row_labels.append(self.canvas.create_text(
+                4, y + self.row_height // 2, anchor=tk.W, font=font
+            ))
+
+        self.setup_bindings()
+        self.render()
+
+    def setup_bindings(self) -> None:
+        """
+        Sets up mouse and keyboard bindings of the list and filter box.
+        """
+        for widget in (self.filter_entry, self.canvas):
+            widget.bind('<Up>', lambda event: self.move_cursor(-1))
+            widget.bind('<Down>', lambda event: self.move_cursor(1))
+            widget.bind('<Prior>', lambda event: self.move_cursor(-self.rows))
+            widget.bind('<Next>', lambda event: self.move_cursor(self.rows))
+            widget.bind(
+                '<Return>',
+                lambda event: self.event_generate('<<SchemeActivated>>')
+            )
+
+        self.filter_entry.bind('<Escape>', lambda event: self.clear_filter())
+        self.canvas.bind(
+            '<Home>', lambda event: self.move_cursor(-len(self.view))
+        )
+        self.canvas.bind(
+            '<End>', lambda event: self.move_cursor(len(self.view))
+        )
+        self.canvas.bind('<Key>', self.on_key)
+        self.canvas.bind('<Button-1>', self.on_click)
+        self.canvas.bind(
+            '<MouseWheel>',
+            lambda event: self.scroll(
+                'scroll', -1 if event.delta > 0 else 1, 'units'
+            )
+        )
+        self.canvas.bind(
+            '<Button-4>', lambda event: self.scroll('scroll', -1, 'units')
+        )
+        self.canvas.bind(
+            '<Button-5>', lambda event: self.scroll('scroll', 1, 'units')
+        )
+
+    def add_schemes(self, batch: list[tuple[str, list[str]]]) -> None:
+        """
+        Adds a batch of schemes to the list, or updates schemes already
+        listed. Incomplete schemes are listed, but can not be selected.
+
+        Args:
+            batch (list[tuple[str, list[str]]]): Scheme names paired with
+                                                 their missing files.
+        """
+        self.index.add(name for name, missing in batch)
+        for name, missing in batch:
+            if missing:
+                self.disabled.add(self.index.ids[name])
+            else:
+                self.disabled.discard(self.index.ids[name])
+
+        self.apply_filter()
+
+    def set_placeholder(self, text: str) -> None:
+        """
+        Sets the text displayed while no scheme matches the filter.
+
+        Args:
+            text (str): The placeholder text.
+        """
+        self.placeholder = text
+        self.render()
+
+    def set_ranking(self, names: list[str] | None) -> None:
+        """
+        Lists only the ranked schemes, in order.
+
+        Args:
+            names (list[str] | None): Names of the ranked schemes, None to
+                                      list all schemes again.
+        """
+        self.ranking = None if names is None else [
+            self.index.ids[name] for name in names if name in self.index.ids
+        ]
+        self.apply_filter()
+
+    def set_hidden(self, names: set[str]) -> None:
+        """
+        Sets the schemes that are not listed.
+
+        Args:
+            names (set[str]): Names of the hidden schemes.
+        """
+        self.hidden = {
+            self.index.ids[name] for name in names if name in self.index.ids
+        }
+        self.apply_filter()
+
+    def clear_filter(self) -> None:
+        """
+        Clears the filter text and the ranking.
+        """
+        self.ranking = None
+        if self.filter_var.get():
+            self.filter_var.set('')
+        else:
+            self.apply_filter()
+
+    def apply_filter(self) -> None:
+        """
+        Refreshes the view for the current filter text and keeps the selected
+        scheme highlighted if it is still visible.
+        """
+        self.view = self.index.search(self.filter_var.get())
+        if self.ranking is not None:
+            matching: set[int] = set(self.view)
+            self.view = [
+                name_id for name_id in self.ranking if name_id in matching
+            ]
+        if self.hidden:
+            self.view = [
+                name_id for name_id in self.view
+                if name_id not in self.hidden
+            ]
+
+        selected: str = self.variable.get()
+        self.cursor = 0
+        for position, name_id in enumerate(self.view):
+            if self.index.names[name_id] == selected:
+                self.cursor = position
+                break
+        else:
+            self.select_first_enabled()
+
+        self.ensure_visible()
+        self.render()
+
+    def select_first_enabled(self) -> None:
+        """
+        Moves the cursor to the first selectable scheme in the view.
+        """
+        for position, name_id in enumerate(self.view):
+            if name_id not in self.disabled:
+                self.cursor = position
+                self.variable.set(self.index.names[name_id])
+                return
+
+    def move_cursor(self, step: int) -> str:
+        """
+        Moves the cursor by the given number of rows and selects the scheme
+        under it.
+
+        Args:
+            step (int): The number of rows to move, negative moves up.
+
+        Returns:
+            str: 'break' to stop further handling of the key event.
+        """
+        if self.view:
+            self.set_cursor(
+                max(0, min(len(self.view) - 1, self.cursor + step))
+            )
+
+        return 'break'
+
+    def set_cursor(self, position: int) -> None:
+        """
+        Places the cursor at the given view position and selects the scheme
+        if it is complete.
+
+        Args:
+            position (int): The position in the view.
+        """
+        self.cursor = position
+        name_id: int = self.view[position]
+        if name_id not in self.disabled:
+            self.variable.set(self.index.names[name_id])
+
+        self.ensure_visible()
+        self.render()
+
+    def ensure_visible(self) -> None:
+        """
+        Scrolls the list so the cursor row is visible.
+        """
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + self.rows:
+            self.top = self.cursor - self.rows + 1
+        self.top = max(0, min(self.top, len(self.view) - self.rows))
+
+    def scroll(self, *args: str) -> None:
+        """
+        Scrolls the list, called by the scrollbar and the mouse wheel.
+
+        Args:
+            *args (str): Scrollbar command, either ('moveto', fraction) or
+                         ('scroll', number, 'units' | 'pages').
+        """
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * len(self.view))
+        elif args[0] == 'scroll':
+            step: int = int(args[1])
+            self.top += step * self.rows if args[2] == 'pages' else step
+        self.top = max(0, min(self.top, len(self.view) - self.rows))
+
+        self.render()
+
+    def render(self) -> None:
+        """
+        Draws the visible rows of the view.
+        """
+        total: int = len(self.view)
+
+        for row in range(self.rows):
+            position: int = self.top + row
+            text: str = ''
+            foreground: str = SCHEME_PICKER_FOREGROUND
+            background: str = ''
+
+            if position < total:
+                name_id: int = self.view[position]
+                text = self.index.names[name_id]
+                if name_id in self.disabled:
+                    text = f'{text} (incomplete)'
+                    foreground = SCHEME_PICKER_DISABLED_FOREGROUND
+                if position == self.cursor:
+                    background = SCHEME_PICKER_SELECT_BACKGROUND
+                    if name_id not in self.disabled:
+                        foreground = SCHEME_PICKER_SELECT_FOREGROUND
+            elif row == 0 and total == 0:
+                text = self.placeholder
+                foreground = SCHEME_PICKER_DISABLED_FOREGROUND
+
+            self.canvas.itemconfigure(
+                self.row_labels[row], text=text, fill=foreground
+            )
+            self.canvas.itemconfigure(
+                self.row_backgrounds[row], fill=background
+            )
+
+        if total > self.rows:
+            self.scrollbar.set(
+                self.top / total, (self.top + self.rows) / total
+            )
+        else:
+            self.scrollbar.set(0, 1)
+
+    def on_click(self, event: tk.Event) -> None:
+        """
+        Selects the clicked row.
+
+        Args:
+            event (tk.Event): The mouse event.
+        """
+        self.canvas.focus_set()
+        position: int = self.top + event.y // self.row_height
+        if position < len(self.view):
+            self.set_cursor(position)
+
+    def on_key(self, event: tk.Event) -> str | None:
+        """
+        Handles typing into the list. With an empty filter the typed prefix
+        jumps to the first matching scheme, otherwise the key is passed to
+        the filter box.
+
+        Args:
+            event (tk.Event): The key event.
+
+        Returns:
+            str | None: 'break' if the key was handled.
+        """
+        if not event.char or not event.char.isprintable():
+            return None
+
+        if self.filter_var.get():
+            self.filter_entry.insert(tk.END, event.char)
+            self.filter_entry.focus_set()
+            return 'break'
+
+        # Type-ahead, reset after a pause in typing
+        if self.typeahead_job is not None:
+            self.after_cancel(self.typeahead_job)
+        self.typeahead += event.char
+        self.typeahead_job = self.after(
+            SCHEME_PICKER_TYPEAHEAD_TIMEOUT, self.reset_typeahead
+        )
+
+        position: int | None = self.find_typeahead(self.typeahead)
+        if position is not None:
+            self.set_cursor(position)
+
+        return 'break'
+
+    def find_typeahead(self, prefix: str) -> int | None:
+        """
+        Finds the first listed scheme starting with the typed prefix. Only
+        the view is searched, so hidden schemes are skipped and a ranking
+        keeps its order.
+
+        Args:
+            prefix (str): The typed prefix.
+
+        Returns:
+            int | None: The position in the view, or None if no listed
+                        scheme starts with prefix.
+        """
+        return self.index.find_prefix_in(
+            prefix, self.view, self.ranking is None
+        )
+
+    def reset_typeahead(self) -> None:
+        """
+        Clears the type-ahead prefix.
+        """
+        self.typeahead = ''
+        self.typeahead_job = None
+
 class AppFrame(ttk.Frame):
     """
     A class for the main application frame, containing UI elements.
 
     Attributes:
         scheme_var (StringVar): Variable to hold the selected scheme name.
+        scheme_selected (bool): Whether a complete scheme has been selected.
+        scheme_queue (queue.Queue): Queue passing discovered scheme batches
+                                    from the background thread to the GUI.
+        scheme_index (SchemeIndex): Merged index of schemes from all scheme
+                                    paths.
+        preloader (SchemePreloader): Speculative loader and merger of the
+                                     selected scheme.
+        preload_job (str | None): Scheduled preload of the selected scheme.
+        palette_index (PaletteIndex | None): Index of scheme palettes, built
+                                             on first use and dropped when
+                                             schemes change.
+        apply_queue (ApplyQueue): Background worker applying schemes.
+        scheme_watcher (SchemeWatcher | None): Watcher of scheme paths and DC
+                                               configuration files, started
+                                               after the discovery.
+        applied_scheme (Scheme | None): The last successfully applied
+                                        scheme.
+        reapply_scheme (Scheme | None): The scheme re-applied on changes.
         dark_mode_var (BooleanVar): Variable to store the state of
                                     the dark mode checkbox.
-        scheme_selector_label (ttk.Label): Label for the scheme selector
-                                           dropdown.
-        scheme_selector (ttk.OptionMenu): Dropdown menu to select a scheme.
+        reapply_var (BooleanVar): Variable to store the state of the
+                                  re-apply checkbox.
+        component_vars (dict[str, BooleanVar]): Variables to store the states
+                                                of the component checkboxes,
+                                                keyed by file type or XML
+                                                tag.
+        status_var (StringVar): Variable to hold the latest apply or undo
+                                outcome, including re-applies.
+        scheme_selector_label (ttk.Label): Label for the scheme selector.
+        scheme_selector (SchemePicker): Filterable list to select a scheme.
         dark_mode_tick (ttk.Checkbutton): Checkbox to enable or disable auto
                                           dark mode.
+        reapply_tick (ttk.Checkbutton): Checkbox to re-apply the applied
+                                        scheme when its files or DC
+                                        configuration files change.
+        component_frame (ttk.LabelFrame): Frame holding checkboxes to select
+                                          the applied configuration files
+                                          and XML tags.
+        button_frame (ttk.Frame): Frame holding the buttons.
+        preview_button (ttk.Button): Button to preview changes of the
+                                     selected scheme.
+        undo_button (ttk.Button): Button to undo the latest applied scheme.
+        similar_button (ttk.Button): Button to list schemes similar to the
+                                     selected scheme.
+        near_button (ttk.Button): Button to list schemes close to a picked
+                                  color.
+        status_label (ttk.Label): Label showing the latest apply or undo
+                                  outcome.
         apply_button (ttk.Button): Button to verify and apply the selected
                                    scheme.
 
@@ -153,40 +677,346 @@ class AppFrame(ttk.Frame):
         """
         super().__init__(container)
         self.user_config: dict = user_config
+        self.scheme_index: SchemeIndex = SchemeIndex(
+            SchemeIndex.get_roots(user_config['schemes']['path']),
+            user_config['schemes']['extensions'], CATALOG_PATH,
+            SCHEME_DOMINANT_COLORS
+        )
+        self.preloader: SchemePreloader = SchemePreloader(
+            SCHEME_PRELOAD_CACHE_SIZE,
+            SchemeMaterializer(SCHEME_MATERIALIZE_CACHE_SIZE)
+        )
+        self.preload_job: str | None = None
+        self.palette_index: PaletteIndex | None = None
+        self.apply_queue: ApplyQueue = ApplyQueue()
+        self.scheme_watcher: SchemeWatcher | None = None
+        self.applied_scheme: Scheme | None = None
+        self.reapply_scheme: Scheme | None = None
 
         self.setup_widgets()
         self.grid(padx=10, pady=10, sticky=tk.NSEW)
+        self.update_undo()
         self.initialize_scheme()
+        self.start_scheme_discovery()
+
+    def discover_schemes(self) -> None:
+        """
+        Passes cataloged schemes of all scheme paths to the GUI, then
+        refreshes their catalog and passes schemes changed since the last
+        run. Scheme paths are loaded concurrently. Runs in a background
+        thread, so it must not touch any widgets.
+        """
+        try:
+            errors: dict[str, Exception] = self.scheme_index.build(
+                lambda kind, root, batch: self.scheme_queue.put(
+                    ('batch', (root, batch))
+                ), True
+            )
+            for root, error in errors.items():
+                self.scheme_queue.put(('error', f'{root}: {error}'))
+        except Exception as e:
+            self.scheme_queue.put(('error', str(e)))
+        self.scheme_queue.put(('done', None))
 
     def initialize_scheme(self) -> None:
         """
         Initialize object of Scheme class.
         """
+        scheme_path: str = (
+            self.scheme_index.resolve(self.scheme_var.get())
+            or self.scheme_index.roots[0]
+        )
         self.scheme = Scheme(
-            self.scheme_var.get(), self.user_config['schemes']['path'],
+            self.scheme_var.get(), scheme_path,
             self.user_config['doubleCommander']['configPaths'],
             self.user_config['doubleCommander']['backupConfigs'],
-            self.dark_mode_var.get(),
-            self.user_config['schemes']['xmlTags']
+            self.dark_mode_var.get(), [
+                tag for tag in self.user_config['schemes']['xmlTags']
+                if self.component_vars[
+                    SchemeFileManager.get_xml_tag_path(tag)
+                ].get()
+            ], [
+                file_type for file_type in ('cfg', 'json')
+                if self.component_vars[file_type].get()
+            ] + ['xml']
         )
 
     def modify_scheme(self) -> None:
         """
-        Applies the selected scheme and updates the configuration accordingly.
+        Queues the selected scheme to be applied in the background. Rapid
+        repeated requests are collapsed, only the latest one is applied.
+        """
+        scheme: Scheme = self.scheme
+        future: Future = self.apply_queue.submit(scheme)
+        self.after(SCHEME_POLL_INTERVAL, self.poll_apply, scheme, future)
+
+    def poll_apply(self, scheme: Scheme, future: Future) -> None:
+        """
+        Reports the queued apply of the scheme once it is finished and
+        updates the configuration accordingly, reschedules itself meanwhile.
+
+        Args:
+            scheme (Scheme): The queued scheme.
+            future (Future): The future of the queued apply.
         """
+        if not future.done():
+            self.after(SCHEME_POLL_INTERVAL, self.poll_apply, scheme, future)
+            return
+
         try:
-            self.scheme.apply_scheme()
+            # Superseded by a newer request, which reports itself
+            if not future.result():
+                return
+
+            # Own changes must not trigger the watcher
+            self.applied_scheme = scheme
+            if self.scheme_watcher is not None:
+                self.scheme_watcher.mark_applied()
+            self.update_reapply()
+
+            # DC configuration changed, preload it again for the next apply
+            self.schedule_preload()
+
+            self.status_var.set(f'Scheme \'{scheme.scheme}\' applied.')
+            self.update_undo()
             showinfo(
                 title='Info',
-                message=(
-                    f'Scheme \'{self.scheme_var.get()}\' applied successfully.'
+                message=f'Scheme \'{scheme.scheme}\' applied successfully.'
+            )
+        except Exception as e:
+            self.report_apply_error(
+                f'Applying scheme \'{scheme.scheme}\' failed.', str(e)
+            )
+
+    def poll_schemes(self) -> None:
+        """
+        Merges discovered schemes from the queue into the scheme index and
+        the scheme selector and reschedules itself until the discovery is
+        finished.
+        """
+        schemes: list[tuple[str, list[str]]] = []
+        errors: list[str] = []
+        finished: bool = False
+
+        while not finished:
+            try:
+                kind, payload = self.scheme_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'batch':
+                schemes.extend(self.scheme_index.update(*payload))
+            elif kind == 'applied':
+                # Re-applied by the watcher, which marked its own writes
+                self.status_var.set(payload)
+                self.update_undo()
+                self.schedule_preload()
+            elif kind == 'failed':
+                self.report_apply_error(
+                    'Re-applying the scheme failed.', payload
+                )
+            elif kind == 'error':
+                errors.append(payload)
+            elif kind == 'done':
+                finished = True
+
+        # Refresh the selector once for all batches received since last poll
+        if schemes:
+            self.add_schemes(schemes)
+        if errors:
+            showerror(title='Error', message='\n\n'.join(errors))
+
+        # Catalog fingerprints are complete once the discovery is finished
+        if self.user_config['schemes'].get('hideDuplicates', False) and (
+            finished or schemes and self.scheme_watcher
+        ):
+            self.hide_duplicates()
+
+        if finished:
+            if not self.scheme_selected:
+                self.scheme_selector.set_placeholder(SCHEME_NONE_LABEL)
+            threading.Thread(target=self.watch_schemes, daemon=True).start()
+
+        # Keep polling for changes found by the watcher, less often
+        self.after(
+            SCHEME_WATCH_POLL_INTERVAL if finished or self.scheme_watcher
+            else SCHEME_POLL_INTERVAL, self.poll_schemes
+        )
+
+    def add_schemes(self, batch: list[tuple[str, list[str]]]) -> None:
+        """
+        Adds a batch of schemes to the scheme selector and enables applying
+        once the first complete scheme is selected.
+
+        Args:
+            batch (list[tuple[str, list[str]]]): Scheme names paired with
+                                                 their missing files.
+        """
+        self.scheme_selector.add_schemes(batch)
+        self.palette_index = None
+
+        if not self.scheme_selected and self.scheme_var.get():
+            self.scheme_selected = True
+            self.apply_button.config(state=tk.NORMAL)
+            self.preview_button.config(state=tk.NORMAL)
+            self.similar_button.config(state=tk.NORMAL)
+
+    def get_palette_index(self) -> PaletteIndex:
+        """
+        Gets the index of palettes of complete schemes, building it from the
+        catalog if schemes changed since the last use.
+
+        Returns:
+            PaletteIndex: The palette index.
+        """
+        if self.palette_index is None:
+            palette_index: PaletteIndex = PaletteIndex(PALETTE_CELL_SIZE)
+            palette_index.add_entries(self.get_catalog_entries())
+            self.palette_index = palette_index
+
+        return self.palette_index
+
+    def get_catalog_entries(self) -> list[dict]:
+        """
+        Gets catalog entries of complete schemes of all scheme paths,
+        skipping copies shadowed by a scheme path of higher precedence.
+
+        Returns:
+            list[dict]: Scheme metadata.
+        """
+        catalog: SchemeCatalog = SchemeCatalog(
+            CATALOG_PATH, SCHEME_DOMINANT_COLORS
+        )
+        try:
+            return [
+                entry for root in self.scheme_index.roots
+                for entry in catalog.search(root)
+                if self.scheme_index.resolve(entry['name']) == root
+            ]
+        finally:
+            catalog.close()
+
+    def hide_duplicates(self) -> None:
+        """
+        Hides exact duplicates from the scheme selector, keeping the first
+        name of each group.
+        """
+        try:
+            hidden: set[str] = DuplicateFinder.get_hidden(
+                self.get_catalog_entries()
+            )
+        except Exception as e:
+            showerror(title='Error', message=str(e))
+            return
+
+        # Keep the selected scheme listed
+        hidden.discard(self.scheme_var.get())
+        self.scheme_selector.set_hidden(hidden)
+
+    def show_near_color(self) -> None:
+        """
+        Lists schemes with a color close to a picked color, closest first.
+        """
+        color: str | None = askcolor(parent=self, title='Near color')[1]
+        if color is None:
+            return
+
+        try:
+            ranked: list[tuple[str, float]] = (
+                self.get_palette_index().near_color(
+                    ColorUtils.parse_color(color), PALETTE_RESULTS
                 )
             )
+        except Exception as e:
+            showerror(title='Error', message=str(e))
+            return
+
+        self.scheme_selector.set_ranking([name for name, _ in ranked])
+
+    def show_similar(self) -> None:
+        """
+        Lists the selected scheme followed by schemes with similar palettes,
+        most similar first.
+        """
+        name: str = self.scheme_var.get()
+        try:
+            ranked: list[tuple[str, float]] = (
+                self.get_palette_index().similar(name, PALETTE_RESULTS)
+            )
+        except KeyError as e:
+            showinfo(title='Similar schemes', message=e.args[0])
+            return
+        except Exception as e:
+            showerror(title='Error', message=str(e))
+            return
+
+        self.scheme_selector.set_ranking(
+            [name] + [similar for similar, _ in ranked]
+        )
+
+    def preload_scheme(self) -> None:
+        """
+        Starts speculative loading of the selected scheme and the current DC
+        configuration files.
+        """
+        self.preload_job = None
+        if not self.scheme_selected:
+            return
+
+        self.initialize_scheme()
+        self.preloader.preload(self.scheme)
+
+    def preview_scheme(self) -> None:
+        """
+        Displays changes applying the selected scheme would make, without
+        writing anything.
+        """
+        try:
+            diff: dict[str, list] = self.scheme.diff_scheme()
         except Exception as e:
             showerror(
                 title='Error',
                 message=str(e)
             )
+            return
+
+        preview_window: tk.Toplevel = tk.Toplevel(self)
+
+        # Set window properties
+        preview_window.iconbitmap(AppUtils.get_asset_path(ICON_PATH))
+        preview_window.title(f'Preview: {self.scheme.scheme}')
+
+        ttk.Button(
+            preview_window, text='Close',
+            command=lambda: preview_window.destroy()
+        ).pack(side=tk.BOTTOM, pady=10)
+
+        # Read-only text with the changes
+        text: tk.Text = tk.Text(
+            preview_window, width=PREVIEW_WINDOW_WIDTH,
+            height=PREVIEW_WINDOW_HEIGHT, wrap=tk.NONE
+        )
+        scrollbar: ttk.Scrollbar = ttk.Scrollbar(
+            preview_window, orient=tk.VERTICAL, command=text.yview
+        )
+        text.config(yscrollcommand=scrollbar.set)
+        text.insert('1.0', SchemeDiff.format(diff, DIFF_VALUE_WIDTH))
+        text.config(state=tk.DISABLED)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        preview_window.focus_set()
+
+    def schedule_preload(self) -> None:
+        """
+        Schedules preloading of the selected scheme. Rapid selection changes,
+        e.g. while browsing the list with keyboard, are collapsed into one.
+        """
+        if self.preload_job is not None:
+            self.after_cancel(self.preload_job)
+        self.preload_job = self.after(
+            SCHEME_PRELOAD_DELAY, self.preload_scheme
+        )
 
     def setup_widgets(self) -> None:
         """
@@ -194,22 +1024,27 @@ class AppFrame(ttk.Frame):
         """
         options: dict = {'padx': 5, 'pady': 5}
 
-        # Scheme selector
+        # Scheme selector, filled in by the background discovery
         self.scheme_var: tk.StringVar = tk.StringVar(self)
-        schemes = SchemeFileManager.list_schemes(
-            self.user_config['schemes']['path'],
-            self.user_config['schemes']['extensions']
+        self.scheme_var.trace_add(
+            'write', lambda *args: self.schedule_preload()
         )
+        self.scheme_selected: bool = False
         self.scheme_selector_label: ttk.Label = ttk.Label(
             self, text='Select scheme:'
         )
         self.scheme_selector_label.grid(
             column=0, row=0, sticky=tk.W, **options
         )
-        self.scheme_selector: ttk.OptionMenu = ttk.OptionMenu(
-            self, self.scheme_var, schemes[0], *schemes
+        self.scheme_selector: SchemePicker = SchemePicker(
+            self, self.scheme_var, SCHEME_PICKER_ROWS
+        )
+        self.scheme_selector.grid(
+            column=0, row=1, columnspan=2, sticky=tk.EW, **options
+        )
+        self.scheme_selector.bind(
+            '<<SchemeActivated>>', lambda event: self.apply_button.invoke()
         )
-        self.scheme_selector.grid(column=1, row=0, **options)
 
         # Dark Mode checkbox
         self.dark_mode_var = tk.BooleanVar(self)
@@ -218,20 +1053,190 @@ class AppFrame(ttk.Frame):
             onvalue=True, offvalue=False, takefocus=False
         )
         self.dark_mode_tick.grid(
-            column=0, row=1, columnspan=2, sticky=tk.W, **options
+            column=0, row=2, columnspan=2, sticky=tk.W, **options
+        )
+
+        # Re-apply checkbox
+        self.reapply_var = tk.BooleanVar(self)
+        self.reapply_tick: ttk.Checkbutton = ttk.Checkbutton(
+            self, text='Re-apply on changes', variable=self.reapply_var,
+            onvalue=True, offvalue=False, takefocus=False,
+            command=self.update_reapply
+        )
+        self.reapply_tick.grid(
+            column=0, row=3, columnspan=2, sticky=tk.W, **options
+        )
+
+        # Component checkboxes, the xml file is applied if any tag is ticked
+        self.component_frame: ttk.LabelFrame = ttk.LabelFrame(
+            self, text='Apply to'
+        )
+        self.component_frame.grid(
+            column=0, row=4, columnspan=2, sticky=tk.EW, **options
+        )
+        self.component_vars: dict[str, tk.BooleanVar] = {}
+        components: list[str] = ['cfg', 'json'] + [
+            SchemeFileManager.get_xml_tag_path(tag)
+            for tag in self.user_config['schemes']['xmlTags']
+        ]
+        for i, component in enumerate(components):
+            self.component_vars[component] = tk.BooleanVar(self, True)
+            ttk.Checkbutton(
+                self.component_frame, text=component,
+                variable=self.component_vars[component], onvalue=True,
+                offvalue=False, takefocus=False,
+                command=self.schedule_preload
+            ).grid(
+                column=i % COMPONENT_COLUMNS, row=i // COMPONENT_COLUMNS,
+                sticky=tk.W, padx=5
+            )
+
+        self.button_frame: ttk.Frame = ttk.Frame(self)
+        self.button_frame.grid(
+            column=0, row=5, columnspan=2, sticky=tk.W, **options
         )
 
         # Initialize, verify and apply scheme
         self.apply_button: ttk.Button = ttk.Button(
-            self, text='Apply', command=lambda: (
-                self.initialize_scheme(), self.verify_scheme(),
-                self.modify_scheme()
+            self.button_frame, text='Apply', command=lambda: (
+                self.initialize_scheme(), self.preloader.prepare(self.scheme),
+                self.verify_scheme(), self.modify_scheme()
+            ), state=tk.DISABLED
+        )
+        self.apply_button.pack(side=tk.LEFT)
+
+        # Initialize and preview scheme
+        self.preview_button: ttk.Button = ttk.Button(
+            self.button_frame, text='Preview', command=lambda: (
+                self.initialize_scheme(), self.preview_scheme()
+            ), state=tk.DISABLED
+        )
+        self.preview_button.pack(side=tk.LEFT, padx=(10, 0))
+
+        # Undo the latest apply
+        self.undo_button: ttk.Button = ttk.Button(
+            self.button_frame, text='Undo', command=self.undo_scheme
+        )
+        self.undo_button.pack(side=tk.LEFT, padx=(10, 0))
+
+        # List schemes by palette, Escape in the filter box lists all again
+        self.similar_button: ttk.Button = ttk.Button(
+            self.button_frame, text='Similar', command=self.show_similar,
+            state=tk.DISABLED
+        )
+        self.similar_button.pack(side=tk.LEFT, padx=(10, 0))
+        self.near_button: ttk.Button = ttk.Button(
+            self.button_frame, text='Near color...',
+            command=self.show_near_color
+        )
+        self.near_button.pack(side=tk.LEFT, padx=(10, 0))
+
+        # Outcome of the latest apply, undo or re-apply
+        self.status_var: tk.StringVar = tk.StringVar(self)
+        self.status_label: ttk.Label = ttk.Label(
+            self, textvariable=self.status_var
+        )
+        self.status_label.grid(
+            column=0, row=6, columnspan=2, sticky=tk.W, **options
+        )
+
+    def start_scheme_discovery(self) -> None:
+        """
+        Starts the background scheme discovery and polling of its results.
+        """
+        self.scheme_queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self.discover_schemes, daemon=True).start()
+        self.after(SCHEME_POLL_INTERVAL, self.poll_schemes)
+
+    def undo_scheme(self) -> None:
+        """
+        Queues an undo of the latest applied scheme, restoring only the
+        sections it replaced. It runs in the apply worker, after the applies
+        requested before it.
+        """
+        config_paths: dict[str, str] = (
+            self.user_config['doubleCommander']['configPaths']
+        )
+        future: Future = self.apply_queue.submit_task(
+            lambda: ApplyHistory(HISTORY_PATH, HISTORY_SIZE).undo(
+                config_paths, 1
             )
         )
-        self.apply_button.grid(
-            column=0, row=2, columnspan=2, sticky=tk.W, **options
+        self.after(SCHEME_POLL_INTERVAL, self.poll_undo, future)
+
+    def poll_undo(self, future: Future) -> None:
+        """
+        Reports the queued undo once it is finished and updates the
+        configuration accordingly, reschedules itself meanwhile.
+
+        Args:
+            future (Future): The future of the queued undo.
+        """
+        if not future.done():
+            self.after(SCHEME_POLL_INTERVAL, self.poll_undo, future)
+            return
+
+        try:
+            names: list[str] = future.result()
+
+            # Own changes must not trigger the watcher, nor be re-applied
+            self.applied_scheme = None
+            if self.scheme_watcher is not None:
+                self.scheme_watcher.mark_applied()
+            self.update_reapply()
+
+            # DC configuration changed, preload it again for the next apply
+            self.schedule_preload()
+
+            self.status_var.set(f'Scheme \'{names[0]}\' undone.')
+            self.update_undo()
+            showinfo(
+                title='Info',
+                message=f'Scheme \'{names[0]}\' undone successfully.'
+            )
+        except Exception as e:
+            showerror(
+                title='Error',
+                message=str(e)
+            )
+
+    def report_apply_error(self, status: str, message: str) -> None:
+        """
+        Reports a failed apply or re-apply. Files written before the failure
+        are recorded in the history, so they can still be undone.
+
+        Args:
+            status (str): The text of the status line.
+            message (str): The error message.
+        """
+        self.status_var.set(status)
+        self.update_undo()
+        self.schedule_preload()
+        showerror(
+            title='Error',
+            message=message
+        )
+
+    def update_undo(self) -> None:
+        """
+        Enables the undo button if the apply history holds any apply.
+        """
+        self.undo_button.config(
+            state=tk.NORMAL if ApplyHistory(HISTORY_PATH, HISTORY_SIZE).load()
+            else tk.DISABLED
         )
 
+    def update_reapply(self) -> None:
+        """
+        Passes the scheme to re-apply on changes to the watcher, the last
+        applied scheme if the re-apply checkbox is ticked.
+        """
+        self.reapply_scheme = (
+            self.applied_scheme if self.reapply_var.get() else None
+        )
+        if self.scheme_watcher is not None:
+            self.scheme_watcher.set_scheme(self.reapply_scheme)
+
     def verify_scheme(self) -> None:
         """
         Verifies the selected scheme version against target scheme version.
@@ -242,4 +1247,27 @@ class AppFrame(ttk.Frame):
             showerror(
                 title='Error',
                 message=str(e)
-            )
\ No newline at end of file
+            )
+
+    def watch_schemes(self) -> None:
+        """
+        Watches scheme paths and DC configuration files, passing rescanned
+        schemes and re-apply errors to the GUI. Runs in a background thread,
+        so it must not touch any widgets.
+        """
+        try:
+            watcher = SchemeWatcher(
+                self.scheme_index,
+                self.user_config['doubleCommander']['configPaths'],
+                WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
+            )
+            watcher.set_scheme(self.reapply_scheme)
+            self.scheme_watcher = watcher
+            watcher.run(
+                lambda kind, root, batch: self.scheme_queue.put(
+                    ('batch', (root, batch))
+                ),
+                lambda kind, message: self.scheme_queue.put((kind, message))
+            )
+        except Exception as e:
+            self.scheme_queue.put(('error', str(e)))
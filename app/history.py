@@ -0,0 +1,218 @@
+import json
+import os
+from datetime import datetime
+import defusedxml.ElementTree as defusedxmlET
+from app.config import (
+    APPLY_LOCK_NAME, APPLY_LOCK_POLL_INTERVAL, APPLY_LOCK_TIMEOUT
+)
+from app.lock import ProfileLock
+from app.utils import DCFileManager, SchemeFileManager
+
+class ApplyHistory:
+    """
+    A journal of applied schemes, used to undo them.
+
+    Each apply appends one line holding only the sections it replaced: the
+    previous 'DarkMode' value, the replaced style and 'FileColors' entries
+    and the replaced xml tags. Undo restores these sections into the current
+    DC configuration files, so unrelated changes made since are kept.
+
+    Sections are a dictionary keyed by file type: 'cfg' holds keys, 'json'
+    holds 'FileColors' and 'Styles' keyed by style name, 'xml' holds
+    serialized tags keyed by tag. None means the section did not exist.
+
+    Attributes:
+        path (str): The path to the journal file.
+        size (int): The maximum number of kept applies.
+    """
+    def __init__(self, path: str, size: int) -> None:
+        """
+        Initializes the ApplyHistory class.
+
+        Args:
+            path (str): The path to the journal file.
+            size (int): The maximum number of kept applies.
+        """
+        self.path: str = path
+        self.size: int = size
+
+    def load(self) -> list[dict]:
+        """
+        Reads the journal.
+
+        Returns:
+            list[dict]: Applies from the oldest to the latest.
+        """
+        try:
+            with open(self.path, encoding='utf-8') as journal_file:
+                return [json.loads(line) for line in journal_file if line]
+        except FileNotFoundError:
+            return []
+
+    def save(self, entries: list[dict]) -> None:
+        """
+        Writes the journal, replacing it atomically.
+
+        Args:
+            entries (list[dict]): Applies from the oldest to the latest.
+        """
+        temp_path: str = f'{self.path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as journal_file:
+            for entry in entries:
+                journal_file.write(
+                    f'{json.dumps(entry, ensure_ascii=False)}\n'
+                )
+        os.replace(temp_path, self.path)
+
+    def record(self, scheme: str, sections: dict[str, dict]) -> None:
+        """
+        Appends an apply to the journal. The journal is compacted once it
+        holds twice the maximum number of applies.
+
+        Args:
+            scheme (str): The name of the applied scheme.
+            sections (dict[str, dict]): The replaced sections.
+        """
+        entry: dict = {
+            'scheme': scheme, 'time': datetime.now().isoformat(),
+            'sections': sections
+        }
+        with open(self.path, 'a', encoding='utf-8') as journal_file:
+            journal_file.write(f'{json.dumps(entry, ensure_ascii=False)}\n')
+
+        entries: list[dict] = self.load()
+        if len(entries) > 2 * self.size:
+            self.save(entries[-self.size:])
+
+    @staticmethod
+    def merge(entries: list[dict]) -> dict[str, dict]:
+        """
+        Merges sections of the applies to undo. A section replaced by
+        several applies is restored to the value before the oldest one.
+
+        Args:
+            entries (list[dict]): Applies to undo, from the oldest to the
+                                  latest.
+
+        Returns:
+            dict[str, dict]: The sections to restore.
+        """
+        merged: dict[str, dict] = {'cfg': {}, 'json': {}, 'xml': {}}
+
+        for entry in reversed(entries):
+            for file_type, sections in entry['sections'].items():
+                for key, value in sections.items():
+                    if key == 'Styles':
+                        merged[file_type].setdefault(key, {}).update(value)
+                    else:
+                        merged[file_type][key] = value
+
+        return merged
+
+    def undo(self, dc_configs: dict[str, str], count: int) -> list[str]:
+        """
+        Undoes the latest applies, writing only the sections they replaced.
+        The DC profile is locked meanwhile, as for applying.
+
+        Args:
+            dc_configs (dict[str, str]): A dictionary containing DC
+                                         configuration file types and their
+                                         paths.
+            count (int): The number of applies to undo.
+
+        Returns:
+            list[str]: Names of the undone schemes, the latest first.
+
+        Raises:
+            ValueError: If there is nothing to undo.
+        """
+        target_files: dict[str, str] = {
+            file_type: DCFileManager.get_config(dc_configs[file_type])
+            for file_type in ('cfg', 'json', 'xml')
+        }
+
+        with ProfileLock(
+            list(target_files.values()), APPLY_LOCK_NAME, APPLY_LOCK_TIMEOUT,
+            APPLY_LOCK_POLL_INTERVAL
+        ):
+            entries: list[dict] = self.load()
+            if not entries or count < 1:
+                raise ValueError('There is no applied scheme to undo.')
+
+            undone: list[dict] = entries[-count:]
+            merged: dict[str, dict] = self.merge(undone)
+            if merged['cfg']:
+                self.restore_cfg(target_files['cfg'], merged['cfg'])
+            if merged['json']:
+                self.restore_json(target_files['json'], merged['json'])
+            if merged['xml']:
+                self.restore_xml(target_files['xml'], merged['xml'])
+
+            self.save(entries[:-len(undone)])
+
+        return [entry['scheme'] for entry in reversed(undone)]
+
+    @staticmethod
+    def restore_cfg(target_file: str, sections: dict) -> None:
+        """
+        Restores cfg keys.
+
+        Args:
+            target_file (str): The path to the cfg configuration file.
+            sections (dict): Previous values keyed by key.
+        """
+        config = SchemeFileManager.get_cfg(target_file)
+        for key, value in sections.items():
+            if value is None:
+                config.pop(key, None)
+            else:
+                config[key] = value
+
+        SchemeFileManager.set_cfg(config, target_file)
+
+    @staticmethod
+    def restore_json(target_file: str, sections: dict) -> None:
+        """
+        Restores styles and file colors.
+
+        Args:
+            target_file (str): The path to the json configuration file.
+            sections (dict): Previous 'FileColors' and previous 'Styles' keyed
+                             by name.
+        """
+        config: dict = SchemeFileManager.get_json(target_file)
+
+        for name, style in sections.get('Styles', {}).items():
+            for i, current in enumerate(config.get('Styles', [])):
+                if current['Name'] == name:
+                    config['Styles'][i] = style
+                    break
+        if 'FileColors' in sections:
+            if sections['FileColors'] is None:
+                config.pop('FileColors', None)
+            else:
+                config['FileColors'] = sections['FileColors']
+
+        SchemeFileManager.set_json(config, target_file)
+
+    @staticmethod
+    def restore_xml(target_file: str, sections: dict) -> None:
+        """
+        Restores xml tags in place.
+
+        Args:
+            target_file (str): The path to the xml configuration file.
+            sections (dict): Previous serialized tags keyed by tag path.
+        """
+        root = defusedxmlET.parse(target_file).getroot()
+        index: dict = SchemeFileManager.index_xml_paths(root, list(sections))
+
+        for tag, content in sections.items():
+            SchemeFileManager.replace_xml_element(
+                index, SchemeFileManager.normalize_xml_path(tag),
+                None if content is None else defusedxmlET.fromstring(content)
+            )
+
+        SchemeFileManager.set_xml(
+            SchemeFileManager.prettify_xml(root), target_file
+        )
@@ -0,0 +1,230 @@
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from app.catalog import SchemeCatalog
+from app.config import SCHEME_BATCH_SIZE
+
+class SchemeIndex:
+    """
+    A merged index of schemes from an ordered list of scheme roots
+    (directories or zip archives).
+
+    Roots listed first take precedence: a scheme is resolved to the first
+    root holding a complete copy of it, so per-user schemes shadow schemes of
+    the same name on a shared root. Incomplete copies are used only if no
+    root holds a complete one.
+
+    Attributes:
+        roots (list[str]): The scheme roots, in order of precedence.
+        scheme_exts (list[str]): A list of required file extensions for each
+                                 scheme.
+        catalog_path (str): The path to the catalog database.
+        dominant_colors (int): The number of dominant colors to catalog.
+        schemes (dict[str, dict[str, list[str]]]): Scheme names paired with
+                                                   their missing files, keyed
+                                                   by root.
+        lock (threading.Lock): Lock guarding the schemes.
+    """
+    def __init__(
+        self, roots: list[str], scheme_exts: list[str], catalog_path: str,
+        dominant_colors: int
+    ) -> None:
+        """
+        Initializes an empty SchemeIndex.
+
+        Args:
+            roots (list[str]): The scheme roots, in order of precedence.
+            scheme_exts (list[str]): A list of required file extensions for
+                                     each scheme.
+            catalog_path (str): The path to the catalog database.
+            dominant_colors (int): The number of dominant colors to catalog.
+        """
+        self.roots: list[str] = roots
+        self.scheme_exts: list[str] = scheme_exts
+        self.catalog_path: str = catalog_path
+        self.dominant_colors: int = dominant_colors
+        self.schemes: dict[str, dict[str, list[str]]] = {
+            root: {} for root in roots
+        }
+        self.lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def get_roots(scheme_path: str | list[str]) -> list[str]:
+        """
+        Gets the ordered scheme roots from the 'schemes.path' setting, which
+        is either a single path or a list of paths.
+
+        Args:
+            scheme_path (str | list[str]): The 'schemes.path' setting.
+
+        Returns:
+            list[str]: The scheme roots without duplicates, in order of
+                       precedence.
+
+        Raises:
+            ValueError: If no scheme root is configured.
+        """
+        paths: list[str] = (
+            [scheme_path] if isinstance(scheme_path, str) else scheme_path
+        )
+        roots: list[str] = list(dict.fromkeys(paths))
+        if not roots:
+            raise ValueError('No scheme path is configured.')
+
+        return roots
+
+    def update(
+        self, root: str, batch: list[tuple[str, list[str]]]
+    ) -> list[tuple[str, list[str]]]:
+        """
+        Updates schemes of a root. Schemes missing all files are removed from
+        the root.
+
+        Args:
+            root (str): The scheme root.
+            batch (list[tuple[str, list[str]]]): Scheme names paired with
+                                                 their missing files.
+
+        Returns:
+            list[tuple[str, list[str]]]: Updated scheme names paired with
+                                         their missing files after merging
+                                         all roots.
+        """
+        with self.lock:
+            schemes: dict[str, list[str]] = self.schemes[root]
+            for name, missing in batch:
+                if len(missing) >= len(self.scheme_exts):
+                    schemes.pop(name, None)
+                else:
+                    schemes[name] = missing
+
+            return [(name, self.get_missing(name)) for name, missing in batch]
+
+    def resolve(self, name: str) -> str | None:
+        """
+        Finds the root the scheme is applied from.
+
+        Args:
+            name (str): The name of the scheme.
+
+        Returns:
+            str | None: The first root holding a complete copy of the scheme,
+                        or the first root holding it at all, or None if no
+                        root holds the scheme.
+        """
+        fallback: str | None = None
+        for root in self.roots:
+            missing: list[str] | None = self.schemes[root].get(name)
+            if missing is None:
+                continue
+            if not missing:
+                return root
+            if fallback is None:
+                fallback = root
+
+        return fallback
+
+    def get_missing(self, name: str) -> list[str]:
+        """
+        Gets missing files of the scheme in the resolved root.
+
+        Args:
+            name (str): The name of the scheme.
+
+        Returns:
+            list[str]: Missing files, all files if no root holds the scheme.
+        """
+        root: str | None = self.resolve(name)
+        if root is None:
+            return [f'{name}.{ext}' for ext in self.scheme_exts]
+
+        return self.schemes[root][name]
+
+    def list_schemes(self) -> list[tuple[str, list[str]]]:
+        """
+        Lists schemes of all roots, shadowed copies excluded.
+
+        Returns:
+            list[tuple[str, list[str]]]: Sorted scheme names paired with their
+                                         missing files.
+        """
+        with self.lock:
+            names: set[str] = set()
+            for schemes in self.schemes.values():
+                names.update(schemes)
+
+            return [(name, self.get_missing(name)) for name in sorted(names)]
+
+    def load_root(
+        self, root: str, callback: Callable[[str, str, list], None],
+        refresh: bool
+    ) -> None:
+        """
+        Passes cataloged schemes of a root to the callback, then refreshes
+        the catalog of the root and passes changed schemes. Runs in a worker
+        thread with its own catalog connection.
+
+        Args:
+            root (str): The scheme root.
+            callback (Callable[[str, str, list], None]): Receives the batch
+                kind ('cached' or 'changed'), the root and the batch.
+            refresh (bool): Whether to refresh the catalog. Roots without any
+                            cataloged schemes are always refreshed.
+        """
+        catalog = SchemeCatalog(self.catalog_path, self.dominant_colors)
+        try:
+            schemes: list[tuple[str, list[str]]] = catalog.list_schemes(root)
+            for i in range(0, len(schemes), SCHEME_BATCH_SIZE):
+                callback('cached', root, schemes[i:i + SCHEME_BATCH_SIZE])
+
+            if refresh or not schemes:
+                self.refresh_root(catalog, root, callback)
+        finally:
+            catalog.close()
+
+    def refresh_root(
+        self, catalog: SchemeCatalog, root: str,
+        callback: Callable[[str, str, list], None]
+    ) -> None:
+        """
+        Refreshes the catalog of a root and passes changed schemes.
+
+        Args:
+            catalog (SchemeCatalog): The catalog connection of this thread.
+            root (str): The scheme root.
+            callback (Callable[[str, str, list], None]): Receives the batch
+                kind ('changed'), the root and the batch.
+        """
+        for batch in catalog.refresh(root, self.scheme_exts):
+            callback('changed', root, batch)
+
+    def build(
+        self, callback: Callable[[str, str, list], None], refresh: bool
+    ) -> dict[str, Exception]:
+        """
+        Loads all roots concurrently, so a slow root does not hold back the
+        others. A failing root is reported, but does not stop the others.
+
+        Args:
+            callback (Callable[[str, str, list], None]): Receives the batch
+                kind ('cached' or 'changed'), the root and the batch. It is
+                called from worker threads.
+            refresh (bool): Whether to refresh the catalog of each root.
+
+        Returns:
+            dict[str, Exception]: Errors keyed by the failed root.
+        """
+        errors: dict[str, Exception] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.roots), thread_name_prefix='scheme-root'
+        ) as executor:
+            futures: dict[Future, str] = {
+                executor.submit(self.load_root, root, callback, refresh): root
+                for root in self.roots
+            }
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    errors[futures[future]] = future.exception()
+
+        return errors
@@ -0,0 +1,417 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from xml.etree.ElementTree import Element
+import configobj
+import defusedxml.ElementTree as defusedxmlET
+from app.config import SCHEME_BASE_KEY
+from app.store import SchemeStore
+from app.utils import SchemeFileManager
+from app.validate import SchemeValidator
+
+class SchemeResolver:
+    """
+    Resolves schemes declaring base schemes into flat scheme files.
+
+    A scheme declares its bases with the 'Base' key of its cfg file, e.g.
+    'Base = Nord' or 'Base = Nord, Fonts'. Bases are found in the same
+    scheme path and may declare bases themselves. The scheme overrides only
+    the sections it holds, bases listed later override earlier ones:
+    - cfg: keys.
+    - json: styles matched by 'Name', merged key by key, and 'FileColors'
+      as a whole. Styles of the scheme come first, so its first style is
+      applied.
+    - xml: children of the root, matched by tag and occurrence and
+      replaced as a whole, and attributes of the root.
+
+    Bases form a graph which is resolved depth first, each scheme once per
+    resolution, and cycles are reported. Resolved files are cached by a
+    hash covering the content of the scheme and of all its ancestors, so
+    applying an unchanged variant parses only flat files, and editing a
+    scheme invalidates only schemes inheriting from it. Schemes without
+    bases are never resolved and are read from their store as usual. All
+    caches are bounded, so browsing a large library does not keep every
+    scheme file in memory.
+
+    Attributes:
+        cache_size (int): The maximum number of entries of each cache.
+        lock (threading.Lock): Lock guarding the caches.
+        bases (OrderedDict): Base names keyed by store path and scheme, with
+                             the cfg fingerprint they were read from, in
+                             least recently used order.
+        files (OrderedDict): Content and its hash keyed by store path and
+                             scheme, with the fingerprints it was read from,
+                             in least recently used order.
+        resolved (OrderedDict): Resolved scheme files keyed by the hash of
+                                all ancestors, in least recently used order.
+    """
+    def __init__(self, cache_size: int) -> None:
+        """
+        Initializes the SchemeResolver class.
+
+        Args:
+            cache_size (int): The maximum number of entries of each cache.
+        """
+        self.cache_size: int = cache_size
+        self.lock: threading.Lock = threading.Lock()
+        self.bases: OrderedDict[tuple[str, str], tuple] = OrderedDict()
+        self.files: OrderedDict[tuple[str, str], tuple] = OrderedDict()
+        self.resolved: OrderedDict[str, dict[str, bytes]] = OrderedDict()
+
+    def get_cached(self, cache: OrderedDict, key: object) -> object | None:
+        """
+        Gets an entry of a cache, marking it as recently used.
+
+        Args:
+            cache (OrderedDict): The cache.
+            key (object): The key of the entry.
+
+        Returns:
+            object | None: The entry, or None if it is not cached.
+        """
+        with self.lock:
+            value: object | None = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+
+        return value
+
+    def set_cached(
+        self, cache: OrderedDict, key: object, value: object
+    ) -> None:
+        """
+        Stores an entry in a cache, evicting least recently used entries.
+
+        Args:
+            cache (OrderedDict): The cache.
+            key (object): The key of the entry.
+            value (object): The entry.
+        """
+        with self.lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    def get_bases(self, store: SchemeStore, name: str) -> list[str]:
+        """
+        Gets the base schemes declared by the scheme. Only the declaring
+        line is parsed, so telling flat schemes apart stays cheap.
+
+        Args:
+            store (SchemeStore): The store holding the scheme.
+            name (str): The name of the scheme.
+
+        Returns:
+            list[str]: Names of the base schemes, empty for a flat scheme or
+                       if the cfg file does not exist.
+
+        Raises:
+            ValueError: If the declaration cannot be parsed.
+        """
+        fingerprint: tuple | None = store.get_fingerprint(name, 'cfg')
+        if fingerprint is None:
+            return []
+
+        cached: tuple | None = self.get_cached(self.bases, (store.path, name))
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        base: str | list[str] = []
+        for line in store.read(name, 'cfg').decode('utf-8-sig').splitlines():
+            if line.partition('=')[0].strip() != SCHEME_BASE_KEY:
+                continue
+            try:
+                base = configobj.ConfigObj([line])[SCHEME_BASE_KEY]
+            except configobj.ConfigObjError as e:
+                raise ValueError(
+                    f'Invalid base declaration: {line.strip()}'
+                ) from e
+        bases: list[str] = [
+            item for item in ([base] if isinstance(base, str) else base)
+            if item
+        ]
+        self.set_cached(self.bases, (store.path, name), (fingerprint, bases))
+
+        return bases
+
+    def read(self, store: SchemeStore, name: str) -> tuple[str, dict]:
+        """
+        Reads all files of the scheme, once per change.
+
+        Args:
+            store (SchemeStore): The store holding the scheme.
+            name (str): The name of the scheme.
+
+        Returns:
+            tuple[str, dict]: The hash of the content and the content keyed
+                              by file type.
+
+        Raises:
+            FileNotFoundError: If a file of the scheme does not exist.
+        """
+        fingerprints: tuple = tuple(
+            store.get_fingerprint(name, file_type)
+            for file_type in ('cfg', 'json', 'xml')
+        )
+        if None in fingerprints:
+            raise FileNotFoundError(
+                f'Scheme \'{name}\' is missing or incomplete in {store.path}.'
+            )
+
+        cached: tuple | None = self.get_cached(self.files, (store.path, name))
+        if cached is not None and cached[0] == fingerprints:
+            return cached[1], cached[2]
+
+        contents: dict[str, bytes] = {
+            file_type: store.read(name, file_type)
+            for file_type in ('cfg', 'json', 'xml')
+        }
+        digest = hashlib.sha256()
+        for file_type, content in contents.items():
+            digest.update(f'{file_type}\0'.encode('utf-8'))
+            digest.update(hashlib.sha256(content).digest())
+        self.set_cached(
+            self.files, (store.path, name),
+            (fingerprints, digest.hexdigest(), contents)
+        )
+
+        return digest.hexdigest(), contents
+
+    def get_ancestry(
+        self, store: SchemeStore, name: str, path: tuple[str, ...] = ()
+    ) -> tuple:
+        """
+        Gets fingerprints of all files of all ancestors of the scheme, which
+        change whenever any ancestor changes.
+
+        Args:
+            store (SchemeStore): The store holding the scheme.
+            name (str): The name of the scheme.
+            path (tuple[str, ...]): Schemes on the way to this one.
+
+        Returns:
+            tuple: Names and fingerprints of the ancestors, depth first, empty
+                   for a flat scheme.
+
+        Raises:
+            ValueError: If the bases form a cycle.
+        """
+        ancestry: list = []
+        for base in self.get_bases(store, name):
+            self.check_cycle(path + (name,), base)
+            ancestry.append((base, tuple(
+                store.get_fingerprint(base, file_type)
+                for file_type in ('cfg', 'json', 'xml')
+            )))
+            ancestry.extend(self.get_ancestry(store, base, path + (name,)))
+
+        return tuple(ancestry)
+
+    @staticmethod
+    def check_cycle(path: tuple[str, ...], base: str) -> None:
+        """
+        Checks that the base is not already on the way to the scheme.
+
+        Args:
+            path (tuple[str, ...]): Schemes on the way to the base.
+            base (str): The name of the base scheme.
+
+        Raises:
+            ValueError: If the base inherits from itself.
+        """
+        if base in path:
+            cycle: list[str] = list(path[path.index(base):]) + [base]
+            raise ValueError(
+                f'Scheme inheritance cycle: {" -> ".join(cycle)}'
+            )
+
+    def resolve(
+        self, store: SchemeStore, name: str
+    ) -> dict[str, bytes] | None:
+        """
+        Resolves the scheme into flat scheme files.
+
+        Args:
+            store (SchemeStore): The store holding the scheme.
+            name (str): The name of the scheme.
+
+        Returns:
+            dict[str, bytes] | None: Content of the resolved files keyed by
+                                     file type, None for a flat scheme.
+
+        Raises:
+            ValueError: If the bases form a cycle or can not be merged.
+            FileNotFoundError: If a base scheme is missing or incomplete.
+        """
+        if not self.get_bases(store, name):
+            return None
+
+        return self.resolve_scheme(store, name, (), {})[1]
+
+    def resolve_scheme(
+        self, store: SchemeStore, name: str, path: tuple[str, ...],
+        memo: dict[str, tuple[str, dict]]
+    ) -> tuple[str, dict[str, bytes]]:
+        """
+        Resolves a scheme of the graph, memoized per resolution, so schemes
+        shared by several bases are resolved once.
+
+        Args:
+            store (SchemeStore): The store holding the scheme.
+            name (str): The name of the scheme.
+            path (tuple[str, ...]): Schemes on the way to this one.
+            memo (dict[str, tuple[str, dict]]): Schemes resolved so far.
+
+        Returns:
+            tuple[str, dict[str, bytes]]: The hash covering the scheme and
+                                          all its ancestors and the content
+                                          of the resolved files.
+        """
+        if name in memo:
+            return memo[name]
+
+        digest, contents = self.read(store, name)
+        parents: list[tuple[str, dict]] = []
+        for base in self.get_bases(store, name):
+            self.check_cycle(path + (name,), base)
+            parents.append(
+                self.resolve_scheme(store, base, path + (name,), memo)
+            )
+        if not parents:
+            memo[name] = (digest, contents)
+            return memo[name]
+
+        key: str = hashlib.sha256(
+            '\0'.join([digest] + [key for key, _ in parents]).encode('utf-8')
+        ).hexdigest()
+        resolved: dict[str, bytes] | None = self.get_cached(
+            self.resolved, key
+        )
+        if resolved is None:
+            resolved = self.merge(
+                [content for _, content in parents] + [contents]
+            )
+            self.set_cached(self.resolved, key, resolved)
+
+        memo[name] = (key, resolved)
+        return memo[name]
+
+    @staticmethod
+    def merge(layers: list[dict[str, bytes]]) -> dict[str, bytes]:
+        """
+        Merges scheme files, later layers override earlier ones.
+
+        Args:
+            layers (list[dict[str, bytes]]): Content of scheme files keyed by
+                                             file type, the bases first and
+                                             the scheme last.
+
+        Returns:
+            dict[str, bytes]: Content of the merged files keyed by file type.
+        """
+        parsed: list[dict[str, object]] = [
+            {
+                file_type: SchemeValidator.parse(
+                    file_type, io.BytesIO(content)
+                ) for file_type, content in layer.items()
+            } for layer in layers
+        ]
+
+        cfg_config: configobj.ConfigObj = parsed[0]['cfg']
+        json_config: dict = parsed[0]['json']
+        xml_root: Element = parsed[0]['xml'].getroot()
+        for layer in parsed[1:]:
+            cfg_config.merge(layer['cfg'])
+            json_config = SchemeResolver.merge_json(json_config, layer['json'])
+            xml_root = SchemeResolver.merge_xml(
+                xml_root, layer['xml'].getroot()
+            )
+        cfg_config.pop(SCHEME_BASE_KEY, None)
+
+        return {
+            'cfg': SchemeFileManager.format_cfg(cfg_config).encode('utf-8'),
+            'json': SchemeFileManager.format_json(json_config).encode('utf-8'),
+            'xml': defusedxmlET.tostring(xml_root, encoding='utf-8')
+        }
+
+    @staticmethod
+    def merge_dict(parent: dict, child: dict) -> dict:
+        """
+        Merges dictionaries key by key, nested dictionaries recursively.
+
+        Args:
+            parent (dict): The inherited dictionary.
+            child (dict): The overriding dictionary.
+
+        Returns:
+            dict: The merged dictionary.
+        """
+        merged: dict = dict(parent)
+        for key, value in child.items():
+            merged[key] = (
+                SchemeResolver.merge_dict(merged[key], value)
+                if isinstance(value, dict)
+                and isinstance(merged.get(key), dict)
+                else value
+            )
+
+        return merged
+
+    @staticmethod
+    def merge_json(parent: dict, child: dict) -> dict:
+        """
+        Merges json scheme files. Styles are matched by 'Name', other keys
+        are merged as dictionaries, so 'FileColors' is replaced as a whole.
+
+        Args:
+            parent (dict): The inherited json scheme file.
+            child (dict): The overriding json scheme file.
+
+        Returns:
+            dict: The merged json scheme file.
+        """
+        merged: dict = SchemeResolver.merge_dict(
+            {key: value for key, value in parent.items() if key != 'Styles'},
+            {key: value for key, value in child.items() if key != 'Styles'}
+        )
+
+        parent_styles: dict[str, dict] = {
+            style.get('Name'): style for style in parent.get('Styles', [])
+        }
+        child_styles: list[dict] = [
+            SchemeResolver.merge_dict(
+                parent_styles.get(style.get('Name'), {}), style
+            ) for style in child.get('Styles', [])
+        ]
+        overridden: set[str] = {style.get('Name') for style in child_styles}
+        merged['Styles'] = child_styles + [
+            style for style in parent.get('Styles', [])
+            if style.get('Name') not in overridden
+        ]
+
+        return merged
+
+    @staticmethod
+    def merge_xml(parent: Element, child: Element) -> Element:
+        """
+        Merges xml scheme files with the 'merge' strategy of
+        SchemeFileManager.merge_xml_element: children of the root are keyed
+        by tag and occurrence, a child of the overriding file replaces the
+        inherited child of the same key as a whole and other children are
+        appended. Attributes of the overriding root override inherited ones.
+
+        Args:
+            parent (Element): The root of the inherited xml scheme file.
+            child (Element): The root of the overriding xml scheme file.
+
+        Returns:
+            Element: The root of the merged xml scheme file.
+        """
+        merged: Element = SchemeFileManager.merge_xml_element(
+            parent, child, 'merge', None
+        )
+        merged.attrib.update(child.attrib)
+
+        return merged
@@ -0,0 +1,140 @@
+import os
+import sys
+import time
+from typing import IO
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+class ProfileLock:
+    """
+    An advisory lock of DC profiles, held while a scheme is applied, so
+    concurrent DC Themer instances do not interleave their read-modify-write
+    of the same configuration files. Each profile directory gets a lock file
+    locked with flock, or msvcrt on Windows. Profiles are locked in sorted
+    order, so two instances never wait for each other.
+
+    Attributes:
+        profile_dirs (list[str]): The sorted profile directories.
+        lock_name (str): The name of the lock file in each profile.
+        timeout (float): The maximum number of seconds to wait for the lock.
+        poll_interval (float): The number of seconds between lock attempts.
+        files (list[IO[bytes]]): Open lock files, while locked.
+        wait_time (float): Seconds spent waiting for the lock.
+        hold_time (float): Seconds the lock was held.
+        acquired_at (float): Performance counter value when acquired.
+    """
+    def __init__(
+        self, config_files: list[str], lock_name: str, timeout: float,
+        poll_interval: float
+    ) -> None:
+        """
+        Initializes the ProfileLock class.
+
+        Args:
+            config_files (list[str]): The DC configuration files to lock.
+            lock_name (str): The name of the lock file in each profile.
+            timeout (float): The maximum number of seconds to wait for the
+                             lock.
+            poll_interval (float): The number of seconds between lock
+                                   attempts.
+        """
+        self.profile_dirs: list[str] = sorted({
+            os.path.dirname(os.path.abspath(config_file))
+            for config_file in config_files
+        })
+        self.lock_name: str = lock_name
+        self.timeout: float = timeout
+        self.poll_interval: float = poll_interval
+        self.files: list[IO[bytes]] = []
+        self.wait_time: float = 0.0
+        self.hold_time: float = 0.0
+        self.acquired_at: float = 0.0
+
+    @staticmethod
+    def try_lock(lock_file: IO[bytes]) -> bool:
+        """
+        Tries to lock the lock file without blocking.
+
+        Args:
+            lock_file (IO[bytes]): The open lock file.
+
+        Returns:
+            bool: True if the lock was acquired.
+        """
+        try:
+            if sys.platform == 'win32':
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+
+        return True
+
+    @staticmethod
+    def unlock(lock_file: IO[bytes]) -> None:
+        """
+        Unlocks and closes the lock file.
+
+        Args:
+            lock_file (IO[bytes]): The open lock file.
+        """
+        try:
+            if sys.platform == 'win32':
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def acquire(self) -> None:
+        """
+        Locks all profiles, waiting for other instances to finish.
+
+        Raises:
+            TimeoutError: If the lock is not acquired within the timeout.
+        """
+        started: float = time.perf_counter()
+        deadline: float = started + self.timeout
+
+        try:
+            for profile_dir in self.profile_dirs:
+                lock_file: IO[bytes] = open(
+                    os.path.join(profile_dir, self.lock_name), 'a+b'
+                )
+                while not self.try_lock(lock_file):
+                    if time.perf_counter() >= deadline:
+                        lock_file.close()
+                        raise TimeoutError(
+                            'Double Commander configuration is locked by '
+                            f'another DC Themer instance: {profile_dir}'
+                        )
+                    time.sleep(self.poll_interval)
+                self.files.append(lock_file)
+        except BaseException:
+            self.release()
+            raise
+
+        self.acquired_at = time.perf_counter()
+        self.wait_time = self.acquired_at - started
+
+    def release(self) -> None:
+        """
+        Unlocks all locked profiles.
+        """
+        while self.files:
+            self.unlock(self.files.pop())
+        if self.acquired_at:
+            self.hold_time = time.perf_counter() - self.acquired_at
+
+    def __enter__(self) -> 'ProfileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
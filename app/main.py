@@ -1,60 +1,12 @@
-import tkinter as tk
-from tkinter.messagebox import showerror
+import multiprocessing
+import sys
 from app.config import (
-    APP_NAME, ICON_PATH, DEFAULT_USER_CONFIG, USER_CONFIG_PATH,
-    USER_CONFIG_VERSION, MAIN_WINDOW_HEIGHT, MAIN_WINDOW_WIDTH
+    DEFAULT_USER_CONFIG, USER_CONFIG_PATH, USER_CONFIG_VERSION
 )
-from app.gui import AppFrame, AppMenuBar
+from app.server import ServerClient
 from app.user_config import UserConfigManager
 from app.utils import AppUtils
 
-class App(tk.Tk):
-    """
-    The main application class that initializes and runs the tkinter GUI.
-
-    This class inherits from tkinter's Tk class and sets up the application
-    window, including setting the window icon, title, and size, and
-    initializing the menu bar and main application frame.
-
-    Methods:
-        center_window(width, height): Centers the window on the screen with
-                                      the given dimensions.
-    """
-    def __init__(self) -> None:
-        """
-        Initializes the App class by setting up the main application window,
-        its properties, and the components.
-        """
-        super().__init__()
-
-        icon_path: str = AppUtils.get_asset_path(ICON_PATH)
-
-        # Set application window properties
-        self.iconbitmap(icon_path)
-        self.resizable(False, False)
-        self.title(APP_NAME)
-
-        # Create an instance of Menu Bar
-        self.menu = AppMenuBar(self)
-        self.config(menu=self.menu.menu_bar)
-
-        # Center the window on the screen
-        self.center_window(MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT)
-
-    def center_window(self, width: int, height: int) -> None:
-        """
-        Centers the window on the screen using the specified width and height.
-
-        Args:
-            width (int): The width of the window.
-            height (int): The height of the window.
-        """
-        screen_width: int = self.winfo_screenwidth()
-        screen_height: int = self.winfo_screenheight()
-        center_x: int = (screen_width - width) // 2
-        center_y: int = (screen_height - height) // 2
-        self.geometry(f'{width}x{height}+{center_x}+{center_y}')
-
 def init_user_config() -> dict:
     """
     Initializes the user configuration.
@@ -77,13 +29,51 @@ def init_user_config() -> dict:
 
     return user_config
 
+def run_cli(argv: list[str]) -> int:
+    """
+    Runs the command line interface. Commands are forwarded to the resident
+    server if it is running, so they are served from its warm state. The
+    command line interface is imported only if they run locally, so a
+    forwarded command does not pay for it.
+
+    Args:
+        argv (list[str]): The command line arguments.
+
+    Returns:
+        int: The exit code.
+    """
+    code: int | None = ServerClient.forward(argv)
+    if code is not None:
+        return code
+
+    from app.cli import AppCli
+
+    try:
+        user_config: dict = init_user_config()
+    except Exception as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+
+    return AppCli(user_config).run(argv)
+
 if __name__ == '__main__':
     """
     Main execution point of the application.
 
-    This section initializes user configuration,
-    creates the main application window, and starts the event loop.
+    This section initializes user configuration, then either runs the command
+    line interface, if any arguments were given, or creates the main
+    application window and starts the event loop. The GUI modules are
+    imported only when the window is created.
     """
+    # Worker processes of a frozen executable must not start the application
+    multiprocessing.freeze_support()
+
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
+
+    from tkinter.messagebox import showerror
+    from app.gui import App, AppFrame
+
     try:
         user_config: dict = init_user_config()
         app = App()
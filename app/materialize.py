@@ -0,0 +1,227 @@
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from app.scheme import Scheme
+from app.utils import DCFileManager
+
+class SchemeMaterializer:
+    """
+    Merges recently used schemes into the DC configuration files ahead of
+    time in a background thread, so applying one of them only renames ready
+    files over the DC configuration files.
+
+    Ready files are written next to the DC configuration files, so the
+    rename is atomic. Each entry records fingerprints of the scheme and DC
+    configuration files it was merged from. Once any of them changes, e.g.
+    by DC itself, the entry is stale: it is merged again and never applied.
+
+    Attributes:
+        cache_size (int): The maximum number of materialized schemes.
+        executor (ThreadPoolExecutor): Background worker merging the files.
+        lock (threading.Lock): Lock guarding the cache.
+        entries (OrderedDict): Schemes paired with futures of their ready
+                               files, keyed by scheme and apply options, in
+                               least recently used order.
+    """
+    def __init__(self, cache_size: int) -> None:
+        """
+        Initializes the SchemeMaterializer class.
+
+        Args:
+            cache_size (int): The maximum number of materialized schemes.
+        """
+        self.cache_size: int = cache_size
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='scheme-materialize'
+        )
+        self.lock: threading.Lock = threading.Lock()
+        self.entries: OrderedDict[
+            tuple, tuple[Scheme, Future | None]
+        ] = OrderedDict()
+
+        # Ready files must not be left next to the DC configuration files
+        atexit.register(self.clear)
+
+    @staticmethod
+    def get_key(scheme: Scheme) -> tuple:
+        """
+        Gets the cache key of the scheme, covering all options affecting the
+        merged files.
+
+        Args:
+            scheme (Scheme): The scheme.
+
+        Returns:
+            tuple: The cache key.
+        """
+        return (
+            scheme.scheme_path, scheme.scheme, scheme.auto_dark_mode,
+            tuple(
+                tuple(spec.values()) for spec in scheme.xml_tag_specs
+            ), tuple(scheme.file_types),
+            tuple(sorted(scheme.dc_configs.items()))
+        )
+
+    @staticmethod
+    def copy_scheme(scheme: Scheme) -> Scheme:
+        """
+        Creates a copy of the scheme without any parsed files.
+
+        Args:
+            scheme (Scheme): The scheme.
+
+        Returns:
+            Scheme: The copy of the scheme.
+        """
+        return Scheme(
+            scheme.scheme, scheme.scheme_path, scheme.dc_configs,
+            scheme.dc_configs_backup, scheme.auto_dark_mode,
+            scheme.xml_tag_specs,
+            scheme.file_types
+        )
+
+    @staticmethod
+    def build(scheme: Scheme) -> dict:
+        """
+        Merges the scheme and writes the ready files, runs in the background
+        worker.
+
+        Args:
+            scheme (Scheme): A fresh copy of the scheme to merge.
+
+        Returns:
+            dict: Fingerprints of the scheme files ('sources') and of the DC
+                  configuration files ('targets'), paths to the ready files
+                  ('files') and the replaced sections ('replaced'), all keyed
+                  by file type.
+        """
+        # Fingerprints first, a change during the merge makes it stale
+        sources: dict[str, tuple | None] = {}
+        targets: dict[str, tuple | None] = {}
+        for file_type in scheme.file_types:
+            sources[file_type] = scheme.get_source_fingerprint(file_type)
+            targets[file_type] = scheme.get_target_fingerprint(file_type)
+
+        files: dict[str, str] = DCFileManager.write_ready_files(
+            scheme.merge_scheme()
+        )
+
+        return {
+            'sources': sources, 'targets': targets, 'files': files,
+            'replaced': scheme.replaced
+        }
+
+    @staticmethod
+    def is_fresh(future: Future, scheme: Scheme) -> bool:
+        """
+        Checks if a finished entry is still up to date with the files.
+
+        Args:
+            future (Future): The future of the ready files.
+            scheme (Scheme): The materialized scheme.
+
+        Returns:
+            bool: True if the entry is pending or all files are unchanged.
+        """
+        if not future.done():
+            return True
+        if future.exception() is not None:
+            return False
+
+        result: dict = future.result()
+        try:
+            return all(
+                result['sources'][file_type] == (
+                    scheme.get_source_fingerprint(file_type)
+                ) and result['targets'][file_type] == (
+                    scheme.get_target_fingerprint(file_type)
+                ) for file_type in scheme.file_types
+            )
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def discard(future: Future) -> None:
+        """
+        Removes the ready files of an entry, once they are written.
+
+        Args:
+            future (Future): The future of the ready files.
+        """
+        def remove(done: Future) -> None:
+            if done.exception() is None:
+                DCFileManager.remove_files(
+                    list(done.result()['files'].values())
+                )
+
+        future.add_done_callback(remove)
+
+    def materialize(self, scheme: Scheme) -> None:
+        """
+        Schedules merging of the scheme and of the other cached schemes whose
+        entries are missing or stale.
+
+        Args:
+            scheme (Scheme): The scheme to materialize.
+        """
+        key: tuple = self.get_key(scheme)
+
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = (self.copy_scheme(scheme), None)
+            self.entries.move_to_end(key)
+
+            # Evict least recently used schemes
+            while len(self.entries) > self.cache_size:
+                future: Future | None = self.entries.popitem(last=False)[1][1]
+                if future is not None:
+                    self.discard(future)
+
+            # Favorites are merged again once the DC configuration changed
+            for cached_key in list(self.entries):
+                cached_scheme, future = self.entries[cached_key]
+                if future is not None:
+                    if self.is_fresh(future, cached_scheme):
+                        continue
+                    self.discard(future)
+
+                # Merging consumes parsed files, so every merge gets a copy
+                self.entries[cached_key] = (
+                    cached_scheme, self.executor.submit(
+                        self.build, self.copy_scheme(cached_scheme)
+                    )
+                )
+
+    def prepare(self, scheme: Scheme) -> None:
+        """
+        Hands over ready files to the scheme about to be applied. Entries
+        still in progress or failed are dropped, so the scheme is merged as
+        usual.
+
+        Args:
+            scheme (Scheme): The scheme about to be applied.
+        """
+        with self.lock:
+            # The ready files will be renamed by the apply
+            entry: tuple[Scheme, Future | None] | None = self.entries.pop(
+                self.get_key(scheme), None
+            )
+
+        if entry is None or entry[1] is None:
+            return
+        future: Future = entry[1]
+        if future.done() and future.exception() is None:
+            scheme.materialized = future.result()
+        else:
+            self.discard(future)
+
+    def clear(self) -> None:
+        """
+        Drops all entries and removes their ready files.
+        """
+        with self.lock:
+            for cached_scheme, future in self.entries.values():
+                if future is not None:
+                    self.discard(future)
+            self.entries.clear()
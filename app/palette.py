@@ -0,0 +1,261 @@
+import heapq
+import math
+from itertools import product
+from app.colors import ColorUtils
+
+class PaletteIndex:
+    """
+    A spatial index of scheme palettes, finding schemes similar to a scheme
+    or close to a color.
+
+    Each scheme is represented by its dominant colors, converted to CIELAB,
+    where euclidean distance approximates the perceived difference. Colors
+    are bucketed in a grid of cubic cells, which is searched in growing
+    shells of cells around the queried color. Colors outside the searched
+    shells are farther than their radius, so the search stops as soon as
+    enough schemes are closer, and a query visits only cells near the
+    queried color, however many schemes are indexed.
+
+    Attributes:
+        cell_size (float): The edge of a grid cell, in CIELAB units.
+        names (list[str]): Names of indexed schemes, by scheme id.
+        ids (dict[str, int]): Scheme ids by name.
+        palettes (list[list[tuple]]): CIELAB colors of schemes, by scheme
+                                      id.
+        cells (dict[tuple[int, int, int], list[tuple]]): Scheme ids and
+                                                          CIELAB colors by
+                                                          grid cell.
+        bounds (list[list[int]] | None): The lowest and highest occupied
+                                         cell, None while empty.
+    """
+    def __init__(self, cell_size: float) -> None:
+        """
+        Initializes the PaletteIndex class.
+
+        Args:
+            cell_size (float): The edge of a grid cell, in CIELAB units.
+        """
+        self.cell_size: float = cell_size
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+        self.palettes: list[list[tuple]] = []
+        self.cells: dict[tuple[int, int, int], list[tuple]] = {}
+        self.bounds: list[list[int]] | None = None
+
+    def __len__(self) -> int:
+        """
+        Gets the number of indexed schemes.
+
+        Returns:
+            int: The number of schemes with a palette.
+        """
+        return sum(1 for palette in self.palettes if palette)
+
+    def get_cell(self, lab: tuple) -> tuple[int, int, int]:
+        """
+        Gets the grid cell containing a color.
+
+        Args:
+            lab (tuple): The CIELAB color.
+
+        Returns:
+            tuple[int, int, int]: The cell coordinates.
+        """
+        return tuple(math.floor(value / self.cell_size) for value in lab)
+
+    def add(self, name: str, colors: list[int]) -> None:
+        """
+        Adds a scheme to the index, replacing its previous palette.
+
+        Args:
+            name (str): The name of the scheme.
+            colors (list[int]): Dominant colors of the scheme as TColor
+                                integers.
+        """
+        scheme_id: int | None = self.ids.get(name)
+        if scheme_id is None:
+            scheme_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.palettes.append([])
+
+        # Drop the previous palette
+        for lab in self.palettes[scheme_id]:
+            self.cells[self.get_cell(lab)].remove((scheme_id, lab))
+
+        self.palettes[scheme_id] = [
+            ColorUtils.to_lab(color) for color in dict.fromkeys(colors)
+        ]
+        for lab in self.palettes[scheme_id]:
+            cell: tuple[int, int, int] = self.get_cell(lab)
+            self.cells.setdefault(cell, []).append((scheme_id, lab))
+            if self.bounds is None:
+                self.bounds = [list(cell), list(cell)]
+            else:
+                for axis, value in enumerate(cell):
+                    self.bounds[0][axis] = min(self.bounds[0][axis], value)
+                    self.bounds[1][axis] = max(self.bounds[1][axis], value)
+
+    def add_entries(self, entries: list[dict]) -> None:
+        """
+        Adds schemes from their catalog entries.
+
+        Args:
+            entries (list[dict]): Catalog entries, with 'name' and
+                                  'dominantColors'.
+        """
+        for entry in entries:
+            self.add(entry['name'], entry.get('dominantColors') or [])
+
+    def iter_shell(
+        self, center: tuple[int, int, int], radius: int
+    ) -> list[tuple[int, int, int]]:
+        """
+        Gets occupied cells at the given distance from a cell.
+
+        Args:
+            center (tuple[int, int, int]): The central cell.
+            radius (int): The distance in cells, along the farthest axis.
+
+        Returns:
+            list[tuple[int, int, int]]: The occupied cells of the shell.
+        """
+        if radius == 0:
+            return [center] if center in self.cells else []
+
+        # Faces along the first two axes span the whole last axis, other
+        # cells are on the two faces along the last axis only
+        shell: list[tuple[int, int, int]] = []
+        span: range = range(-radius, radius + 1)
+        for dx, dy in product(span, span):
+            dzs: range | tuple[int, int] = (
+                span if max(abs(dx), abs(dy)) == radius else (-radius, radius)
+            )
+            for dz in dzs:
+                cell: tuple[int, int, int] = (
+                    center[0] + dx, center[1] + dy, center[2] + dz
+                )
+                if cell in self.cells:
+                    shell.append(cell)
+
+        return shell
+
+    def nearest(
+        self, lab: tuple, limit: int, exclude: int | None = None
+    ) -> dict[int, float]:
+        """
+        Finds schemes with a color closest to a color.
+
+        Args:
+            lab (tuple): The CIELAB color.
+            limit (int): The maximum number of schemes.
+            exclude (int | None): The id of a scheme to skip.
+
+        Returns:
+            dict[int, float]: Distances of the closest color by scheme id.
+        """
+        if self.bounds is None or limit <= 0:
+            return {}
+
+        center: tuple[int, int, int] = self.get_cell(lab)
+        # Beyond this radius no cell is occupied
+        max_radius: int = max(
+            max(center[axis] - self.bounds[0][axis],
+                self.bounds[1][axis] - center[axis])
+            for axis in range(3)
+        )
+        best: dict[int, float] = {}
+
+        for radius in range(max_radius + 1):
+            for cell in self.iter_shell(center, radius):
+                for scheme_id, point in self.cells[cell]:
+                    if scheme_id == exclude:
+                        continue
+                    distance: float = math.dist(lab, point)
+                    if distance < best.get(scheme_id, math.inf):
+                        best[scheme_id] = distance
+
+            # Colors beyond the searched shells are farther than its radius
+            if len(best) >= limit and heapq.nsmallest(
+                limit, best.values()
+            )[-1] <= radius * self.cell_size:
+                break
+
+        return dict(heapq.nsmallest(
+            limit, best.items(), key=lambda item: item[1]
+        ))
+
+    @staticmethod
+    def palette_distance(palette: list[tuple], other: list[tuple]) -> float:
+        """
+        Computes the distance of two palettes, the mean distance of each
+        color to the closest color of the other palette, both ways.
+
+        Args:
+            palette (list[tuple]): CIELAB colors.
+            other (list[tuple]): CIELAB colors.
+
+        Returns:
+            float: The distance, 0 for identical palettes.
+        """
+        def directed(source: list[tuple], target: list[tuple]) -> float:
+            return sum(
+                min(math.dist(lab, point) for point in target)
+                for lab in source
+            ) / len(source)
+
+        return (directed(palette, other) + directed(other, palette)) / 2
+
+    def near_color(self, color: int, limit: int) -> list[tuple[str, float]]:
+        """
+        Finds schemes with a color closest to a color.
+
+        Args:
+            color (int): The color as TColor integer.
+            limit (int): The maximum number of schemes.
+
+        Returns:
+            list[tuple[str, float]]: Names of schemes and the distance of
+                                     their closest color, closest first.
+        """
+        found: dict[int, float] = self.nearest(
+            ColorUtils.to_lab(color), limit
+        )
+
+        return sorted(
+            ((self.names[scheme_id], round(distance, 2))
+             for scheme_id, distance in found.items()),
+            key=lambda item: (item[1], item[0])
+        )
+
+    def similar(self, name: str, limit: int) -> list[tuple[str, float]]:
+        """
+        Finds schemes with palettes similar to the palette of a scheme.
+        Candidates are the schemes closest to any of its colors, ranked by
+        the distance of whole palettes.
+
+        Args:
+            name (str): The name of the scheme.
+            limit (int): The maximum number of schemes.
+
+        Returns:
+            list[tuple[str, float]]: Names of schemes and the distance of
+                                     their palettes, most similar first.
+
+        Raises:
+            KeyError: If the scheme is not indexed or has no colors.
+        """
+        scheme_id: int | None = self.ids.get(name)
+        if scheme_id is None or not self.palettes[scheme_id]:
+            raise KeyError(f'Scheme \'{name}\' has no indexed colors.')
+        palette: list[tuple] = self.palettes[scheme_id]
+
+        candidates: set[int] = set()
+        for lab in palette:
+            candidates.update(self.nearest(lab, limit, scheme_id))
+
+        return sorted(
+            ((self.names[candidate], round(self.palette_distance(
+                palette, self.palettes[candidate]
+            ), 2)) for candidate in candidates),
+            key=lambda item: (item[1], item[0])
+        )[:limit]
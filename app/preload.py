@@ -0,0 +1,189 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from app.materialize import SchemeMaterializer
+from app.scheme import Scheme
+
+class SchemePreloader:
+    """
+    Speculatively parses schemes and DC configuration files in a background
+    thread, so only the merge and write steps remain when a scheme is applied.
+
+    Parsed schemes are kept in a bounded LRU cache. Parsed DC configuration
+    files are kept as a single snapshot, consumed by the next apply. With a
+    materializer, preloaded schemes are also merged ahead of time.
+
+    Attributes:
+        cache_size (int): The maximum number of cached schemes.
+        materializer (SchemeMaterializer | None): Merges preloaded schemes
+                                                  ahead of time.
+        executor (ThreadPoolExecutor): Background worker parsing the files.
+        lock (threading.Lock): Lock guarding the cache and the snapshot.
+        sources (OrderedDict): Futures of preloaded schemes, keyed by scheme
+                               and selection, in least recently used order.
+        targets (Future | None): Future of the preloaded DC configuration
+                                 files snapshot.
+    """
+    def __init__(
+        self, cache_size: int,
+        materializer: SchemeMaterializer | None = None
+    ) -> None:
+        """
+        Initializes the SchemePreloader class.
+
+        Args:
+            cache_size (int): The maximum number of cached schemes.
+            materializer (SchemeMaterializer | None): Merges preloaded
+                                                      schemes ahead of time.
+        """
+        self.cache_size: int = cache_size
+        self.materializer: SchemeMaterializer | None = materializer
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='scheme-preload'
+        )
+        self.lock: threading.Lock = threading.Lock()
+        self.sources: OrderedDict[tuple, Future] = OrderedDict()
+        self.targets: Future | None = None
+
+    @staticmethod
+    def is_fresh(
+        future: Future, get_fingerprint: Callable[[str], tuple | None]
+    ) -> bool:
+        """
+        Checks if a finished preload is still up to date with the files.
+
+        Args:
+            future (Future): The future of the preloaded scheme or snapshot.
+            get_fingerprint (Callable[[str], tuple | None]): Gets the current
+                                                             fingerprint of a
+                                                             file type.
+
+        Returns:
+            bool: True if the preload is pending or all files are unchanged.
+        """
+        if not future.done():
+            return True
+        if future.exception() is not None:
+            return False
+
+        return all(
+            fingerprint == get_fingerprint(file_type)
+            for file_type, (fingerprint, config) in future.result().items()
+        )
+
+    @staticmethod
+    def get_key(scheme: Scheme) -> tuple:
+        """
+        Gets the cache key of the scheme. The selected files and tags decide
+        which files are parsed and how they are validated, so a scheme
+        preloaded with another selection is not reused.
+
+        Args:
+            scheme (Scheme): The scheme.
+
+        Returns:
+            tuple: The cache key.
+        """
+        return (
+            scheme.scheme_path, scheme.scheme, scheme.auto_dark_mode,
+            scheme.get_selection()
+        )
+
+    @staticmethod
+    def load_sources(scheme: Scheme) -> dict:
+        """
+        Parses and validates the scheme files, runs in the background worker.
+
+        Args:
+            scheme (Scheme): The scheme to parse.
+
+        Returns:
+            dict: Parsed scheme files paired with their fingerprints.
+        """
+        scheme.load_sources()
+
+        return scheme.sources
+
+    @staticmethod
+    def load_targets(scheme: Scheme) -> dict:
+        """
+        Parses the DC configuration files, runs in the background worker.
+
+        Args:
+            scheme (Scheme): The scheme holding the DC configuration paths.
+
+        Returns:
+            dict: Parsed configuration files paired with their fingerprints.
+        """
+        scheme.load_targets()
+
+        return scheme.targets
+
+    def preload(self, scheme: Scheme) -> None:
+        """
+        Schedules parsing of the scheme and the DC configuration files, unless
+        they are already preloaded and up to date.
+
+        Args:
+            scheme (Scheme): The scheme to preload.
+        """
+        key: tuple = self.get_key(scheme)
+        worker_scheme = Scheme(
+            scheme.scheme, scheme.scheme_path, scheme.dc_configs,
+            scheme.dc_configs_backup, scheme.auto_dark_mode,
+            scheme.xml_tag_specs,
+            scheme.file_types
+        )
+
+        with self.lock:
+            future: Future | None = self.sources.get(key)
+            if future is None or not self.is_fresh(
+                future, scheme.get_source_fingerprint
+            ):
+                self.sources[key] = self.executor.submit(
+                    self.load_sources, worker_scheme
+                )
+            self.sources.move_to_end(key)
+
+            # Evict least recently used schemes
+            while len(self.sources) > self.cache_size:
+                self.sources.popitem(last=False)
+
+            try:
+                targets_fresh: bool = self.targets is not None and (
+                    self.is_fresh(self.targets, scheme.get_target_fingerprint)
+                )
+            except FileNotFoundError:
+                targets_fresh = False
+            if not targets_fresh:
+                self.targets = self.executor.submit(
+                    self.load_targets, worker_scheme
+                )
+
+        if self.materializer is not None:
+            self.materializer.materialize(scheme)
+
+    def prepare(self, scheme: Scheme) -> None:
+        """
+        Hands over preloaded files to the scheme about to be applied. Waits
+        for the preload of this scheme if it is still in progress. Failed
+        preloads are skipped, so the apply reports the error itself.
+
+        Args:
+            scheme (Scheme): The scheme about to be applied.
+        """
+        key: tuple = self.get_key(scheme)
+
+        with self.lock:
+            sources: Future | None = self.sources.get(key)
+            targets: Future | None = self.targets
+            # The snapshot will be modified by the apply
+            self.targets = None
+
+        if sources is not None and sources.exception() is None:
+            scheme.sources = dict(sources.result())
+        if targets is not None and targets.exception() is None:
+            scheme.targets = dict(targets.result())
+        if self.materializer is not None:
+            self.materializer.prepare(scheme)
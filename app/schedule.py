@@ -0,0 +1,425 @@
+import json
+import os
+import threading
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from app.scheme import Scheme
+
+class CronExpression:
+    """
+    A cron-like expression with minute, hour, day of month, month and day of
+    week fields. Fields accept '*', single values, ranges, lists and steps,
+    e.g. '*/15', '1-5' or '0,30'. Day of week 0 and 7 are Sunday.
+
+    As in cron, if both day fields are restricted, a day matching either of
+    them matches.
+
+    Attributes:
+        expression (str): The original expression.
+        minutes (set[int]): Matching minutes.
+        hours (set[int]): Matching hours.
+        days (set[int]): Matching days of month.
+        months (set[int]): Matching months.
+        weekdays (set[int]): Matching days of week, 0 is Sunday.
+        days_restricted (bool): Whether the day of month field is not '*'.
+        weekdays_restricted (bool): Whether the day of week field is not '*'.
+    """
+    SEARCH_LIMIT = timedelta(days=5 * 366)
+
+    def __init__(self, expression: str) -> None:
+        """
+        Parses the expression.
+
+        Args:
+            expression (str): The cron-like expression.
+
+        Raises:
+            ValueError: If the expression is not valid.
+        """
+        fields: list[str] = expression.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f'Cron expression \'{expression}\' must have 5 fields.'
+            )
+
+        self.expression: str = expression
+        self.minutes: set[int] = self.parse_field(fields[0], 0, 59)
+        self.hours: set[int] = self.parse_field(fields[1], 0, 23)
+        self.days: set[int] = self.parse_field(fields[2], 1, 31)
+        self.months: set[int] = self.parse_field(fields[3], 1, 12)
+        self.weekdays: set[int] = {
+            weekday % 7 for weekday in self.parse_field(fields[4], 0, 7)
+        }
+        self.days_restricted: bool = fields[2] != '*'
+        self.weekdays_restricted: bool = fields[4] != '*'
+
+    @staticmethod
+    def parse_field(field: str, low: int, high: int) -> set[int]:
+        """
+        Parses a single field of the expression.
+
+        Args:
+            field (str): The field.
+            low (int): The lowest allowed value.
+            high (int): The highest allowed value.
+
+        Returns:
+            set[int]: Matching values.
+
+        Raises:
+            ValueError: If the field is not valid.
+        """
+        values: set[int] = set()
+
+        for part in field.split(','):
+            value_range, _, step_text = part.partition('/')
+            step: int = int(step_text) if step_text else 1
+            if value_range == '*':
+                start, end = low, high
+            elif '-' in value_range:
+                start, end = (int(value) for value in value_range.split('-'))
+            else:
+                start = int(value_range)
+                end = high if step_text else start
+            if step < 1 or start < low or end > high or start > end:
+                raise ValueError(
+                    f'Cron field \'{field}\' is out of range {low}-{high}.'
+                )
+            values.update(range(start, end + 1, step))
+
+        return values
+
+    def match_day(self, moment: datetime) -> bool:
+        """
+        Checks if the day of the moment matches the day fields.
+
+        Args:
+            moment (datetime): The moment to check.
+
+        Returns:
+            bool: True if the day matches.
+        """
+        day: bool = moment.day in self.days
+        weekday: bool = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return day or weekday
+
+        return day and weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Finds the first matching minute after the moment. Non-matching
+        months, days and hours are skipped as a whole.
+
+        Args:
+            moment (datetime): The moment to search from.
+
+        Returns:
+            datetime: The first matching minute after the moment.
+
+        Raises:
+            ValueError: If the expression never matches.
+        """
+        moment = moment.replace(second=0, microsecond=0)
+        limit: datetime = moment + self.SEARCH_LIMIT
+        moment += timedelta(minutes=1)
+
+        while moment < limit:
+            if moment.month not in self.months:
+                moment = (
+                    moment.replace(day=1, hour=0, minute=0)
+                    + timedelta(days=32)
+                ).replace(day=1)
+            elif not self.match_day(moment):
+                moment = (
+                    moment.replace(hour=0, minute=0) + timedelta(days=1)
+                )
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+
+        raise ValueError(
+            f'Cron expression \'{self.expression}\' never matches.'
+        )
+
+    def previous(self, moment: datetime) -> datetime:
+        """
+        Finds the last matching minute at or before the moment.
+
+        Args:
+            moment (datetime): The moment to search from.
+
+        Returns:
+            datetime: The last matching minute at or before the moment.
+
+        Raises:
+            ValueError: If the expression never matches.
+        """
+        moment = moment.replace(second=0, microsecond=0)
+        limit: datetime = moment - self.SEARCH_LIMIT
+
+        while moment > limit:
+            if moment.month not in self.months:
+                moment = (
+                    moment.replace(day=1, hour=0, minute=0)
+                    - timedelta(minutes=1)
+                )
+            elif not self.match_day(moment):
+                moment = (
+                    moment.replace(hour=0, minute=0) - timedelta(minutes=1)
+                )
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) - timedelta(minutes=1)
+            elif moment.minute not in self.minutes:
+                moment -= timedelta(minutes=1)
+            else:
+                return moment
+
+        raise ValueError(
+            f'Cron expression \'{self.expression}\' never matches.'
+        )
+
+class SchemeScheduler:
+    """
+    Switches schemes on time of day or cron-like rules.
+
+    The scheduler sleeps until the next transition rather than polling. The
+    sleep is timed by the monotonic clock, so the wall clock is compared on
+    each wake: an early wake sleeps the rest again, and transitions missed
+    while the machine was suspended or the clock was set forward are caught
+    up, the latest due transition is applied once. Schemes are parsed and
+    validated up front, so a switch only merges and writes the files. The
+    last applied transition is kept in a state file, so a restart does not
+    re-apply it, e.g. over a manual change.
+
+    Rules are dictionaries with 'scheme' and either 'at' ('HH:MM') or 'cron'
+    keys, and an optional 'autoDarkMode' key.
+
+    Attributes:
+        rules (list[tuple[CronExpression, dict]]): Parsed rules.
+        state_path (str): The path to the state file.
+        schemes (dict[int, Scheme]): Validated schemes, keyed by rule index.
+        state (dict): The last applied transition.
+        stopped (threading.Event): Set to stop the scheduler.
+    """
+    def __init__(self, rules: list[dict], state_path: str) -> None:
+        """
+        Initializes the SchemeScheduler class.
+
+        Args:
+            rules (list[dict]): The schedule rules.
+            state_path (str): The path to the state file.
+
+        Raises:
+            ValueError: If any rule is not valid.
+        """
+        self.rules: list[tuple[CronExpression, dict]] = self.parse_rules(
+            rules
+        )
+        self.state_path: str = state_path
+        self.schemes: dict[int, Scheme] = {}
+        self.state: dict = self.load_state()
+        self.stopped: threading.Event = threading.Event()
+
+    @staticmethod
+    def parse_rules(rules: list[dict]) -> list[tuple[CronExpression, dict]]:
+        """
+        Parses the schedule rules.
+
+        Args:
+            rules (list[dict]): The schedule rules.
+
+        Returns:
+            list[tuple[CronExpression, dict]]: Rules paired with their
+                                               expressions.
+
+        Raises:
+            ValueError: If any rule is not valid.
+        """
+        if not rules:
+            raise ValueError('No schedule rules are configured.')
+
+        parsed: list[tuple[CronExpression, dict]] = []
+        for i, rule in enumerate(rules):
+            try:
+                if not rule.get('scheme'):
+                    raise ValueError('Key \'scheme\' is missing.')
+                if 'at' in rule:
+                    hour, minute = (int(value) for value in (
+                        rule['at'].split(':')
+                    ))
+                    expression = CronExpression(f'{minute} {hour} * * *')
+                elif 'cron' in rule:
+                    expression = CronExpression(rule['cron'])
+                else:
+                    raise ValueError('Key \'at\' or \'cron\' is missing.')
+                expression.next_after(datetime.now())
+            except (ValueError, AttributeError) as e:
+                raise ValueError(f'Schedule rule {i + 1}: {e}') from e
+            parsed.append((expression, rule))
+
+        return parsed
+
+    def validate(self, create_scheme: Callable[[str, bool], Scheme]) -> None:
+        """
+        Parses and validates schemes of all rules up front.
+
+        Args:
+            create_scheme (Callable[[str, bool], Scheme]): Creates the scheme
+                from its name and the auto dark mode flag.
+
+        Raises:
+            ValueError: If the scheme of any rule is not valid.
+        """
+        for i, (expression, rule) in enumerate(self.rules):
+            try:
+                scheme: Scheme = create_scheme(
+                    rule['scheme'], rule.get('autoDarkMode', False)
+                )
+                scheme.load_sources()
+            except Exception as e:
+                raise ValueError(f'Schedule rule {i + 1}: {e}') from e
+            self.schemes[i] = scheme
+
+    def load_state(self) -> dict:
+        """
+        Reads the state file.
+
+        Returns:
+            dict: The last applied transition, empty if unknown.
+        """
+        try:
+            with open(self.state_path, encoding='utf-8') as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self) -> None:
+        """
+        Writes the state file, replacing it atomically.
+        """
+        temp_path: str = f'{self.state_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as state_file:
+            json.dump(self.state, state_file, indent=2)
+        os.replace(temp_path, self.state_path)
+
+    def get_due(self, now: datetime) -> tuple[int, datetime]:
+        """
+        Finds the latest transition at or before now.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            tuple[int, datetime]: The rule index and the transition time.
+                                  Later rules win ties.
+        """
+        return max(
+            (
+                (i, expression.previous(now))
+                for i, (expression, rule) in enumerate(self.rules)
+            ),
+            key=lambda due: (due[1], due[0])
+        )
+
+    def get_next(self, now: datetime) -> datetime:
+        """
+        Finds the first transition after now.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            datetime: The transition time.
+        """
+        return min(
+            expression.next_after(now) for expression, rule in self.rules
+        )
+
+    def switch(self, now: datetime) -> str | None:
+        """
+        Applies the scheme of the latest due transition, unless it has been
+        applied already.
+
+        Args:
+            now (datetime): The current time.
+
+        Returns:
+            str | None: The name of the applied scheme, or None if the due
+                        transition has been applied already.
+        """
+        rule_index, transition = self.get_due(now)
+        state: dict = {
+            'rule': rule_index, 'transition': transition.isoformat()
+        }
+        if self.state.get('rule') == state['rule'] and (
+            self.state.get('transition') == state['transition']
+        ):
+            return None
+
+        # Fresh copy reusing the validated scheme files
+        validated: Scheme = self.schemes[rule_index]
+        scheme = Scheme(
+            validated.scheme, validated.scheme_path, validated.dc_configs,
+            validated.dc_configs_backup, validated.auto_dark_mode,
+            validated.xml_tag_specs
+        )
+        scheme.sources = dict(validated.sources)
+        scheme.apply_scheme()
+
+        self.state = {**state, 'scheme': scheme.scheme}
+        self.save_state()
+
+        return scheme.scheme
+
+    def sleep_until(self, moment: datetime) -> None:
+        """
+        Sleeps until the wall clock reaches the moment or the scheduler is
+        stopped. The wall clock is read again on each wake, as the monotonic
+        sleep does not follow clock adjustments.
+
+        Args:
+            moment (datetime): The moment to wake at.
+        """
+        while not self.stopped.is_set():
+            remaining: float = (moment - datetime.now()).total_seconds()
+            if remaining <= 0:
+                return
+            self.stopped.wait(remaining)
+
+    def stop(self) -> None:
+        """
+        Stops the scheduler.
+        """
+        self.stopped.set()
+
+    def run(self, on_event: Callable[[str, str], None]) -> None:
+        """
+        Switches schemes until stopped.
+
+        Args:
+            on_event (Callable[[str, str], None]): Receives the event kind
+                ('applied', 'waiting' or 'error') and its message.
+        """
+        while not self.stopped.is_set():
+            now: datetime = datetime.now()
+            try:
+                name: str | None = self.switch(now)
+                if name is not None:
+                    on_event('applied', f'Scheme \'{name}\' applied.')
+            except Exception as e:
+                on_event('error', str(e))
+
+            next_transition: datetime = self.get_next(now)
+            if self.state.get('next') != next_transition.isoformat():
+                self.state['next'] = next_transition.isoformat()
+                on_event(
+                    'waiting',
+                    f'Next switch at {next_transition:%Y-%m-%d %H:%M}.'
+                )
+
+            # Due transitions are checked against the wall clock on wake
+            self.sleep_until(next_transition)
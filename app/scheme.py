@@ -1,9 +1,20 @@
+import io
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter.messagebox import showwarning
 import configobj
 import defusedxml.ElementTree as defusedxmlET
-import defusedxml.minidom as defusedxmlMD
-from app.utils import DCFileManager, SchemeFileManager
+from app.config import (
+    APPLY_LOCK_NAME, APPLY_LOCK_POLL_INTERVAL, APPLY_LOCK_TIMEOUT,
+    HISTORY_PATH, HISTORY_SIZE, SCHEME_RESOLVE_CACHE_SIZE
+)
+from app.diff import SchemeDiff
+from app.history import ApplyHistory
+from app.inherit import SchemeResolver
+from app.lock import ProfileLock
+from app.store import SchemeStore
+from app.utils import AppUtils, DCFileManager, SchemeFileManager
+from app.validate import SchemeValidator
 
 class Scheme:
     """
@@ -11,184 +22,797 @@ class Scheme:
 
     Attributes:
         scheme (str): The name of the scheme.
-        scheme_path (str): The file path where the scheme files are located.
+        scheme_path (str): The path to the directory or zip archive where the
+                           scheme files are located.
+        store (SchemeStore): The store reading the scheme files.
         dc_configs (dict): A dictionary containing DC configuration file types
                            and their paths.
         dc_configs_backup (bool): A flag to backup DC  configuration before
                                   scheme apply.
         auto_dark_mode (bool): A flag to force auto dark mode if True.
         xml_tags (list): A list of XML tags to be modified in XML configuration
-                         files.
+                         files, given as normalized paths of nested tags.
+        xml_tag_specs (list[dict]): The XML tags with their merge strategies,
+                                    see SchemeFileManager.normalize_xml_tag.
+        file_types (list[str]): The configuration file types to apply, the
+                                xml file only if any XML tags are selected.
+        sources (dict): Preloaded scheme files, keyed by file type, paired with
+                        their file fingerprints.
+        targets (dict): Preloaded DC configuration files, keyed by file type,
+                        paired with their file fingerprints.
+        lock_times (tuple[float, float] | None): Seconds spent waiting for
+                                                 and holding the profile lock
+                                                 by the last apply.
+        replaced (dict[str, dict]): Sections replaced by the last apply,
+                                    keyed by file type, see ApplyHistory.
+        backups (dict[str, Future]): Backups in progress, keyed by file type.
+        materialized (dict | None): Ready files merged ahead of time, see
+                                    SchemeMaterializer.
+        resolver (SchemeResolver): Resolves schemes inheriting from base
+                                   schemes, shared by all schemes.
 
     Methods:
-        apply_scheme(): Applies the scheme to all configuration files
-                        (cfg, json, xml).
+        apply_scheme(): Applies the scheme to the selected configuration
+                        files (cfg, json, xml).
         apply_scheme_cfg(): Applies the scheme specifically to the cfg
                             configuration file.
         apply_scheme_json(): Applies the scheme specifically to the json
                              configuration file.
         apply_scheme_xml(): Applies the scheme specifically to the xml
                             configuration file.
-        verify_scheme(): Verifies the scheme version of all configuration files
-                         (cfg, json, xml).
+        merge_scheme(): Merges the scheme into all selected configuration
+                        files in memory.
+        switch_scheme(target_files, written): Renames ready files merged
+                                              ahead of time over the
+                                              configuration files.
+        replace_files(files, target_files, written): Renames ready files
+                                                     over the configuration
+                                                     files.
+        discard_materialized(): Removes unused ready files merged ahead of
+                                time.
+        wait_backup(file_type, target_file): Waits for the backup of the DC
+                                             configuration file.
+        diff_scheme(): Computes changes applying the scheme would make,
+                       without writing anything.
+        load_sources(): Parses and validates the selected scheme files.
+        validate_sources(): Validates the selected scheme files before any
+                            configuration file is touched.
+        load_targets(): Parses the selected DC configuration files.
+        verify_scheme(): Verifies the scheme version of the selected
+                         configuration files (cfg, json, xml).
+        get_config_versions(): Gets the xml configuration scheme version of
+                               the scheme and of the DC configuration.
         verify_scheme_version_xml(): Verifies the scheme version of xml
                                      configuration file specifically.
     """
+    resolver: SchemeResolver = SchemeResolver(SCHEME_RESOLVE_CACHE_SIZE)
+
     def __init__(
         self, scheme: str, scheme_path: str, dc_configs: dict[str, str],
-        dc_configs_backup: bool, auto_dark_mode: bool, xml_tags: list[str]
+        dc_configs_backup: bool, auto_dark_mode: bool,
+        xml_tags: list[str | dict], file_types: list[str] | None = None
     ) -> None:
         """
         Constructs all the necessary attributes for the Scheme object.
 
         Args:
             scheme (str): The name of the scheme.
-            scheme_path (str): The file path where the scheme files are
-                               located.
+            scheme_path (str): The path to the directory or zip archive
+                               where the scheme files are located.
             dc_configs (dict[str, str]): A dictionary containing DC
                                          configuration file types and their
                                          paths.
             dc_configs_backup (bool): A flag to backup DC  configuration before
                                       scheme apply.
             auto_dark_mode (bool): A flag to force auto dark mode if True.
-            xml_tags (list[str]): A list of XML tags to be modified in xml
-                                  configuration files.
+            xml_tags (list[str | dict]): A list of XML tags to be modified in
+                                         xml configuration files. Nested
+                                         tags are given as paths, e.g.
+                                         'Viewer/Colors'. Objects declare
+                                         the merge strategy of the tag, see
+                                         normalize_xml_tag.
+            file_types (list[str] | None): The configuration file types to
+                                           apply (cfg, json, xml), all if
+                                           None. Other files are neither
+                                           read, backed up nor written.
         """
         self.scheme: str = scheme
         self.scheme_path: str = scheme_path
+        self.store: SchemeStore = SchemeStore.create(scheme_path)
         self.dc_configs: dict[str, str] = dc_configs
         self.dc_configs_backup: bool = dc_configs_backup
         self.auto_dark_mode: bool = auto_dark_mode
-        self.xml_tags: list[str] = xml_tags
+        # Paths nested in another selected path are merged along with it
+        specs: dict[str, dict] = {}
+        for tag in xml_tags:
+            spec: dict = SchemeFileManager.normalize_xml_tag(tag)
+            specs.setdefault(spec['path'], spec)
+        self.xml_tag_specs: list[dict] = [
+            spec for path, spec in specs.items()
+            if not any(path.startswith(f'{other}/') for other in specs)
+        ]
+        self.xml_tags: list[str] = [
+            spec['path'] for spec in self.xml_tag_specs
+        ]
+        self.file_types: list[str] = [
+            file_type for file_type in ('cfg', 'json', 'xml')
+            if (file_types is None or file_type in file_types)
+            and (file_type != 'xml' or self.xml_tags)
+        ]
+        self.sources: dict[str, tuple[tuple[int, int] | None, object]] = {}
+        self.targets: dict[str, tuple[tuple[int, int] | None, object]] = {}
+        self.lock_times: tuple[float, float] | None = None
+        self.replaced: dict[str, dict] = {}
+        self.backups: dict[str, Future] = {}
+        self.materialized: dict | None = None
 
     def apply_scheme(self) -> None:
         """
-        Applies the scheme to all configuration files (cfg, json, xml).
+        Applies the scheme to the selected configuration files (cfg, json,
+        xml). The DC profile is locked meanwhile, so other instances applying
+        a scheme wait instead of interleaving their writes. Replaced sections
+        are recorded in the apply history.
+
+        Backups are snapshotted up front and written by a background worker
+        while the files are parsed and merged. All files are merged and
+        written to ready files before any of them is renamed over its DC
+        configuration file, so a failing merge leaves every file untouched.
+        Each file waits for its backup only before it is renamed. Ready
+        files merged ahead of time are renamed instead, if they are still up
+        to date. Files renamed before a failure are recorded in the history.
+
+        Raises:
+            ValueError: If no configuration files are selected or the scheme
+                        files are invalid.
+            OSError: If a configuration file cannot be written.
         """
-        self.apply_scheme_cfg()
-        self.apply_scheme_json()
-        self.apply_scheme_xml()
+        if not self.file_types:
+            raise ValueError('No configuration files are selected.')
+
+        # Pre-flight check, an invalid scheme must not touch any file
+        self.validate_sources()
+
+        target_files: dict[str, str] = {
+            file_type: DCFileManager.get_config(self.dc_configs[file_type])
+            for file_type in self.file_types
+        }
+        self.replaced = {}
+        written: list[str] = []
+        lock = ProfileLock(
+            list(target_files.values()), APPLY_LOCK_NAME, APPLY_LOCK_TIMEOUT,
+            APPLY_LOCK_POLL_INTERVAL
+        )
+
+        with lock, ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='scheme-backup'
+        ) as executor:
+            try:
+                if self.dc_configs_backup:
+                    for file_type, target_file in target_files.items():
+                        self.backups[file_type] = executor.submit(
+                            DCFileManager.write_backup, target_file,
+                            DCFileManager.snapshot_config(target_file)
+                        )
+
+                if not self.switch_scheme(target_files, written):
+                    files: dict[str, str] = DCFileManager.write_ready_files(
+                        self.merge_scheme()
+                    )
+                    try:
+                        self.replace_files(files, target_files, written)
+                    finally:
+                        DCFileManager.remove_files(list(files.values()))
+            finally:
+                if written:
+                    ApplyHistory(HISTORY_PATH, HISTORY_SIZE).record(
+                        self.scheme, {
+                            file_type: self.replaced[file_type]
+                            for file_type in written
+                        }
+                    )
+                self.backups = {}
+                self.discard_materialized()
+
+        self.lock_times = (lock.wait_time, lock.hold_time)
 
     def apply_scheme_cfg(self) -> None:
         """
         Applies the scheme specifically to the cfg configuration file.
         """
-        source_file: str = os.path.join(self.scheme_path, f'{self.scheme}.cfg')
+        target_file, target_config = self.merge_scheme_cfg()
+
+        # Backup current configuration
+        if self.dc_configs_backup:
+            self.wait_backup('cfg', target_file)
+
+        # Save modified DC cfg config file
+        SchemeFileManager.set_cfg(target_config, target_file)
+        self.targets.pop('cfg', None)
+
+    def merge_scheme_cfg(self) -> tuple[str, configobj.ConfigObj]:
+        """
+        Merges the scheme into the cfg configuration file in memory.
+
+        Returns:
+            tuple[str, ConfigObj]: The path to the configuration file and the
+                                   merged configuration.
+        """
         target_file: str = DCFileManager.get_config(self.dc_configs['cfg'])
-        source_config: configobj.ConfigObj = (
-            SchemeFileManager.get_cfg(source_file)
-        )
+        source_config: configobj.ConfigObj = self.get_source('cfg')
         target_config: configobj.ConfigObj = (
-            SchemeFileManager.get_cfg(target_file)
+            self.get_target('cfg', target_file)
         )
 
         # Set new 'DarkMode' value
+        self.replaced['cfg'] = {'DarkMode': target_config.get('DarkMode')}
         target_config['DarkMode'] = (
             '1' if self.auto_dark_mode else source_config['DarkMode']
         )
 
-        # Backup current configuration
-        if self.dc_configs_backup:
-            DCFileManager.backup_config(target_file)
-
-        # Save modified DC cfg config file
-        SchemeFileManager.set_cfg(target_config, target_file)
+        return target_file, target_config
 
     def apply_scheme_json(self) -> None:
         """
         Applies the scheme specifically to the json configuration file.
         """
-        source_file: str = (
-            os.path.join(self.scheme_path, f'{self.scheme}.json')
-        )
-        target_file: str = DCFileManager.get_config(self.dc_configs['json'])
-        source_config: dict = SchemeFileManager.get_json(source_file)
-        target_config: dict = SchemeFileManager.get_json(target_file)
+        target_file, target_config = self.merge_scheme_json()
 
         # Backup current configuration
         if self.dc_configs_backup:
-            DCFileManager.backup_config(target_file)
+            self.wait_backup('json', target_file)
+
+        # Save modified DC json config file
+        SchemeFileManager.set_json(target_config, target_file)
+        self.targets.pop('json', None)
+
+    def merge_scheme_json(self) -> tuple[str, dict]:
+        """
+        Merges the scheme into the json configuration file in memory.
+
+        Returns:
+            tuple[str, dict]: The path to the configuration file and the
+                              merged configuration.
+        """
+        target_file: str = DCFileManager.get_config(self.dc_configs['json'])
+        source_config: dict = self.get_source('json')
+        target_config: dict = self.get_target('json', target_file)
 
         # Replace the style if name matches
+        self.replaced['json'] = {'Styles': {}}
         for i, style in enumerate(target_config['Styles']):
             if style['Name'] == source_config['Styles'][0]['Name']:
+                self.replaced['json']['Styles'][style['Name']] = style
                 target_config['Styles'][i] = source_config['Styles'][0]
                 break
 
         # Replace the file colors
+        self.replaced['json']['FileColors'] = target_config.get('FileColors')
         target_config['FileColors'] = source_config['FileColors']
 
-        # Save modified DC json config file
-        SchemeFileManager.set_json(target_config, target_file)
+        return target_file, target_config
 
     def apply_scheme_xml(self) -> None:
         """
         Applies the scheme specifically to the xml configuration file.
         """
-        source_file: str = os.path.join(self.scheme_path, f'{self.scheme}.xml')
-        target_file: str = DCFileManager.get_config(self.dc_configs['xml'])
+        target_file, pretty_xml = self.merge_scheme_xml()
 
         # Backup current configuration
         if self.dc_configs_backup:
-            DCFileManager.backup_config(target_file)
+            self.wait_backup('xml', target_file)
+
+        # Save modified DC xml config file
+        SchemeFileManager.set_xml(pretty_xml, target_file)
+        self.targets.pop('xml', None)
+
+    def merge_scheme_xml(self) -> tuple[str, str]:
+        """
+        Merges the scheme into the xml configuration file in memory.
+
+        Returns:
+            tuple[str, str]: The path to the configuration file and the
+                             merged, prettified xml data.
+        """
+        target_file: str = DCFileManager.get_config(self.dc_configs['xml'])
 
-        for item in self.xml_tags:
-            # Create element tree object
-            source_tree = defusedxmlET.parse(source_file)
-            target_tree = defusedxmlET.parse(target_file)
+        # Create element tree objects
+        source_tree = self.get_source('xml')
+        target_tree = self.get_target('xml', target_file)
 
-            # Get root element
-            target_root = target_tree.getroot()
+        # Get root element and resolve all tag paths in one pass per tree
+        target_root = target_tree.getroot()
+        source_index: dict = SchemeFileManager.index_xml_paths(
+            source_tree.getroot(), self.xml_tags
+        )
+        target_index: dict = SchemeFileManager.index_xml_paths(
+            target_root, self.xml_tags
+        )
+        self.replaced['xml'] = {}
 
-            source_tag = source_tree.find(f'./{item}')
-            target_tag = target_tree.find(f'./{item}')
+        for spec in self.xml_tag_specs:
+            item: str = spec['path']
+            source_tag = source_index.get(item)
+            target_tag = target_index.get(item)
 
-            # Remove current tags and append new ones
+            # Merge current tags in place or append new ones
             if source_tag is not None:
-                if target_tag is not None:
-                    target_root.remove(target_tag)
-                target_root.append(source_tag)
+                self.replaced['xml'][item] = None if target_tag is None else (
+                    defusedxmlET.tostring(target_tag, encoding='unicode')
+                    .strip()
+                )
+                SchemeFileManager.replace_xml_element(
+                    target_index, item, SchemeFileManager.merge_xml_element(
+                        target_tag, source_tag, spec['strategy'], spec['key']
+                    )
+                )
             else:
                 raise ValueError(
                     f'Tag \'{item}\' does not exist in the source xml '
                     'configuration data.'
                 )
 
-            # Prettify XML
-            xml_str: str = defusedxmlET.tostring(target_root, encoding='utf-8')
-            dom = defusedxmlMD.parseString(xml_str)
-            pretty_xml: str = dom.toprettyxml(indent='  ')
-            pretty_xml = '\n'.join(
-                [line for line in pretty_xml.split('\n') if line.strip()]
+        # Prettify XML
+        pretty_xml: str = SchemeFileManager.prettify_xml(target_root)
+
+        return target_file, pretty_xml
+
+    def merge_scheme(self) -> dict[str, tuple[str, str]]:
+        """
+        Merges the scheme into all selected configuration files in memory.
+
+        Returns:
+            dict[str, tuple[str, str]]: The paths to the configuration files
+                                        and their merged data, keyed by file
+                                        type.
+        """
+        outputs: dict[str, tuple[str, str]] = {}
+        if 'cfg' in self.file_types:
+            target_file, target_config = self.merge_scheme_cfg()
+            outputs['cfg'] = (
+                target_file, SchemeFileManager.format_cfg(target_config)
+            )
+        if 'json' in self.file_types:
+            target_file, target_config = self.merge_scheme_json()
+            outputs['json'] = (
+                target_file, SchemeFileManager.format_json(target_config)
+            )
+        if 'xml' in self.file_types:
+            outputs['xml'] = self.merge_scheme_xml()
+
+        return outputs
+
+    def switch_scheme(
+        self, target_files: dict[str, str], written: list[str]
+    ) -> bool:
+        """
+        Renames ready files merged ahead of time over the DC configuration
+        files. The ready files are used only if neither the scheme files nor
+        the DC configuration files changed since they were merged, otherwise
+        they are removed.
+
+        Args:
+            target_files (dict[str, str]): The paths to the DC configuration
+                                           files, keyed by file type.
+            written (list[str]): Receives the file types of renamed files.
+
+        Returns:
+            bool: True if the ready files were used.
+        """
+        materialized: dict | None = self.materialized
+        if materialized is None:
+            return False
+
+        if any(
+            materialized['sources'][file_type] != (
+                self.get_source_fingerprint(file_type)
+            ) or materialized['targets'][file_type] != (
+                AppUtils.get_file_fingerprint(target_file)
+            ) for file_type, target_file in target_files.items()
+        ):
+            self.discard_materialized()
+            return False
+
+        self.replaced = materialized['replaced']
+        self.replace_files(materialized['files'], target_files, written)
+        self.materialized = None
+
+        return True
+
+    def replace_files(
+        self, files: dict[str, str], target_files: dict[str, str],
+        written: list[str]
+    ) -> None:
+        """
+        Renames ready files over the DC configuration files, each after its
+        backup is written.
+
+        Args:
+            files (dict[str, str]): The paths to the ready files, keyed by
+                                    file type.
+            target_files (dict[str, str]): The paths to the DC configuration
+                                           files, keyed by file type.
+            written (list[str]): Receives the file types of renamed files.
+
+        Raises:
+            OSError: If an error occurs while renaming a file.
+        """
+        for file_type, target_file in target_files.items():
+            # Backup current configuration
+            if self.dc_configs_backup:
+                self.wait_backup(file_type, target_file)
+
+            try:
+                os.replace(files[file_type], target_file)
+            except Exception as e:
+                raise OSError(
+                    f'Failed to write configuration.\n\n{str(e)}'
+                ) from e
+            written.append(file_type)
+            self.targets.pop(file_type, None)
+
+    def discard_materialized(self) -> None:
+        """
+        Removes ready files merged ahead of time, unless they were used.
+        """
+        if self.materialized is not None:
+            DCFileManager.remove_files(
+                list(self.materialized['files'].values())
+            )
+            self.materialized = None
+
+    def get_selection(self) -> tuple:
+        """
+        Gets the parts of the DC configuration the scheme writes. Applying a
+        scheme overwrites whatever an earlier scheme with the same selection
+        wrote.
+
+        Returns:
+            tuple: The written configuration files and XML tags.
+        """
+        return (
+            tuple(
+                (file_type, self.dc_configs[file_type])
+                for file_type in self.file_types
+            ),
+            tuple(sorted(self.xml_tags)) if 'xml' in self.file_types else ()
+        )
+
+    def wait_backup(self, file_type: str, target_file: str) -> None:
+        """
+        Waits for the backup of the DC configuration file started by
+        apply_scheme, or backs the file up now if none was started.
+
+        Args:
+            file_type (str): The configuration file type (cfg, json, xml).
+            target_file (str): The path to the configuration file.
+
+        Raises:
+            OSError: If an error occurs during the backup process.
+        """
+        backup: Future | None = self.backups.pop(file_type, None)
+        if backup is None:
+            DCFileManager.backup_config(target_file)
+        else:
+            backup.result()
+
+    def diff_scheme(self) -> dict[str, list[tuple[str, str, object, object]]]:
+        """
+        Computes changes applying the scheme would make to the cfg keys, the
+        Styles and FileColors entries and the xml tags, without writing
+        anything (dry run).
+
+        Returns:
+            dict[str, list[tuple[str, str, object, object]]]: Changes keyed by
+                the DC configuration file, see SchemeDiff.
+        """
+        diff: dict[str, list[tuple[str, str, object, object]]] = {}
+
+        # The 'DarkMode' key of cfg
+        if 'cfg' in self.file_types:
+            target_file: str = self.get_target_file('cfg')
+            source_config = self.get_source('cfg')
+            diff[target_file] = SchemeDiff.diff_cfg(
+                self.get_target('cfg', target_file), {
+                    'DarkMode': (
+                        '1' if self.auto_dark_mode
+                        else source_config['DarkMode']
+                    )
+                }, ['DarkMode']
+            )
+
+        # The style of the same name and the file colors of json
+        if 'json' in self.file_types:
+            target_file = self.get_target_file('json')
+            source_config = self.get_source('json')
+            target_config = self.get_target('json', target_file)
+            changes: list[tuple[str, str, object, object]] = []
+            digests: dict[int, bytes] = {}
+            for i, style in enumerate(target_config['Styles']):
+                if style['Name'] == source_config['Styles'][0]['Name']:
+                    SchemeDiff.diff_json(
+                        style, source_config['Styles'][0], f'Styles[{i}]',
+                        changes, digests
+                    )
+                    break
+            SchemeDiff.diff_json(
+                target_config.get('FileColors'), source_config['FileColors'],
+                'FileColors', changes, digests
+            )
+            diff[target_file] = changes
+
+        # The xml tags
+        if 'xml' in self.file_types:
+            target_file = self.get_target_file('xml')
+            source_tree = self.get_source('xml')
+            target_tree = self.get_target('xml', target_file)
+            source_index: dict = SchemeFileManager.index_xml_paths(
+                source_tree.getroot(), self.xml_tags
+            )
+            target_index: dict = SchemeFileManager.index_xml_paths(
+                target_tree.getroot(), self.xml_tags
+            )
+            changes = []
+            digests = {}
+            for spec in self.xml_tag_specs:
+                item: str = spec['path']
+                if item not in source_index:
+                    raise ValueError(
+                        f'Tag \'{item}\' does not exist in the source xml '
+                        'configuration data.'
+                    )
+                merged = SchemeFileManager.merge_xml_element(
+                    target_index.get(item), source_index[item],
+                    spec['strategy'], spec['key']
+                )
+                SchemeDiff.diff_xml(
+                    target_index.get(item), merged, item, changes, digests
+                )
+            diff[target_file] = changes
+
+        return diff
+
+    def get_source(self, file_type: str) -> object:
+        """
+        Gets the parsed scheme file, preloaded one if it is still up to date.
+
+        Args:
+            file_type (str): The scheme file type (cfg, json, xml).
+
+        Returns:
+            object: The parsed and validated scheme file.
+        """
+        if file_type in self.sources:
+            fingerprint, config = self.sources[file_type]
+            if fingerprint == self.get_source_fingerprint(file_type):
+                return config
+
+        return self.load_source(file_type)
+
+    def get_source_fingerprint(self, file_type: str) -> tuple | None:
+        """
+        Gets the fingerprint of the scheme file. Fingerprints of schemes
+        inheriting from base schemes cover all ancestors, so editing a base
+        invalidates them.
+
+        Args:
+            file_type (str): The scheme file type (cfg, json, xml).
+
+        Returns:
+            tuple | None: The fingerprint, or None if the file does not exist.
+        """
+        fingerprint: tuple | None = self.store.get_fingerprint(
+            self.scheme, file_type
+        )
+        if fingerprint is None:
+            return None
+
+        try:
+            ancestry: tuple = self.resolver.get_ancestry(
+                self.store, self.scheme
+            )
+        except (OSError, ValueError, configobj.ConfigObjError):
+            # Reported once the scheme is loaded
+            ancestry = (None,)
+
+        return (fingerprint, ancestry) if ancestry else fingerprint
+
+    def get_target_fingerprint(self, file_type: str) -> tuple | None:
+        """
+        Gets the fingerprint of the DC configuration file.
+
+        Args:
+            file_type (str): The configuration file type (cfg, json, xml).
+
+        Returns:
+            tuple | None: The fingerprint, or None if the file does not exist.
+        """
+        return AppUtils.get_file_fingerprint(self.get_target_file(file_type))
+
+    def get_target_file(self, file_type: str) -> str:
+        """
+        Gets the path to the DC configuration file.
+
+        Args:
+            file_type (str): The configuration file type (cfg, json, xml).
+
+        Returns:
+            str: The absolute path to the configuration file.
+        """
+        return DCFileManager.get_config(self.dc_configs[file_type])
+
+    def get_target(self, file_type: str, target_file: str) -> object:
+        """
+        Gets the parsed DC configuration file, preloaded one if it is still up
+        to date.
+
+        Args:
+            file_type (str): The configuration file type (cfg, json, xml).
+            target_file (str): The path to the configuration file.
+
+        Returns:
+            object: The parsed configuration file.
+        """
+        if file_type in self.targets:
+            fingerprint, config = self.targets[file_type]
+            if fingerprint == AppUtils.get_file_fingerprint(target_file):
+                return config
+
+        return self.load_target(file_type, target_file)
+
+    def load_source(self, file_type: str) -> object:
+        """
+        Parses and validates the scheme file. The file is streamed from the
+        scheme store, so archived schemes are never extracted to disk.
+        Schemes inheriting from base schemes are resolved first.
+
+        Args:
+            file_type (str): The scheme file type (cfg, json, xml).
+
+        Returns:
+            object: The parsed scheme file.
+
+        Raises:
+            ValueError: If the scheme file cannot be parsed or does not match
+                        its schema, or the scheme cannot be resolved, listing
+                        all errors.
+        """
+        name: str = f'{self.scheme}.{file_type}'
+        try:
+            resolved: dict[str, bytes] | None = self.resolver.resolve(
+                self.store, self.scheme
+            )
+        except (OSError, ValueError, configobj.ConfigObjError) as e:
+            raise ValueError(f'{name}: {e}') from e
+
+        try:
+            if resolved is not None:
+                config = SchemeValidator.parse(
+                    file_type, io.BytesIO(resolved[file_type])
+                )
+            else:
+                with self.store.open(self.scheme, file_type) as source_file:
+                    config = SchemeValidator.parse(file_type, source_file)
+        except ValueError as e:
+            raise ValueError(f'{name}: {e}') from e
+
+        errors: list[str] = SchemeValidator.validate(
+            file_type, config, self.xml_tags
+        )
+        if errors:
+            raise ValueError('\n'.join(f'{name}: {error}' for error in errors))
+
+        return config
+
+    def load_target(self, file_type: str, target_file: str) -> object:
+        """
+        Parses the DC configuration file.
+
+        Args:
+            file_type (str): The configuration file type (cfg, json, xml).
+            target_file (str): The path to the configuration file.
+
+        Returns:
+            object: The parsed configuration file.
+        """
+        if file_type == 'cfg':
+            return SchemeFileManager.get_cfg(target_file)
+        if file_type == 'json':
+            return SchemeFileManager.get_json(target_file)
+
+        return defusedxmlET.parse(target_file)
+
+    def load_sources(self) -> None:
+        """
+        Parses and validates the selected scheme files into the sources
+        attribute.
+        """
+        for file_type in self.file_types:
+            fingerprint = self.get_source_fingerprint(file_type)
+            self.sources[file_type] = (
+                fingerprint, self.load_source(file_type)
+            )
+
+    def validate_sources(self) -> None:
+        """
+        Parses and validates the selected scheme files, before any DC
+        configuration file is touched. Files already validated by preload or
+        merged ahead of time are skipped if they are unchanged.
+
+        Raises:
+            ValueError: If any scheme file is invalid, listing the errors of
+                        all files.
+        """
+        errors: list[str] = []
+        for file_type in self.file_types:
+            fingerprint = self.get_source_fingerprint(file_type)
+            if self.materialized is not None and (
+                self.materialized['sources'].get(file_type) == fingerprint
+            ):
+                continue
+            if file_type in self.sources and (
+                self.sources[file_type][0] == fingerprint
+            ):
+                continue
+
+            try:
+                self.sources[file_type] = (
+                    fingerprint, self.load_source(file_type)
+                )
+            except ValueError as e:
+                errors.append(str(e))
+
+        if errors:
+            raise ValueError(
+                f'Scheme \'{self.scheme}\' is invalid:\n' + '\n'.join(errors)
             )
 
-            # Save modified DC xml config file
-            SchemeFileManager.set_xml(pretty_xml, target_file)
+    def load_targets(self) -> None:
+        """
+        Parses the selected DC configuration files into the targets
+        attribute.
+        """
+        for file_type in self.file_types:
+            target_file: str = self.get_target_file(file_type)
+            fingerprint = AppUtils.get_file_fingerprint(target_file)
+            self.targets[file_type] = (
+                fingerprint, self.load_target(file_type, target_file)
+            )
 
     def verify_scheme(self) -> None:
         """
-        Verifies the scheme version of all configuration files
+        Verifies the scheme version of the selected configuration files
         (cfg, json, xml).
         """
-        self.verify_scheme_version_xml()
+        if 'xml' in self.file_types:
+            self.verify_scheme_version_xml()
 
-    def verify_scheme_version_xml(self) -> None:
+    def get_config_versions(self) -> tuple[str | None, str | None]:
         """
-        Verifies the scheme version of xml configuration file specifically.
+        Gets the xml configuration scheme version of the scheme and of the DC
+        configuration.
+
+        Returns:
+            tuple[str | None, str | None]: The source and target
+                                           'ConfigVersion' values.
         """
-        source_file: str = os.path.join(self.scheme_path, f'{self.scheme}.xml')
         target_file: str = DCFileManager.get_config(self.dc_configs['xml'])
 
-        source_tree = defusedxmlET.parse(source_file)
-        target_tree = defusedxmlET.parse(target_file)
+        source_tree = self.get_source('xml')
+        target_tree = self.get_target('xml', target_file)
 
-        source_config_version: str | None = (
-            source_tree.getroot().attrib.get('ConfigVersion')
-        )
-        target_config_version: str | None = (
+        return (
+            source_tree.getroot().attrib.get('ConfigVersion'),
             target_tree.getroot().attrib.get('ConfigVersion')
         )
 
+    def verify_scheme_version_xml(self) -> None:
+        """
+        Verifies the scheme version of xml configuration file specifically.
+        """
+        source_config_version, target_config_version = (
+            self.get_config_versions()
+        )
+
         if source_config_version != target_config_version:
             showwarning(
                 title='Warning',
@@ -200,4 +824,4 @@ class Scheme:
                     'In case of any issues, please verify your configuration '
                     'files.'
                 )
-            )
\ No newline at end of file
+            )
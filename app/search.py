@@ -0,0 +1,209 @@
+import bisect
+from collections.abc import Iterable
+
+class SchemeSearchIndex:
+    """
+    An in-memory index over scheme names used for interactive filtering.
+
+    Names are kept in a sorted key list for prefix lookups and in a trigram
+    posting index for substring lookups. Consecutive queries that extend the
+    previous one only narrow down the previous result.
+
+    Attributes:
+        names (list[str]): Indexed scheme names, position is the name id.
+        ids (dict[str, int]): Name ids keyed by scheme name.
+        keys (list[str]): Lowercase search keys, aligned with names.
+        trigrams (dict[str, list[int]]): Trigram to name ids posting lists.
+        order (list[int]): Name ids sorted alphabetically by key.
+        sorted_keys (list[str]): Keys in the alphabetical order.
+        rank (list[int]): Position of each name id in the alphabetical order.
+        dirty (bool): Whether the alphabetical order needs to be rebuilt.
+        last_query (str): The last substring query.
+        last_result (list[int] | None): The result of the last query.
+    """
+    def __init__(self) -> None:
+        """
+        Initializes an empty SchemeSearchIndex.
+        """
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+        self.keys: list[str] = []
+        self.trigrams: dict[str, list[int]] = {}
+        self.order: list[int] = []
+        self.sorted_keys: list[str] = []
+        self.rank: list[int] = []
+        self.dirty: bool = False
+        self.last_query: str = ''
+        self.last_result: list[int] | None = None
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed names.
+        """
+        return len(self.names)
+
+    def add(self, names: Iterable[str]) -> None:
+        """
+        Adds names to the index, names already indexed are skipped.
+
+        Args:
+            names (Iterable[str]): Scheme names to add.
+        """
+        for name in names:
+            if name in self.ids:
+                continue
+            name_id: int = len(self.names)
+            key: str = name.lower()
+            self.names.append(name)
+            self.ids[name] = name_id
+            self.keys.append(key)
+            for trigram in {key[i:i + 3] for i in range(len(key) - 2)}:
+                self.trigrams.setdefault(trigram, []).append(name_id)
+
+        self.dirty = True
+        self.last_result = None
+
+    def ensure_order(self) -> None:
+        """
+        Rebuilds the alphabetical order if names were added since last query.
+        """
+        if not self.dirty:
+            return
+
+        self.order = sorted(
+            range(len(self.names)),
+            key=lambda name_id: (self.keys[name_id], self.names[name_id])
+        )
+        self.sorted_keys = [self.keys[name_id] for name_id in self.order]
+        self.rank = [0] * len(self.names)
+        for position, name_id in enumerate(self.order):
+            self.rank[name_id] = position
+        self.dirty = False
+
+    def search(self, query: str) -> list[int]:
+        """
+        Finds names containing the query, case insensitive.
+
+        Args:
+            query (str): The substring to look for.
+
+        Returns:
+            list[int]: Matching name ids in alphabetical order.
+        """
+        self.ensure_order()
+        query = query.lower()
+
+        if not query:
+            result: list[int] = self.order
+        elif (
+            self.last_result is not None and self.last_query
+            and query.startswith(self.last_query)
+        ):
+            # Narrow down the previous result
+            result = [
+                name_id for name_id in self.last_result
+                if query in self.keys[name_id]
+            ]
+        elif len(query) >= 3:
+            result = self.search_trigrams(query)
+        else:
+            result = [
+                name_id for name_id in self.order
+                if query in self.keys[name_id]
+            ]
+
+        self.last_query = query
+        self.last_result = result
+
+        return result
+
+    def search_trigrams(self, query: str) -> list[int]:
+        """
+        Finds names containing the query using the trigram postings.
+
+        Args:
+            query (str): The lowercase substring, at least 3 characters long.
+
+        Returns:
+            list[int]: Matching name ids in alphabetical order.
+        """
+        postings: list[list[int]] = []
+        for trigram in {query[i:i + 3] for i in range(len(query) - 2)}:
+            posting = self.trigrams.get(trigram)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+        # Intersect starting from the shortest posting list
+        postings.sort(key=len)
+        candidates: set[int] = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        return sorted(
+            (
+                name_id for name_id in candidates
+                if query in self.keys[name_id]
+            ),
+            key=self.rank.__getitem__
+        )
+
+    def find_prefix(self, prefix: str) -> int | None:
+        """
+        Finds the first name, in alphabetical order, starting with the prefix.
+
+        Args:
+            prefix (str): The prefix to look for, case insensitive.
+
+        Returns:
+            int | None: The name id, or None if no name starts with prefix.
+        """
+        self.ensure_order()
+        prefix = prefix.lower()
+
+        position: int = bisect.bisect_left(self.sorted_keys, prefix)
+        if (
+            position < len(self.sorted_keys)
+            and self.sorted_keys[position].startswith(prefix)
+        ):
+            return self.order[position]
+
+        return None
+
+    def find_prefix_in(
+        self, prefix: str, view: list[int], ordered: bool = True
+    ) -> int | None:
+        """
+        Finds the first name of a view starting with the prefix.
+
+        Args:
+            prefix (str): The prefix to look for, case insensitive.
+            view (list[int]): Name ids, e.g. a search result.
+            ordered (bool): Whether the view is in alphabetical order, so it
+                            can be bisected, otherwise it is scanned.
+
+        Returns:
+            int | None: The position in the view, or None if no name of the
+                        view starts with prefix.
+        """
+        prefix = prefix.lower()
+
+        if not ordered:
+            return next(
+                (
+                    position for position, name_id in enumerate(view)
+                    if self.keys[name_id].startswith(prefix)
+                ), None
+            )
+
+        position: int = bisect.bisect_left(
+            view, prefix, key=self.keys.__getitem__
+        )
+        if position < len(view) and self.keys[view[position]].startswith(
+            prefix
+        ):
+            return position
+
+        return None
@@ -0,0 +1,473 @@
+import getpass
+import hashlib
+import io
+import json
+import os
+import queue
+import secrets
+import stat
+import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextlib import redirect_stderr, redirect_stdout
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from app.config import (
+    SERVER_DIR_NAME, SERVER_FORWARDED_COMMANDS, SERVER_KEY_NAME,
+    SERVER_PIPE_NAME, SERVER_SOCKET_NAME, USER_CONFIG_PATH,
+    USER_CONFIG_VERSION
+)
+from app.user_config import UserConfigManager
+from app.utils import AppUtils
+
+class ServerClient:
+    """
+    Provides static methods for forwarding requests to the resident server.
+
+    The server files live in a directory private to the current user, and
+    the client checks who owns them before trusting them. Messages are sent
+    as json, so a connection never unpickles anything.
+    """
+    @staticmethod
+    def get_runtime_dir() -> str:
+        """
+        Gets the directory of the current user holding the server files,
+        creating it if it does not exist.
+
+        Returns:
+            str: The path to the directory.
+
+        Raises:
+            PermissionError: If the directory is accessible to other users.
+        """
+        if sys.platform == 'win32':
+            # Protected by the access control list of the user profile
+            path: str = os.path.join(
+                os.environ.get('LOCALAPPDATA') or tempfile.gettempdir(),
+                SERVER_DIR_NAME
+            )
+        elif os.environ.get('XDG_RUNTIME_DIR'):
+            path = os.path.join(
+                os.environ['XDG_RUNTIME_DIR'], SERVER_DIR_NAME
+            )
+        else:
+            path = os.path.join(
+                tempfile.gettempdir(), f'{SERVER_DIR_NAME}-{os.getuid()}'
+            )
+
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        ServerClient.check_owner(path, True)
+
+        return path
+
+    @staticmethod
+    def check_owner(path: str, private: bool) -> None:
+        """
+        Checks that a server file is owned by the current user. On Windows
+        the private directory is trusted instead.
+
+        Args:
+            path (str): The path to the file or directory.
+            private (bool): Whether other users must have no access to it.
+
+        Raises:
+            PermissionError: If the path is a symbolic link, is owned by
+                             another user or is accessible to other users.
+        """
+        if sys.platform == 'win32':
+            return
+
+        status: os.stat_result = os.lstat(path)
+        if (
+            stat.S_ISLNK(status.st_mode) or status.st_uid != os.getuid()
+            or private and status.st_mode & 0o077
+        ):
+            raise PermissionError(
+                f'{path} is not private to the current user.'
+            )
+
+    @staticmethod
+    def get_key_path() -> str:
+        """
+        Gets the path to the file with the authentication key.
+
+        Returns:
+            str: The path to the key file.
+
+        Raises:
+            PermissionError: If the server directory is not private.
+        """
+        return os.path.join(ServerClient.get_runtime_dir(), SERVER_KEY_NAME)
+
+    @staticmethod
+    def get_address(authkey: bytes) -> tuple[str, str]:
+        """
+        Gets the server address of the current user. The pipe name is
+        derived from the key, so it can not be taken over in advance.
+
+        Args:
+            authkey (bytes): The authentication key.
+
+        Returns:
+            tuple[str, str]: The address and its family.
+
+        Raises:
+            PermissionError: If the server directory is not private.
+        """
+        if sys.platform == 'win32':
+            return SERVER_PIPE_NAME.format(
+                user=getpass.getuser(),
+                token=hashlib.sha256(authkey).hexdigest()[:16]
+            ), 'AF_PIPE'
+
+        return (
+            os.path.join(ServerClient.get_runtime_dir(), SERVER_SOCKET_NAME),
+            'AF_UNIX'
+        )
+
+    @staticmethod
+    def send_message(connection, message: dict) -> None:
+        """
+        Sends a message as json.
+
+        Args:
+            connection (multiprocessing.connection.Connection): The
+                                                                connection.
+            message (dict): The message.
+        """
+        connection.send_bytes(json.dumps(message).encode('utf-8'))
+
+    @staticmethod
+    def receive_message(connection) -> dict:
+        """
+        Receives a json message.
+
+        Args:
+            connection (multiprocessing.connection.Connection): The
+                                                                connection.
+
+        Returns:
+            dict: The message.
+
+        Raises:
+            ValueError: If the message is not a json object.
+        """
+        message: object = json.loads(connection.recv_bytes())
+        if not isinstance(message, dict):
+            raise ValueError('Invalid server message.')
+
+        return message
+
+    @staticmethod
+    def send(request: dict) -> dict | None:
+        """
+        Sends a request to the resident server and waits for the response.
+
+        Args:
+            request (dict): The request.
+
+        Returns:
+            dict | None: The response, or None if no server is running or its
+                         files are not owned by the current user.
+        """
+        try:
+            key_path: str = ServerClient.get_key_path()
+            ServerClient.check_owner(key_path, True)
+            with open(key_path, 'rb') as key_file:
+                authkey: bytes = key_file.read()
+            address, family = ServerClient.get_address(authkey)
+            if family == 'AF_UNIX':
+                ServerClient.check_owner(address, False)
+            with Client(address, family, authkey=authkey) as connection:
+                ServerClient.send_message(connection, request)
+                return ServerClient.receive_message(connection)
+        except (OSError, EOFError, ValueError, AuthenticationError):
+            return None
+
+    @staticmethod
+    def forward(argv: list[str]) -> int | None:
+        """
+        Forwards the command line to the resident server, if it is running
+        and the command can be served.
+
+        Args:
+            argv (list[str]): The command line arguments.
+
+        Returns:
+            int | None: The exit code, or None if the command must be run
+                        locally.
+        """
+        if not argv or argv[0] not in SERVER_FORWARDED_COMMANDS:
+            return None
+
+        response: dict | None = ServerClient.send(
+            {'cwd': os.getcwd(), 'argv': argv}
+        )
+        if response is None or response['code'] is None:
+            return None
+
+        sys.stdout.write(response['stdout'])
+        sys.stderr.write(response['stderr'])
+
+        return response['code']
+
+class SchemeServer:
+    """
+    A resident server keeping the user configuration, scheme index and
+    parsed schemes warm, so repeated command line invocations skip loading
+    them. It listens on a Unix socket or a named pipe, accessible only with
+    a random key stored in a directory private to the current user.
+
+    Requests are executed one at a time. Requests waiting in the queue are
+    coalesced: identical requests are executed once and share the response,
+    and of waiting apply requests with the same selection of files and tags
+    only the latest one is executed.
+
+    Attributes:
+        user_config (dict): The configuration dictionary loaded from user
+                            settings.
+        create_cli (Callable[[dict], object]): Creates the resident command
+                                               line interface.
+        cli (object): The resident command line interface.
+        config_fingerprint (tuple | None): Fingerprint of the loaded user
+                                           configuration file.
+        requests (queue.Queue): Requests paired with their response futures.
+        stopped (threading.Event): Set when the server is stopping.
+    """
+    def __init__(
+        self, user_config: dict, create_cli: Callable[[dict], object]
+    ) -> None:
+        """
+        Initializes the SchemeServer class.
+
+        Args:
+            user_config (dict): The configuration dictionary loaded from user
+                                settings.
+            create_cli (Callable[[dict], object]): Creates the resident
+                                                   command line interface.
+        """
+        self.user_config: dict = user_config
+        self.create_cli: Callable[[dict], object] = create_cli
+        self.cli: object = create_cli(user_config)
+        self.config_fingerprint: tuple | None = (
+            AppUtils.get_file_fingerprint(USER_CONFIG_PATH)
+        )
+        self.requests: queue.Queue = queue.Queue()
+        self.stopped: threading.Event = threading.Event()
+
+    def serve(self) -> None:
+        """
+        Accepts connections until stopped.
+
+        Raises:
+            RuntimeError: If another server is already running.
+        """
+        if ServerClient.send({'ping': True}) is not None:
+            raise RuntimeError('The server is already running.')
+
+        # Files left over by a server that did not stop cleanly
+        authkey: bytes = secrets.token_bytes(32)
+        key_path: str = ServerClient.get_key_path()
+        address, family = ServerClient.get_address(authkey)
+        for path in [key_path, address] if family == 'AF_UNIX' else [key_path]:
+            if os.path.lexists(path):
+                os.remove(path)
+
+        key_fd: int = os.open(
+            key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL
+            | getattr(os, 'O_NOFOLLOW', 0), 0o600
+        )
+        with os.fdopen(key_fd, 'wb') as key_file:
+            key_file.write(authkey)
+
+        threading.Thread(target=self.process_requests, daemon=True).start()
+
+        try:
+            with Listener(address, family, authkey=authkey) as listener:
+                while not self.stopped.is_set():
+                    try:
+                        connection = listener.accept()
+                    except (OSError, EOFError, AuthenticationError):
+                        continue
+                    threading.Thread(
+                        target=self.handle_connection, args=(connection,),
+                        daemon=True
+                    ).start()
+        finally:
+            os.remove(key_path)
+
+    def handle_connection(self, connection) -> None:
+        """
+        Queues the request of a connection and sends back its response.
+
+        Args:
+            connection (multiprocessing.connection.Connection): The client
+                                                                connection.
+        """
+        with connection:
+            try:
+                request: dict = ServerClient.receive_message(connection)
+            except (OSError, EOFError, ValueError):
+                return
+
+            if request.get('ping'):
+                ServerClient.send_message(
+                    connection, {'code': 0, 'stdout': '', 'stderr': ''}
+                )
+                return
+
+            future: Future = Future()
+            self.requests.put((request, future))
+            try:
+                ServerClient.send_message(connection, future.result())
+            except OSError:
+                # Client went away
+                pass
+
+        # Stop only once the response is sent, the process exits right away
+        if request.get('stop'):
+            self.stop()
+
+    def process_requests(self) -> None:
+        """
+        Executes queued requests, coalescing identical waiting requests.
+        Runs in the worker thread.
+        """
+        while True:
+            pending: dict[tuple, list] = {}
+            arrivals: dict[tuple, int] = {}
+            arrival: int = 0
+            request, future = self.requests.get()
+
+            # Collect everything waiting, identical requests share a future
+            while True:
+                key: tuple = (
+                    request.get('stop', False), request.get('cwd'),
+                    tuple(request.get('argv', []))
+                )
+                pending.setdefault(key, [request, []])[1].append(future)
+                # Requests queued again count from their latest arrival
+                arrivals[key] = arrival
+                arrival += 1
+                try:
+                    request, future = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+
+            # Only the latest scheme of a selection would remain, skip
+            # rewrites before it
+            latest: dict[tuple, tuple] = {}
+            for key in sorted(pending, key=lambda key: arrivals[key]):
+                selection: tuple | None = self.get_apply_selection(key[2])
+                if selection is None:
+                    continue
+                if selection in latest:
+                    for future in pending.pop(latest[selection])[1]:
+                        future.set_result({
+                            'code': 0, 'stdout': 'Superseded by a later '
+                            'apply request.\n', 'stderr': ''
+                        })
+                latest[selection] = key
+
+            for request, futures in pending.values():
+                response: dict = self.execute(request)
+                for future in futures:
+                    future.set_result(response)
+
+    @staticmethod
+    def get_apply_selection(argv: tuple[str, ...]) -> tuple | None:
+        """
+        Gets the configuration files and XML tags an apply request writes.
+        Options taking values consume arguments up to the next option, as
+        they do in the command line parser.
+
+        Args:
+            argv (tuple[str, ...]): The command line arguments.
+
+        Returns:
+            tuple | None: The selected files and tags, each None if not
+                          selected, or None if the request is not an apply
+                          request writing files.
+        """
+        if argv[:1] != ('apply',) or '--dry-run' in argv:
+            return None
+
+        values: dict[str, list[str] | None] = {'--files': None, '--tags': None}
+        option: str | None = None
+        for arg in argv[1:]:
+            name, separator, value = arg.partition('=')
+            if name in values:
+                option = name
+                values[option] = [value] if separator else []
+            elif arg.startswith('-'):
+                option = None
+            elif option is not None:
+                values[option].append(arg)
+
+        return tuple(
+            tuple(sorted(value)) if value is not None else None
+            for value in values.values()
+        )
+
+    def execute(self, request: dict) -> dict:
+        """
+        Executes a single request.
+
+        Args:
+            request (dict): The request.
+
+        Returns:
+            dict: The response with the exit code and captured output. The
+                  exit code is None if the request must be run locally.
+        """
+        if request.get('stop'):
+            return {'code': 0, 'stdout': 'Server stopped.\n', 'stderr': ''}
+
+        # Relative paths in the user configuration depend on the directory
+        if request['cwd'] != os.getcwd():
+            return {'code': None, 'stdout': '', 'stderr': ''}
+
+        stdout: io.StringIO = io.StringIO()
+        stderr: io.StringIO = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                self.reload_config()
+                code: int = self.cli.run(request['argv'])
+            except SystemExit as e:
+                # Raised by argparse for --help and invalid arguments
+                code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                print(f'Error: {e}', file=sys.stderr)
+                code = 1
+
+        return {
+            'code': code, 'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue()
+        }
+
+    def reload_config(self) -> None:
+        """
+        Reloads the user configuration and resets warm state if the user
+        configuration file changed.
+        """
+        fingerprint: tuple | None = (
+            AppUtils.get_file_fingerprint(USER_CONFIG_PATH)
+        )
+        if fingerprint == self.config_fingerprint:
+            return
+
+        user_config: dict = UserConfigManager.get_config(USER_CONFIG_PATH)
+        UserConfigManager.verify(
+            USER_CONFIG_VERSION, user_config['configVersion']
+        )
+        self.user_config = user_config
+        self.cli = self.create_cli(user_config)
+        self.config_fingerprint = fingerprint
+
+    def stop(self) -> None:
+        """
+        Stops the server, waking up the listener with a dummy connection.
+        """
+        self.stopped.set()
+        ServerClient.send({'ping': True})
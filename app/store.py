@@ -0,0 +1,336 @@
+import os
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import IO
+from app.utils import AppUtils, SchemeFileManager
+
+class SchemeStore(ABC):
+    """
+    An abstract base class for places scheme files are read from.
+
+    Attributes:
+        path (str): The path to the scheme directory or archive.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the SchemeStore class.
+
+        Args:
+            path (str): The path to the scheme directory or archive.
+        """
+        self.path: str = path
+
+    @staticmethod
+    def create(path: str) -> 'SchemeStore':
+        """
+        Creates the store matching the path, an archive store for files and
+        a directory store otherwise.
+
+        Args:
+            path (str): The path to the scheme directory or archive.
+
+        Returns:
+            SchemeStore: The scheme store.
+        """
+        if os.path.isfile(path):
+            return ArchiveSchemeStore(path)
+
+        return DirectorySchemeStore(path)
+
+    def close(self) -> None:
+        """
+        Releases resources held by the store.
+        """
+
+    @abstractmethod
+    def scan(
+        self, scheme_exts: list[str], batch_size: int
+    ) -> Iterator[list[tuple[str, list[str]]]]:
+        """
+        Scans the store and yields discovered schemes in batches.
+
+        Args:
+            scheme_exts (list[str]): A list of required file extensions for
+                                     each scheme.
+            batch_size (int): The maximum number of schemes in a single batch.
+
+        Yields:
+            list[tuple[str, list[str]]]: A batch of scheme names paired with
+                                         their missing files.
+        """
+
+    @abstractmethod
+    def get_file(self, scheme: str, ext: str) -> str:
+        """
+        Gets the location of a scheme file, used in messages.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            str: The location of the scheme file.
+        """
+
+    @abstractmethod
+    def get_fingerprint(self, scheme: str, ext: str) -> tuple | None:
+        """
+        Gets a cheap fingerprint of a scheme file, used to detect changes.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            tuple | None: The fingerprint, or None if the file does not exist.
+        """
+
+    @abstractmethod
+    def open(self, scheme: str, ext: str) -> IO[bytes]:
+        """
+        Opens a scheme file for binary reading.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            IO[bytes]: The readable binary stream.
+        """
+
+    def read(self, scheme: str, ext: str) -> bytes:
+        """
+        Reads the content of a scheme file.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            bytes: The content of the scheme file.
+        """
+        with self.open(scheme, ext) as scheme_file:
+            return scheme_file.read()
+
+class DirectorySchemeStore(SchemeStore):
+    """
+    A store reading loose scheme files from a directory.
+    """
+    def scan(
+        self, scheme_exts: list[str], batch_size: int
+    ) -> Iterator[list[tuple[str, list[str]]]]:
+        """
+        Scans the directory and yields discovered schemes in batches.
+
+        Args:
+            scheme_exts (list[str]): A list of required file extensions for
+                                     each scheme.
+            batch_size (int): The maximum number of schemes in a single batch.
+
+        Yields:
+            list[tuple[str, list[str]]]: A batch of scheme names paired with
+                                         their missing files.
+        """
+        return SchemeFileManager.scan_schemes(
+            self.path, scheme_exts, batch_size
+        )
+
+    def get_file(self, scheme: str, ext: str) -> str:
+        """
+        Gets the path to a scheme file.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            str: The path to the scheme file.
+        """
+        return os.path.join(self.path, f'{scheme}.{ext}')
+
+    def get_fingerprint(self, scheme: str, ext: str) -> tuple | None:
+        """
+        Gets modification time and size of a scheme file.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            tuple | None: The fingerprint, or None if the file does not exist.
+        """
+        return AppUtils.get_file_fingerprint(self.get_file(scheme, ext))
+
+    def open(self, scheme: str, ext: str) -> IO[bytes]:
+        """
+        Opens a scheme file for binary reading.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            IO[bytes]: The readable binary stream.
+        """
+        return open(self.get_file(scheme, ext), 'rb')
+
+class ArchiveSchemeStore(SchemeStore):
+    """
+    A store reading scheme files straight from a zip archive, without
+    extracting it. Listing reads only the central directory of the archive,
+    scheme files are streamed member by member.
+
+    Members are matched by their base name, so schemes may be placed in any
+    folder inside the archive. The first member with a given name wins.
+
+    Attributes:
+        archive (zipfile.ZipFile | None): The open archive.
+        members (dict[str, zipfile.ZipInfo]): Archive members keyed by their
+                                              base name.
+        lock (threading.Lock): Lock guarding opening of the archive.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the ArchiveSchemeStore class.
+
+        Args:
+            path (str): The path to the scheme archive.
+        """
+        super().__init__(path)
+        self.archive: zipfile.ZipFile | None = None
+        self.members: dict[str, zipfile.ZipInfo] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def close(self) -> None:
+        """
+        Closes the archive.
+        """
+        with self.lock:
+            if self.archive is not None:
+                self.archive.close()
+                self.archive = None
+                self.members = {}
+
+    def get_archive(self) -> zipfile.ZipFile:
+        """
+        Opens the archive and indexes its central directory, once.
+
+        Returns:
+            zipfile.ZipFile: The open archive.
+
+        Raises:
+            FileNotFoundError: If the archive can not be opened.
+        """
+        with self.lock:
+            if self.archive is None:
+                try:
+                    self.archive = zipfile.ZipFile(self.path)
+                except (OSError, zipfile.BadZipFile) as e:
+                    raise FileNotFoundError(
+                        f'The schemes archive can not be opened: {self.path}'
+                        f'\n\n{str(e)}'
+                    ) from e
+                for info in self.archive.infolist():
+                    if info.is_dir():
+                        continue
+                    self.members.setdefault(
+                        os.path.basename(info.filename), info
+                    )
+
+            return self.archive
+
+    def scan(
+        self, scheme_exts: list[str], batch_size: int
+    ) -> Iterator[list[tuple[str, list[str]]]]:
+        """
+        Lists schemes from the archive central directory in batches.
+
+        Args:
+            scheme_exts (list[str]): A list of required file extensions for
+                                     each scheme.
+            batch_size (int): The maximum number of schemes in a single batch.
+
+        Yields:
+            list[tuple[str, list[str]]]: A batch of scheme names paired with
+                                         their missing files.
+        """
+        self.get_archive()
+
+        scheme_files: dict[str, set[str]] = {}
+        for member in self.members:
+            name, ext = os.path.splitext(member)
+            if ext[1:] in scheme_exts:
+                scheme_files.setdefault(name, set()).add(ext[1:])
+
+        batch: list[tuple[str, list[str]]] = []
+        for name in sorted(scheme_files):
+            missing_exts: set[str] = set(scheme_exts) - scheme_files[name]
+            batch.append(
+                (name, [f'{name}.{ext}' for ext in sorted(missing_exts)])
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def get_file(self, scheme: str, ext: str) -> str:
+        """
+        Gets the location of a scheme file inside the archive.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            str: The archive path and the member name.
+        """
+        self.get_archive()
+        info: zipfile.ZipInfo | None = self.members.get(f'{scheme}.{ext}')
+        member: str = info.filename if info else f'{scheme}.{ext}'
+
+        return f'{self.path}:{member}'
+
+    def get_fingerprint(self, scheme: str, ext: str) -> tuple | None:
+        """
+        Gets CRC and size of a scheme file from the central directory.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            tuple | None: The fingerprint, or None if the member does not
+                          exist.
+        """
+        self.get_archive()
+        info: zipfile.ZipInfo | None = self.members.get(f'{scheme}.{ext}')
+
+        return (info.CRC, info.file_size) if info else None
+
+    def open(self, scheme: str, ext: str) -> IO[bytes]:
+        """
+        Opens an archive member for streamed binary reading.
+
+        Args:
+            scheme (str): The name of the scheme.
+            ext (str): The scheme file extension.
+
+        Returns:
+            IO[bytes]: The readable binary stream.
+
+        Raises:
+            FileNotFoundError: If the member does not exist.
+        """
+        archive: zipfile.ZipFile = self.get_archive()
+        info: zipfile.ZipInfo | None = self.members.get(f'{scheme}.{ext}')
+        if info is None:
+            raise FileNotFoundError(
+                f'Scheme file {scheme}.{ext} does not exist in the archive: '
+                f'{self.path}'
+            )
+
+        return archive.open(info)
@@ -0,0 +1,453 @@
+import colorsys
+import io
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree.ElementTree import Element
+import defusedxml.ElementTree as defusedxmlET
+from app.colors import ColorUtils
+from app.config import (
+    COLOR_TRANSFORMS, SCHEME_RESOLVE_CACHE_SIZE, TRANSFORM_CHUNK_SIZE,
+    TRANSFORM_DARK_MODES
+)
+from app.inherit import SchemeResolver
+from app.store import SchemeStore
+from app.utils import SchemeFileManager
+from app.validate import SchemeValidator
+
+class ColorTransformer:
+    """
+    Derives scheme variants by transforming all colors of a scheme in one
+    batch.
+
+    Colors of the json 'Styles' and 'FileColors' and of the xml 'Colors' tag
+    are packed into an array of TColor integers. Each distinct color is
+    converted once into hue, lightness and saturation arrays, the transforms
+    run over whole arrays in the given order, and the results are written
+    back to the places the colors came from, keeping the notation of xml
+    values. Inverting lightness also swaps dark and light 'DarkMode'.
+
+    Transforms are given as (name, value) pairs:
+    - ('invert', None): inverts lightness.
+    - ('hue', degrees): shifts hue.
+    - ('saturation', factor): scales saturation.
+    - ('contrast', factor): scales lightness away from mid gray.
+    - ('remap', colors): replaces each color with the nearest palette color.
+
+    Attributes:
+        transforms (list[tuple[str, object]]): The transforms, in order.
+        workers (int | None): The number of worker processes transforming a
+                              library, the number of CPUs if None.
+    """
+    def __init__(
+        self, transforms: list[tuple[str, object]], workers: int | None = None
+    ) -> None:
+        """
+        Initializes the ColorTransformer class.
+
+        Args:
+            transforms (list[tuple[str, object]]): The transforms, in order.
+            workers (int | None): The number of worker processes
+                                  transforming a library, the number of
+                                  CPUs if None.
+
+        Raises:
+            ValueError: If there are no transforms.
+        """
+        if not transforms:
+            raise ValueError('No color transforms given.')
+
+        self.transforms: list[tuple[str, object]] = transforms
+        self.workers: int | None = workers
+
+    @staticmethod
+    def parse_transform(spec: str) -> tuple[str, object]:
+        """
+        Parses a transform given on the command line, e.g. 'invert',
+        'hue=30', 'saturation=1.2', 'contrast=1.5' or
+        'remap=$00202020,#ECEFF4'.
+
+        Args:
+            spec (str): The transform.
+
+        Returns:
+            tuple[str, object]: The name and the value of the transform.
+
+        Raises:
+            ValueError: If the transform is unknown or its value is invalid.
+        """
+        name, _, value = (part.strip() for part in spec.partition('='))
+        if name not in COLOR_TRANSFORMS:
+            raise ValueError(
+                f'Unknown color transform \'{name}\', expected one of: '
+                f'{", ".join(COLOR_TRANSFORMS)}.'
+            )
+
+        if name == 'invert':
+            if value:
+                raise ValueError('Color transform \'invert\' takes no value.')
+            return name, None
+        if name == 'remap':
+            colors: list[int | None] = [
+                ColorUtils.parse_color(color)
+                for color in value.split(',') if color.strip()
+            ]
+            if not colors or None in colors:
+                raise ValueError(f'Invalid palette: \'{value}\'')
+            return name, colors
+
+        try:
+            number: float = float(value)
+        except ValueError:
+            raise ValueError(
+                f'Invalid value of color transform \'{name}\': \'{value}\''
+            ) from None
+        if name != 'hue' and number < 0:
+            raise ValueError(
+                f'Color transform \'{name}\' takes a non-negative factor.'
+            )
+
+        return name, number
+
+    def transform_colors(self, colors: array) -> array:
+        """
+        Transforms packed colors.
+
+        Args:
+            colors (array): TColor integers.
+
+        Returns:
+            array: The transformed colors, in the same order.
+        """
+        unique: array = array('L', dict.fromkeys(colors))
+        hues: array = array('d')
+        lightnesses: array = array('d')
+        saturations: array = array('d')
+        for color in unique:
+            red, green, blue = ColorUtils.to_rgb(color)
+            hue, lightness, saturation = colorsys.rgb_to_hls(
+                red / 255, green / 255, blue / 255
+            )
+            hues.append(hue)
+            lightnesses.append(lightness)
+            saturations.append(saturation)
+
+        for name, value in self.transforms:
+            if name == 'invert':
+                lightnesses = array('d', (1 - l for l in lightnesses))
+            elif name == 'hue':
+                hues = array('d', ((h + value / 360) % 1 for h in hues))
+            elif name == 'saturation':
+                saturations = array(
+                    'd', (min(s * value, 1.0) for s in saturations)
+                )
+            elif name == 'contrast':
+                lightnesses = array('d', (
+                    min(max(0.5 + (l - 0.5) * value, 0.0), 1.0)
+                    for l in lightnesses
+                ))
+            elif name == 'remap':
+                hues, lightnesses, saturations = self.remap(
+                    hues, lightnesses, saturations, value
+                )
+
+        mapped: dict[int, int] = {
+            color: ColorUtils.from_rgb(*(
+                round(channel * 255) for channel in colorsys.hls_to_rgb(
+                    hue, lightness, saturation
+                )
+            )) for color, hue, lightness, saturation in zip(
+                unique, hues, lightnesses, saturations
+            )
+        }
+
+        return array('L', (mapped[color] for color in colors))
+
+    @staticmethod
+    def remap(
+        hues: array, lightnesses: array, saturations: array,
+        palette: list[int]
+    ) -> tuple[array, array, array]:
+        """
+        Replaces each color with the nearest palette color by RGB distance.
+
+        Args:
+            hues (array): Hues of the colors.
+            lightnesses (array): Lightnesses of the colors.
+            saturations (array): Saturations of the colors.
+            palette (list[int]): The palette as TColor integers.
+
+        Returns:
+            tuple[array, array, array]: Hues, lightnesses and saturations of
+                                        the replaced colors.
+        """
+        palette_rgb: list[tuple[int, int, int]] = [
+            ColorUtils.to_rgb(color) for color in palette
+        ]
+        palette_hls: list[tuple[float, float, float]] = [
+            colorsys.rgb_to_hls(red / 255, green / 255, blue / 255)
+            for red, green, blue in palette_rgb
+        ]
+
+        remapped: tuple[array, array, array] = (
+            array('d'), array('d'), array('d')
+        )
+        for hue, lightness, saturation in zip(hues, lightnesses, saturations):
+            rgb: tuple[float, ...] = tuple(
+                channel * 255
+                for channel in colorsys.hls_to_rgb(hue, lightness, saturation)
+            )
+            nearest: int = min(
+                range(len(palette_rgb)), key=lambda i: sum(
+                    (a - b) ** 2 for a, b in zip(rgb, palette_rgb[i])
+                )
+            )
+            for values, value in zip(remapped, palette_hls[nearest]):
+                values.append(value)
+
+        return remapped
+
+    def transform_files(self, contents: dict[str, bytes]) -> dict:
+        """
+        Transforms the files of a scheme, runs in a worker process when
+        transforming a library.
+
+        Args:
+            contents (dict[str, bytes]): Content of scheme files, keyed by
+                                         file type.
+
+        Returns:
+            dict: Content of the transformed files keyed by file type
+                  ('contents') and their errors ('errors').
+        """
+        try:
+            configs: dict[str, object] = {
+                file_type: SchemeValidator.parse(
+                    file_type, io.BytesIO(contents[file_type])
+                ) for file_type in ('cfg', 'json', 'xml')
+            }
+        except ValueError as e:
+            return {'contents': {}, 'errors': [str(e)]}
+
+        xml_root: Element = configs['xml'].getroot()
+        json_slots: list = ColorUtils.find_json_colors(configs['json'])
+        xml_slots: list = ColorUtils.find_xml_colors(xml_root.find('./Colors'))
+
+        # Transform all colors of the scheme in one batch
+        colors: array = self.transform_colors(array('L', [
+            color for *_, color in json_slots + xml_slots
+        ]))
+        for (container, key, _), color in zip(json_slots, colors):
+            container[key] = (
+                ColorUtils.format_color(color, container[key])
+                if isinstance(container[key], str) else color
+            )
+        for (element, _), color in zip(
+            xml_slots, colors[len(json_slots):]
+        ):
+            element.text = ColorUtils.format_color(color, element.text)
+
+        dark_mode: object = configs['cfg'].get('DarkMode')
+        inverted: bool = sum(
+            name == 'invert' for name, _ in self.transforms
+        ) % 2 == 1
+        if inverted and dark_mode in TRANSFORM_DARK_MODES:
+            configs['cfg']['DarkMode'] = TRANSFORM_DARK_MODES[dark_mode]
+
+        errors: list[str] = [
+            f'{file_type}: {error}'
+            for file_type, config in configs.items()
+            for error in SchemeValidator.validate(file_type, config, [])
+        ]
+
+        return {
+            'contents': {
+                'cfg': SchemeFileManager.format_cfg(
+                    configs['cfg']
+                ).encode('utf-8'),
+                'json': SchemeFileManager.format_json(
+                    configs['json']
+                ).encode('utf-8'),
+                'xml': defusedxmlET.tostring(
+                    xml_root, encoding='utf-8', xml_declaration=True
+                )
+            },
+            'errors': errors
+        }
+
+    @staticmethod
+    def read_scheme(
+        store: SchemeStore, name: str, resolver: SchemeResolver
+    ) -> dict[str, bytes]:
+        """
+        Reads the files of a scheme, resolved if it inherits from base
+        schemes, so derived schemes are flat.
+
+        Args:
+            store (SchemeStore): The store holding the scheme.
+            name (str): The name of the scheme.
+            resolver (SchemeResolver): The resolver of inheriting schemes.
+
+        Returns:
+            dict[str, bytes]: Content of scheme files, keyed by file type.
+        """
+        resolved: dict[str, bytes] | None = resolver.resolve(store, name)
+        if resolved is not None:
+            return resolved
+
+        return {
+            file_type: store.read(name, file_type)
+            for file_type in ('cfg', 'json', 'xml')
+        }
+
+    @staticmethod
+    def get_files(name: str, scheme_path: str) -> dict[str, str]:
+        """
+        Gets the paths to the files of a derived scheme.
+
+        Args:
+            name (str): The name of the scheme.
+            scheme_path (str): The path to the scheme directory.
+
+        Returns:
+            dict[str, str]: Paths to the scheme files, keyed by file type.
+
+        Raises:
+            ValueError: If the name is invalid.
+        """
+        if not name or os.path.basename(name) != name:
+            raise ValueError(f'Invalid scheme name: \'{name}\'')
+
+        return {
+            file_type: os.path.join(scheme_path, f'{name}.{file_type}')
+            for file_type in ('cfg', 'json', 'xml')
+        }
+
+    @staticmethod
+    def write_scheme(
+        name: str, scheme_path: str, result: dict, force: bool
+    ) -> None:
+        """
+        Writes a transformed scheme.
+
+        Args:
+            name (str): The name of the scheme.
+            scheme_path (str): The path to the scheme directory.
+            result (dict): The result of transform_files.
+            force (bool): Whether to overwrite an existing scheme.
+
+        Raises:
+            ValueError: If the transformed scheme would be invalid.
+            FileExistsError: If the scheme exists and force is not set.
+        """
+        files: dict[str, str] = ColorTransformer.get_files(name, scheme_path)
+        if result['errors']:
+            raise ValueError('\n'.join(result['errors']))
+        if not force and any(os.path.exists(file) for file in files.values()):
+            raise FileExistsError(f'Scheme \'{name}\' already exists.')
+
+        os.makedirs(scheme_path, exist_ok=True)
+        for file_type, file in files.items():
+            with open(file, 'wb') as scheme_file:
+                scheme_file.write(result['contents'][file_type])
+
+    def derive(
+        self, source_path: str, name: str, target_name: str,
+        scheme_path: str, force: bool = False
+    ) -> None:
+        """
+        Derives a new scheme from a scheme.
+
+        Args:
+            source_path (str): The path to the directory or zip archive
+                               holding the scheme.
+            name (str): The name of the scheme.
+            target_name (str): The name of the new scheme.
+            scheme_path (str): The path to the directory of the new scheme.
+            force (bool): Whether to overwrite an existing scheme.
+        """
+        store: SchemeStore = SchemeStore.create(source_path)
+        try:
+            contents: dict[str, bytes] = self.read_scheme(
+                store, name, SchemeResolver(SCHEME_RESOLVE_CACHE_SIZE)
+            )
+        finally:
+            store.close()
+
+        self.write_scheme(
+            target_name, scheme_path, self.transform_files(contents), force
+        )
+
+    def derive_library(
+        self, schemes: list[tuple[str, str]], suffix: str, scheme_path: str,
+        force: bool = False
+    ) -> tuple[list[str], dict[str, str]]:
+        """
+        Derives a new scheme from each scheme in a process pool. New schemes
+        are named after the scheme and the suffix.
+
+        Args:
+            schemes (list[tuple[str, str]]): Names of the schemes paired with
+                                             the path to the directory or zip
+                                             archive holding them.
+            suffix (str): The suffix of the new scheme names.
+            scheme_path (str): The path to the directory of the new schemes.
+            force (bool): Whether to overwrite existing schemes.
+
+        Returns:
+            tuple[list[str], dict[str, str]]: Names of the new schemes and
+                                              errors keyed by the name of the
+                                              failed scheme.
+
+        Raises:
+            FileExistsError: If any of the new schemes exists and force is
+                             not set, nothing is written then.
+        """
+        names: dict[str, str] = {
+            name: f'{name} {suffix}' for name, _ in schemes
+        }
+        existing: list[str] = [
+            target for target in names.values()
+            if any(
+                os.path.exists(file) for file in
+                self.get_files(target, scheme_path).values()
+            )
+        ]
+        if existing and not force:
+            raise FileExistsError(f'Schemes {existing} already exist.')
+
+        errors: dict[str, str] = {}
+        contents: dict[str, dict[str, bytes]] = {}
+        resolver = SchemeResolver(SCHEME_RESOLVE_CACHE_SIZE)
+        stores: dict[str, SchemeStore] = {}
+        try:
+            for name, source_path in schemes:
+                if source_path not in stores:
+                    stores[source_path] = SchemeStore.create(source_path)
+                try:
+                    contents[name] = self.read_scheme(
+                        stores[source_path], name, resolver
+                    )
+                except (OSError, ValueError) as e:
+                    errors[name] = str(e)
+        finally:
+            for store in stores.values():
+                store.close()
+
+        derived: list[str] = []
+        if contents:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = executor.map(
+                    self.transform_files, contents.values(),
+                    chunksize=TRANSFORM_CHUNK_SIZE
+                )
+                for name, result in zip(contents, results):
+                    try:
+                        self.write_scheme(
+                            names[name], scheme_path, result, True
+                        )
+                        derived.append(names[name])
+                    except (OSError, ValueError) as e:
+                        errors[name] = str(e)
+
+        return derived, errors
@@ -1,9 +1,18 @@
 import os
+import re
 import sys
 import shutil
 import json
+import tempfile
+from collections.abc import Iterator
+from xml.etree.ElementTree import Element, SubElement
 import configobj
+import defusedxml.ElementTree as defusedxmlET
+import defusedxml.minidom as defusedxmlMD
 import json_repair
+from app.config import (
+    SCHEME_MATERIALIZE_SUFFIX, XML_MERGE_STRATEGIES, XML_TAG_PATTERN
+)
 
 class AppUtils:
     """
@@ -30,6 +39,26 @@ class AppUtils:
 
         return os.path.join(base_path, infile)
 
+    @staticmethod
+    def get_file_fingerprint(infile: str) -> tuple[int, int] | None:
+        """
+        Gets a cheap fingerprint of the file, used to detect file changes.
+
+        Args:
+            infile (str): The path to the file.
+
+        Returns:
+            tuple[int, int] | None: The modification time in nanoseconds and
+                                    the size of the file, or None if the file
+                                    does not exist.
+        """
+        try:
+            stat: os.stat_result = os.stat(infile)
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
 class DCFileManager:
     """
     Provides static methods for managing DC configuration files.
@@ -79,6 +108,104 @@ class DCFileManager:
                 f'Failed to create backup.\n\n{str(e)}'
             ) from e
 
+    @staticmethod
+    def snapshot_config(file: str) -> bytes:
+        """
+        Reads the content of the specified DC configuration file, so it can
+        be backed up later.
+
+        Args:
+            file (str): The path to the file to be backed up.
+
+        Returns:
+            bytes: The content of the file.
+
+        Raises:
+            OSError: If an error occurs while reading the file.
+        """
+        try:
+            with open(file, 'rb') as config_file:
+                return config_file.read()
+        except Exception as e:
+            raise OSError(
+                f'Failed to create backup.\n\n{str(e)}'
+            ) from e
+
+    @staticmethod
+    def write_backup(file: str, content: bytes) -> None:
+        """
+        Writes a snapshot of the specified DC configuration file with a
+        '.backup' extension.
+
+        Args:
+            file (str): The path to the backed up file.
+            content (bytes): The snapshot of the file.
+
+        Raises:
+            OSError: If an error occurs during the backup process.
+        """
+        try:
+            with open(f'{file}.backup', 'wb') as backup_file:
+                backup_file.write(content)
+        except Exception as e:
+            raise OSError(
+                f'Failed to create backup.\n\n{str(e)}'
+            ) from e
+
+    @staticmethod
+    def remove_files(files: list[str]) -> None:
+        """
+        Removes the specified files, skipping missing ones.
+
+        Args:
+            files (list[str]): The paths to the files.
+        """
+        for file in files:
+            try:
+                os.remove(file)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def write_ready_files(
+        outputs: dict[str, tuple[str, str]]
+    ) -> dict[str, str]:
+        """
+        Writes merged configurations to ready files next to the DC
+        configuration files, to be renamed over them. Nothing is left behind
+        if any file fails.
+
+        Args:
+            outputs (dict[str, tuple[str, str]]): The paths to the DC
+                                                  configuration files and
+                                                  their merged data, keyed
+                                                  by file type.
+
+        Returns:
+            dict[str, str]: The paths to the ready files, keyed by file type.
+
+        Raises:
+            OSError: If an error occurs while writing the files.
+        """
+        files: dict[str, str] = {}
+        try:
+            for file_type, (target_file, data) in outputs.items():
+                fd, files[file_type] = tempfile.mkstemp(
+                    suffix=SCHEME_MATERIALIZE_SUFFIX,
+                    prefix=f'{os.path.basename(target_file)}.',
+                    dir=os.path.dirname(target_file)
+                )
+                with os.fdopen(fd, 'w', encoding='utf-8') as ready_file:
+                    ready_file.write(data)
+                shutil.copymode(target_file, files[file_type])
+        except Exception as e:
+            DCFileManager.remove_files(list(files.values()))
+            raise OSError(
+                f'Failed to write configuration.\n\n{str(e)}'
+            ) from e
+
+        return files
+
 class SchemeFileManager:
     """
     Provides static methods for managing scheme files in various formats (cfg,
@@ -107,6 +234,19 @@ class SchemeFileManager:
                 f'Failed to parse the configuration.\n\n{str(e)}'
             ) from e
 
+    @staticmethod
+    def format_cfg(config: configobj.ConfigObj) -> str:
+        """
+        Serializes a configuration object as cfg data.
+
+        Args:
+            config (ConfigObj): The configuration object to serialize.
+
+        Returns:
+            str: The cfg data.
+        """
+        return ''.join(f'{key}={config[key]}\n' for key in config)
+
     @staticmethod
     def set_cfg(config: configobj.ConfigObj, outfile: str) -> None:
         """
@@ -121,9 +261,7 @@ class SchemeFileManager:
         """
         try:
             with open(outfile, 'w', encoding='utf-8') as cfg_file:
-                for key in config:
-                    line = f'{key}={config[key]}\n'
-                    cfg_file.write(line)
+                cfg_file.write(SchemeFileManager.format_cfg(config))
         except Exception as e:
             raise OSError(
                 f'Failed to write configuration.\n\n{str(e)}'
@@ -147,21 +285,50 @@ class SchemeFileManager:
         try:
             with open(infile, 'r') as json_file:
                 file_content = json_file.read()
-            json_data = json_repair.loads(file_content)
 
-            # Ensure json_data is a dictionary
-            if not isinstance(json_data, dict):
-                raise TypeError(
-                    'The configuration file {infile} does not contain valid '
-                    'json object data.'
-                )
- 
-            return json_data
+            return SchemeFileManager.parse_json(file_content)
         except Exception as e:
             raise OSError(
                 f'Failed to read configuration.\n\n{str(e)}'
             ) from e
 
+    @staticmethod
+    def parse_json(file_content: str) -> dict:
+        """
+        Repairs and parses json configuration data.
+
+        Args:
+            file_content (str): The json configuration data.
+
+        Returns:
+            dict: The parsed json data.
+
+        Raises:
+            TypeError: If data is not valid json object data.
+        """
+        json_data = json_repair.loads(file_content)
+
+        # Ensure json_data is a dictionary
+        if not isinstance(json_data, dict):
+            raise TypeError(
+                'The configuration data is not valid json object data.'
+            )
+
+        return json_data
+
+    @staticmethod
+    def format_json(json_data: dict) -> str:
+        """
+        Serializes json data with consistent indentation.
+
+        Args:
+            json_data (dict): The json data to serialize.
+
+        Returns:
+            str: The json data.
+        """
+        return json.dumps(json_data, ensure_ascii=False, indent=2)
+
     @staticmethod
     def set_json(json_data: dict, outfile: str) -> None:
         """
@@ -176,12 +343,276 @@ class SchemeFileManager:
         """
         try:
             with open(outfile, 'w', encoding='utf-8') as json_file:
-                json.dump(json_data, json_file, ensure_ascii=False, indent=2)
+                json_file.write(SchemeFileManager.format_json(json_data))
         except Exception as e:
             raise OSError(
                 f'Failed to write configuration.\n\n{str(e)}'
             ) from e
 
+    @staticmethod
+    def index_xml_paths(
+        root: Element, paths: list[str]
+    ) -> dict[str, Element]:
+        """
+        Resolves nested xml paths, e.g. 'Viewer/Colors', in one traversal of
+        the tree. Only children of elements on the way to the paths are
+        visited, each at most once, so the cost does not grow with the number
+        of paths. Like find, the first matching child is taken at each step.
+
+        Args:
+            root (Element): The root element of the tree.
+            paths (list[str]): Paths of tags separated by '/', relative to the
+                               root.
+
+        Returns:
+            dict[str, Element]: Found elements keyed by the paths and all
+                                their prefixes, the root keyed by ''.
+        """
+        prefixes: set[str] = set()
+        for path in paths:
+            steps: list[str] = SchemeFileManager.split_xml_path(path)
+            prefixes.update(
+                '/'.join(steps[:i]) for i in range(1, len(steps) + 1)
+            )
+
+        index: dict[str, Element] = {'': root}
+        stack: list[tuple[str, Element]] = [('', root)]
+        while stack:
+            path, element = stack.pop()
+            for child in element:
+                child_path: str = f'{path}/{child.tag}' if path else child.tag
+                if child_path in prefixes and child_path not in index:
+                    index[child_path] = child
+                    stack.append((child_path, child))
+
+        return index
+
+    @staticmethod
+    def split_xml_path(path: str) -> list[str]:
+        """
+        Splits a nested xml path into tags.
+
+        Args:
+            path (str): Path of tags separated by '/', optionally starting
+                        with './'.
+
+        Returns:
+            list[str]: The tags.
+
+        Raises:
+            ValueError: If the path is empty or is not made of plain tags.
+        """
+        steps: list[str] = path.removeprefix('./').strip('/').split('/')
+        if not all(re.fullmatch(XML_TAG_PATTERN, step) for step in steps):
+            raise ValueError(f'Invalid XML tag path: \'{path}\'')
+
+        return steps
+
+    @staticmethod
+    def normalize_xml_path(path: str) -> str:
+        """
+        Normalizes a nested xml path, so equal paths are equal strings.
+
+        Args:
+            path (str): Path of tags separated by '/'.
+
+        Returns:
+            str: The normalized path.
+        """
+        return '/'.join(SchemeFileManager.split_xml_path(path))
+
+    @staticmethod
+    def normalize_xml_tag(tag: str | dict) -> dict:
+        """
+        Normalizes an entry of xmlTags, a tag path or an object declaring
+        the merge strategy of the tag, e.g. {"path": "Colors", "strategy":
+        "merge", "key": "Name"}.
+
+        Args:
+            tag (str | dict): The entry.
+
+        Returns:
+            dict: The normalized path ('path'), the merge strategy
+                  ('strategy') and the attribute keying merged children, None
+                  to key them by tag ('key').
+
+        Raises:
+            ValueError: If the path or the strategy is invalid.
+        """
+        spec: dict = {} if isinstance(tag, str) else dict(tag)
+        spec['path'] = SchemeFileManager.get_xml_tag_path(tag)
+        spec.setdefault('strategy', 'replace')
+        spec.setdefault('key', None)
+        if spec['strategy'] not in XML_MERGE_STRATEGIES:
+            raise ValueError(
+                f'Invalid merge strategy of XML tag \'{spec["path"]}\': '
+                f'\'{spec["strategy"]}\''
+            )
+
+        return spec
+
+    @staticmethod
+    def select_xml_tags(
+        tags: list[str | dict], selected: list[str]
+    ) -> list[str | dict]:
+        """
+        Selects entries of xmlTags by path, keeping their merge strategies.
+        Paths which are not configured are replaced as a whole.
+
+        Args:
+            tags (list[str | dict]): The configured entries of xmlTags.
+            selected (list[str]): The selected tag paths.
+
+        Returns:
+            list[str | dict]: The selected entries.
+        """
+        configured: dict[str, str | dict] = {
+            SchemeFileManager.get_xml_tag_path(tag): tag for tag in tags
+        }
+
+        return [
+            configured.get(SchemeFileManager.normalize_xml_path(path), path)
+            for path in selected
+        ]
+
+    @staticmethod
+    def get_xml_tag_path(tag: str | dict) -> str:
+        """
+        Gets the normalized path of an entry of xmlTags.
+
+        Args:
+            tag (str | dict): The entry.
+
+        Returns:
+            str: The normalized tag path.
+        """
+        return SchemeFileManager.normalize_xml_path(
+            tag if isinstance(tag, str) else tag['path']
+        )
+
+    @staticmethod
+    def merge_xml_element(
+        current: Element | None, source: Element, strategy: str,
+        key: str | None
+    ) -> Element:
+        """
+        Merges the scheme element into the current one, leaving both intact.
+
+        'replace' takes the scheme element as is. 'merge' replaces children
+        of the current element with scheme children of the same key in place
+        and appends the others, children missing in the scheme are kept.
+        Children are keyed by tag, or by tag and the key attribute, and by
+        their occurrence among children sharing it, so the n-th repeated
+        scheme child replaces the n-th current one. Keys are looked up
+        through a hash index, so merging is linear. 'attributes' updates
+        attributes of the current element only.
+
+        Args:
+            current (Element | None): The current element, None if missing.
+            source (Element): The scheme element.
+            strategy (str): The merge strategy.
+            key (str | None): The attribute keying children, None to key them
+                              by tag.
+
+        Returns:
+            Element: The merged element.
+        """
+        if current is None or strategy == 'replace':
+            return source
+
+        merged = Element(
+            current.tag, {**current.attrib, **source.attrib}
+            if strategy == 'attributes' else dict(current.attrib)
+        )
+        merged.text, merged.tail = current.text, current.tail
+        merged.extend(current)
+        if strategy == 'attributes':
+            return merged
+
+        def child_keys(
+            children: Element
+        ) -> list[tuple[str, str | None, int]]:
+            counts: dict[tuple[str, str | None], int] = {}
+            keys: list[tuple[str, str | None, int]] = []
+            for child in children:
+                base: tuple[str, str | None] = (
+                    child.tag, None if key is None else child.get(key)
+                )
+                counts[base] = counts.get(base, 0) + 1
+                keys.append((*base, counts[base]))
+            return keys
+
+        positions: dict[tuple[str, str | None, int], int] = {
+            child_key: i for i, child_key in enumerate(child_keys(merged))
+        }
+        for child, child_key in zip(list(source), child_keys(source)):
+            position: int | None = positions.get(child_key)
+            if position is None:
+                merged.append(child)
+            else:
+                merged[position] = child
+
+        return merged
+
+    @staticmethod
+    def replace_xml_element(
+        index: dict[str, Element], path: str, element: Element | None
+    ) -> None:
+        """
+        Replaces the element at the path in place, appends it to its parent
+        if it does not exist, creating missing parents, or removes it if
+        element is None. The index is updated accordingly.
+
+        Args:
+            index (dict[str, Element]): The path index, see index_xml_paths.
+            path (str): The normalized path of the element.
+            element (Element | None): The new element, None to remove it.
+        """
+        parent_path: str = path.rpartition('/')[0]
+        parent: Element | None = index.get(parent_path)
+        current: Element | None = index.get(path)
+
+        if element is None:
+            if current is not None and parent is not None:
+                parent.remove(current)
+                index.pop(path)
+            return
+
+        if parent is None:
+            # Create missing parents from the deepest existing one
+            steps: list[str] = parent_path.split('/')
+            parent = index['']
+            for i, step in enumerate(steps):
+                step_path: str = '/'.join(steps[:i + 1])
+                if step_path not in index:
+                    index[step_path] = SubElement(parent, step)
+                parent = index[step_path]
+
+        if current is None:
+            parent.append(element)
+        else:
+            parent[list(parent).index(current)] = element
+        index[path] = element
+
+    @staticmethod
+    def prettify_xml(root: Element) -> str:
+        """
+        Serializes an xml tree with consistent indentation.
+
+        Args:
+            root (Element): The root element of the tree.
+
+        Returns:
+            str: The indented xml data without blank lines.
+        """
+        xml_str: str = defusedxmlET.tostring(root, encoding='utf-8')
+        dom = defusedxmlMD.parseString(xml_str)
+        pretty_xml: str = dom.toprettyxml(indent='  ')
+
+        return '\n'.join(
+            [line for line in pretty_xml.split('\n') if line.strip()]
+        )
+
     @staticmethod
     def set_xml(xml_data: str, outfile: str) -> None:
         """
@@ -203,23 +634,28 @@ class SchemeFileManager:
             ) from e
 
     @staticmethod
-    def list_schemes(scheme_path: str, scheme_exts: list[str]) -> list[str]:
+    def scan_schemes(
+        scheme_path: str, scheme_exts: list[str], batch_size: int
+    ) -> Iterator[list[tuple[str, list[str]]]]:
         """
-        Lists all available schemes in the specified directory that meet the
-        required extensions.
+        Scans the specified directory and yields discovered schemes in batches.
+        A scheme is yielded as soon as all of its required files are found,
+        incomplete schemes are yielded once the whole directory is scanned.
 
         Args:
             scheme_path (str): The path to the directory containing scheme
                                files.
             scheme_exts (list[str]): A list of required file extensions for
                                      each scheme.
+            batch_size (int): The maximum number of schemes in a single batch.
 
-        Returns:
-            list[str]: A sorted list of available scheme names.
+        Yields:
+            list[tuple[str, list[str]]]: A batch of scheme names paired with
+                                         their missing files (empty for
+                                         complete schemes).
 
         Raises:
-            FileNotFoundError: If the directory does not exist or required
-                               files are missing.
+            FileNotFoundError: If the directory does not exist.
         """
         # Verify the existence of the scheme directory
         if not os.path.exists(scheme_path):
@@ -227,30 +663,72 @@ class SchemeFileManager:
                 f'The schemes directory does not exist: {scheme_path}'
             )
 
-        # Retrieve all files in the directory
-        files = [
-            file for file in os.listdir(scheme_path) if os.path.isfile(
-                os.path.join(scheme_path, file)
-            )
-        ]
+        required_exts: set[str] = set(scheme_exts)
+        scheme_files: dict[str, set[str]] = {}
+        batch: list[tuple[str, list[str]]] = []
+
+        # Group files by scheme name, emit schemes once they are complete
+        with os.scandir(scheme_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name, ext = os.path.splitext(entry.name)
+                ext = ext[1:]   # Remove dot from extension
+                if ext not in required_exts:
+                    continue
+                found_exts = scheme_files.setdefault(name, set())
+                if ext in found_exts:
+                    continue
+                found_exts.add(ext)
+                if found_exts == required_exts:
+                    batch.append((name, []))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+
+        # Emit schemes with missing files after the scan is finished
+        for name in sorted(scheme_files):
+            missing_exts = required_exts - scheme_files[name]
+            if missing_exts:
+                batch.append(
+                    (name, [f'{name}.{ext}' for ext in sorted(missing_exts)])
+                )
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
 
-        # Create a dictionary to group files by scheme name
-        scheme_files = {}
-        for file in files:
-            name, ext = os.path.splitext(file)
-            if ext[1:] in scheme_exts:   # Remove dot from extension
-                if name not in scheme_files:
-                    scheme_files[name] = []
-                scheme_files[name].append(ext[1:])
-
-        # Validate that each scheme has all required extensions
-        missing_files = {}
-        for name, ext in scheme_files.items():
-            missing_extensions = set(scheme_exts) - set(ext)
-            if missing_extensions:
-                missing_files[name] = [
-                    f'{name}.{ext}' for ext in missing_extensions
-                ]
+        if batch:
+            yield batch
+
+    @staticmethod
+    def list_schemes(scheme_path: str, scheme_exts: list[str]) -> list[str]:
+        """
+        Lists all available schemes in the specified directory that meet the
+        required extensions.
+
+        Args:
+            scheme_path (str): The path to the directory containing scheme
+                               files.
+            scheme_exts (list[str]): A list of required file extensions for
+                                     each scheme.
+
+        Returns:
+            list[str]: A sorted list of available scheme names.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist or required
+                               files are missing.
+        """
+        schemes: list[str] = []
+        missing_files: dict[str, list[str]] = {}
+        for batch in SchemeFileManager.scan_schemes(
+            scheme_path, scheme_exts, sys.maxsize
+        ):
+            for name, missing in batch:
+                if missing:
+                    missing_files[name] = missing
+                else:
+                    schemes.append(name)
 
         # Throw an error if any missing files are found
         if missing_files:
@@ -259,4 +737,4 @@ class SchemeFileManager:
                 error_message += f'\'{name}\' expected files {files}\n'
             raise FileNotFoundError(error_message)
 
-        return sorted(scheme_files.keys())
\ No newline at end of file
+        return sorted(schemes)
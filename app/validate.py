@@ -0,0 +1,148 @@
+import functools
+import json
+from typing import IO
+from xml.etree.ElementTree import ElementTree
+import configobj
+import defusedxml.ElementTree as defusedxmlET
+import jsonschema
+from app.config import SCHEME_SCHEMAS
+from app.utils import AppUtils, SchemeFileManager
+
+class SchemeValidator:
+    """
+    Provides static methods for validating parsed scheme files against the
+    schemas in the application assets.
+
+    Each schema is read and compiled into a validator once per process, so
+    validating a scheme only walks its parsed files. All errors of a file
+    are collected in a single pass.
+    """
+    @staticmethod
+    @functools.cache
+    def get_validator(file_type: str) -> jsonschema.protocols.Validator:
+        """
+        Gets the compiled validator of the scheme file type.
+
+        Args:
+            file_type (str): The scheme file type (cfg, json, xml).
+
+        Returns:
+            jsonschema.protocols.Validator: The validator.
+
+        Raises:
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        with open(
+            AppUtils.get_asset_path(SCHEME_SCHEMAS[file_type]),
+            encoding='utf-8'
+        ) as schema_file:
+            schema: dict = json.load(schema_file)
+
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+
+        return validator_class(schema)
+
+    @staticmethod
+    def parse(file_type: str, source_file: IO[bytes]) -> object:
+        """
+        Parses a scheme file.
+
+        Args:
+            file_type (str): The scheme file type (cfg, json, xml).
+            source_file (IO[bytes]): The readable binary stream of the file.
+
+        Returns:
+            object: The parsed scheme file.
+
+        Raises:
+            ValueError: If the scheme file cannot be parsed.
+        """
+        try:
+            if file_type == 'xml':
+                return defusedxmlET.parse(source_file)
+
+            content: str = source_file.read().decode('utf-8-sig')
+            if file_type == 'cfg':
+                return SchemeFileManager.get_cfg(content.splitlines())
+
+            return SchemeFileManager.parse_json(content)
+        except (
+            ValueError, TypeError, SyntaxError, configobj.ConfigObjError
+        ) as e:
+            raise ValueError(str(e)) from e
+
+    @staticmethod
+    def get_instance(file_type: str, config: object) -> dict:
+        """
+        Gets the validated representation of the parsed scheme file. The xml
+        file is represented by its root tag and attributes.
+
+        Args:
+            file_type (str): The scheme file type (cfg, json, xml).
+            config (object): The parsed scheme file.
+
+        Returns:
+            dict: The representation to validate.
+        """
+        if file_type == 'xml':
+            root = config.getroot()
+            return {'tag': root.tag, 'attributes': dict(root.attrib)}
+
+        return dict(config)
+
+    @staticmethod
+    def format_location(path: list[str | int]) -> str:
+        """
+        Formats the location of an error, e.g. 'FileColors[1].Colors[0]'.
+
+        Args:
+            path (list[str | int]): Keys and indexes leading to the value.
+
+        Returns:
+            str: The formatted location, '(root)' for the whole file.
+        """
+        location: str = ''
+        for key in path:
+            location += f'[{key}]' if isinstance(key, int) else f'.{key}'
+
+        return location.lstrip('.') or '(root)'
+
+    @staticmethod
+    def validate(
+        file_type: str, config: object, xml_tags: list[str]
+    ) -> list[str]:
+        """
+        Validates the parsed scheme file.
+
+        Args:
+            file_type (str): The scheme file type (cfg, json, xml).
+            config (object): The parsed scheme file.
+            xml_tags (list[str]): Paths of the XML tags required in the xml
+                                  file.
+
+        Returns:
+            list[str]: The errors with their locations, empty if the file is
+                       valid.
+        """
+        errors: list[str] = [
+            f'{SchemeValidator.format_location(list(error.absolute_path))}: '
+            f'{error.message}'
+            for error in sorted(
+                SchemeValidator.get_validator(file_type).iter_errors(
+                    SchemeValidator.get_instance(file_type, config)
+                ), key=lambda error: list(map(str, error.absolute_path))
+            )
+        ]
+
+        # Required tags depend on the user configuration
+        if file_type == 'xml' and isinstance(config, ElementTree):
+            index: dict = SchemeFileManager.index_xml_paths(
+                config.getroot(), xml_tags
+            )
+            errors += [
+                f'{path}: Tag does not exist.' for path in xml_tags
+                if path not in index
+            ]
+
+        return errors
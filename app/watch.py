@@ -0,0 +1,466 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from app.catalog import SchemeCatalog
+from app.index import SchemeIndex
+from app.scheme import Scheme
+from app.utils import AppUtils
+
+class PollingWatcher:
+    """
+    Detects changes of watched paths by comparing their snapshots, used where
+    inotify is not available.
+
+    Attributes:
+        paths (list[str]): Watched directories and files.
+        poll_interval (float): Seconds between two snapshots.
+        snapshots (dict[str, object]): Last snapshot, keyed by path.
+    """
+    def __init__(self, paths: list[str], poll_interval: float) -> None:
+        """
+        Initializes the PollingWatcher class.
+
+        Args:
+            paths (list[str]): Watched directories and files.
+            poll_interval (float): Seconds between two snapshots.
+        """
+        self.paths: list[str] = paths
+        self.poll_interval: float = poll_interval
+        self.snapshots: dict[str, object] = {
+            path: self.snapshot(path) for path in paths
+        }
+
+    @staticmethod
+    def snapshot(path: str) -> object:
+        """
+        Takes a snapshot of a path.
+
+        Args:
+            path (str): The watched directory or file.
+
+        Returns:
+            object: Fingerprints of files in the directory, the fingerprint of
+                    the file, or None if the path does not exist.
+        """
+        if not os.path.isdir(path):
+            return AppUtils.get_file_fingerprint(path)
+
+        fingerprints: dict[str, tuple[int, int]] = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat: os.stat_result = entry.stat()
+                        fingerprints[entry.name] = (
+                            stat.st_mtime_ns, stat.st_size
+                        )
+        except OSError:
+            return None
+
+        return fingerprints
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Waits until any watched path changes or the timeout expires.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+
+        Returns:
+            set[str]: Changed paths, empty if the timeout expired.
+        """
+        deadline: float = time.monotonic() + timeout
+
+        while True:
+            changed: set[str] = set()
+            for path in self.paths:
+                snapshot: object = self.snapshot(path)
+                if snapshot != self.snapshots[path]:
+                    self.snapshots[path] = snapshot
+                    changed.add(path)
+
+            remaining: float = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.poll_interval, remaining))
+
+    def close(self) -> None:
+        """
+        Releases resources held by the watcher.
+        """
+
+class InotifyWatcher:
+    """
+    Detects changes of watched paths with Linux inotify, called through
+    ctypes. Directories are watched directly, files are watched through their
+    parent directory, so files replaced by rename are noticed as well.
+
+    Attributes:
+        paths (list[str]): Watched directories and files.
+        libc (ctypes.CDLL): The C library providing inotify.
+        fd (int): The inotify file descriptor.
+        watches (dict[int, str]): Watched directories, keyed by watch
+                                  descriptor.
+        targets (dict[str, list[tuple[str, str | None]]]): Watched paths
+            paired with the entry name they match, None for any entry, keyed
+            by watched directory.
+    """
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    EVENT_MASK = (
+        IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        | IN_DELETE_SELF | IN_MOVE_SELF
+    )
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, paths: list[str]) -> None:
+        """
+        Initializes the InotifyWatcher class.
+
+        Args:
+            paths (list[str]): Watched directories and files.
+
+        Raises:
+            OSError: If inotify is not available.
+        """
+        if not sys.platform.startswith('linux'):
+            raise OSError('inotify is available on Linux only.')
+
+        self.paths: list[str] = paths
+        self.libc: ctypes.CDLL = ctypes.CDLL(
+            ctypes.util.find_library('c'), use_errno=True
+        )
+        self.fd: int = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'Failed to initialize inotify.')
+        self.watches: dict[int, str] = {}
+        self.targets: dict[str, list[tuple[str, str | None]]] = {}
+        self.add_watches()
+
+    def add_watches(self) -> None:
+        """
+        Watches directories of all watched paths, adding watches for paths
+        created or removed since the last call.
+        """
+        self.targets = {}
+        for path in self.paths:
+            if os.path.isdir(path):
+                directory, name = os.path.abspath(path), None
+            else:
+                directory = os.path.dirname(os.path.abspath(path))
+                name = os.path.basename(path)
+            self.targets.setdefault(directory, []).append((path, name))
+
+        watched: set[str] = set(self.watches.values())
+        for directory in self.targets:
+            if directory in watched:
+                continue
+            wd: int = self.libc.inotify_add_watch(
+                self.fd, os.fsencode(directory), self.EVENT_MASK
+            )
+            if wd >= 0:
+                self.watches[wd] = directory
+
+    def read_events(self) -> set[str]:
+        """
+        Reads pending inotify events.
+
+        Returns:
+            set[str]: Watched paths affected by the events.
+        """
+        changed: set[str] = set()
+
+        while True:
+            try:
+                data: bytes = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+
+            offset: int = 0
+            while offset < len(data):
+                wd, mask, cookie, length = (
+                    self.EVENT_HEADER.unpack_from(data, offset)
+                )
+                offset += self.EVENT_HEADER.size
+                name: str = os.fsdecode(
+                    data[offset:offset + length].rstrip(b'\0')
+                )
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    # Events were lost, assume everything changed
+                    changed.update(self.paths)
+                    continue
+
+                directory: str | None = self.watches.get(wd)
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                self_event: bool = bool(
+                    mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF)
+                )
+                for path, target in self.targets.get(directory, []):
+                    if self_event or target is None or target == name:
+                        changed.add(path)
+
+        return changed
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Waits until any watched path changes or the timeout expires.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+
+        Returns:
+            set[str]: Changed paths, empty if the timeout expired.
+        """
+        ready: list = select.select([self.fd], [], [], timeout)[0]
+        if not ready:
+            return set()
+
+        changed: set[str] = self.read_events()
+        if changed:
+            self.add_watches()
+
+        return changed
+
+    def close(self) -> None:
+        """
+        Closes the inotify file descriptor.
+        """
+        os.close(self.fd)
+
+class SchemeWatcher:
+    """
+    Watches scheme paths and DC configuration files. Bursts of changes are
+    debounced into one incremental rescan of the changed scheme paths and,
+    if an active scheme is set, one re-apply of it.
+
+    The active scheme is re-applied when its files change or when DC
+    configuration files are changed by another program. Changes written by
+    the apply itself are recognized by their fingerprints and ignored.
+
+    Attributes:
+        index (SchemeIndex): The merged scheme index.
+        config_files (list[str]): Paths of the DC configuration files.
+        debounce (float): Seconds without changes ending a burst.
+        poll_interval (float): Seconds between checks of the stop flag, and
+                               between snapshots of the polling fallback.
+        watcher (InotifyWatcher | PollingWatcher): The change detector.
+        stopped (threading.Event): Set to stop watching.
+        lock (threading.Lock): Lock guarding the active scheme state.
+        scheme (Scheme | None): The active scheme, re-applied on changes.
+        sources (dict[str, tuple | None]): Fingerprints of the active scheme
+                                           files, keyed by file type.
+        applied (dict[str, tuple | None]): Fingerprints of DC configuration
+                                           files after the last apply, keyed
+                                           by path.
+    """
+    def __init__(
+        self, index: SchemeIndex, dc_configs: dict[str, str], debounce: float,
+        poll_interval: float
+    ) -> None:
+        """
+        Initializes the SchemeWatcher class.
+
+        Args:
+            index (SchemeIndex): The merged scheme index.
+            dc_configs (dict[str, str]): A dictionary containing DC
+                                         configuration file types and their
+                                         paths.
+            debounce (float): Seconds without changes ending a burst.
+            poll_interval (float): Seconds between checks of the stop flag.
+        """
+        self.index: SchemeIndex = index
+        self.config_files: list[str] = [
+            os.path.expandvars(dc_configs[file_type])
+            for file_type in ('cfg', 'json', 'xml')
+        ]
+        self.debounce: float = debounce
+        self.poll_interval: float = poll_interval
+        self.watcher: InotifyWatcher | PollingWatcher = self.create_watcher(
+            index.roots + self.config_files, poll_interval
+        )
+        self.stopped: threading.Event = threading.Event()
+        self.lock: threading.Lock = threading.Lock()
+        self.scheme: Scheme | None = None
+        self.sources: dict[str, tuple | None] = {}
+        self.applied: dict[str, tuple | None] = {}
+        self.mark_applied()
+
+    @staticmethod
+    def create_watcher(
+        paths: list[str], poll_interval: float
+    ) -> InotifyWatcher | PollingWatcher:
+        """
+        Creates an inotify watcher, or a polling one if inotify is not
+        available.
+
+        Args:
+            paths (list[str]): Watched directories and files.
+            poll_interval (float): Seconds between snapshots of the polling
+                                   watcher.
+
+        Returns:
+            InotifyWatcher | PollingWatcher: The change detector.
+        """
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            return PollingWatcher(paths, poll_interval)
+
+    def set_scheme(self, scheme: Scheme | None) -> None:
+        """
+        Sets the scheme re-applied on changes.
+
+        Args:
+            scheme (Scheme | None): The active scheme, None to stop
+                                    re-applying.
+        """
+        with self.lock:
+            self.scheme = scheme
+            self.sources = {
+                file_type: scheme.get_source_fingerprint(file_type)
+                for file_type in scheme.file_types
+            } if scheme is not None else {}
+
+    def mark_applied(self) -> None:
+        """
+        Records fingerprints of DC configuration files, so changes written by
+        an apply are not taken as external changes.
+        """
+        with self.lock:
+            self.applied = {
+                file: AppUtils.get_file_fingerprint(file)
+                for file in self.config_files
+            }
+
+    def stop(self) -> None:
+        """
+        Stops watching, the run loop exits within the poll interval.
+        """
+        self.stopped.set()
+
+    def wait_for_changes(self) -> set[str]:
+        """
+        Waits for a burst of changes to finish.
+
+        Returns:
+            set[str]: Paths changed during the burst, empty if stopped.
+        """
+        changed: set[str] = set()
+
+        while not self.stopped.is_set():
+            events: set[str] = self.watcher.wait(
+                self.debounce if changed else self.poll_interval
+            )
+            if events:
+                changed.update(events)
+            elif changed:
+                return changed
+
+        return set()
+
+    def get_apply_scheme(self, changed: set[str]) -> Scheme | None:
+        """
+        Decides whether the changes require the active scheme to be
+        re-applied.
+
+        Args:
+            changed (set[str]): Paths changed during the burst.
+
+        Returns:
+            Scheme | None: A fresh copy of the active scheme to apply, or None
+                           if no re-apply is needed.
+        """
+        with self.lock:
+            if self.scheme is None:
+                return None
+
+            # Fresh copy, so archive stores read the central directory again
+            scheme = Scheme(
+                self.scheme.scheme,
+                self.index.resolve(self.scheme.scheme)
+                or self.scheme.scheme_path,
+                self.scheme.dc_configs, self.scheme.dc_configs_backup,
+                self.scheme.auto_dark_mode, self.scheme.xml_tag_specs,
+                self.scheme.file_types
+            )
+
+            if scheme.scheme_path != self.scheme.scheme_path or any(
+                scheme.get_source_fingerprint(file_type) != fingerprint
+                for file_type, fingerprint in self.sources.items()
+            ):
+                return scheme
+            for file in self.config_files:
+                if file in changed and (
+                    AppUtils.get_file_fingerprint(file) != self.applied[file]
+                ):
+                    return scheme
+
+        return None
+
+    def run(
+        self, callback: Callable[[str, str, list], None],
+        on_event: Callable[[str, str], None]
+    ) -> None:
+        """
+        Watches for changes until stopped. Runs in a background thread with
+        its own catalog connection.
+
+        Args:
+            callback (Callable[[str, str, list], None]): Receives the batch
+                kind ('changed'), the root and the batch of rescanned
+                schemes.
+            on_event (Callable[[str, str], None]): Receives the event kind
+                ('applied', 'failed' for a failed re-apply, or 'error') and
+                its message.
+        """
+        catalog = SchemeCatalog(
+            self.index.catalog_path, self.index.dominant_colors
+        )
+
+        try:
+            while not self.stopped.is_set():
+                changed: set[str] = self.wait_for_changes()
+                if not changed:
+                    continue
+
+                # Incremental rescan of changed scheme paths
+                for root in self.index.roots:
+                    if root in changed:
+                        try:
+                            self.index.refresh_root(catalog, root, callback)
+                        except Exception as e:
+                            on_event('error', f'{root}: {e}')
+
+                scheme: Scheme | None = self.get_apply_scheme(changed)
+                if scheme is None:
+                    continue
+                try:
+                    scheme.apply_scheme()
+                    self.set_scheme(scheme)
+                    on_event(
+                        'applied', f'Scheme \'{scheme.scheme}\' re-applied.'
+                    )
+                except Exception as e:
+                    on_event('failed', str(e))
+                finally:
+                    # Do not take own, even partial, writes as changes
+                    self.mark_applied()
+        finally:
+            catalog.close()
+            self.watcher.close()
@@ -0,0 +1,137 @@
+import os
+import sys
+import threading
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import apply
+import test_data
+
+class BlockingScheme:
+    """
+    A scheme recording applies, the first one blocks until released.
+    """
+    def __init__(self, name, applied, release, selection=()):
+        self.scheme = name
+        self.applied = applied
+        self.release = release
+        self.selection = selection
+
+    def apply_scheme(self):
+        self.release.wait(test_data.SERVER_TIMEOUT)
+        self.applied.append(self.scheme)
+
+    def discard_materialized(self):
+        pass
+
+    def get_selection(self):
+        return self.selection
+
+class TestApplyQueue(unittest.TestCase):
+    """
+    A set of unit tests for the apply module.
+    """
+    def test_submit(self):
+        """
+        Tests that waiting requests collapse to the latest one.
+        """
+        applied = []
+        release = threading.Event()
+        apply_queue = apply.ApplyQueue()
+
+        futures = [
+            apply_queue.submit(BlockingScheme(name, applied, release))
+            for name in ['first']
+        ]
+        # Wait until the first request is being applied
+        while apply_queue.pending:
+            release.wait(0.01)
+        futures.extend(
+            apply_queue.submit(BlockingScheme(name, applied, release))
+            for name in ['second', 'third']
+        )
+        release.set()
+
+        self.assertListEqual(
+            [
+                future.result(timeout=test_data.SERVER_TIMEOUT)
+                for future in futures
+            ], [True, False, True]
+        )
+        self.assertListEqual(applied, ['first', 'third'])
+        self.assertEqual(apply_queue.superseded, 1)
+
+    def test_submit_selections(self):
+        """
+        Tests that waiting requests collapse only with requests of the same
+        selection.
+        """
+        applied = []
+        release = threading.Event()
+        apply_queue = apply.ApplyQueue()
+
+        futures = [
+            apply_queue.submit(BlockingScheme('first', applied, release))
+        ]
+        # Wait until the first request is being applied
+        while apply_queue.pending:
+            release.wait(0.01)
+        futures.extend(
+            apply_queue.submit(
+                BlockingScheme(name, applied, release, selection)
+            )
+            for name, selection in test_data.APPLY_SELECTION_REQUESTS
+        )
+        release.set()
+
+        self.assertListEqual(
+            [
+                future.result(timeout=test_data.SERVER_TIMEOUT)
+                for future in futures
+            ], [True, False, True, True]
+        )
+        self.assertListEqual(applied, ['first', 'colors', 'new'])
+        self.assertEqual(apply_queue.superseded, 1)
+
+    def test_submit_task(self):
+        """
+        Tests that tasks run in order with applies and keep applies queued
+        before them.
+        """
+        applied = []
+        release = threading.Event()
+        apply_queue = apply.ApplyQueue()
+
+        futures = [
+            apply_queue.submit(BlockingScheme('first', applied, release))
+        ]
+        # Wait until the first request is being applied
+        while apply_queue.pending:
+            release.wait(0.01)
+        futures.append(
+            apply_queue.submit(BlockingScheme('second', applied, release))
+        )
+        futures.append(apply_queue.submit_task(
+            lambda: applied.append('undo') or 'undone'
+        ))
+        futures.append(
+            apply_queue.submit(BlockingScheme('third', applied, release))
+        )
+        release.set()
+
+        self.assertListEqual(
+            [
+                future.result(timeout=test_data.SERVER_TIMEOUT)
+                for future in futures
+            ], [True, True, 'undone', True]
+        )
+        self.assertListEqual(applied, ['first', 'second', 'undo', 'third'])
+        self.assertEqual(apply_queue.superseded, 0)
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,227 @@
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import catalog
+import test_data
+
+class TestSchemeCatalog(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeCatalog class.
+    """
+    def setUp(self):
+        """
+        Creates the test schemes and opens the catalog.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for name in test_data.CATALOG_SCHEME_NAMES:
+            self.create_test_scheme(name)
+        self.catalog = catalog.SchemeCatalog(
+            test_data.CATALOG_PATH, test_data.CATALOG_DOMINANT_COLORS
+        )
+
+    def tearDown(self):
+        """
+        Closes the catalog and removes the test schemes and database.
+        """
+        self.catalog.close()
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        if os.path.exists(test_data.CATALOG_PATH):
+            os.remove(test_data.CATALOG_PATH)
+
+    def create_test_scheme(self, name, cfg_content=None):
+        """
+        Helper method to create a test scheme from the source mocks.
+        """
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            content = config_mock[f'{config_type}Source']['content']
+            if config_type == 'cfg' and cfg_content is not None:
+                content = cfg_content
+            with open(
+                os.path.join(test_data.SCHEME_PATH, f'{name}.{config_type}'),
+                'w', encoding='utf-8'
+            ) as file:
+                file.write(content)
+
+    def refresh(self):
+        """
+        Helper method to refresh the catalog and collect all changes.
+        """
+        return sorted(
+            change for batch in self.catalog.refresh(
+                test_data.SCHEME_PATH,
+                test_data.USER_CONFIG_DEFAULT['schemes']['extensions']
+            ) for change in batch
+        )
+
+    def test_refresh(self):
+        """
+        Tests that the refresh stores scheme metadata.
+        """
+        self.assertListEqual(
+            self.refresh(),
+            [(name, []) for name in test_data.CATALOG_SCHEME_NAMES]
+        )
+
+        entry = self.catalog.get_scheme(
+            test_data.SCHEME_PATH, test_data.CATALOG_SCHEME_NAMES[0]
+        )
+        for key, value in test_data.CATALOG_METADATA.items():
+            self.assertEqual(entry[key], value, key)
+
+        # Copies of the same scheme share fingerprints
+        copy = self.catalog.get_scheme(
+            test_data.SCHEME_PATH, test_data.CATALOG_SCHEME_NAMES[1]
+        )
+        self.assertIsNotNone(entry['canonicalHash'])
+        self.assertEqual(entry['canonicalHash'], copy['canonicalHash'])
+        self.assertEqual(entry['simhash'], copy['simhash'])
+
+    def test_outdated_layout(self):
+        """
+        Tests that a catalog of an outdated layout is rebuilt.
+        """
+        self.refresh()
+        with self.catalog.connection:
+            self.catalog.connection.execute('PRAGMA user_version = 0')
+        self.catalog.close()
+
+        self.catalog = catalog.SchemeCatalog(
+            test_data.CATALOG_PATH, test_data.CATALOG_DOMINANT_COLORS
+        )
+        self.assertListEqual(
+            self.catalog.list_schemes(test_data.SCHEME_PATH), []
+        )
+        self.assertListEqual(
+            self.refresh(),
+            [(name, []) for name in test_data.CATALOG_SCHEME_NAMES]
+        )
+
+    def test_refresh_incremental(self):
+        """
+        Tests that the refresh reports only changed and removed schemes.
+        """
+        self.refresh()
+        self.assertListEqual(self.refresh(), [])
+
+        changed, removed = test_data.CATALOG_SCHEME_NAMES
+        self.create_test_scheme(changed, 'DarkMode=3\n')
+        for ext in ['cfg', 'json', 'xml']:
+            os.remove(os.path.join(test_data.SCHEME_PATH, f'{removed}.{ext}'))
+
+        self.assertListEqual(
+            self.refresh(),
+            [
+                (changed, []),
+                (
+                    removed,
+                    [f'{removed}.{ext}' for ext in ['cfg', 'json', 'xml']]
+                )
+            ]
+        )
+        entry = self.catalog.get_scheme(test_data.SCHEME_PATH, changed)
+        self.assertEqual(entry['darkMode'], '3')
+        self.assertIsNone(
+            self.catalog.get_scheme(test_data.SCHEME_PATH, removed)
+        )
+
+    def test_concurrent_reader(self):
+        """
+        Tests that another connection reads the catalog while a write is in
+        progress.
+        """
+        self.refresh()
+        reader = catalog.SchemeCatalog(
+            test_data.CATALOG_PATH, test_data.CATALOG_DOMINANT_COLORS
+        )
+
+        try:
+            self.catalog.connection.execute('DELETE FROM schemes')
+            self.assertListEqual(
+                [name for name, missing in reader.list_schemes(
+                    test_data.SCHEME_PATH
+                )],
+                sorted(test_data.CATALOG_SCHEME_NAMES)
+            )
+            self.catalog.connection.rollback()
+        finally:
+            reader.close()
+
+        self.assertEqual(
+            self.catalog.connection.execute(
+                'PRAGMA journal_mode'
+            ).fetchone()[0],
+            'wal'
+        )
+
+    def test_set_wal_mode_locked(self):
+        """
+        Tests that switching to write-ahead log mode waits for a lock held by
+        another connection.
+        """
+        self.catalog.connection.execute('PRAGMA journal_mode=DELETE')
+        self.catalog.close()
+        locker = sqlite3.connect(
+            test_data.CATALOG_PATH, check_same_thread=False
+        )
+        locker.execute('BEGIN IMMEDIATE')
+        timer = threading.Timer(
+            test_data.CATALOG_LOCK_HOLD_TIME, locker.rollback
+        )
+        timer.start()
+
+        try:
+            self.catalog = catalog.SchemeCatalog(
+                test_data.CATALOG_PATH, test_data.CATALOG_DOMINANT_COLORS
+            )
+        finally:
+            timer.join()
+            locker.close()
+
+        self.assertEqual(
+            self.catalog.connection.execute(
+                'PRAGMA journal_mode'
+            ).fetchone()[0],
+            'wal'
+        )
+
+    def test_search(self):
+        """
+        Tests the search method with full-text and attribute filters.
+        """
+        self.create_test_scheme('Light', 'DarkMode=3\n')
+        self.refresh()
+
+        self.assertListEqual(
+            [
+                entry['name'] for entry in self.catalog.search(
+                    test_data.SCHEME_PATH, text='sol'
+                )
+            ],
+            ['Solarized']
+        )
+        self.assertListEqual(
+            [
+                entry['name'] for entry in self.catalog.search(
+                    test_data.SCHEME_PATH, dark_mode='3', xml_tag='Fonts'
+                )
+            ],
+            ['Light']
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
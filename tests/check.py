@@ -0,0 +1,125 @@
+import os
+import shutil
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import check
+import test_data
+
+class TestSchemeChecker(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeChecker class.
+    """
+    def setUp(self):
+        """
+        Creates a valid, an invalid and an incomplete test scheme.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_scheme_file(
+                test_data.SCHEME_NAME, config_type,
+                config_mock[f'{config_type}Source']['content']
+            )
+            self.create_scheme_file(
+                test_data.CHECK_INVALID_SCHEME, config_type,
+                test_data.VALIDATE_INVALID_FILES[config_type]
+            )
+        self.create_scheme_file(
+            test_data.CHECK_INCOMPLETE_SCHEME, 'cfg',
+            test_data.DC_CONFIG_CFG_MOCK['cfgSource']['content']
+        )
+
+        self.scheme_checker = check.SchemeChecker(
+            [test_data.SCHEME_PATH], test_data.CHECK_SCHEME_EXTS,
+            test_data.SCHEME_XML_TAGS, test_data.CHECK_CACHE_PATH,
+            test_data.CHECK_WORKERS
+        )
+
+    def tearDown(self):
+        """
+        Removes the test schemes and the cache file.
+        """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        if os.path.exists(test_data.CHECK_CACHE_PATH):
+            os.remove(test_data.CHECK_CACHE_PATH)
+
+    def create_scheme_file(self, name, config_type, content):
+        """
+        Helper method to create a test scheme file.
+        """
+        with open(
+            os.path.join(test_data.SCHEME_PATH, f'{name}.{config_type}'), 'w',
+            encoding='utf-8'
+        ) as file:
+            file.write(content)
+
+    def test_check(self):
+        """
+        Tests the check method.
+        """
+        report = self.scheme_checker.check(test_data.CHECK_TARGET_VERSION)
+        results = {result['name']: result for result in report['schemes']}
+
+        # Check the summary and results of each scheme
+        self.assertDictEqual(
+            report['summary'], {**test_data.CHECK_SUMMARY, 'checked': 3}
+        )
+        self.assertTrue(results[test_data.SCHEME_NAME]['valid'])
+        self.assertTrue(results[test_data.SCHEME_NAME]['compatible'])
+        self.assertDictEqual(
+            results[test_data.CHECK_INVALID_SCHEME]['errors'],
+            test_data.VALIDATE_ERRORS
+        )
+        self.assertFalse(results[test_data.CHECK_INVALID_SCHEME]['compatible'])
+        self.assertListEqual(
+            results[test_data.CHECK_INCOMPLETE_SCHEME]['missing'], [
+                f'{test_data.CHECK_INCOMPLETE_SCHEME}.{config_type}'
+                for config_type in ['json', 'xml']
+            ]
+        )
+        self.assertIsNone(
+            results[test_data.CHECK_INCOMPLETE_SCHEME]['compatible']
+        )
+
+    def test_check_cached(self):
+        """
+        Tests that a rerun checks only changed schemes.
+        """
+        first_report = self.scheme_checker.check(
+            test_data.CHECK_TARGET_VERSION
+        )
+        cached_report = self.scheme_checker.check(
+            test_data.CHECK_TARGET_VERSION
+        )
+
+        self.assertEqual(cached_report['summary']['checked'], 0)
+        self.assertListEqual(
+            cached_report['schemes'], first_report['schemes']
+        )
+
+        # Fix the invalid scheme
+        self.create_scheme_file(
+            test_data.CHECK_INVALID_SCHEME, 'cfg',
+            test_data.DC_CONFIG_CFG_MOCK['cfgSource']['content']
+        )
+        report = self.scheme_checker.check(test_data.CHECK_TARGET_VERSION)
+        results = {result['name']: result for result in report['schemes']}
+
+        self.assertEqual(report['summary']['checked'], 1)
+        self.assertNotIn(
+            'cfg', results[test_data.CHECK_INVALID_SCHEME]['errors']
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+from array import array
+import defusedxml.ElementTree as defusedxmlET
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import contrast
+import test_data
+
+class TestContrastAuditor(unittest.TestCase):
+    """
+    A set of unit tests for the ContrastAuditor class.
+    """
+    def test_get_ratios(self):
+        """
+        Tests the get_ratios method.
+        """
+        ratios = contrast.ContrastAuditor.get_ratios(
+            array('L', test_data.CONTRAST_RATIOS['foregrounds']),
+            array('L', test_data.CONTRAST_RATIOS['backgrounds'])
+        )
+
+        self.assertListEqual(
+            [round(ratio, 2) for ratio in ratios],
+            test_data.CONTRAST_RATIOS['ratios']
+        )
+
+    def test_audit(self):
+        """
+        Tests the audit method.
+        """
+        report = contrast.ContrastAuditor.audit(
+            test_data.CONTRAST_JSON,
+            defusedxmlET.fromstring(test_data.CONTRAST_XML),
+            test_data.CONTRAST_PAIRS, test_data.CONTRAST_MIN_RATIO
+        )
+
+        self.assertDictEqual(report, test_data.CONTRAST_REPORT)
+
+    def test_audit_empty(self):
+        """
+        Tests the audit method with no color pairs.
+        """
+        report = contrast.ContrastAuditor.audit(
+            None, None, test_data.CONTRAST_PAIRS,
+            test_data.CONTRAST_MIN_RATIO
+        )
+
+        self.assertDictEqual(
+            report, {'pairs': 0, 'minRatio': None, 'failing': []}
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import sys
+import unittest
+import defusedxml.ElementTree as defusedxmlET
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import diff
+import test_data
+
+class TestSchemeDiff(unittest.TestCase):
+    """
+    A set of unit tests for the diff module.
+    """
+    def test_diff_cfg(self):
+        """
+        Tests that only differing cfg keys are reported.
+        """
+        self.assertListEqual(
+            diff.SchemeDiff.diff_cfg(
+                {'DarkMode': '2'}, {'DarkMode': '2'}, ['DarkMode']
+            ), []
+        )
+        self.assertListEqual(
+            diff.SchemeDiff.diff_cfg(
+                {'DarkMode': '2'}, {'DarkMode': '1'}, ['DarkMode']
+            ), [('changed', 'DarkMode', '2', '1')]
+        )
+
+    def test_diff_json(self):
+        """
+        Tests that moved entries are matched and changes are reported.
+        """
+        changes = []
+        digests = {}
+        diff.SchemeDiff.diff_json(
+            test_data.DIFF_JSON_CURRENT, test_data.DIFF_JSON_APPLIED, '',
+            changes, digests
+        )
+
+        self.assertListEqual(changes, test_data.DIFF_JSON_CHANGES)
+
+    def test_hash_value(self):
+        """
+        Tests that digests ignore key order but not entry order, and are
+        memoized per node.
+        """
+        value, reordered, moved = test_data.DIFF_JSON_HASH_VALUES
+        digests = {}
+        digest = diff.SchemeDiff.hash_value(value, digests)
+
+        self.assertIn(id(value), digests)
+        self.assertEqual(
+            diff.SchemeDiff.hash_value(reordered, {}), digest
+        )
+        self.assertNotEqual(diff.SchemeDiff.hash_value(moved, {}), digest)
+
+    def test_diff_xml(self):
+        """
+        Tests that identical subtrees are skipped and changes are reported.
+        """
+        source_root = defusedxmlET.fromstring(
+            test_data.DC_CONFIG_XML_MOCK['xmlSource']['content'].encode()
+        )
+        target_root = defusedxmlET.fromstring(
+            test_data.DC_CONFIG_XML_MOCK['xmlTarget']['content'].encode()
+        )
+        changes = []
+        digests = {}
+        for item in test_data.SCHEME_XML_TAGS[::-1]:
+            diff.SchemeDiff.diff_xml(
+                target_root.find(item), source_root.find(item), item,
+                changes, digests
+            )
+
+        self.assertListEqual(changes, test_data.DIFF_XML_CHANGES)
+
+        changes = []
+        diff.SchemeDiff.diff_xml(
+            target_root, target_root, 'doublecmd', changes, digests
+        )
+        self.assertListEqual(changes, [])
+
+    def test_format(self):
+        """
+        Tests that changes are formatted with shortened values.
+        """
+        text = diff.SchemeDiff.format(
+            {'colors.json': test_data.DIFF_JSON_CHANGES, 'doublecmd.cfg': []},
+            test_data.DIFF_VALUE_WIDTH
+        )
+        lines = text.splitlines()
+
+        self.assertEqual(lines[0], 'colors.json: 4 change(s)')
+        self.assertEqual(lines[1], '  ~ FileColors[1].Color: 255 -> 16711680')
+        self.assertTrue(lines[2].endswith('...'))
+        self.assertEqual(lines[-1], 'doublecmd.cfg: no changes')
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import sys
+import unittest
+import configobj
+import defusedxml.ElementTree as defusedxmlET
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import duplicates
+import test_data
+
+class TestDuplicateFinder(unittest.TestCase):
+    """
+    A set of unit tests for the DuplicateFinder class.
+    """
+    def get_hashes(self, get_features, configs):
+        """
+        Helper method to hash the features of each config.
+        """
+        return [
+            duplicates.DuplicateFinder.get_hash(get_features(config))
+            for config in configs
+        ]
+
+    def test_get_hash(self):
+        """
+        Tests that reformatted copies have the same canonical hash.
+        """
+        for get_features, configs in [
+            (
+                duplicates.DuplicateFinder.get_cfg_features, [
+                    configobj.ConfigObj([line])
+                    for line in test_data.DUPLICATE_CFG
+                ]
+            ),
+            (
+                duplicates.DuplicateFinder.get_json_features,
+                test_data.DUPLICATE_JSON
+            ),
+            (
+                duplicates.DuplicateFinder.get_xml_features, [
+                    defusedxmlET.fromstring(content)
+                    for content in test_data.DUPLICATE_XML
+                ]
+            )
+        ]:
+            with self.subTest(get_features=get_features.__name__):
+                hashes = self.get_hashes(get_features, configs)
+                self.assertEqual(hashes[0], hashes[1])
+
+        # Order of repeated tags is kept
+        hashes = self.get_hashes(
+            duplicates.DuplicateFinder.get_xml_features, [
+                defusedxmlET.fromstring(content) for content in [
+                    test_data.DUPLICATE_XML[0],
+                    test_data.DUPLICATE_XML_CHANGED
+                ]
+            ]
+        )
+        self.assertNotEqual(hashes[0], hashes[1])
+
+    def test_get_simhash(self):
+        """
+        Tests that changing one of many features changes few bits.
+        """
+        features = [
+            f'json:Styles[0].Key{i}={i}'
+            for i in range(test_data.DUPLICATE_FEATURE_COUNT)
+        ]
+        changed = features[:-1] + ['json:Styles[0].Key0=1']
+
+        self.assertLessEqual(
+            (
+                duplicates.DuplicateFinder.get_simhash(features)
+                ^ duplicates.DuplicateFinder.get_simhash(changed)
+            ).bit_count(), test_data.DUPLICATE_MAX_DISTANCE
+        )
+
+    def test_find(self):
+        """
+        Tests the find method.
+        """
+        self.assertDictEqual(
+            duplicates.DuplicateFinder.find(
+                test_data.DUPLICATE_ENTRIES, test_data.DUPLICATE_MAX_DISTANCE
+            ), test_data.DUPLICATE_REPORT
+        )
+
+    def test_get_hidden(self):
+        """
+        Tests the get_hidden method.
+        """
+        self.assertSetEqual(
+            duplicates.DuplicateFinder.get_hidden(
+                test_data.DUPLICATE_ENTRIES
+            ), {'Nord Copy'}
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import shutil
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import export, scheme
+import test_data
+
+class TestSchemeExporter(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeExporter class.
+    """
+    def setUp(self):
+        """
+        Creates the test configuration files.
+        """
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_test_file(
+                config_mock[f'{config_type}Target']['name'],
+                config_mock[f'{config_type}Target']['content']
+            )
+
+        self.scheme_exporter = export.SchemeExporter(
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.SCHEME_XML_TAGS
+        )
+
+    def tearDown(self):
+        """
+        Removes the test configuration files and exported schemes.
+        """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in test_data.PRELOAD_DC_CONFIG_PATHS.values():
+            if os.path.exists(name):
+                os.remove(name)
+
+    def create_test_file(self, name, content):
+        """
+        Helper method to create a test file.
+        """
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def test_read_xml(self):
+        """
+        Tests that only the first match of each configured tag is extracted.
+        """
+        self.create_test_file(
+            test_data.PRELOAD_DC_CONFIG_PATHS['xml'],
+            test_data.EXPORT_XML_CONTENT
+        )
+        scheme_exporter = export.SchemeExporter(
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.EXPORT_XML_TAGS
+        )
+
+        self.assertEqual(
+            export.defusedxmlET.tostring(
+                scheme_exporter.read_xml(), encoding='unicode'
+            ),
+            test_data.EXPORT_XML_EXTRACTED
+        )
+
+    def test_export(self):
+        """
+        Tests that applying the exported scheme changes nothing.
+        """
+        self.scheme_exporter.export(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH
+        )
+
+        exported_scheme = scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+        for changes in exported_scheme.diff_scheme().values():
+            self.assertListEqual(changes, [])
+
+        # Check that existing schemes are kept
+        with self.assertRaises(FileExistsError):
+            self.scheme_exporter.export(
+                test_data.SCHEME_NAME, test_data.SCHEME_PATH
+            )
+
+    def test_export_styles(self):
+        """
+        Tests that every style is exported with its DarkMode value.
+        """
+        self.create_test_file(
+            test_data.PRELOAD_DC_CONFIG_PATHS['json'],
+            test_data.EXPORT_JSON_CONTENT
+        )
+
+        names = self.scheme_exporter.export_styles(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH
+        )
+
+        self.assertListEqual(
+            names, list(test_data.EXPORT_STYLE_DARK_MODES)
+        )
+        for name, dark_mode in test_data.EXPORT_STYLE_DARK_MODES.items():
+            path = os.path.join(test_data.SCHEME_PATH, name)
+            self.assertEqual(
+                scheme.SchemeFileManager.get_cfg(f'{path}.cfg')['DarkMode'],
+                dark_mode
+            )
+            self.assertEqual(
+                scheme.SchemeFileManager.get_json(f'{path}.json')['Styles'][0]
+                ['Name'], name.rpartition(' ')[2]
+            )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import queue
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import gui
+from app.search import SchemeSearchIndex
+import test_data
+
+class TestSchemePicker(unittest.TestCase):
+    """
+    A set of unit tests for the SchemePicker class, run on its state only, so
+    no display is needed.
+    """
+    def setUp(self):
+        """
+        Creates the picker state with all test schemes listed.
+        """
+        index = SchemeSearchIndex()
+        index.add(test_data.SEARCH_SCHEME_NAMES)
+        self.picker = SimpleNamespace(
+            index=index, ranking=None, view=index.search('')
+        )
+
+    def find_typeahead(self, prefix):
+        """
+        Helper method to find the name selected by type-ahead.
+        """
+        position = gui.SchemePicker.find_typeahead(self.picker, prefix)
+
+        return None if position is None else self.picker.index.names[
+            self.picker.view[position]
+        ]
+
+    def test_find_typeahead(self):
+        """
+        Tests type-ahead with hidden schemes.
+        """
+        self.assertEqual(self.find_typeahead('so'), 'Solarized Dark')
+
+        hidden = self.picker.index.ids[test_data.SEARCH_HIDDEN]
+        self.picker.view = [
+            name_id for name_id in self.picker.view if name_id != hidden
+        ]
+        self.assertEqual(self.find_typeahead('so'), 'Solarized Light')
+
+    def test_find_typeahead_ranking(self):
+        """
+        Tests type-ahead while a ranking is listed.
+        """
+        self.picker.ranking = [
+            self.picker.index.ids[name] for name in test_data.SEARCH_RANKING
+        ]
+        self.picker.view = self.picker.ranking
+
+        self.assertEqual(self.find_typeahead('n'), 'Nord')
+        self.assertEqual(self.find_typeahead('d'), 'Dracula')
+        self.assertIsNone(self.find_typeahead('one'))
+
+class TestAppFrame(unittest.TestCase):
+    """
+    A set of unit tests for the AppFrame class, run on a stand-in of its
+    state, so no display is needed.
+    """
+    def test_poll_watcher_events(self):
+        """
+        Tests that re-applies of the watcher are reported like applies.
+        """
+        frame = SimpleNamespace(
+            scheme_queue=queue.Queue(), status_var=Mock(),
+            update_undo=Mock(), schedule_preload=Mock(),
+            report_apply_error=Mock(), after=Mock(), poll_schemes=Mock(),
+            user_config={'schemes': {}}, scheme_watcher=Mock()
+        )
+        for event in test_data.GUI_WATCHER_EVENTS:
+            frame.scheme_queue.put(event)
+
+        gui.AppFrame.poll_schemes(frame)
+
+        frame.status_var.set.assert_called_once_with(
+            test_data.GUI_WATCHER_EVENTS[0][1]
+        )
+        frame.update_undo.assert_called_once()
+        frame.report_apply_error.assert_called_once_with(
+            'Re-applying the scheme failed.',
+            test_data.GUI_WATCHER_EVENTS[1][1]
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
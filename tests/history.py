@@ -0,0 +1,138 @@
+import os
+import shutil
+import sys
+import unittest
+import defusedxml.ElementTree as defusedxmlET
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import history, scheme
+from app.utils import SchemeFileManager
+import test_data
+
+class TestApplyHistory(unittest.TestCase):
+    """
+    A set of unit tests for the history module.
+    """
+    def setUp(self):
+        """
+        Creates the test scheme and configuration files.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_test_file(
+                os.path.join(
+                    test_data.SCHEME_PATH,
+                    f'{test_data.SCHEME_NAME}.{config_type}'
+                ),
+                config_mock[f'{config_type}Source']['content']
+            )
+            self.create_test_file(
+                config_mock[f'{config_type}Target']['name'],
+                config_mock[f'{config_type}Target']['content']
+            )
+
+    def tearDown(self):
+        """
+        Removes the test scheme, configuration and journal files.
+        """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in list(test_data.PRELOAD_DC_CONFIG_PATHS.values()) + [
+            test_data.APPLY_PROFILE_LOCK_PATH, test_data.APPLY_HISTORY_PATH,
+            test_data.HISTORY_PATH
+        ]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def create_test_file(self, name, content):
+        """
+        Helper method to create a test file.
+        """
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def test_undo(self):
+        """
+        Tests that undo restores the replaced sections only.
+        """
+        paths = test_data.PRELOAD_DC_CONFIG_PATHS
+        scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH, paths,
+            test_data.DC_BACKUP_CONFIGS, test_data.DARK_MODE,
+            test_data.SCHEME_XML_TAGS
+        ).apply_scheme()
+
+        # Unrelated change made after the apply
+        cfg = SchemeFileManager.get_cfg(paths['cfg'])
+        cfg['SplashForm'] = '0'
+        SchemeFileManager.set_cfg(cfg, paths['cfg'])
+
+        journal = history.ApplyHistory(
+            test_data.APPLY_HISTORY_PATH, test_data.HISTORY_SIZE
+        )
+        self.assertListEqual(
+            journal.undo(paths, 5), [test_data.SCHEME_NAME]
+        )
+
+        cfg = SchemeFileManager.get_cfg(paths['cfg'])
+        self.assertEqual(cfg['DarkMode'], '3')
+        self.assertEqual(cfg['SplashForm'], '0')
+        colors = SchemeFileManager.get_json(paths['json'])
+        self.assertEqual(colors['Styles'][0]['Log']['InfoColor'], 7654321)
+        self.assertListEqual(colors['FileColors'], [])
+        root = defusedxmlET.parse(paths['xml']).getroot()
+        self.assertEqual(root.find('./Fonts/Main/Name').text, 'Consolas')
+        self.assertEqual(root.find('./Colors/UseCursorBorder').text, 'False')
+
+        with self.assertRaises(ValueError):
+            journal.undo(paths, 1)
+
+    def test_record(self):
+        """
+        Tests that the journal is compacted to the latest applies.
+        """
+        journal = history.ApplyHistory(
+            test_data.HISTORY_PATH, test_data.HISTORY_SIZE
+        )
+        for i in range(2 * test_data.HISTORY_SIZE + 1):
+            journal.record(str(i), {'cfg': {'DarkMode': str(i)}})
+
+        self.assertListEqual(
+            [entry['scheme'] for entry in journal.load()],
+            [str(i) for i in range(
+                test_data.HISTORY_SIZE + 1, 2 * test_data.HISTORY_SIZE + 1
+            )]
+        )
+
+    def test_merge(self):
+        """
+        Tests that sections are restored to the value before the oldest
+        undone apply.
+        """
+        merged = history.ApplyHistory.merge([
+            {'sections': {
+                'cfg': {'DarkMode': '3'},
+                'json': {'Styles': {'Dark': {'Name': 'Dark'}}}
+            }},
+            {'sections': {
+                'cfg': {'DarkMode': '2'},
+                'json': {'Styles': {'Light': {'Name': 'Light'}}}
+            }}
+        ])
+
+        self.assertEqual(merged['cfg']['DarkMode'], '3')
+        self.assertSetEqual(
+            set(merged['json']['Styles']), {'Dark', 'Light'}
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,141 @@
+import os
+import shutil
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import index
+import test_data
+
+class TestSchemeIndex(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeIndex class.
+    """
+    def setUp(self):
+        """
+        Creates the scheme index over the test scheme paths.
+        """
+        self.exts = test_data.USER_CONFIG_DEFAULT['schemes']['extensions']
+        self.index = index.SchemeIndex(
+            test_data.INDEX_SCHEME_PATHS, self.exts, test_data.CATALOG_PATH,
+            test_data.CATALOG_DOMINANT_COLORS
+        )
+
+    def tearDown(self):
+        """
+        Removes the test scheme paths and catalog.
+        """
+        for scheme_path in test_data.INDEX_SCHEME_PATHS:
+            if os.path.exists(scheme_path):
+                shutil.rmtree(scheme_path)
+        if os.path.exists(test_data.CATALOG_PATH):
+            os.remove(test_data.CATALOG_PATH)
+
+    def create_test_scheme(self, scheme_path, name, exts):
+        """
+        Helper method to create scheme files from the source mocks.
+        """
+        os.makedirs(scheme_path, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            if config_type not in exts:
+                continue
+            with open(
+                os.path.join(scheme_path, f'{name}.{config_type}'), 'w',
+                encoding='utf-8'
+            ) as file:
+                file.write(config_mock[f'{config_type}Source']['content'])
+
+    def test_get_roots(self):
+        """
+        Tests that a single path and a list of paths are accepted.
+        """
+        self.assertListEqual(
+            index.SchemeIndex.get_roots(test_data.SCHEME_PATH),
+            [test_data.SCHEME_PATH]
+        )
+        self.assertListEqual(
+            index.SchemeIndex.get_roots(
+                test_data.INDEX_SCHEME_PATHS + test_data.INDEX_SCHEME_PATHS
+            ),
+            test_data.INDEX_SCHEME_PATHS
+        )
+        with self.assertRaises(ValueError):
+            index.SchemeIndex.get_roots([])
+
+    def test_resolve(self):
+        """
+        Tests that the first root holding a complete scheme wins.
+        """
+        user_path, shared_path = test_data.INDEX_SCHEME_PATHS
+        complete, incomplete = test_data.INDEX_SHARED_SCHEME_NAMES
+
+        self.index.update(shared_path, [(complete, []), (incomplete, [])])
+        merged = self.index.update(
+            user_path, [(complete, []), (incomplete, [f'{incomplete}.xml'])]
+        )
+
+        self.assertListEqual(merged, [(complete, []), (incomplete, [])])
+        self.assertEqual(self.index.resolve(complete), user_path)
+        self.assertEqual(self.index.resolve(incomplete), shared_path)
+        self.assertIsNone(self.index.resolve(test_data.SCHEME_NAME))
+
+        # Scheme removed from the shared root
+        self.index.update(
+            shared_path,
+            [(incomplete, [f'{incomplete}.{ext}' for ext in self.exts])]
+        )
+        self.assertEqual(self.index.resolve(incomplete), user_path)
+        self.assertListEqual(
+            self.index.get_missing(incomplete), [f'{incomplete}.xml']
+        )
+
+    def test_build(self):
+        """
+        Tests that all roots are loaded and failing roots are reported.
+        """
+        user_path, shared_path = test_data.INDEX_SCHEME_PATHS
+        for name in test_data.INDEX_SHARED_SCHEME_NAMES:
+            self.create_test_scheme(shared_path, name, self.exts)
+        self.create_test_scheme(user_path, test_data.SCHEME_NAME, ['cfg'])
+
+        errors = self.index.build(
+            lambda kind, root, batch: self.index.update(root, batch), True
+        )
+
+        self.assertDictEqual(errors, {})
+        self.assertListEqual(
+            self.index.list_schemes(),
+            [
+                (name, []) for name in test_data.INDEX_SHARED_SCHEME_NAMES
+            ] + [
+                (
+                    test_data.SCHEME_NAME,
+                    [
+                        f'{test_data.SCHEME_NAME}.{ext}'
+                        for ext in ['json', 'xml']
+                    ]
+                )
+            ]
+        )
+
+        # Unavailable root does not block the others
+        shutil.rmtree(user_path)
+        self.index.schemes = {root: {} for root in self.index.roots}
+        errors = self.index.build(
+            lambda kind, root, batch: self.index.update(root, batch), True
+        )
+        self.assertListEqual(list(errors), [user_path])
+        for name in test_data.INDEX_SHARED_SCHEME_NAMES:
+            self.assertEqual(self.index.resolve(name), shared_path)
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
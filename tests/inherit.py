@@ -0,0 +1,224 @@
+import io
+import json
+import os
+import shutil
+import sys
+import unittest
+from unittest.mock import patch
+import defusedxml.ElementTree as defusedxmlET
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import inherit
+from app.store import SchemeStore
+from app.utils import SchemeFileManager
+import test_data
+
+class TestSchemeResolver(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeResolver class.
+    """
+    def setUp(self):
+        """
+        Creates a base scheme and a variant inheriting from it.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_scheme_file(
+                test_data.SCHEME_NAME, config_type,
+                config_mock[f'{config_type}Source']['content']
+            )
+        self.create_variant(
+            test_data.INHERIT_VARIANT, test_data.INHERIT_VARIANT_FILES['cfg']
+        )
+
+        self.store = SchemeStore.create(test_data.SCHEME_PATH)
+        self.scheme_resolver = inherit.SchemeResolver(
+            test_data.INHERIT_CACHE_SIZE
+        )
+
+    def tearDown(self):
+        """
+        Removes the test schemes.
+        """
+        self.store.close()
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+
+    def create_scheme_file(self, name, config_type, content):
+        """
+        Helper method to create a test scheme file.
+        """
+        with open(
+            os.path.join(test_data.SCHEME_PATH, f'{name}.{config_type}'), 'w',
+            encoding='utf-8'
+        ) as file:
+            file.write(content)
+
+    def create_variant(self, name, cfg_content):
+        """
+        Helper method to create a test variant with the given cfg file.
+        """
+        self.create_scheme_file(name, 'cfg', cfg_content)
+        for config_type in ['json', 'xml']:
+            self.create_scheme_file(
+                name, config_type,
+                test_data.INHERIT_VARIANT_FILES[config_type]
+            )
+
+    def assert_resolved(self, resolved):
+        """
+        Helper method to check the variant resolved over the base scheme.
+        """
+        cfg_config = SchemeFileManager.get_cfg(
+            resolved['cfg'].decode('utf-8').splitlines()
+        )
+        self.assertEqual(
+            cfg_config['DarkMode'], test_data.INHERIT_RESOLVED_DARK_MODE
+        )
+        self.assertNotIn('Base', cfg_config)
+
+        json_config = json.loads(resolved['json'])
+        self.assertDictEqual(
+            json_config['Styles'][0]['Log'], test_data.INHERIT_RESOLVED_LOG
+        )
+        self.assertIn('FileColors', json_config)
+
+        xml_root = defusedxmlET.parse(io.BytesIO(resolved['xml'])).getroot()
+        self.assertEqual(
+            xml_root.get('ConfigVersion'),
+            test_data.INHERIT_RESOLVED_CONFIG_VERSION
+        )
+        self.assertListEqual(
+            [xml_root.findtext(f'./Fonts/Main/{tag}') for tag in [
+                'Name', 'Size'
+            ]], test_data.INHERIT_RESOLVED_FONT
+        )
+        self.assertIsNotNone(xml_root.find('./Colors/UseCursorBorder'))
+
+    def test_resolve(self):
+        """
+        Tests the resolve method.
+        """
+        self.assertIsNone(
+            self.scheme_resolver.resolve(self.store, test_data.SCHEME_NAME)
+        )
+        self.assert_resolved(
+            self.scheme_resolver.resolve(self.store, test_data.INHERIT_VARIANT)
+        )
+
+    def test_resolve_diamond(self):
+        """
+        Tests that a base shared by several bases is read once.
+        """
+        for name, bases in test_data.INHERIT_DIAMOND_BASES.items():
+            self.create_variant(
+                name, test_data.INHERIT_VARIANT_FILES['cfg'].replace(
+                    test_data.SCHEME_NAME, bases
+                )
+            )
+
+        with patch.object(
+            self.scheme_resolver, 'read', wraps=self.scheme_resolver.read
+        ) as mock_read:
+            resolved = self.scheme_resolver.resolve(self.store, 'diamond')
+
+        self.assert_resolved(resolved)
+        self.assertEqual(
+            [call.args[1] for call in mock_read.call_args_list].count(
+                test_data.SCHEME_NAME
+            ), 1
+        )
+
+    def test_resolve_cycle(self):
+        """
+        Tests that an inheritance cycle is reported.
+        """
+        for name, base in test_data.INHERIT_CYCLE_BASES.items():
+            self.create_variant(
+                name, test_data.INHERIT_VARIANT_FILES['cfg'].replace(
+                    test_data.SCHEME_NAME, base
+                )
+            )
+
+        with self.assertRaises(ValueError) as context:
+            self.scheme_resolver.resolve(self.store, 'cycle-a')
+        self.assertEqual(
+            str(context.exception), test_data.INHERIT_CYCLE_ERROR
+        )
+
+    def test_resolve_cached(self):
+        """
+        Tests that resolved schemes are cached until an ancestor changes.
+        """
+        resolved = self.scheme_resolver.resolve(
+            self.store, test_data.INHERIT_VARIANT
+        )
+        ancestry = self.scheme_resolver.get_ancestry(
+            self.store, test_data.INHERIT_VARIANT
+        )
+
+        with patch.object(
+            self.scheme_resolver, 'merge', wraps=self.scheme_resolver.merge
+        ) as mock_merge:
+            self.assertIs(
+                self.scheme_resolver.resolve(
+                    self.store, test_data.INHERIT_VARIANT
+                ), resolved
+            )
+            mock_merge.assert_not_called()
+
+            # Edit the base scheme
+            self.create_scheme_file(
+                test_data.SCHEME_NAME, 'cfg',
+                test_data.DC_CONFIG_CFG_MOCK['cfgSource']['content']
+                + 'ShowSplash=0\n'
+            )
+            self.scheme_resolver.resolve(
+                self.store, test_data.INHERIT_VARIANT
+            )
+            mock_merge.assert_called_once()
+
+        self.assertNotEqual(
+            self.scheme_resolver.get_ancestry(
+                self.store, test_data.INHERIT_VARIANT
+            ), ancestry
+        )
+        self.assertTupleEqual(
+            self.scheme_resolver.get_ancestry(
+                self.store, test_data.SCHEME_NAME
+            ), ()
+        )
+
+    def test_cache_bounded(self):
+        """
+        Tests that read files and bases are evicted beyond the cache size.
+        """
+        names = [
+            f'{test_data.INHERIT_VARIANT}-{i}'
+            for i in range(test_data.INHERIT_CACHE_SIZE)
+        ]
+        for name in names:
+            self.create_variant(name, test_data.INHERIT_VARIANT_FILES['cfg'])
+            self.scheme_resolver.resolve(self.store, name)
+
+        self.assertEqual(
+            len(self.scheme_resolver.files), test_data.INHERIT_CACHE_SIZE
+        )
+        self.assertEqual(
+            len(self.scheme_resolver.bases), test_data.INHERIT_CACHE_SIZE
+        )
+        self.assertIn(
+            (test_data.SCHEME_PATH, names[-1]), self.scheme_resolver.files
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
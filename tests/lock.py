@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import lock
+import test_data
+
+class TestProfileLock(unittest.TestCase):
+    """
+    A set of unit tests for the lock module.
+    """
+    def tearDown(self):
+        """
+        Removes the test lock file.
+        """
+        if os.path.exists(test_data.APPLY_LOCK_NAME):
+            os.remove(test_data.APPLY_LOCK_NAME)
+
+    def create_lock(self):
+        """
+        Helper method to create a lock of the test DC profile.
+        """
+        return lock.ProfileLock(
+            list(test_data.PRELOAD_DC_CONFIG_PATHS.values()),
+            test_data.APPLY_LOCK_NAME, test_data.APPLY_LOCK_TIMEOUT,
+            test_data.APPLY_LOCK_POLL_INTERVAL
+        )
+
+    def test_profile_dirs(self):
+        """
+        Tests that configuration files of one profile share a lock.
+        """
+        self.assertListEqual(self.create_lock().profile_dirs, [os.getcwd()])
+
+    def test_acquire(self):
+        """
+        Tests that a held lock makes other instances wait and time out.
+        """
+        with self.create_lock() as first_lock:
+            second_lock = self.create_lock()
+            with self.assertRaises(TimeoutError):
+                second_lock.acquire()
+
+        with self.create_lock() as second_lock:
+            pass
+
+        self.assertGreater(first_lock.hold_time, 0)
+        self.assertLess(second_lock.wait_time, test_data.APPLY_LOCK_TIMEOUT)
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
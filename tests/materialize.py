@@ -0,0 +1,185 @@
+import glob
+import os
+import shutil
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import materialize, scheme
+import test_data
+
+class TestSchemeMaterializer(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeMaterializer class.
+    """
+    def setUp(self):
+        """
+        Creates the test scheme and configuration files.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_test_file(
+                os.path.join(
+                    test_data.SCHEME_PATH,
+                    f'{test_data.SCHEME_NAME}.{config_type}'
+                ),
+                config_mock[f'{config_type}Source']['content']
+            )
+            self.create_test_file(
+                config_mock[f'{config_type}Target']['name'],
+                config_mock[f'{config_type}Target']['content']
+            )
+
+        self.materializer = materialize.SchemeMaterializer(2)
+        self.scheme = self.create_scheme()
+
+    def tearDown(self):
+        """
+        Removes the test scheme, configuration and ready files.
+        """
+        self.materializer.clear()
+        self.materializer.executor.shutdown()
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in list(test_data.PRELOAD_DC_CONFIG_PATHS.values()) + [
+            test_data.APPLY_PROFILE_LOCK_PATH, test_data.APPLY_HISTORY_PATH
+        ] + self.get_ready_files():
+            if os.path.exists(name):
+                os.remove(name)
+
+    def create_test_file(self, name, content):
+        """
+        Helper method to create a test file.
+        """
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def create_scheme(self):
+        """
+        Helper method to create a scheme pointing at the test files.
+        """
+        return scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+
+    def get_ready_files(self):
+        """
+        Helper method to list ready files next to the configuration files.
+        """
+        return [
+            name for target in test_data.PRELOAD_DC_CONFIG_PATHS.values()
+            for name in glob.glob(f'{target}.*{test_data.MATERIALIZE_SUFFIX}')
+        ]
+
+    def wait_materialized(self):
+        """
+        Helper method to wait for the materialized test scheme.
+        """
+        return self.materializer.entries[
+            self.materializer.get_key(self.scheme)
+        ][1].result()
+
+    def test_prepare(self):
+        """
+        Tests that apply renames the ready files over the configuration files.
+        """
+        self.materializer.materialize(self.scheme)
+        self.wait_materialized()
+        self.assertEqual(len(self.get_ready_files()), 3)
+
+        applied_scheme = self.create_scheme()
+        self.materializer.prepare(applied_scheme)
+        self.assertIsNotNone(applied_scheme.materialized)
+        self.assertFalse(self.materializer.entries)
+
+        applied_scheme.apply_scheme()
+
+        # Check that the ready files were consumed and changes were applied
+        self.assertListEqual(self.get_ready_files(), [])
+        self.assertIsNone(applied_scheme.materialized)
+        self.assertDictEqual(
+            applied_scheme.replaced['cfg'], {'DarkMode': '3'}
+        )
+        self.assertEqual(
+            scheme.SchemeFileManager.get_cfg(
+                test_data.PRELOAD_DC_CONFIG_PATHS['cfg']
+            )['DarkMode'],
+            '2'
+        )
+        self.assertEqual(
+            scheme.SchemeFileManager.get_json(
+                test_data.PRELOAD_DC_CONFIG_PATHS['json']
+            )['Styles'][0]['Log']['InfoColor'],
+            1234567
+        )
+
+    def test_prepare_stale(self):
+        """
+        Tests that ready files are dropped once a configuration file changed
+        outside the application.
+        """
+        self.materializer.materialize(self.scheme)
+        self.wait_materialized()
+
+        self.create_test_file(
+            test_data.PRELOAD_DC_CONFIG_PATHS['cfg'],
+            'SplashForm=0\nDarkMode=3\n'
+        )
+        applied_scheme = self.create_scheme()
+        self.materializer.prepare(applied_scheme)
+        applied_scheme.apply_scheme()
+
+        # Check that the file was merged again, keeping the external change
+        self.assertListEqual(self.get_ready_files(), [])
+        config = scheme.SchemeFileManager.get_cfg(
+            test_data.PRELOAD_DC_CONFIG_PATHS['cfg']
+        )
+        self.assertEqual(config['SplashForm'], '0')
+        self.assertEqual(config['DarkMode'], '2')
+
+    def test_materialize_stale(self):
+        """
+        Tests that stale entries are merged again.
+        """
+        self.materializer.materialize(self.scheme)
+        ready_files = self.wait_materialized()['files']
+
+        self.create_test_file(
+            test_data.PRELOAD_DC_CONFIG_PATHS['cfg'],
+            'SplashForm=0\nDarkMode=3\n'
+        )
+        self.materializer.materialize(self.scheme)
+        result = self.wait_materialized()
+
+        self.assertNotEqual(result['files'], ready_files)
+        self.assertSetEqual(
+            set(self.get_ready_files()),
+            {os.path.basename(name) for name in result['files'].values()}
+        )
+
+    def test_materialize_evict(self):
+        """
+        Tests that the least recently used scheme is evicted from the cache.
+        """
+        for name in ['first', 'second', 'third']:
+            self.scheme.scheme = name
+            self.materializer.materialize(self.scheme)
+
+        self.assertListEqual(
+            [key[1] for key in self.materializer.entries],
+            ['second', 'third']
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
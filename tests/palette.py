@@ -0,0 +1,93 @@
+import math
+import os
+import random
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import palette
+from app.colors import ColorUtils
+import test_data
+
+class TestPaletteIndex(unittest.TestCase):
+    """
+    A set of unit tests for the PaletteIndex class.
+    """
+    def setUp(self):
+        """
+        Creates a palette index of test schemes.
+        """
+        self.palette_index = palette.PaletteIndex(test_data.PALETTE_CELL_SIZE)
+        self.palette_index.add_entries([
+            {'name': name, 'dominantColors': colors}
+            for name, colors in test_data.PALETTE_SCHEMES.items()
+        ])
+
+    def test_similar(self):
+        """
+        Tests the similar method.
+        """
+        self.assertListEqual(
+            self.palette_index.similar('Nord', 2), test_data.PALETTE_SIMILAR
+        )
+        for name in ['Empty', 'Unknown']:
+            with self.subTest(name=name):
+                with self.assertRaises(KeyError):
+                    self.palette_index.similar(name, 2)
+
+    def test_near_color(self):
+        """
+        Tests the near_color method.
+        """
+        self.assertListEqual(
+            self.palette_index.near_color(test_data.PALETTE_NEAR_COLOR, 3),
+            test_data.PALETTE_NEAR
+        )
+
+    def test_add_replaces(self):
+        """
+        Tests that adding a scheme again replaces its palette.
+        """
+        self.palette_index.add('Mono', [0x123456])
+
+        self.assertEqual(len(self.palette_index), 4)
+        self.assertEqual(
+            self.palette_index.near_color(0x123456, 1)[0], ('Mono', 0.0)
+        )
+        self.assertNotIn(
+            'Mono', [
+                name for name, _ in self.palette_index.near_color(
+                    test_data.PALETTE_NEAR_COLOR, 2
+                )
+            ]
+        )
+
+    def test_nearest_exact(self):
+        """
+        Tests that the grid search matches a search over all colors.
+        """
+        generator = random.Random(test_data.PALETTE_RANDOM_SEED)
+        palette_index = palette.PaletteIndex(test_data.PALETTE_CELL_SIZE)
+        for i in range(test_data.PALETTE_RANDOM_SCHEMES):
+            palette_index.add(
+                str(i), [generator.randrange(0x1000000) for _ in range(5)]
+            )
+
+        for color in [generator.randrange(0x1000000) for _ in range(20)]:
+            lab = ColorUtils.to_lab(color)
+            expected = sorted(
+                min(math.dist(lab, point) for point in labs)
+                for labs in palette_index.palettes
+            )[:10]
+            with self.subTest(color=color):
+                self.assertListEqual(
+                    sorted(palette_index.nearest(lab, 10).values()), expected
+                )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
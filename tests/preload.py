@@ -0,0 +1,150 @@
+import os
+import shutil
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import preload, scheme
+import test_data
+
+class TestSchemePreloader(unittest.TestCase):
+    """
+    A set of unit tests for the SchemePreloader class.
+    """
+    def setUp(self):
+        """
+        Creates the test scheme and configuration files.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_test_file(
+                os.path.join(
+                    test_data.SCHEME_PATH,
+                    f'{test_data.SCHEME_NAME}.{config_type}'
+                ),
+                config_mock[f'{config_type}Source']['content']
+            )
+            self.create_test_file(
+                config_mock[f'{config_type}Target']['name'],
+                config_mock[f'{config_type}Target']['content']
+            )
+
+        self.preloader = preload.SchemePreloader(2)
+        self.scheme = self.create_scheme()
+
+    def tearDown(self):
+        """
+        Removes the test scheme and configuration files.
+        """
+        self.preloader.executor.shutdown()
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in list(test_data.PRELOAD_DC_CONFIG_PATHS.values()) + [
+            test_data.APPLY_PROFILE_LOCK_PATH, test_data.APPLY_HISTORY_PATH
+        ]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def create_test_file(self, name, content):
+        """
+        Helper method to create a test file.
+        """
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def create_scheme(self):
+        """
+        Helper method to create a scheme pointing at the test files.
+        """
+        return scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+
+    def test_prepare(self):
+        """
+        Tests that prepare hands over preloaded files and apply uses them.
+        """
+        self.preloader.preload(self.scheme)
+        applied_scheme = self.create_scheme()
+        self.preloader.prepare(applied_scheme)
+
+        self.assertSetEqual(
+            set(applied_scheme.sources), {'cfg', 'json', 'xml'}
+        )
+        self.assertSetEqual(
+            set(applied_scheme.targets), {'cfg', 'json', 'xml'}
+        )
+
+        applied_scheme.apply_scheme()
+
+        # Check that the snapshot was consumed and changes were applied
+        self.assertDictEqual(applied_scheme.targets, {})
+        self.assertEqual(
+            scheme.SchemeFileManager.get_cfg(
+                test_data.PRELOAD_DC_CONFIG_PATHS['cfg']
+            )['DarkMode'],
+            '2'
+        )
+
+    def test_prepare_stale(self):
+        """
+        Tests that a scheme file changed after preload is parsed again.
+        """
+        self.preloader.preload(self.scheme)
+        self.preloader.sources[self.preloader.get_key(self.scheme)].result()
+
+        self.create_test_file(
+            os.path.join(
+                test_data.SCHEME_PATH, f'{test_data.SCHEME_NAME}.cfg'
+            ),
+            'DarkMode=3\n'
+        )
+        applied_scheme = self.create_scheme()
+        self.preloader.prepare(applied_scheme)
+        applied_scheme.apply_scheme_cfg()
+
+        self.assertEqual(
+            scheme.SchemeFileManager.get_cfg(
+                test_data.PRELOAD_DC_CONFIG_PATHS['cfg']
+            )['DarkMode'],
+            '3'
+        )
+
+    def test_prepare_selection(self):
+        """
+        Tests that a scheme preloaded with other files selected is not
+        handed over.
+        """
+        self.scheme.file_types = ['cfg']
+        self.preloader.preload(self.scheme)
+        applied_scheme = self.create_scheme()
+        self.preloader.prepare(applied_scheme)
+
+        self.assertDictEqual(applied_scheme.sources, {})
+
+    def test_preload_evict(self):
+        """
+        Tests that the least recently used scheme is evicted from the cache.
+        """
+        for name in ['first', 'second', 'third']:
+            self.scheme.scheme = name
+            self.preloader.preload(self.scheme)
+
+        self.assertListEqual(
+            [key[1] for key in self.preloader.sources],
+            ['second', 'third']
+        )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import shutil
+import sys
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import schedule, scheme
+from app.utils import SchemeFileManager
+import test_data
+
+class TestCronExpression(unittest.TestCase):
+    """
+    A set of unit tests for the CronExpression class.
+    """
+    def test_next_after(self):
+        """
+        Tests the next_after method.
+        """
+        for expression, moment, next_time, previous_time in (
+            test_data.SCHEDULE_CRON_CASES
+        ):
+            self.assertEqual(
+                schedule.CronExpression(expression).next_after(
+                    datetime.fromisoformat(moment)
+                ),
+                datetime.fromisoformat(next_time), expression
+            )
+
+    def test_previous(self):
+        """
+        Tests the previous method.
+        """
+        for expression, moment, next_time, previous_time in (
+            test_data.SCHEDULE_CRON_CASES
+        ):
+            self.assertEqual(
+                schedule.CronExpression(expression).previous(
+                    datetime.fromisoformat(moment)
+                ),
+                datetime.fromisoformat(previous_time), expression
+            )
+
+class TestSchemeScheduler(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeScheduler class.
+    """
+    def setUp(self):
+        """
+        Creates the test scheme and configuration files.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_test_file(
+                os.path.join(
+                    test_data.SCHEME_PATH,
+                    f'{test_data.SCHEME_NAME}.{config_type}'
+                ),
+                config_mock[f'{config_type}Source']['content']
+            )
+            self.create_test_file(
+                config_mock[f'{config_type}Target']['name'],
+                config_mock[f'{config_type}Target']['content']
+            )
+
+    def tearDown(self):
+        """
+        Removes the test scheme, configuration and state files.
+        """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in list(test_data.PRELOAD_DC_CONFIG_PATHS.values()) + [
+            test_data.SCHEDULE_STATE_PATH, test_data.APPLY_PROFILE_LOCK_PATH,
+            test_data.APPLY_HISTORY_PATH
+        ]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def create_test_file(self, name, content):
+        """
+        Helper method to create a test file.
+        """
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def create_scheduler(self):
+        """
+        Helper method to create a scheduler with validated schemes.
+        """
+        scheduler = schedule.SchemeScheduler(
+            test_data.SCHEDULE_RULES, test_data.SCHEDULE_STATE_PATH
+        )
+        scheduler.validate(
+            lambda name, auto_dark_mode: scheme.Scheme(
+                name, test_data.SCHEME_PATH,
+                test_data.PRELOAD_DC_CONFIG_PATHS,
+                test_data.DC_BACKUP_CONFIGS, auto_dark_mode,
+                test_data.SCHEME_XML_TAGS
+            )
+        )
+
+        return scheduler
+
+    def test_parse_rules(self):
+        """
+        Tests that invalid rules are rejected.
+        """
+        for rules in test_data.SCHEDULE_INVALID_RULES:
+            with self.assertRaises(ValueError, msg=rules):
+                schedule.SchemeScheduler.parse_rules(rules)
+
+    def test_sleep_until(self):
+        """
+        Tests that the wall clock is compared on each wake.
+        """
+        for moment, wall_clock, sleeps in test_data.SCHEDULE_SLEEPS:
+            scheduler = self.create_scheduler()
+            scheduler.stopped = Mock(is_set=Mock(return_value=False))
+            with patch.object(schedule, 'datetime', Mock(now=Mock(
+                side_effect=[datetime.fromisoformat(now) for now in wall_clock]
+            ))):
+                scheduler.sleep_until(datetime.fromisoformat(moment))
+
+            self.assertListEqual(
+                [
+                    call.args[0]
+                    for call in scheduler.stopped.wait.call_args_list
+                ],
+                sleeps, moment
+            )
+
+    def test_switch(self):
+        """
+        Tests that due transitions are applied once, also after restart.
+        """
+        for moment, dark_mode in test_data.SCHEDULE_SWITCHES:
+            # Restart the scheduler before each switch
+            name = self.create_scheduler().switch(
+                datetime.fromisoformat(moment)
+            )
+
+            if dark_mode is None:
+                self.assertIsNone(name, moment)
+                continue
+            self.assertEqual(name, test_data.SCHEME_NAME, moment)
+            self.assertEqual(
+                SchemeFileManager.get_cfg(
+                    test_data.PRELOAD_DC_CONFIG_PATHS['cfg']
+                )['DarkMode'],
+                dark_mode, moment
+            )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
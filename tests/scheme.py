@@ -1,4 +1,5 @@
 import os
+import shutil
 import sys
 import unittest
 from unittest.mock import patch
@@ -39,8 +40,15 @@ class TestScheme(unittest.TestCase):
 
     def tearDown(self):
         """
-        Removes the test configuration file.
+        Removes the test configuration files.
         """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in [
+            test_data.APPLY_PROFILE_LOCK_PATH, test_data.APPLY_HISTORY_PATH
+        ]:
+            if os.path.exists(name):
+                os.remove(name)
         self.remove_test_file(test_data.DC_CONFIG_CFG_MOCK['cfgSource'])
         self.remove_test_file(test_data.DC_CONFIG_CFG_MOCK['cfgTarget'])
         self.remove_test_file(test_data.DC_CONFIG_JSON_MOCK['jsonSource'])
@@ -55,6 +63,34 @@ class TestScheme(unittest.TestCase):
         with open(config_mock['name'], 'w', encoding='utf-8') as file:
             file.write(config_mock['content'])
 
+    def create_test_scheme(self):
+        """
+        Helper method to create the test scheme from the source mocks.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            shutil.copy(
+                config_mock[f'{config_type}Source']['name'], os.path.join(
+                    test_data.SCHEME_PATH,
+                    f'{test_data.SCHEME_NAME}.{config_type}'
+                )
+            )
+
+    def read_targets(self):
+        """
+        Helper method to read the content of the DC configuration files.
+        """
+        contents = {}
+        for file_type, name in test_data.PRELOAD_DC_CONFIG_PATHS.items():
+            with open(name, encoding='utf-8') as target_file:
+                contents[file_type] = target_file.read()
+
+        return contents
+
     def remove_test_file(self, config_mock):
         """
         Helper method to remove a test file.
@@ -118,6 +154,104 @@ class TestScheme(unittest.TestCase):
             test_data.DC_CONFIG_XML_MOCK, test_data.SCHEME_XML_TAGS
         )
 
+    def test_apply_scheme_selected(self):
+        """
+        Tests that only the selected files and XML tags are applied and the
+        other files are not even read.
+        """
+        self.create_test_scheme()
+        selected_scheme = scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SELECTED_XML_TAGS,
+            test_data.SELECTED_FILE_TYPES
+        )
+
+        with patch.object(
+            scheme.SchemeFileManager, 'get_cfg'
+        ) as mock_get_cfg, patch.object(
+            scheme.SchemeFileManager, 'get_json'
+        ) as mock_get_json:
+            selected_scheme.apply_scheme()
+
+        mock_get_cfg.assert_not_called()
+        mock_get_json.assert_not_called()
+        self.assertListEqual(list(selected_scheme.replaced), ['xml'])
+        self.assert_xml_files_equal(
+            test_data.DC_CONFIG_XML_MOCK, test_data.SELECTED_XML_TAGS
+        )
+        target_tree = defusedxmlET.parse(
+            test_data.DC_CONFIG_XML_MOCK['xmlTarget']['name']
+        )
+        self.assertEqual(
+            target_tree.find('./Colors/UseCursorBorder').text, 'False'
+        )
+        with open(
+            test_data.DC_CONFIG_CFG_MOCK['cfgTarget']['name'],
+            encoding='utf-8'
+        ) as cfg_file:
+            self.assertEqual(
+                cfg_file.read(),
+                test_data.DC_CONFIG_CFG_MOCK['cfgTarget']['content']
+            )
+
+    def test_apply_scheme_merge_failed(self):
+        """
+        Tests that a failing merge leaves all configuration files untouched.
+        """
+        self.create_test_scheme()
+        contents = self.read_targets()
+        failing_scheme = scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+
+        with patch.object(
+            failing_scheme, 'merge_scheme_xml', side_effect=ValueError
+        ), self.assertRaises(ValueError):
+            failing_scheme.apply_scheme()
+
+        self.assertDictEqual(self.read_targets(), contents)
+        self.assertFalse(os.path.exists(test_data.APPLY_HISTORY_PATH))
+        self.assertFalse(any(
+            name.endswith(test_data.APPLY_READY_SUFFIX)
+            for name in os.listdir()
+        ))
+
+    def test_apply_scheme_write_failed(self):
+        """
+        Tests that files written before a failing write are recorded in the
+        history.
+        """
+        self.create_test_scheme()
+        failing_scheme = scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+        replace = os.replace
+
+        def replace_cfg(source, target):
+            if not target.endswith('.cfg'):
+                raise PermissionError(target)
+            replace(source, target)
+
+        with patch('os.replace', side_effect=replace_cfg), self.assertRaises(
+            OSError
+        ):
+            failing_scheme.apply_scheme()
+
+        entries = scheme.ApplyHistory(
+            test_data.APPLY_HISTORY_PATH, test_data.HISTORY_SIZE
+        ).load()
+        self.assertEqual(len(entries), 1)
+        self.assertListEqual(list(entries[0]['sections']), ['cfg'])
+        self.assertFalse(any(
+            name.endswith(test_data.APPLY_READY_SUFFIX)
+            for name in os.listdir()
+        ))
+
     @patch('tkinter.messagebox._show')
     @patch('app.utils.DCFileManager.get_config')
     @patch('os.path.join')
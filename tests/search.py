@@ -0,0 +1,92 @@
+import os
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import search
+import test_data
+
+class TestSchemeSearchIndex(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeSearchIndex class.
+    """
+    def setUp(self):
+        """
+        Initializes the SchemeSearchIndex class with test data.
+        """
+        self.index = search.SchemeSearchIndex()
+        self.index.add(test_data.SEARCH_SCHEME_NAMES)
+
+    def get_names(self, name_ids):
+        """
+        Helper method to map name ids to names.
+        """
+        return [self.index.names[name_id] for name_id in name_ids]
+
+    def test_search(self):
+        """
+        Tests the search method.
+        """
+        for query, expected in test_data.SEARCH_QUERIES.items():
+            self.assertListEqual(
+                self.get_names(self.index.search(query)), expected, query
+            )
+
+    def test_search_incremental(self):
+        """
+        Tests the search method with a query extending the previous one.
+        """
+        self.index.search('d')
+        self.index.search('da')
+
+        self.assertListEqual(
+            self.get_names(self.index.search('dar')),
+            test_data.SEARCH_QUERIES['dar']
+        )
+
+    def test_add_after_search(self):
+        """
+        Tests that names added after a search are found by the next search.
+        """
+        self.index.search('dark')
+        self.index.add(['Amber Dark'])
+
+        self.assertListEqual(
+            self.get_names(self.index.search('dark')),
+            ['Amber Dark'] + test_data.SEARCH_QUERIES['dark']
+        )
+
+    def test_find_prefix(self):
+        """
+        Tests the find_prefix method.
+        """
+        self.assertEqual(
+            self.index.names[self.index.find_prefix('so')], 'Solarized Dark'
+        )
+        self.assertIsNone(self.index.find_prefix('zz'))
+
+    def test_find_prefix_in(self):
+        """
+        Tests the find_prefix_in method with hidden names and a ranking.
+        """
+        view = [
+            name_id for name_id in self.index.search('')
+            if self.index.names[name_id] != test_data.SEARCH_HIDDEN
+        ]
+        position = self.index.find_prefix_in('so', view)
+        self.assertEqual(
+            self.index.names[view[position]], 'Solarized Light'
+        )
+        self.assertIsNone(self.index.find_prefix_in('so', view[:2]))
+
+        ranking = [self.index.ids[name] for name in test_data.SEARCH_RANKING]
+        self.assertEqual(self.index.find_prefix_in('n', ranking, False), 1)
+        self.assertIsNone(self.index.find_prefix_in('one', ranking, False))
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,189 @@
+import os
+import shutil
+import sys
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest.mock import patch
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import server
+import test_data
+
+class EchoCli:
+    """
+    A command line interface printing its arguments and counting runs.
+    """
+    def __init__(self):
+        self.runs = 0
+
+    def run(self, argv):
+        self.runs += 1
+        print(' '.join(argv))
+        return 0
+
+class TestSchemeServer(unittest.TestCase):
+    """
+    A set of unit tests for the server module.
+    """
+    def setUp(self):
+        """
+        Creates the server with a command line interface echoing arguments.
+        """
+        self.cli = EchoCli()
+        self.server = server.SchemeServer({}, lambda user_config: self.cli)
+        self.server.reload_config = lambda: None
+        os.makedirs(test_data.SERVER_DIR_PATH, mode=0o700, exist_ok=True)
+        self.runtime_dir = patch.object(
+            server.ServerClient, 'get_runtime_dir',
+            return_value=test_data.SERVER_DIR_PATH
+        )
+        self.runtime_dir.start()
+
+    def tearDown(self):
+        """
+        Stops patching the server directory and removes it.
+        """
+        self.runtime_dir.stop()
+        shutil.rmtree(test_data.SERVER_DIR_PATH, ignore_errors=True)
+
+    def test_execute(self):
+        """
+        Tests that output is captured and other directories run locally.
+        """
+        response = self.server.execute(
+            {'cwd': os.getcwd(), 'argv': ['apply', 'test-scheme']}
+        )
+        self.assertEqual(response['code'], 0)
+        self.assertEqual(response['stdout'], 'apply test-scheme\n')
+
+        response = self.server.execute(
+            {'cwd': os.path.dirname(os.getcwd()), 'argv': ['list']}
+        )
+        self.assertIsNone(response['code'])
+
+    def test_coalesce(self):
+        """
+        Tests that identical waiting requests are executed once.
+        """
+        futures = []
+        for argv in [['list'], ['refresh'], ['list']]:
+            futures.append(Future())
+            self.server.requests.put(
+                ({'cwd': os.getcwd(), 'argv': argv}, futures[-1])
+            )
+        threading.Thread(
+            target=self.server.process_requests, daemon=True
+        ).start()
+
+        responses = [
+            future.result(timeout=test_data.SERVER_TIMEOUT)
+            for future in futures
+        ]
+        self.assertEqual(self.cli.runs, 2)
+        self.assertIs(responses[0], responses[2])
+
+    def test_supersede(self):
+        """
+        Tests that only the apply request arriving last is executed.
+        """
+        futures = []
+        for argv in test_data.SERVER_APPLY_REQUESTS:
+            futures.append(Future())
+            self.server.requests.put(
+                ({'cwd': os.getcwd(), 'argv': argv}, futures[-1])
+            )
+        threading.Thread(
+            target=self.server.process_requests, daemon=True
+        ).start()
+
+        responses = [
+            future.result(timeout=test_data.SERVER_TIMEOUT)
+            for future in futures
+        ]
+        self.assertEqual(self.cli.runs, 1)
+        self.assertEqual(
+            responses[-1]['stdout'],
+            f'{" ".join(test_data.SERVER_APPLY_REQUESTS[-1])}\n'
+        )
+        self.assertIs(responses[0], responses[2])
+        self.assertIn('Superseded', responses[1]['stdout'])
+
+    def test_supersede_selections(self):
+        """
+        Tests that apply requests supersede only requests selecting the same
+        files and tags.
+        """
+        futures = []
+        for argv in test_data.SERVER_SELECTION_REQUESTS:
+            futures.append(Future())
+            self.server.requests.put(
+                ({'cwd': os.getcwd(), 'argv': argv}, futures[-1])
+            )
+        threading.Thread(
+            target=self.server.process_requests, daemon=True
+        ).start()
+
+        responses = [
+            future.result(timeout=test_data.SERVER_TIMEOUT)
+            for future in futures
+        ]
+        self.assertEqual(self.cli.runs, 2)
+        self.assertIn('Superseded', responses[0]['stdout'])
+        for argv, response in zip(
+            test_data.SERVER_SELECTION_REQUESTS[1:], responses[1:]
+        ):
+            self.assertEqual(response['stdout'], f'{" ".join(argv)}\n')
+
+    def test_forward_not_running(self):
+        """
+        Tests that commands run locally if no server is running.
+        """
+        self.assertIsNone(server.ServerClient.forward(['list']))
+
+    @unittest.skipIf(sys.platform == 'win32', 'requires Unix sockets')
+    def test_serve(self):
+        """
+        Tests that commands are forwarded to the running server.
+        """
+        thread = threading.Thread(target=self.server.serve)
+        thread.start()
+
+        try:
+            for i in range(test_data.SERVER_TIMEOUT * 10):
+                if server.ServerClient.send({'ping': True}) is not None:
+                    break
+                self.server.stopped.wait(0.1)
+            self.assertEqual(server.ServerClient.forward(['list']), 0)
+            self.assertIsNone(server.ServerClient.forward(['watch']))
+            self.assertEqual(self.cli.runs, 1)
+        finally:
+            response = server.ServerClient.send({'stop': True})
+            thread.join(test_data.SERVER_TIMEOUT)
+
+        self.assertEqual(response['code'], 0)
+
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(server.ServerClient.get_key_path()))
+
+    @unittest.skipIf(sys.platform == 'win32', 'requires Unix permissions')
+    def test_not_private(self):
+        """
+        Tests that server files accessible to other users are rejected.
+        """
+        key_path = server.ServerClient.get_key_path()
+        with open(key_path, 'wb') as key_file:
+            key_file.write(b'key')
+        os.chmod(key_path, 0o644)
+
+        with self.assertRaises(PermissionError):
+            server.ServerClient.check_owner(key_path, True)
+        self.assertIsNone(server.ServerClient.send({'ping': True}))
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import sys
+import unittest
+import zipfile
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import scheme, store
+import test_data
+
+class TestArchiveSchemeStore(unittest.TestCase):
+    """
+    A set of unit tests for the ArchiveSchemeStore class.
+    """
+    def setUp(self):
+        """
+        Creates the test archive with a complete and an incomplete scheme.
+        """
+        with zipfile.ZipFile(test_data.STORE_ARCHIVE_PATH, 'w') as archive:
+            for config_mock, config_type in [
+                (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+                (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+                (test_data.DC_CONFIG_XML_MOCK, 'xml')
+            ]:
+                archive.writestr(
+                    f'{test_data.STORE_ARCHIVE_FOLDER}/'
+                    f'{test_data.SCHEME_NAME}.{config_type}',
+                    config_mock[f'{config_type}Source']['content']
+                )
+            archive.writestr(
+                f'{test_data.STORE_ARCHIVE_FOLDER}/'
+                f'{test_data.STORE_INCOMPLETE_SCHEME}.cfg',
+                test_data.DC_CONFIG_CFG_MOCK['cfgSource']['content']
+            )
+
+        self.store = store.SchemeStore.create(test_data.STORE_ARCHIVE_PATH)
+
+    def tearDown(self):
+        """
+        Closes the store and removes the test archive.
+        """
+        self.store.close()
+        if os.path.exists(test_data.STORE_ARCHIVE_PATH):
+            os.remove(test_data.STORE_ARCHIVE_PATH)
+
+    def test_scan(self):
+        """
+        Tests that schemes are listed from the archive central directory.
+        """
+        self.assertIsInstance(self.store, store.ArchiveSchemeStore)
+
+        schemes = [
+            change for batch in self.store.scan(
+                test_data.USER_CONFIG_DEFAULT['schemes']['extensions'], 1
+            ) for change in batch
+        ]
+
+        self.assertListEqual(
+            schemes,
+            [
+                (
+                    test_data.STORE_INCOMPLETE_SCHEME,
+                    [
+                        f'{test_data.STORE_INCOMPLETE_SCHEME}.{ext}'
+                        for ext in ['json', 'xml']
+                    ]
+                ),
+                (test_data.SCHEME_NAME, [])
+            ]
+        )
+
+    def test_read(self):
+        """
+        Tests that archive members are read by scheme name and file type.
+        """
+        content = test_data.DC_CONFIG_JSON_MOCK['jsonSource']['content']
+
+        self.assertEqual(
+            self.store.read(test_data.SCHEME_NAME, 'json').decode('utf-8'),
+            content
+        )
+        self.assertEqual(
+            self.store.get_fingerprint(test_data.SCHEME_NAME, 'json'),
+            (
+                zipfile.crc32(content.encode('utf-8')),
+                len(content.encode('utf-8'))
+            )
+        )
+        self.assertIsNone(
+            self.store.get_fingerprint(
+                test_data.STORE_INCOMPLETE_SCHEME, 'json'
+            )
+        )
+        with self.assertRaises(FileNotFoundError):
+            self.store.open(test_data.STORE_INCOMPLETE_SCHEME, 'json')
+
+    def test_load_sources(self):
+        """
+        Tests that a scheme is parsed straight from the archive.
+        """
+        test_scheme = scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.STORE_ARCHIVE_PATH,
+            test_data.DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+
+        test_scheme.load_sources()
+        test_scheme.store.close()
+
+        self.assertSetEqual(
+            set(test_scheme.sources), {'cfg', 'json', 'xml'}
+        )
+        self.assertIn('DarkMode', test_scheme.sources['cfg'][1])
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
@@ -14,6 +14,464 @@ SCHEME_XML_TAGS = [
     "Colors",
     "Fonts"
 ]
+SELECTED_FILE_TYPES = ['xml']
+SELECTED_XML_TAGS = ['Fonts/Main']
+
+# Catalog
+CATALOG_DOMINANT_COLORS = 2
+CATALOG_LOCK_HOLD_TIME = 0.2   # s
+CATALOG_METADATA = {
+    "darkMode": "2",
+    "styleNames": ["Dark"],
+    "fileColorsCount": 1,
+    "xmlTags": ["Fonts", "Colors"],
+    "configVersion": "15",
+    "dominantColors": [1234567, 0],
+    "error": None
+}
+CATALOG_PATH = 'dc-themer-catalog-test.db'
+CATALOG_SCHEME_NAMES = ['Nord', 'Solarized']
+
+# Index
+INDEX_SCHEME_PATHS = ['./test-schemes', './test-schemes-shared']
+INDEX_SHARED_SCHEME_NAMES = ['Nord', 'Solarized']
+
+# Preload
+PRELOAD_DC_CONFIG_PATHS = {
+    "cfg": "doublecmd-test-2.cfg",
+    "json": "colors-test-2.json",
+    "xml": "doublecmd-test-2.xml"
+}
+
+# Store
+STORE_ARCHIVE_PATH = 'dc-themer-schemes-test.zip'
+STORE_ARCHIVE_FOLDER = 'schemes'
+STORE_INCOMPLETE_SCHEME = 'Solarized'
+
+# Watch
+WATCH_NEW_FILE = 'new-scheme.cfg'
+WATCH_POLL_INTERVAL = 0.05
+WATCH_TIMEOUT = 5
+
+# Schedule
+SCHEDULE_CRON_CASES = [
+    # Expression, moment, next transition, previous transition
+    (
+        '30 7 * * 1-5', '2024-06-07T08:00', '2024-06-10T07:30',
+        '2024-06-07T07:30'
+    ),
+    (
+        '*/20 22 1,15 * 0', '2024-06-09T23:59', '2024-06-15T22:00',
+        '2024-06-09T22:40'
+    ),
+    ('0 0 1 1 *', '2024-01-01T00:00', '2025-01-01T00:00', '2024-01-01T00:00')
+]
+SCHEDULE_INVALID_RULES = [
+    [{"scheme": "test-scheme", "cron": "61 * * * *"}],
+    [{"scheme": "test-scheme", "cron": "0 0 31 2 *"}],
+    [{"scheme": "test-scheme", "at": "7"}],
+    [{"at": "07:00"}],
+    []
+]
+SCHEDULE_RULES = [
+    {"scheme": "test-scheme", "at": "07:00"},
+    {"scheme": "test-scheme", "at": "19:00", "autoDarkMode": True}
+]
+SCHEDULE_SLEEPS = [
+    # Wake moment, wall clock on each wake, expected sleeps in seconds
+    (
+        '2024-06-07T19:00',
+        ['2024-06-07T18:59', '2024-06-07T18:59:30', '2024-06-07T19:00'],
+        [60, 30]
+    ),
+    # Resumed after the transition
+    ('2024-06-07T19:00', ['2024-06-07T18:00', '2024-06-07T21:00'], [3600])
+]
+SCHEDULE_STATE_PATH = 'dc-themer-schedule-test.json'
+SCHEDULE_SWITCHES = [
+    # Moment, applied DarkMode value or None if already applied
+    ('2024-06-07T20:00', '1'),
+    ('2024-06-07T23:00', None),
+    ('2024-06-08T08:00', '2')
+]
+
+# Server
+SERVER_APPLY_REQUESTS = [
+    ['apply', 'Nord'], ['apply', 'Solarized'], ['apply', 'Nord']
+]
+SERVER_DIR_PATH = 'dc-themer-test'
+SERVER_SELECTION_REQUESTS = [
+    ['apply', 'Nord', '--files', 'cfg'],
+    ['apply', 'Solarized', '--files', 'xml', '--tags', 'Colors'],
+    ['apply', '--files=cfg', '-v', 'Nord']
+]
+SERVER_TIMEOUT = 5
+
+# Apply
+APPLY_HISTORY_PATH = 'dc-themer-history.jsonl'
+APPLY_LOCK_NAME = 'dc-themer-test.lock'
+APPLY_LOCK_POLL_INTERVAL = 0.01
+APPLY_LOCK_TIMEOUT = 0.1
+APPLY_PROFILE_LOCK_PATH = '.dc-themer.lock'
+APPLY_READY_SUFFIX = '.dc-themer'
+APPLY_SELECTION_REQUESTS = [
+    ('old', ((('cfg', 'doublecmd.cfg'),), ())),
+    ('colors', ((('xml', 'doublecmd.xml'),), ('Colors',))),
+    ('new', ((('cfg', 'doublecmd.cfg'),), ()))
+]
+
+# History
+HISTORY_PATH = 'dc-themer-history-test.jsonl'
+HISTORY_SIZE = 2
+
+# Diff
+DIFF_JSON_CURRENT = {
+    "FileColors": [
+        {"Name": "Archives", "Color": 255},
+        {"Name": "Images", "Color": 65280},
+        {"Name": "Hidden", "Color": 8421504}
+    ],
+    "Mask": "*.zip"
+}
+DIFF_JSON_APPLIED = {
+    "FileColors": [
+        {"Name": "Images", "Color": 65280},
+        {"Name": "Archives", "Color": 16711680}
+    ],
+    "Attributes": "h"
+}
+DIFF_JSON_HASH_VALUES = [
+    {"Name": "Nord", "Colors": [1, 2]},
+    {"Colors": [1, 2], "Name": "Nord"},
+    {"Name": "Nord", "Colors": [2, 1]}
+]
+DIFF_JSON_CHANGES = [
+    ('changed', 'FileColors[1].Color', 255, 16711680),
+    ('removed', 'FileColors[2]', {"Name": "Hidden", "Color": 8421504}, None),
+    ('removed', 'Mask', '*.zip', None),
+    ('added', 'Attributes', None, 'h')
+]
+DIFF_XML_CHANGES = [
+    ('changed', 'Fonts/Main/Name', 'Consolas', 'default'),
+    ('changed', 'Fonts/Main/Size', '12', '10'),
+    ('changed', 'Colors/UseCursorBorder', 'False', 'True'),
+    ('changed', 'Colors/UseFrameCursor', 'True', 'False')
+]
+DIFF_VALUE_WIDTH = 20
+
+# Materialize
+MATERIALIZE_SUFFIX = '.dc-themer'
+
+# XML paths
+XML_PATHS_CONTENT = (
+    '<doublecmd><Viewer><Colors><Back>1</Back></Colors><Font>a</Font>'
+    '</Viewer><Fonts /></doublecmd>'
+)
+XML_PATHS = ['Viewer/Colors/Back', './Viewer/Font', 'Toolbars/Main/']
+XML_PATHS_INDEX = [
+    '', 'Viewer', 'Viewer/Colors', 'Viewer/Colors/Back', 'Viewer/Font'
+]
+XML_PATHS_REPLACED = (
+    '<doublecmd><Viewer><Colors><Back>new</Back></Colors><Font>new</Font>'
+    '</Viewer><Toolbars><Main>new</Main></Toolbars></doublecmd>'
+)
+
+# XML merge
+XML_MERGE_CURRENT = (
+    '<Colors Mode="1" Font="a"><Color Name="Back">1</Color>'
+    '<Color Name="Fore">2</Color><Cursor>3</Cursor></Colors>'
+)
+XML_MERGE_SOURCE = (
+    '<Colors Mode="2"><Color Name="Fore">5</Color><Cursor>6</Cursor>'
+    '<Color Name="Mark">7</Color></Colors>'
+)
+XML_MERGE_RESULTS = {
+    "replace": XML_MERGE_SOURCE,
+    "merge": (
+        '<Colors Mode="1" Font="a"><Color Name="Back">1</Color>'
+        '<Color Name="Fore">5</Color><Cursor>6</Cursor>'
+        '<Color Name="Mark">7</Color></Colors>'
+    ),
+    "attributes": (
+        '<Colors Mode="2" Font="a"><Color Name="Back">1</Color>'
+        '<Color Name="Fore">2</Color><Cursor>3</Cursor></Colors>'
+    )
+}
+XML_MERGE_KEY = 'Name'
+XML_MERGE_REPEATED = [   # Current, source, key, merged
+    (
+        '<T><A /></T>', '<T><Item>1</Item><Item>2</Item></T>', None,
+        '<T><A /><Item>1</Item><Item>2</Item></T>'
+    ),
+    (
+        '<T><Item>a</Item><Item>b</Item><Item>c</Item></T>',
+        '<T><Item>1</Item><Item>2</Item></T>', None,
+        '<T><Item>1</Item><Item>2</Item><Item>c</Item></T>'
+    ),
+    (
+        '<T><Color Name="Back">1</Color><Item>a</Item></T>',
+        '<T><Item>x</Item><Item>y</Item></T>', 'Name',
+        '<T><Color Name="Back">1</Color><Item>x</Item><Item>y</Item></T>'
+    )
+]
+XML_MERGE_TAGS = [
+    "Fonts",
+    {"path": "./Colors/", "strategy": "merge", "key": "Name"}
+]
+XML_MERGE_SELECTED = ['Colors', 'Viewer/Colors']
+
+# Validate
+VALIDATE_INVALID_FILES = {
+    "cfg": "SplashForm=-1\nDarkMode=dark\n",
+    "json": """{
+  Styles : [],
+  FileColors : [
+    {
+      Name : "json",
+      Colors : [0, -1]
+    },
+    {
+      Masks : "*.txt"
+    }
+  ]
+}""",
+    "xml": """<?xml version="1.0" encoding="UTF-8"?>
+<doublecmd ConfigVersion="x">
+  <Colors />
+</doublecmd>"""
+}
+VALIDATE_ERRORS = {
+    "cfg": ["DarkMode: 'dark' does not match '^[0-9]+$'"],
+    "json": [
+        "FileColors[0].Colors[1]: -1 is less than the minimum of 0",
+        "FileColors[1]: 'Name' is a required property",
+        "Styles: [] should be non-empty"
+    ],
+    "xml": [
+        "attributes.ConfigVersion: 'x' does not match '^[0-9]+$'",
+        "Fonts: Tag does not exist."
+    ]
+}
+
+# Export
+EXPORT_JSON_CONTENT = """{
+  Styles : [
+    { Name : "Light", Log : { InfoColor : 1 } },
+    { Name : "Dark", Log : { InfoColor : 2 } }
+  ],
+  FileColors : []
+}"""
+EXPORT_STYLE_DARK_MODES = {"test-scheme Light": "3", "test-scheme Dark": "2"}
+EXPORT_XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<doublecmd DCVersion="1.1.16 gamma" ConfigVersion="15">
+  <History><Entry>a</Entry><Entry>b</Entry></History>
+  <Viewer><Font>x</Font><Colors><Back>1</Back></Colors></Viewer>
+  <Fonts><Main><Size>10</Size></Main></Fonts>
+  <Viewer><Colors><Back>2</Back></Colors></Viewer>
+  <Hotkeys><Form>c</Form></Hotkeys>
+</doublecmd>"""
+EXPORT_XML_TAGS = ['Fonts', 'Viewer/Colors', 'Fonts/Main']
+EXPORT_XML_EXTRACTED = (
+    '<doublecmd DCVersion="1.1.16 gamma" ConfigVersion="15">'
+    '<Fonts><Main><Size>10</Size></Main></Fonts>'
+    '<Viewer><Colors><Back>1</Back></Colors></Viewer></doublecmd>'
+)
+
+# Check
+CHECK_CACHE_PATH = 'dc-themer-check-cache-test.json'
+CHECK_INVALID_SCHEME = 'invalid-scheme'
+CHECK_INCOMPLETE_SCHEME = 'incomplete-scheme'
+CHECK_SCHEME_EXTS = ['cfg', 'json', 'xml']
+CHECK_SUMMARY = {
+    "schemes": 3,
+    "valid": 1,
+    "invalid": 2,
+    "incompatible": 1,
+    "lowContrast": 0
+}
+CHECK_TARGET_VERSION = '15'
+CHECK_WORKERS = 2
+
+# Inherit
+INHERIT_CACHE_SIZE = 4
+INHERIT_CYCLE_BASES = {
+    "cycle-a": "cycle-b",
+    "cycle-b": "cycle-a"
+}
+INHERIT_CYCLE_ERROR = 'Scheme inheritance cycle: cycle-a -> cycle-b -> cycle-a'
+INHERIT_DIAMOND_BASES = {
+    "diamond-left": "test-scheme",
+    "diamond-right": "test-scheme",
+    "diamond": "diamond-left, diamond-right"
+}
+INHERIT_RESOLVED_CONFIG_VERSION = '15'
+INHERIT_RESOLVED_DARK_MODE = '3'
+INHERIT_RESOLVED_FONT = ['mono', None]
+INHERIT_RESOLVED_LOG = {
+    "InfoColor": 42,
+    "ErrorColor": 1234567,
+    "SuccessColor": 1234567
+}
+INHERIT_VARIANT = 'test-variant'
+INHERIT_VARIANT_FILES = {
+    "cfg": "Base = test-scheme\n"
+        "DarkMode=3\n",
+    "json": '{"Styles": [{"Name": "Dark", "Log": {"InfoColor": 42}}]}',
+    "xml": '<doublecmd><Fonts><Main><Name>mono</Name></Main></Fonts>'
+        '</doublecmd>'
+}
+
+# Contrast
+CONTRAST_JSON = {
+    "Styles": [
+        {
+            "Name": "Light",
+            "FilePanel": {
+                "ForeColor": 7763574,
+                "BackColor": 16777215,
+                "BackColor2": 0,
+                "CursorText": 255,
+                "CursorColor": 16777215
+            }
+        }
+    ]
+}
+CONTRAST_MIN_RATIO = 4.5
+CONTRAST_PAIRS = (
+    ('ForeColor', 'BackColor'),
+    ('ForeColor', 'BackColor2'),
+    ('CursorText', 'CursorColor')
+)
+CONTRAST_XML = (
+    '<doublecmd><Colors><ForeColor>$00777777</ForeColor>'
+    '<BackColor>$00FFFFFF</BackColor></Colors></doublecmd>'
+)
+CONTRAST_RATIOS = {
+    "foregrounds": [0x000000, 0x777777, 0x0000FF, 0xFFFFFF],
+    "backgrounds": [0xFFFFFF, 0xFFFFFF, 0xFFFFFF, 0xFFFFFF],
+    "ratios": [21.0, 4.48, 4.0, 1.0]
+}
+CONTRAST_REPORT = {
+    "pairs": 4,
+    "minRatio": 4.0,
+    "failing": [
+        {
+            "location": "Styles[0].FilePanel",
+            "foreground": "CursorText",
+            "background": "CursorColor",
+            "ratio": 4.0
+        },
+        {
+            "location": "Colors",
+            "foreground": "ForeColor",
+            "background": "BackColor",
+            "ratio": 4.48
+        }
+    ]
+}
+
+# Transform
+TRANSFORM_COLORS = [0x000000, 0xFFFFFF, 0x0000FF, 0x00FF00, 0x0000FF]
+TRANSFORM_RESULTS = {
+    "invert": [0xFFFFFF, 0x000000, 0x0000FF, 0x00FF00, 0x0000FF],
+    "hue=120": [0x000000, 0xFFFFFF, 0x00FF00, 0xFF0000, 0x00FF00],
+    "saturation=0": [0x000000, 0xFFFFFF, 0x808080, 0x808080, 0x808080],
+    "contrast=0": [0x808080, 0x808080, 0x0000FF, 0x00FF00, 0x0000FF],
+    "remap=#101010,$00F0F0F0": [
+        0x101010, 0xF0F0F0, 0x101010, 0x101010, 0x101010
+    ]
+}
+TRANSFORM_INVALID_SPECS = [
+    'blur', 'invert=1', 'hue=x', 'contrast=-1', 'remap='
+]
+TRANSFORM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<doublecmd ConfigVersion="15">
+  <Colors>
+    <Back>$00FFFFFF</Back>
+    <Fore>0</Fore>
+    <Cursor>#FF0000</Cursor>
+    <UseCursorBorder>True</UseCursorBorder>
+    <InactivePanelBrightness>100</InactivePanelBrightness>
+  </Colors>
+  <Fonts><Main><Size>10</Size></Main></Fonts>
+</doublecmd>"""
+TRANSFORM_XML_COLORS = {
+    "Back": '$00000000',
+    "Fore": '16777215',
+    "Cursor": '#FF0000',
+    "UseCursorBorder": 'True',
+    "InactivePanelBrightness": '100'
+}
+TRANSFORM_JSON_LOG_COLOR = 2747806
+TRANSFORM_DARK_MODE = '3'
+TRANSFORM_SUFFIX = 'Inverted'
+TRANSFORM_WORKERS = 2
+
+# Palette
+PALETTE_CELL_SIZE = 10.0
+PALETTE_SCHEMES = {
+    "Nord": [0x40342E, 0xF0E9E5, 0xC1A188, 0x6A61BF],
+    "Nord Light": [0xF0E9E5, 0x40342E, 0xC1A188, 0x6A61BF, 0xFFFFFF],
+    "Solarized": [0x362B00, 0xA1A193, 0x0089B5],
+    "Mono": [0x000000, 0xFFFFFF],
+    "Empty": []
+}
+PALETTE_SIMILAR = [('Nord Light', 0.87), ('Mono', 24.69)]
+PALETTE_NEAR_COLOR = 0x000000
+PALETTE_NEAR = [('Mono', 0.0), ('Solarized', 21.2), ('Nord', 23.17)]
+PALETTE_RANDOM_SEED = 49
+PALETTE_RANDOM_SCHEMES = 200
+
+# Duplicates
+DUPLICATE_CFG = ['DarkMode=3', ' DarkMode = 3 ']
+DUPLICATE_JSON = [
+    {"Styles": [{"Name": "Dark", "Colors": ["#FF0000", 0]}], "Version": 1},
+    {"Version": 1, "Styles": [{"Colors": [255, "$00000000"], "Name": "Dark"}]}
+]
+DUPLICATE_XML = [
+    '<doublecmd A="1" B="2"><Colors><Back>$00FFFFFF</Back><Item>1</Item>'
+    '<Item>2</Item></Colors></doublecmd>',
+    '<doublecmd B="2" A="1">\n  <Colors>\n    <Back> 16777215 </Back>\n'
+    '    <Item>1</Item><Item>2</Item>\n  </Colors>\n</doublecmd>'
+]
+DUPLICATE_XML_CHANGED = (
+    '<doublecmd A="1" B="2"><Colors><Back>$00FFFFFF</Back><Item>2</Item>'
+    '<Item>1</Item></Colors></doublecmd>'
+)
+DUPLICATE_FEATURE_COUNT = 300
+DUPLICATE_MAX_DISTANCE = 3
+DUPLICATE_ENTRIES = [
+    {"name": "Nord Copy", "canonicalHash": 'a', "simhash": 0b1011},
+    {"name": "Nord", "canonicalHash": 'a', "simhash": 0b1011},
+    {"name": "Nord Near", "canonicalHash": 'b', "simhash": 0b1000},
+    {"name": "Solarized", "canonicalHash": 'c', "simhash": 0xFFFF0000},
+    {"name": "Broken", "canonicalHash": None, "simhash": None}
+]
+DUPLICATE_REPORT = {
+    "duplicates": [['Nord', 'Nord Copy']],
+    "similar": [{"schemes": ['Nord', 'Nord Near'], "distance": 2}]
+}
+
+# GUI
+GUI_WATCHER_EVENTS = [
+    ('applied', 'Scheme \'Nord\' re-applied.'),
+    ('failed', 'Failed to write configuration.')
+]
+
+# Search
+SEARCH_SCHEME_NAMES = [
+    'Nord', 'Solarized Light', 'Dracula', 'Solarized Dark', 'One Dark'
+]
+SEARCH_QUERIES = {
+    '': ['Dracula', 'Nord', 'One Dark', 'Solarized Dark', 'Solarized Light'],
+    'dar': ['One Dark', 'Solarized Dark'],
+    'dark': ['One Dark', 'Solarized Dark'],
+    'LIGHT': ['Solarized Light'],
+    'or': ['Nord'],
+    'xyz': []
+}
+SEARCH_HIDDEN = 'Solarized Dark'
+SEARCH_RANKING = ['Solarized Light', 'Nord', 'Dracula']
 
 # User config
 CONFIG_CURRENT_VERSION = 2
@@ -28,12 +486,14 @@ USER_CONFIG_DEFAULT = {
             "xml": "%APPDATA%\\doublecmd\\doublecmd.xml"
         }
     },
+    "schedule": [],
     "schemes": {
         "extensions": [
             "cfg",
             "json",
             "xml"
         ],
+        "hideDuplicates": False,
         "path": "./schemes",
         "xmlTags": [
             "Colors",
@@ -0,0 +1,138 @@
+import io
+import json
+import os
+import shutil
+import sys
+import unittest
+from array import array
+import defusedxml.ElementTree as defusedxmlET
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import transform
+from app.utils import SchemeFileManager
+import test_data
+
+class TestColorTransformer(unittest.TestCase):
+    """
+    A set of unit tests for the ColorTransformer class.
+    """
+    def setUp(self):
+        """
+        Creates a test scheme with colors in json and xml files.
+        """
+        self.contents = {
+            'cfg': test_data.DC_CONFIG_CFG_MOCK['cfgSource']['content'],
+            'json': test_data.DC_CONFIG_JSON_MOCK['jsonSource']['content'],
+            'xml': test_data.TRANSFORM_XML
+        }
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_type, content in self.contents.items():
+            with open(
+                os.path.join(
+                    test_data.SCHEME_PATH,
+                    f'{test_data.SCHEME_NAME}.{config_type}'
+                ), 'w', encoding='utf-8'
+            ) as file:
+                file.write(content)
+
+        self.color_transformer = transform.ColorTransformer(
+            [('invert', None)], test_data.TRANSFORM_WORKERS
+        )
+
+    def tearDown(self):
+        """
+        Removes the test schemes.
+        """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+
+    def test_parse_transform(self):
+        """
+        Tests the parse_transform method.
+        """
+        self.assertTupleEqual(
+            transform.ColorTransformer.parse_transform('hue = -30'),
+            ('hue', -30.0)
+        )
+        for spec in test_data.TRANSFORM_INVALID_SPECS:
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    transform.ColorTransformer.parse_transform(spec)
+
+    def test_transform_colors(self):
+        """
+        Tests the transform_colors method.
+        """
+        for spec, expected in test_data.TRANSFORM_RESULTS.items():
+            with self.subTest(spec=spec):
+                color_transformer = transform.ColorTransformer(
+                    [transform.ColorTransformer.parse_transform(spec)]
+                )
+                self.assertListEqual(
+                    list(color_transformer.transform_colors(
+                        array('L', test_data.TRANSFORM_COLORS)
+                    )), expected
+                )
+
+    def test_transform_files(self):
+        """
+        Tests the transform_files method.
+        """
+        result = self.color_transformer.transform_files({
+            config_type: content.encode('utf-8')
+            for config_type, content in self.contents.items()
+        })
+
+        self.assertListEqual(result['errors'], [])
+        cfg_config = SchemeFileManager.get_cfg(
+            result['contents']['cfg'].decode('utf-8').splitlines()
+        )
+        self.assertEqual(cfg_config['DarkMode'], test_data.TRANSFORM_DARK_MODE)
+
+        json_config = json.loads(result['contents']['json'])
+        self.assertEqual(
+            json_config['Styles'][0]['Log']['InfoColor'],
+            test_data.TRANSFORM_JSON_LOG_COLOR
+        )
+
+        xml_root = defusedxmlET.parse(
+            io.BytesIO(result['contents']['xml'])
+        ).getroot()
+        self.assertDictEqual(
+            {child.tag: child.text for child in xml_root.find('./Colors')},
+            test_data.TRANSFORM_XML_COLORS
+        )
+        self.assertEqual(xml_root.findtext('./Fonts/Main/Size'), '10')
+
+    def test_derive_library(self):
+        """
+        Tests the derive_library method.
+        """
+        name = f'{test_data.SCHEME_NAME} {test_data.TRANSFORM_SUFFIX}'
+
+        names, errors = self.color_transformer.derive_library(
+            [(test_data.SCHEME_NAME, test_data.SCHEME_PATH)],
+            test_data.TRANSFORM_SUFFIX, test_data.SCHEME_PATH
+        )
+
+        self.assertListEqual(names, [name])
+        self.assertDictEqual(errors, {})
+        for config_type in ['cfg', 'json', 'xml']:
+            self.assertTrue(os.path.exists(os.path.join(
+                test_data.SCHEME_PATH, f'{name}.{config_type}'
+            )))
+
+        # Existing schemes are kept
+        with self.assertRaises(FileExistsError):
+            self.color_transformer.derive_library(
+                [(test_data.SCHEME_NAME, test_data.SCHEME_PATH)],
+                test_data.TRANSFORM_SUFFIX, test_data.SCHEME_PATH
+            )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
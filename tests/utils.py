@@ -121,6 +121,22 @@ class TestScheme(unittest.TestCase):
             "Config backup file does not exist."
         )
 
+    def test_write_backup(self):
+        """
+        Tests the snapshot_config and write_backup methods.
+        """
+        name = test_data.DC_CONFIG_XML_MOCK['xmlSource']['name']
+        content = test_data.DC_CONFIG_XML_MOCK['xmlSource']['content']
+        snapshot = self.dc_file_manager.snapshot_config(name)
+
+        # The backup holds the snapshot, even if the file changed meanwhile
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write('')
+        self.dc_file_manager.write_backup(name, snapshot)
+
+        with open(f'{name}.backup', encoding='utf-8') as file:
+            self.assertEqual(file.read(), content)
+
     def test_get_cfg(self):
         """
         Tests the get_cfg method.
@@ -222,6 +238,123 @@ class TestScheme(unittest.TestCase):
             )
         ])
 
+    def test_index_xml_paths(self):
+        """
+        Tests the index_xml_paths method.
+        """
+        root = utils.defusedxmlET.fromstring(test_data.XML_PATHS_CONTENT)
+        index = self.scheme_file_manager.index_xml_paths(
+            root, test_data.XML_PATHS
+        )
+
+        self.assertListEqual(sorted(index), test_data.XML_PATHS_INDEX)
+        self.assertEqual(index['Viewer/Colors/Back'].text, '1')
+        with self.assertRaises(ValueError):
+            self.scheme_file_manager.index_xml_paths(root, ['Viewer[1]'])
+
+    def test_replace_xml_element(self):
+        """
+        Tests the replace_xml_element method.
+        """
+        root = utils.defusedxmlET.fromstring(test_data.XML_PATHS_CONTENT)
+        index = self.scheme_file_manager.index_xml_paths(
+            root, test_data.XML_PATHS + ['Fonts']
+        )
+
+        for path in test_data.XML_PATHS:
+            path = self.scheme_file_manager.normalize_xml_path(path)
+            tag = path.rpartition('/')[2]
+            self.scheme_file_manager.replace_xml_element(
+                index, path,
+                utils.defusedxmlET.fromstring(f'<{tag}>new</{tag}>')
+            )
+        self.scheme_file_manager.replace_xml_element(index, 'Fonts', None)
+
+        # Check that existing tags kept their place, missing ones were added
+        self.assertEqual(
+            utils.defusedxmlET.tostring(root, encoding='unicode'),
+            test_data.XML_PATHS_REPLACED
+        )
+
+    def test_merge_xml_element(self):
+        """
+        Tests the merge_xml_element method.
+        """
+        for strategy, expected in test_data.XML_MERGE_RESULTS.items():
+            current = utils.defusedxmlET.fromstring(
+                test_data.XML_MERGE_CURRENT
+            )
+            merged = self.scheme_file_manager.merge_xml_element(
+                current,
+                utils.defusedxmlET.fromstring(test_data.XML_MERGE_SOURCE),
+                strategy, test_data.XML_MERGE_KEY
+            )
+
+            # Check the merged tag and that the current one is intact
+            self.assertEqual(
+                utils.defusedxmlET.tostring(merged, encoding='unicode'),
+                expected
+            )
+            self.assertEqual(
+                utils.defusedxmlET.tostring(current, encoding='unicode'),
+                test_data.XML_MERGE_CURRENT
+            )
+
+    def test_merge_xml_element_repeated(self):
+        """
+        Tests that repeated children sharing a key are merged by occurrence.
+        """
+        for current, source, key, expected in test_data.XML_MERGE_REPEATED:
+            with self.subTest(source=source, key=key):
+                merged = self.scheme_file_manager.merge_xml_element(
+                    utils.defusedxmlET.fromstring(current),
+                    utils.defusedxmlET.fromstring(source), 'merge', key
+                )
+                self.assertEqual(
+                    utils.defusedxmlET.tostring(merged, encoding='unicode'),
+                    expected
+                )
+
+    def test_select_xml_tags(self):
+        """
+        Tests the select_xml_tags and normalize_xml_tag methods.
+        """
+        selected = self.scheme_file_manager.select_xml_tags(
+            test_data.XML_MERGE_TAGS, test_data.XML_MERGE_SELECTED
+        )
+
+        self.assertListEqual(
+            [
+                self.scheme_file_manager.normalize_xml_tag(tag)
+                for tag in selected
+            ],
+            [
+                {'path': 'Colors', 'strategy': 'merge', 'key': 'Name'},
+                {'path': 'Viewer/Colors', 'strategy': 'replace', 'key': None}
+            ]
+        )
+        with self.assertRaises(ValueError):
+            self.scheme_file_manager.normalize_xml_tag(
+                {'path': 'Colors', 'strategy': 'append'}
+            )
+
+    def test_scan_schemes(self):
+        """
+        Tests the scan_schemes method.
+        """
+        batches = list(
+            self.scheme_file_manager.scan_schemes(
+                test_data.SCHEME_PATH,
+                test_data.USER_CONFIG_DEFAULT['schemes']['extensions'], 10
+            )
+        )
+
+        # Check that incomplete scheme is reported with its missing files
+        self.assertListEqual(
+            batches,
+            [[(test_data.SCHEME_NAME, [f'{test_data.SCHEME_NAME}.json'])]]
+        )
+
     def test_list_schemes(self):
         """
         Tests the list_schemes method.
@@ -0,0 +1,152 @@
+import os
+import shutil
+import sys
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import scheme, validate
+import test_data
+
+class TestSchemeValidator(unittest.TestCase):
+    """
+    A set of unit tests for the SchemeValidator class.
+    """
+    def setUp(self):
+        """
+        Creates the test scheme and configuration files.
+        """
+        self.scheme_validator = validate.SchemeValidator()
+
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_test_file(
+                self.get_scheme_file(config_type),
+                config_mock[f'{config_type}Source']['content']
+            )
+            self.create_test_file(
+                config_mock[f'{config_type}Target']['name'],
+                config_mock[f'{config_type}Target']['content']
+            )
+
+    def tearDown(self):
+        """
+        Removes the test scheme and configuration files.
+        """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in list(test_data.PRELOAD_DC_CONFIG_PATHS.values()) + [
+            test_data.APPLY_PROFILE_LOCK_PATH, test_data.APPLY_HISTORY_PATH
+        ]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def create_test_file(self, name, content):
+        """
+        Helper method to create a test file.
+        """
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def get_scheme_file(self, config_type):
+        """
+        Helper method to get the path to a test scheme file.
+        """
+        return os.path.join(
+            test_data.SCHEME_PATH, f'{test_data.SCHEME_NAME}.{config_type}'
+        )
+
+    def create_scheme(self):
+        """
+        Helper method to create a scheme pointing at the test files.
+        """
+        return scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+
+    def test_get_validator(self):
+        """
+        Tests that validators are compiled only once.
+        """
+        for config_type in test_data.VALIDATE_ERRORS:
+            self.assertIs(
+                self.scheme_validator.get_validator(config_type),
+                self.scheme_validator.get_validator(config_type)
+            )
+
+    def test_validate(self):
+        """
+        Tests the validate method with valid and invalid scheme files.
+        """
+        valid_scheme = self.create_scheme()
+        for config_type in test_data.VALIDATE_ERRORS:
+            self.assertListEqual(
+                self.scheme_validator.validate(
+                    config_type, valid_scheme.load_source(config_type),
+                    test_data.SCHEME_XML_TAGS
+                ),
+                []
+            )
+
+        for config_type, content in test_data.VALIDATE_INVALID_FILES.items():
+            self.create_test_file(self.get_scheme_file(config_type), content)
+
+        # Check that all errors of a file are reported with their locations
+        for config_type, errors in test_data.VALIDATE_ERRORS.items():
+            with self.assertRaises(ValueError) as context:
+                self.create_scheme().load_source(config_type)
+            self.assertListEqual(
+                str(context.exception).splitlines(),
+                [
+                    f'{test_data.SCHEME_NAME}.{config_type}: {error}'
+                    for error in errors
+                ]
+            )
+
+    def test_validate_sources(self):
+        """
+        Tests that an invalid scheme fails before any file is written.
+        """
+        self.create_test_file(
+            self.get_scheme_file('cfg'),
+            test_data.VALIDATE_INVALID_FILES['cfg']
+        )
+        self.create_test_file(
+            self.get_scheme_file('xml'),
+            test_data.VALIDATE_INVALID_FILES['xml']
+        )
+        invalid_scheme = self.create_scheme()
+
+        with self.assertRaises(ValueError) as context:
+            invalid_scheme.apply_scheme()
+
+        # Check that errors of both files are reported and nothing changed
+        errors = str(context.exception).splitlines()[1:]
+        self.assertEqual(
+            len(errors),
+            len(test_data.VALIDATE_ERRORS['cfg'])
+            + len(test_data.VALIDATE_ERRORS['xml'])
+        )
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            with open(
+                config_mock[f'{config_type}Target']['name'], encoding='utf-8'
+            ) as file:
+                self.assertEqual(
+                    file.read(), config_mock[f'{config_type}Target']['content']
+                )
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()
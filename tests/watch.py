@@ -0,0 +1,172 @@
+import os
+import queue
+import shutil
+import sys
+import threading
+import unittest
+
+# Append the parent directory to the system path to access app module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import index, scheme, watch
+import test_data
+
+class TestSchemeWatcher(unittest.TestCase):
+    """
+    A set of unit tests for the watch module.
+    """
+    def setUp(self):
+        """
+        Creates the test scheme, configuration files and scheme index.
+        """
+        os.makedirs(test_data.SCHEME_PATH, exist_ok=True)
+        for config_mock, config_type in [
+            (test_data.DC_CONFIG_CFG_MOCK, 'cfg'),
+            (test_data.DC_CONFIG_JSON_MOCK, 'json'),
+            (test_data.DC_CONFIG_XML_MOCK, 'xml')
+        ]:
+            self.create_test_file(
+                os.path.join(
+                    test_data.SCHEME_PATH,
+                    f'{test_data.SCHEME_NAME}.{config_type}'
+                ),
+                config_mock[f'{config_type}Source']['content']
+            )
+            self.create_test_file(
+                config_mock[f'{config_type}Target']['name'],
+                config_mock[f'{config_type}Target']['content']
+            )
+
+        self.index = index.SchemeIndex(
+            [test_data.SCHEME_PATH],
+            test_data.USER_CONFIG_DEFAULT['schemes']['extensions'],
+            test_data.CATALOG_PATH, test_data.CATALOG_DOMINANT_COLORS
+        )
+        self.index.update(
+            test_data.SCHEME_PATH, [(test_data.SCHEME_NAME, [])]
+        )
+        self.config_file = test_data.PRELOAD_DC_CONFIG_PATHS['cfg']
+
+    def tearDown(self):
+        """
+        Removes the test scheme, configuration files and catalog.
+        """
+        if os.path.exists(test_data.SCHEME_PATH):
+            shutil.rmtree(test_data.SCHEME_PATH)
+        for name in list(test_data.PRELOAD_DC_CONFIG_PATHS.values()) + [
+            test_data.APPLY_PROFILE_LOCK_PATH, test_data.APPLY_HISTORY_PATH
+        ]:
+            if os.path.exists(name):
+                os.remove(name)
+        if os.path.exists(test_data.CATALOG_PATH):
+            os.remove(test_data.CATALOG_PATH)
+
+    def create_test_file(self, name, content):
+        """
+        Helper method to create a test file.
+        """
+        with open(name, 'w', encoding='utf-8') as file:
+            file.write(content)
+
+    def create_scheme(self):
+        """
+        Helper method to create a scheme pointing at the test files.
+        """
+        return scheme.Scheme(
+            test_data.SCHEME_NAME, test_data.SCHEME_PATH,
+            test_data.PRELOAD_DC_CONFIG_PATHS, test_data.DC_BACKUP_CONFIGS,
+            test_data.DARK_MODE, test_data.SCHEME_XML_TAGS
+        )
+
+    def test_polling_watcher(self):
+        """
+        Tests that the polling watcher reports changed paths.
+        """
+        watcher = watch.PollingWatcher(
+            [test_data.SCHEME_PATH, self.config_file],
+            test_data.WATCH_POLL_INTERVAL
+        )
+
+        self.assertSetEqual(watcher.wait(0), set())
+        self.create_test_file(
+            os.path.join(test_data.SCHEME_PATH, test_data.WATCH_NEW_FILE), ''
+        )
+        self.assertSetEqual(
+            watcher.wait(test_data.WATCH_TIMEOUT), {test_data.SCHEME_PATH}
+        )
+
+    @unittest.skipUnless(sys.platform.startswith('linux'), 'requires Linux')
+    def test_inotify_watcher(self):
+        """
+        Tests that the inotify watcher reports changed paths.
+        """
+        watcher = watch.InotifyWatcher(
+            [test_data.SCHEME_PATH, self.config_file]
+        )
+
+        try:
+            self.assertSetEqual(watcher.wait(0), set())
+            self.create_test_file(self.config_file, '')
+            self.assertSetEqual(
+                watcher.wait(test_data.WATCH_TIMEOUT), {self.config_file}
+            )
+        finally:
+            watcher.close()
+
+    def test_get_apply_scheme(self):
+        """
+        Tests that own writes are ignored and external changes re-apply.
+        """
+        watcher = watch.SchemeWatcher(
+            self.index, test_data.PRELOAD_DC_CONFIG_PATHS,
+            test_data.WATCH_POLL_INTERVAL, test_data.WATCH_POLL_INTERVAL
+        )
+        watcher.watcher.close()
+        test_scheme = self.create_scheme()
+        watcher.set_scheme(test_scheme)
+
+        test_scheme.apply_scheme()
+        watcher.mark_applied()
+        self.assertIsNone(watcher.get_apply_scheme({self.config_file}))
+
+        self.create_test_file(self.config_file, '')
+        self.assertIsInstance(
+            watcher.get_apply_scheme({self.config_file}), scheme.Scheme
+        )
+
+    def test_run(self):
+        """
+        Tests that the active scheme is re-applied after an external change.
+        """
+        events = queue.Queue()
+        watcher = watch.SchemeWatcher(
+            self.index, test_data.PRELOAD_DC_CONFIG_PATHS,
+            test_data.WATCH_POLL_INTERVAL, test_data.WATCH_POLL_INTERVAL
+        )
+        watcher.set_scheme(self.create_scheme())
+        thread = threading.Thread(
+            target=watcher.run,
+            args=(
+                lambda kind, root, batch: None,
+                lambda kind, message: events.put(kind)
+            )
+        )
+        thread.start()
+
+        try:
+            self.create_test_file(self.config_file, 'DarkMode=3\n')
+            self.assertEqual(
+                events.get(timeout=test_data.WATCH_TIMEOUT), 'applied'
+            )
+        finally:
+            watcher.stop()
+            thread.join()
+
+        with open(self.config_file, encoding='utf-8') as file:
+            self.assertIn('DarkMode=2', file.read())
+
+if __name__ == '__main__':
+    """
+    Main execution point of the unit tests.
+    """
+    unittest.main()